@@ -275,6 +275,9 @@ def main():
 
     configure_language(config_mgr, sys.argv)
     install_qt_i18n()
+    from src.core.db_core_service import DbCorePoolConfig, configure_shared_db_core_pool
+
+    configure_shared_db_core_pool(DbCorePoolConfig.from_config_manager(config_mgr))
     tunnel_engine = engine_cls()
 
     # 2. 설정 파일 경로 안내 (첫 실행 사용자를 위해)
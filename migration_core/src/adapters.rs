@@ -631,6 +631,8 @@ pub(crate) fn mysql_opts(endpoint: &Endpoint) -> mysql::OptsBuilder {
         .tcp_keepalive_time_ms(Some(10_000))
         // 재접속/최초 접속이 무한 대기하지 않도록 상한(재시도 루프에서 특히 중요).
         .tcp_connect_timeout(Some(std::time::Duration::from_secs(30)))
+        // 연결별 prepared statement LRU. query.execute 의 prepare 경로가 이 캐시를 쓴다.
+        .stmt_cache_size(Some(STATEMENT_CACHE_CAPACITY))
 }
 
 pub(crate) fn postgres_config(endpoint: &Endpoint) -> postgres::Config {
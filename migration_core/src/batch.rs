@@ -0,0 +1,315 @@
+use serde_json::Value;
+
+use mysql::prelude::Queryable;
+
+use crate::*;
+
+/// 다중 행 INSERT 로 합칠 때 statement 하나에 넣는 최대 행 수.
+pub(crate) const BATCH_INSERT_MAX_ROWS: usize = 1000;
+/// 다중 행 INSERT statement 의 최대 길이. MySQL 5.7 기본 max_allowed_packet(4MiB)보다 충분히 작다.
+pub(crate) const BATCH_INSERT_MAX_BYTES: usize = 1 << 20;
+
+/// 실제로 서버에 보낼 statement. 다중 행 INSERT 로 합쳐졌으면 원래 statement 여러 개를 대표한다.
+#[derive(Debug, Clone, PartialEq)]
+pub(crate) struct BatchStatement {
+    pub(crate) sql: String,
+    pub(crate) first_index: usize,
+    pub(crate) count: usize,
+}
+
+#[derive(Debug, Clone, PartialEq)]
+pub(crate) struct BatchPlan {
+    pub(crate) statements: Vec<BatchStatement>,
+    /// 요청에 들어 있던 원래 statement 수.
+    pub(crate) total: usize,
+}
+
+impl BatchPlan {
+    pub(crate) fn rewritten(&self) -> bool {
+        self.statements.len() < self.total
+    }
+}
+
+#[derive(Debug, Default)]
+pub(crate) struct BatchOutcome {
+    /// 원래 statement 별 영향 행 수. 실행되지 않았거나 실패했으면 `None`.
+    pub(crate) rows_affected: Vec<Option<u64>>,
+    pub(crate) errors: Vec<(usize, String)>,
+    pub(crate) committed: bool,
+}
+
+/// `sql` + `params` 행렬, 또는 `statements`(문자열 또는 `{sql, params}`) 목록을 실행 계획으로 만든다.
+pub(crate) fn plan_batch(payload: &Value) -> Result<BatchPlan, String> {
+    if let Some(statements) = payload.get("statements") {
+        let items = statements
+            .as_array()
+            .ok_or_else(|| "query.execute_batch statements must be an array".to_string())?;
+        let mut planned = Vec::with_capacity(items.len());
+        for (index, item) in items.iter().enumerate() {
+            let sql = match item {
+                Value::String(sql) => sql.trim().to_string(),
+                Value::Object(_) => bind_query_params(
+                    item.get("sql").and_then(Value::as_str).unwrap_or("").trim(),
+                    &query_params(item),
+                ),
+                _ => String::new(),
+            };
+            if sql.is_empty() {
+                return Err(format!("query.execute_batch statement {index} has no sql"));
+            }
+            planned.push(BatchStatement {
+                sql,
+                first_index: index,
+                count: 1,
+            });
+        }
+        return Ok(BatchPlan {
+            total: planned.len(),
+            statements: planned,
+        });
+    }
+
+    let sql = payload
+        .get("sql")
+        .and_then(Value::as_str)
+        .unwrap_or("")
+        .trim();
+    if sql.is_empty() {
+        return Err("query.execute_batch requires sql or statements".to_string());
+    }
+    let rows: Vec<Vec<Value>> = payload
+        .get("params")
+        .and_then(Value::as_array)
+        .map(|rows| {
+            rows.iter()
+                .map(|row| row.as_array().cloned().unwrap_or_default())
+                .collect()
+        })
+        .unwrap_or_default();
+    let rewrite = payload
+        .get("rewrite_inserts")
+        .and_then(Value::as_bool)
+        .unwrap_or(true);
+    if rewrite && rows.len() > 1 {
+        if let Some(statements) = rewrite_multi_row_insert(sql, &rows) {
+            return Ok(BatchPlan {
+                statements,
+                total: rows.len(),
+            });
+        }
+    }
+    Ok(BatchPlan {
+        statements: rows
+            .iter()
+            .enumerate()
+            .map(|(index, row)| BatchStatement {
+                sql: bind_query_params(sql, row),
+                first_index: index,
+                count: 1,
+            })
+            .collect(),
+        total: rows.len(),
+    })
+}
+
+/// `INSERT INTO t (..) VALUES (%s, ..)` 템플릿을 행 묶음별 다중 행 INSERT 로 바꾼다.
+///
+/// VALUES 튜플에 placeholder 만 있고 그 뒤에 아무것도 없는 평범한 INSERT 만 대상이다.
+/// `INSERT IGNORE`, `ON DUPLICATE KEY`/`ON CONFLICT`, `RETURNING` 처럼 행별 영향 수가
+/// 1 이 아닐 수 있는 형태는 statement 별로 실행한다.
+pub(crate) fn rewrite_multi_row_insert(
+    sql: &str,
+    rows: &[Vec<Value>],
+) -> Option<Vec<BatchStatement>> {
+    let trimmed = sql.trim().trim_end_matches(';').trim_end();
+    let mut words = trimmed.split_whitespace();
+    if !words.next()?.eq_ignore_ascii_case("insert") || !words.next()?.eq_ignore_ascii_case("into")
+    {
+        return None;
+    }
+    let values_at = trimmed.to_ascii_uppercase().rfind("VALUES")?;
+    let head = trimmed[..values_at].trim_end();
+    let tuple = trimmed[values_at + "VALUES".len()..].trim();
+    let inner = tuple.strip_prefix('(')?.strip_suffix(')')?;
+    let placeholders_only = inner.split(',').all(|part| {
+        let part = part.trim();
+        part == "%s"
+            || part.strip_prefix('$').is_some_and(|digits| {
+                !digits.is_empty() && digits.bytes().all(|b| b.is_ascii_digit())
+            })
+    });
+    if !placeholders_only || head.contains('\'') || head.contains('"') {
+        return None;
+    }
+
+    let mut statements = Vec::new();
+    let mut current = String::new();
+    let mut first_index = 0;
+    let mut count = 0;
+    for (index, row) in rows.iter().enumerate() {
+        let values = bind_query_params(tuple, row);
+        let full = count >= BATCH_INSERT_MAX_ROWS
+            || (count > 0 && current.len() + values.len() + 2 > BATCH_INSERT_MAX_BYTES);
+        if full {
+            statements.push(BatchStatement {
+                sql: std::mem::take(&mut current),
+                first_index,
+                count,
+            });
+            count = 0;
+        }
+        if count == 0 {
+            first_index = index;
+            current = format!("{head} VALUES {values}");
+        } else {
+            current.push_str(", ");
+            current.push_str(&values);
+        }
+        count += 1;
+    }
+    if count > 0 {
+        statements.push(BatchStatement {
+            sql: current,
+            first_index,
+            count,
+        });
+    }
+    Some(statements)
+}
+
+fn run_control(adapter: &mut LiveAdapter, sql: &str) -> Result<(), String> {
+    match adapter {
+        LiveAdapter::MySql(conn) => conn
+            .query_drop(sql)
+            .map_err(|err| format!("mysql {sql} error: {err}")),
+        LiveAdapter::PostgreSql(client) => client
+            .batch_execute(sql)
+            .map_err(|err| format!("postgresql {sql} error: {err}")),
+    }
+}
+
+/// 계획된 statement 를 한 연결에서 순서대로 실행한다.
+///
+/// `transaction` 이면 전체를 한 트랜잭션으로 묶고 첫 오류에서 롤백한다. 아니면 호출자가
+/// 소유한 트랜잭션 안에서 실행되며, `stop_on_error` 가 false 면 실패한 statement 를 기록하고
+/// 계속 진행한다.
+pub(crate) fn execute_batch_adapter(
+    adapter: &mut LiveAdapter,
+    plan: &BatchPlan,
+    transaction: bool,
+    stop_on_error: bool,
+) -> Result<BatchOutcome, String> {
+    let mut outcome = BatchOutcome {
+        rows_affected: vec![None; plan.total],
+        ..BatchOutcome::default()
+    };
+    if transaction {
+        let begin = match adapter {
+            LiveAdapter::MySql(_) => "START TRANSACTION",
+            LiveAdapter::PostgreSql(_) => "BEGIN",
+        };
+        run_control(adapter, begin)?;
+    }
+    for statement in &plan.statements {
+        match execute_query_adapter(adapter, &statement.sql) {
+            Ok(result) => {
+                if statement.count == 1 {
+                    outcome.rows_affected[statement.first_index] = Some(result.rows_affected);
+                } else {
+                    // 평범한 다중 행 INSERT 는 전부 들어가거나 전부 실패하므로 행마다 1 이다.
+                    for index in statement.first_index..statement.first_index + statement.count {
+                        outcome.rows_affected[index] = Some(1);
+                    }
+                }
+            }
+            Err(err) => {
+                let message = if statement.count == 1 {
+                    err
+                } else {
+                    format!(
+                        "statements {}..{} (multi-row INSERT): {err}",
+                        statement.first_index,
+                        statement.first_index + statement.count - 1
+                    )
+                };
+                outcome.errors.push((statement.first_index, message));
+                if transaction || stop_on_error {
+                    break;
+                }
+            }
+        }
+    }
+    if transaction {
+        if outcome.errors.is_empty() {
+            run_control(adapter, "COMMIT")?;
+            outcome.committed = true;
+        } else {
+            run_control(adapter, "ROLLBACK")?;
+            outcome
+                .rows_affected
+                .iter_mut()
+                .for_each(|count| *count = None);
+        }
+    }
+    Ok(outcome)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use serde_json::json;
+
+    #[test]
+    fn plain_insert_template_is_rewritten_into_multi_row_chunks() {
+        let rows: Vec<Value> = (0..2500).map(|id| json!([id, format!("n'{id}")])).collect();
+        let plan = plan_batch(&json!({
+            "sql": "INSERT INTO users (id, name) VALUES (%s, %s);",
+            "params": rows
+        }))
+        .unwrap();
+
+        assert_eq!(plan.total, 2500);
+        assert!(plan.rewritten());
+        assert_eq!(
+            plan.statements
+                .iter()
+                .map(|statement| (statement.first_index, statement.count))
+                .collect::<Vec<_>>(),
+            vec![(0, 1000), (1000, 1000), (2000, 500)]
+        );
+        assert!(plan.statements[0]
+            .sql
+            .starts_with("INSERT INTO users (id, name) VALUES (0, 'n''0'), (1, 'n''1')"));
+    }
+
+    #[test]
+    fn inserts_with_conflict_clauses_and_updates_run_one_statement_per_row() {
+        for sql in [
+            "INSERT IGNORE INTO users (id) VALUES (%s)",
+            "INSERT INTO users (id) VALUES (%s) ON DUPLICATE KEY UPDATE id = id",
+            "UPDATE users SET name = %s WHERE id = %s",
+        ] {
+            let plan = plan_batch(&json!({"sql": sql, "params": [[1, 2], [3, 4]]})).unwrap();
+            assert!(!plan.rewritten(), "{sql}");
+            assert_eq!(plan.statements.len(), 2, "{sql}");
+        }
+    }
+
+    #[test]
+    fn statement_list_accepts_plain_sql_and_parameterized_items() {
+        let plan = plan_batch(&json!({
+            "statements": [
+                "DELETE FROM orphans WHERE id = 1",
+                {"sql": "UPDATE users SET name = %s WHERE id = %s", "params": ["x", 2]}
+            ]
+        }))
+        .unwrap();
+
+        assert_eq!(plan.total, 2);
+        assert_eq!(
+            plan.statements[1].sql,
+            "UPDATE users SET name = 'x' WHERE id = 2"
+        );
+        assert!(plan_batch(&json!({"statements": [""]})).is_err());
+    }
+}
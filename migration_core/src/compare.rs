@@ -256,7 +256,7 @@ pub(crate) fn mysql_row_to_json(columns: &[String], row: mysql::Row) -> Value {
     Value::Object(object)
 }
 
-fn mysql_value_to_json(value: mysql::Value) -> Value {
+pub(crate) fn mysql_value_to_json(value: mysql::Value) -> Value {
     match value {
         mysql::Value::NULL => Value::Null,
         mysql::Value::Bytes(value) => Value::String(String::from_utf8_lossy(&value).to_string()),
@@ -0,0 +1,184 @@
+use serde_json::Value;
+use std::sync::mpsc::{sync_channel, Receiver, SyncSender};
+use std::sync::{Arc, Mutex};
+use std::thread;
+
+use crate::*;
+
+/// 생산자 스레드가 fetch 보다 앞서 읽어 둘 수 있는 배치 수.
+/// 채널이 차면 생산자의 send 가 막히고, 그동안 드라이버 읽기도 멈춘다(역압).
+pub(crate) const CURSOR_PREFETCH_BATCHES: usize = 2;
+
+enum CursorChunk {
+    Columns(Vec<String>),
+    Rows(Vec<Value>),
+    Done,
+    Failed(String),
+}
+
+/// 조기 종료 시 서버 쪽 statement 를 중단시킬 대상.
+///
+/// `streaming` 은 생산자가 어댑터 락을 놓기 직전에 `false` 로 바꾼다. 취소는 이 락을 잡은
+/// 채 보내므로, 생산자가 끝나 다음 명령이 같은 세션에서 시작된 뒤에 늦은 취소가 그 명령을
+/// 죽이는 일은 없다.
+pub(crate) struct CursorCancel {
+    pub(crate) endpoint: Endpoint,
+    pub(crate) session_id: u64,
+    streaming: Arc<Mutex<bool>>,
+}
+
+/// 서버 측 스트리밍 커서.
+///
+/// 생산자 스레드가 연결 어댑터 락을 잡은 채 결과를 점진적으로 읽어 제한 채널로 배치를
+/// 넘기고, `cursor.fetch` 가 요청할 때마다 한 배치씩 꺼낸다.
+///
+/// 수신측을 닫는 것만으로는 서버가 멈추지 않는다. MySQL `QueryResult` 는 drop 될 때 남은
+/// 행을 끝까지 읽어 버리므로, 다 읽기 전에 커서를 drop 하면 먼저 side connection 으로
+/// `KILL QUERY`/`pg_cancel_backend` 를 보내 남은 결과 전송을 끊는다. PostgreSQL 은
+/// 포털에서 배치 크기만큼만 가져오므로 취소 전에도 서버가 앞서 보내는 행은 한 배치뿐이다.
+pub(crate) struct ServerCursor {
+    /// 메모리 행 커서는 연결에 묶이지 않는다.
+    pub(crate) connection_id: Option<String>,
+    pub(crate) columns: Vec<String>,
+    pub(crate) rows_fetched: u64,
+    receiver: Receiver<CursorChunk>,
+    done: bool,
+    cancel: Option<CursorCancel>,
+}
+
+impl ServerCursor {
+    /// `cancel_target` 은 연결의 엔드포인트와 서버 세션 id. 모르면 조기 종료 시 서버가
+    /// 남은 결과를 다 보낼 때까지 생산자가 어댑터 락을 잡고 있게 된다.
+    pub(crate) fn open_live(
+        connection_id: String,
+        shared: Arc<Mutex<LiveAdapter>>,
+        sql: String,
+        batch_size: usize,
+        cancel_target: Option<(Endpoint, u64)>,
+    ) -> Result<Self, String> {
+        let (sender, receiver) = sync_channel(CURSOR_PREFETCH_BATCHES);
+        let producer_connection_id = connection_id.clone();
+        let streaming = Arc::new(Mutex::new(true));
+        let producer_streaming = Arc::clone(&streaming);
+        thread::spawn(move || {
+            let Ok(mut adapter) = shared.lock() else {
+                let _ = sender.send(CursorChunk::Failed(format!(
+                    "connection is unusable after a failed request: {producer_connection_id}"
+                )));
+                return;
+            };
+            let outcome = stream_query_adapter(&mut adapter, &sql, batch_size, |item| {
+                let chunk = match item {
+                    QueryStreamItem::Columns(columns) => CursorChunk::Columns(columns),
+                    QueryStreamItem::Rows(rows) => CursorChunk::Rows(rows),
+                };
+                sender.send(chunk).is_ok()
+            });
+            // 어댑터 락을 놓기 전에 표시해, 이후의 취소가 다음 명령에 닿지 않게 한다.
+            *producer_streaming
+                .lock()
+                .unwrap_or_else(|poisoned| poisoned.into_inner()) = false;
+            drop(adapter);
+            finish_producer(&sender, outcome);
+        });
+        let mut cursor = Self::from_receiver(Some(connection_id), receiver)?;
+        cursor.cancel = cancel_target.map(|(endpoint, session_id)| CursorCancel {
+            endpoint,
+            session_id,
+            streaming,
+        });
+        Ok(cursor)
+    }
+
+    /// 메모리 행 모드 커서. 라이브 DB 없이 fetch/역압 계약을 테스트할 때 쓴다.
+    pub(crate) fn open_memory(
+        columns: Vec<String>,
+        rows: Vec<Value>,
+        batch_size: usize,
+    ) -> Result<Self, String> {
+        let (sender, receiver) = sync_channel(CURSOR_PREFETCH_BATCHES);
+        let batch_size = batch_size.max(1);
+        thread::spawn(move || {
+            if sender.send(CursorChunk::Columns(columns)).is_err() {
+                return;
+            }
+            let mut streamed = 0u64;
+            for chunk in rows.chunks(batch_size) {
+                streamed += chunk.len() as u64;
+                if sender.send(CursorChunk::Rows(chunk.to_vec())).is_err() {
+                    return;
+                }
+            }
+            finish_producer(&sender, Ok(streamed));
+        });
+        Self::from_receiver(None, receiver)
+    }
+
+    fn from_receiver(
+        connection_id: Option<String>,
+        receiver: Receiver<CursorChunk>,
+    ) -> Result<Self, String> {
+        match receiver.recv() {
+            Ok(CursorChunk::Columns(columns)) => Ok(Self {
+                connection_id,
+                columns,
+                rows_fetched: 0,
+                receiver,
+                done: false,
+                cancel: None,
+            }),
+            Ok(CursorChunk::Failed(err)) => Err(err),
+            _ => Err("cursor producer stopped before sending columns".to_string()),
+        }
+    }
+
+    /// 다음 배치를 기다려 꺼낸다. 결과가 끝났으면 `None`.
+    pub(crate) fn next_batch(&mut self) -> Result<Option<Vec<Value>>, String> {
+        while !self.done {
+            match self.receiver.recv() {
+                Ok(CursorChunk::Rows(rows)) => {
+                    self.rows_fetched += rows.len() as u64;
+                    return Ok(Some(rows));
+                }
+                Ok(CursorChunk::Columns(_)) => continue,
+                Ok(CursorChunk::Failed(err)) => {
+                    self.done = true;
+                    return Err(err);
+                }
+                Ok(CursorChunk::Done) | Err(_) => self.done = true,
+            }
+        }
+        Ok(None)
+    }
+
+    pub(crate) fn is_done(&self) -> bool {
+        self.done
+    }
+}
+
+impl Drop for ServerCursor {
+    fn drop(&mut self) {
+        // 수신측은 이 함수가 끝난 뒤에 닫힌다. 그 전에 취소해야 생산자가 send 실패로
+        // 결과를 drop 할 때 남은 행 전체가 아니라 중단된 결과만 비우게 된다.
+        if self.done {
+            return;
+        }
+        let Some(cancel) = self.cancel.take() else {
+            return;
+        };
+        let streaming = cancel
+            .streaming
+            .lock()
+            .unwrap_or_else(|poisoned| poisoned.into_inner());
+        if *streaming {
+            let _ = cancel_session_query(&cancel.endpoint, cancel.session_id);
+        }
+    }
+}
+
+fn finish_producer(sender: &SyncSender<CursorChunk>, outcome: Result<u64, String>) {
+    let _ = sender.send(match outcome {
+        Ok(_) => CursorChunk::Done,
+        Err(err) => CursorChunk::Failed(err),
+    });
+}
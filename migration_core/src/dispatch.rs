@@ -0,0 +1,136 @@
+use std::sync::mpsc::{channel, Receiver, Sender};
+use std::sync::{Arc, Mutex};
+use std::thread::{self, JoinHandle};
+
+use crate::*;
+
+/// 한 코어 프로세스가 동시에 처리하는 요청 수. 요청마다 DB 핸드셰이크가 따를 수 있으므로
+/// 초과분은 스레드를 만들지 않고 큐에서 기다린다.
+pub const MAX_CONCURRENT_REQUESTS: usize = 16;
+
+/// 취소/커서 닫기 전용 워커 수. 일반 워커가 모두 긴 쿼리에 묶여 있어도 취소가 큐 뒤에서
+/// 기다리지 않게 따로 둔다.
+pub const CONTROL_REQUEST_WORKERS: usize = 2;
+
+/// 일반 요청 큐를 건너뛰어야 하는 제어 명령인지 판단한다.
+pub fn is_control_request(request: &Request) -> bool {
+    matches!(
+        request.command.as_str(),
+        "query.cancel" | "job.cancel" | "cursor.close"
+    )
+}
+
+/// 고정 개수의 워커 스레드가 공유 큐에서 요청을 꺼내 처리한다.
+///
+/// `submit` 은 막히지 않는다. 워커가 모두 바쁘면 요청은 큐에 쌓여 순서대로 처리되므로,
+/// 요청이 한꺼번에 몰려도 스레드와 DB 연결 수는 `count` 를 넘지 않는다.
+pub struct RequestWorkers {
+    sender: Option<Sender<Request>>,
+    workers: Vec<JoinHandle<()>>,
+}
+
+impl RequestWorkers {
+    pub fn start<F>(name: &str, count: usize, handler: Arc<F>) -> Self
+    where
+        F: Fn(Request) + Send + Sync + 'static,
+    {
+        let (sender, receiver) = channel::<Request>();
+        let receiver = Arc::new(Mutex::new(receiver));
+        let workers = (0..count.max(1))
+            .map(|index| {
+                let receiver = Arc::clone(&receiver);
+                let handler = Arc::clone(&handler);
+                thread::Builder::new()
+                    .name(format!("{name}-{index}"))
+                    .spawn(move || run_worker(&receiver, handler.as_ref()))
+                    .expect("failed to spawn request worker thread")
+            })
+            .collect();
+        Self {
+            sender: Some(sender),
+            workers,
+        }
+    }
+
+    pub fn submit(&self, request: Request) {
+        if let Some(sender) = &self.sender {
+            let _ = sender.send(request);
+        }
+    }
+
+    /// 큐를 닫고, 이미 들어온 요청을 모두 처리한 뒤 워커를 종료한다.
+    pub fn join(&mut self) {
+        self.sender = None;
+        for worker in self.workers.drain(..) {
+            let _ = worker.join();
+        }
+    }
+}
+
+impl Drop for RequestWorkers {
+    fn drop(&mut self) {
+        self.join();
+    }
+}
+
+fn run_worker<F: Fn(Request)>(receiver: &Mutex<Receiver<Request>>, handler: &F) {
+    loop {
+        // 다음 요청을 받는 동안만 큐 락을 잡는다.
+        let next = match receiver.lock() {
+            Ok(receiver) => receiver.recv(),
+            Err(_) => return,
+        };
+        match next {
+            Ok(request) => handler(request),
+            Err(_) => return,
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use serde_json::json;
+    use std::sync::atomic::{AtomicUsize, Ordering};
+    use std::time::Duration;
+
+    fn request(command: &str, id: usize) -> Request {
+        Request {
+            command: command.to_string(),
+            request_id: Some(format!("req-{id}")),
+            payload: json!({}),
+        }
+    }
+
+    #[test]
+    fn request_workers_cap_concurrency_and_drain_the_queue() {
+        let running = Arc::new(AtomicUsize::new(0));
+        let peak = Arc::new(AtomicUsize::new(0));
+        let done = Arc::new(AtomicUsize::new(0));
+        let handler = {
+            let (running, peak, done) = (running.clone(), peak.clone(), done.clone());
+            Arc::new(move |_request: Request| {
+                let now = running.fetch_add(1, Ordering::SeqCst) + 1;
+                peak.fetch_max(now, Ordering::SeqCst);
+                thread::sleep(Duration::from_millis(5));
+                running.fetch_sub(1, Ordering::SeqCst);
+                done.fetch_add(1, Ordering::SeqCst);
+            })
+        };
+        let mut workers = RequestWorkers::start("test-request", 3, handler);
+        for id in 0..40 {
+            workers.submit(request("query.execute", id));
+        }
+        workers.join();
+
+        assert_eq!(done.load(Ordering::SeqCst), 40);
+        assert!(peak.load(Ordering::SeqCst) <= 3);
+    }
+
+    #[test]
+    fn cancel_commands_use_the_control_lane() {
+        assert!(is_control_request(&request("query.cancel", 1)));
+        assert!(is_control_request(&request("cursor.close", 2)));
+        assert!(!is_control_request(&request("query.execute", 3)));
+    }
+}
@@ -1,25 +1,33 @@
 mod adapters;
-mod protocol;
+mod batch;
+mod compare;
+mod cursor;
+mod ddl;
+mod dispatch;
 mod dump;
+mod dump_format;
 mod import;
+mod migrate;
+mod oneclick;
+mod protocol;
 mod query;
 mod schema;
-mod oneclick;
-mod migrate;
-mod compare;
-mod dump_format;
-mod ddl;
+mod statements;
 
 pub use adapters::*;
 pub use protocol::*;
 // dump / query / oneclick 는 크레이트 외부로 공개할 pub 아이템이 없고
 // 크로스모듈에서 참조되는 pub(crate) 항목만 루트로 평탄화하면 되므로 pub(crate) use 로 재수출한다.
+pub(crate) use batch::*;
+pub use compare::*;
+pub(crate) use cursor::*;
+pub use ddl::*;
+pub use dispatch::*;
 pub(crate) use dump::*;
+pub use dump_format::*;
 pub use import::*;
+pub use migrate::*;
+pub(crate) use oneclick::*;
 pub(crate) use query::*;
 pub use schema::*;
-pub(crate) use oneclick::*;
-pub use migrate::*;
-pub use compare::*;
-pub use dump_format::*;
-pub use ddl::*;
+pub(crate) use statements::*;
@@ -1,11 +1,28 @@
-use migration_core::{handle_request_streaming, CoreService, Request};
+use migration_core::{
+    dispatches_concurrently, handle_request_streaming, is_control_request, CoreService, Request,
+    RequestWorkers, CONTROL_REQUEST_WORKERS, MAX_CONCURRENT_REQUESTS,
+};
 use serde_json::{json, Value};
 use std::io::{self, BufRead, Write};
+use std::sync::Arc;
 
 fn main() {
     let stdin = io::stdin();
     let mut handled = false;
-    let mut service = CoreService::new();
+    let service = Arc::new(CoreService::new());
+    // request_id 가 있는 요청은 고정 크기 워커 풀에서 동시에 처리하고, 초과분은 큐에서
+    // 기다린다. 취소는 별도 워커로 보내 바쁜 쿼리 뒤에 줄 서지 않게 한다. 이벤트는 한 줄
+    // 단위로 stdout 락을 잡고 쓰므로 여러 요청의 이벤트가 섞여도 줄은 깨지지 않는다.
+    let handler = {
+        let service = Arc::clone(&service);
+        Arc::new(move |request: Request| service.handle_request_streaming(request, emit_one))
+    };
+    let mut workers = RequestWorkers::start(
+        "core-request",
+        MAX_CONCURRENT_REQUESTS,
+        Arc::clone(&handler),
+    );
+    let mut controls = RequestWorkers::start("core-control", CONTROL_REQUEST_WORKERS, handler);
 
     for line in stdin.lock().lines() {
         match line {
@@ -17,10 +34,22 @@ fn main() {
                 match serde_json::from_str::<Request>(&line) {
                     Ok(request) => {
                         let should_shutdown = request.command == "service.shutdown";
-                        service.handle_request_streaming(request, emit_one);
                         if should_shutdown {
+                            // 진행 중인 요청이 결과를 낸 뒤에 종료 응답을 보낸다.
+                            workers.join();
+                            controls.join();
+                            service.handle_request_streaming(request, emit_one);
                             break;
                         }
+                        if dispatches_concurrently(&request) {
+                            if is_control_request(&request) {
+                                controls.submit(request);
+                            } else {
+                                workers.submit(request);
+                            }
+                        } else {
+                            service.handle_request_streaming(request, emit_one);
+                        }
                     }
                     Err(err) => emit_one(json!({
                         "event": "error",
@@ -33,6 +62,8 @@ fn main() {
             }
         }
     }
+    workers.join();
+    controls.join();
 
     if !handled {
         let command = std::env::args()
@@ -1,35 +1,126 @@
 use serde_json::{json, Value};
 use std::collections::BTreeMap;
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::{Arc, Mutex};
 
 use crate::*;
 
+/// 서비스 연결 하나. 같은 연결로 들어온 명령은 이 뮤텍스로 직렬화되고,
+/// 서로 다른 연결의 명령은 동시에 실행된다.
+type SharedAdapter = Arc<Mutex<LiveAdapter>>;
+
+/// 어댑터 락을 잡고 실행 중인 요청의 request_id (없으면 빈 문자열). 실행 중이 아니면 `None`.
+type ExecutingRequest = Arc<Mutex<Option<String>>>;
+
+fn lock_executing(slot: &ExecutingRequest) -> std::sync::MutexGuard<'_, Option<String>> {
+    slot.lock().unwrap_or_else(|poisoned| poisoned.into_inner())
+}
+
+/// 어댑터 락을 잡은 동안 실행 중인 요청을 기록하고, drop 될 때 지운다.
+///
+/// 어댑터 가드보다 나중에 만들어 먼저 drop 되게 한다. `query.cancel` 은 이 기록의 락을 잡은
+/// 채 취소를 보내므로, 취소가 끝나기 전에는 요청이 어댑터를 놓지 못하고 다음 요청의
+/// statement 에 늦은 취소가 닿지 않는다.
+struct ExecutingMark {
+    slot: ExecutingRequest,
+}
+
+impl ExecutingMark {
+    fn new(slot: &ExecutingRequest, request: &Request) -> Self {
+        *lock_executing(slot) = Some(request.request_id.clone().unwrap_or_default());
+        Self {
+            slot: Arc::clone(slot),
+        }
+    }
+}
+
+impl Drop for ExecutingMark {
+    fn drop(&mut self) {
+        *lock_executing(&self.slot) = None;
+    }
+}
+
+/// 연결 맵 항목. 취소는 실행 중인 쿼리가 잡은 어댑터 락을 기다리지 않고 side connection 으로
+/// 보내야 하므로, 엔드포인트와 서버 세션 id 를 어댑터 밖에 따로 들고 있는다.
+#[derive(Clone)]
+struct ServiceConnection {
+    adapter: SharedAdapter,
+    endpoint: Endpoint,
+    session_id: Option<u64>,
+    executing: ExecutingRequest,
+    /// prepared statement 캐시. 어댑터 락을 잡은 뒤에만 잠근다.
+    statements: Arc<Mutex<StatementCache>>,
+}
+
+/// 열린 서버 측 커서. 같은 커서의 fetch 는 뮤텍스로 직렬화되고, fetch 가 배치를
+/// 기다리는 동안에도 소유 연결은 락 없이 확인할 수 있도록 따로 들고 있는다.
+#[derive(Clone)]
+struct SharedCursor {
+    connection_id: Option<String>,
+    cursor: Arc<Mutex<ServerCursor>>,
+}
+
 pub struct CoreService {
-    connections: BTreeMap<String, LiveAdapter>,
-    next_connection_sequence: u64,
+    connections: Mutex<BTreeMap<String, ServiceConnection>>,
+    next_connection_sequence: AtomicU64,
+    cursors: Mutex<BTreeMap<String, SharedCursor>>,
+    next_cursor_sequence: AtomicU64,
 }
 
 impl CoreService {
     pub fn new() -> Self {
         Self {
-            connections: BTreeMap::new(),
-            next_connection_sequence: 1,
+            connections: Mutex::new(BTreeMap::new()),
+            next_connection_sequence: AtomicU64::new(1),
+            cursors: Mutex::new(BTreeMap::new()),
+            next_cursor_sequence: AtomicU64::new(1),
         }
     }
 
-    pub fn handle_request_streaming<F: FnMut(Value)>(&mut self, request: Request, emit: F) {
+    /// 요청 하나를 처리한다. `&self` 만 요구하므로 `Arc<CoreService>` 를 여러
+    /// 워커 스레드가 공유하며 request_id 별로 동시에 호출할 수 있다.
+    pub fn handle_request_streaming<F: FnMut(Value)>(&self, request: Request, emit: F) {
         match request.command.as_str() {
             "connection.open" => emit_all_events(self.connection_open(&request), emit),
             "connection.close" => emit_all_events(self.connection_close(&request), emit),
-            "query.execute" => emit_all_events(self.query_execute(&request), emit),
+            "query.execute" => self.query_execute(&request, emit),
+            "query.execute_batch" => emit_all_events(self.query_execute_batch(&request), emit),
+            "cursor.open" => emit_all_events(self.cursor_open(&request), emit),
+            "cursor.fetch" => emit_all_events(self.cursor_fetch(&request), emit),
+            "cursor.close" => emit_all_events(self.cursor_close(&request), emit),
+            "query.cancel" | "job.cancel" => emit_all_events(self.query_cancel(&request), emit),
             "service.shutdown" => {
-                self.connections.clear();
+                // 커서를 먼저 버려야 생산자 스레드가 멈추고 어댑터 락을 놓는다.
+                self.lock_cursors().clear();
+                self.lock_connections().clear();
                 emit_all_events(service_shutdown(&request), emit);
             }
             _ => handle_request_streaming(request, emit),
         }
     }
 
-    fn connection_open(&mut self, request: &Request) -> Vec<Value> {
+    fn lock_connections(&self) -> std::sync::MutexGuard<'_, BTreeMap<String, ServiceConnection>> {
+        // 다른 요청 스레드가 패닉해도 연결 맵 자체는 일관적이므로 poison 을 무시한다.
+        self.connections
+            .lock()
+            .unwrap_or_else(|poisoned| poisoned.into_inner())
+    }
+
+    fn lock_cursors(&self) -> std::sync::MutexGuard<'_, BTreeMap<String, SharedCursor>> {
+        self.cursors
+            .lock()
+            .unwrap_or_else(|poisoned| poisoned.into_inner())
+    }
+
+    /// 스트리밍 커서가 열려 있는 연결은 생산자 스레드가 어댑터 락을 잡고 있으므로,
+    /// 같은 연결의 다른 명령은 기다리지 않고 바로 거절한다.
+    fn connection_has_open_cursor(&self, connection_id: &str) -> bool {
+        self.lock_cursors()
+            .values()
+            .any(|open| open.connection_id.as_deref() == Some(connection_id))
+    }
+
+    fn connection_open(&self, request: &Request) -> Vec<Value> {
         let endpoint = match request_endpoint(request) {
             Ok(endpoint) => endpoint,
             Err(err) => {
@@ -40,11 +131,26 @@ impl CoreService {
                 })]
             }
         };
+        // 핸드셰이크는 연결 맵 락 밖에서 수행해 다른 연결의 명령을 막지 않는다.
         match LiveAdapter::connect(&endpoint) {
-            Ok(adapter) => {
-                let id = unique_connection_id(&endpoint, self.next_connection_sequence);
-                self.next_connection_sequence = self.next_connection_sequence.saturating_add(1);
-                self.connections.insert(id.clone(), adapter);
+            Ok(mut adapter) => {
+                let sequence = self
+                    .next_connection_sequence
+                    .fetch_add(1, Ordering::Relaxed);
+                let id = unique_connection_id(&endpoint, sequence);
+                let session_id = adapter_session_id(&mut adapter);
+                self.lock_connections().insert(
+                    id.clone(),
+                    ServiceConnection {
+                        adapter: Arc::new(Mutex::new(adapter)),
+                        endpoint: endpoint.clone(),
+                        session_id,
+                        executing: Arc::new(Mutex::new(None)),
+                        statements: Arc::new(Mutex::new(StatementCache::new(
+                            STATEMENT_CACHE_CAPACITY,
+                        ))),
+                    },
+                );
                 vec![json!({
                     "event": "result",
                     "request_id": request.request_id,
@@ -65,13 +171,16 @@ impl CoreService {
         }
     }
 
-    fn connection_close(&mut self, request: &Request) -> Vec<Value> {
+    fn connection_close(&self, request: &Request) -> Vec<Value> {
         let connection_id = request
             .payload
             .get("connection_id")
             .and_then(Value::as_str)
             .unwrap_or("");
-        let removed = self.connections.remove(connection_id).is_some();
+        // 실행 중인 쿼리가 Arc 를 잡고 있으면 그 쿼리가 끝난 뒤에 실제 연결이 닫힌다.
+        self.lock_cursors()
+            .retain(|_, open| open.connection_id.as_deref() != Some(connection_id));
+        let removed = self.lock_connections().remove(connection_id).is_some();
         vec![json!({
             "event": "result",
             "request_id": request.request_id,
@@ -82,8 +191,183 @@ impl CoreService {
         })]
     }
 
-    fn query_execute(&mut self, request: &Request) -> Vec<Value> {
-        if let Some(connection_id) = request.payload.get("connection_id").and_then(Value::as_str) {
+    fn query_execute<F: FnMut(Value)>(&self, request: &Request, mut emit: F) {
+        let Some(connection_id) = request.payload.get("connection_id").and_then(Value::as_str)
+        else {
+            return emit_all_events(query_execute(request), emit);
+        };
+        let sql = request
+            .payload
+            .get("sql")
+            .and_then(Value::as_str)
+            .unwrap_or("")
+            .trim();
+        if sql.is_empty() {
+            return emit(error_event(
+                request,
+                "query.execute requires sql".to_string(),
+            ));
+        }
+        let connection = match self.stateful_connection(connection_id) {
+            Ok(connection) => connection,
+            Err(err) => return emit(error_event(request, err)),
+        };
+        let mut adapter = match connection.adapter.lock() {
+            Ok(adapter) => adapter,
+            Err(_) => {
+                return emit(error_event(
+                    request,
+                    format!("connection is unusable after a failed request: {connection_id}"),
+                ))
+            }
+        };
+        let _executing = ExecutingMark::new(&connection.executing, request);
+        let params = query_params(&request.payload);
+        let stream_rows = request
+            .payload
+            .get("stream_rows")
+            .and_then(Value::as_bool)
+            .unwrap_or(false);
+        let prepare = request
+            .payload
+            .get("prepare")
+            .and_then(Value::as_bool)
+            .unwrap_or(false);
+        if prepare && !stream_rows && !params.is_empty() {
+            if let Ok(mut statements) = connection.statements.lock() {
+                match execute_prepared_adapter(&mut adapter, &mut statements, sql, &params) {
+                    Ok(Some(prepared)) => {
+                        return emit_all_events(prepared_result_events(request, prepared), emit)
+                    }
+                    Ok(None) => {}
+                    Err(err) => return emit(error_event(request, err)),
+                }
+            }
+        }
+        let bound_sql = bind_query_params(sql, &params);
+        if stream_rows && query_returns_rows(&bound_sql) {
+            return stream_query_events(request, &mut adapter, &bound_sql, emit);
+        }
+        match execute_query_adapter(&mut adapter, &bound_sql) {
+            Ok(result) => emit_all_events(query_result_events(request, result), emit),
+            Err(err) => emit(error_event(request, err)),
+        }
+    }
+
+    fn query_execute_batch(&self, request: &Request) -> Vec<Value> {
+        let Some(connection_id) = request.payload.get("connection_id").and_then(Value::as_str)
+        else {
+            return query_execute_batch(request);
+        };
+        let plan = match plan_batch(&request.payload) {
+            Ok(plan) => plan,
+            Err(err) => return vec![error_event(request, err)],
+        };
+        let connection = match self.stateful_connection(connection_id) {
+            Ok(connection) => connection,
+            Err(err) => return vec![error_event(request, err)],
+        };
+        let Ok(mut adapter) = connection.adapter.lock() else {
+            return vec![error_event(
+                request,
+                format!("connection is unusable after a failed request: {connection_id}"),
+            )];
+        };
+        let _executing = ExecutingMark::new(&connection.executing, request);
+        let (transaction, stop_on_error) = batch_options(request);
+        match execute_batch_adapter(&mut adapter, &plan, transaction, stop_on_error) {
+            Ok(outcome) => batch_result_events(request, &plan, outcome),
+            Err(err) => vec![error_event(request, err)],
+        }
+    }
+
+    fn stateful_connection(&self, connection_id: &str) -> Result<ServiceConnection, String> {
+        if self.connection_has_open_cursor(connection_id) {
+            return Err(format!(
+                "connection has an open streaming cursor; fetch or close it first: {connection_id}"
+            ));
+        }
+        self.lock_connections()
+            .get(connection_id)
+            .cloned()
+            .ok_or_else(|| format!("unknown connection_id: {connection_id}"))
+    }
+
+    /// 연결에서 실행 중인 statement 를 서버 측에서 중단한다. 어댑터 락은 잡지 않는다.
+    ///
+    /// 어댑터를 잡고 실행 중인 요청이 있을 때만, 그 기록의 락을 잡은 채 보낸다. 연결이 쉬고
+    /// 있으면 아무것도 보내지 않고 `cancelled: false` 를 돌려준다.
+    fn query_cancel(&self, request: &Request) -> Vec<Value> {
+        let Some(connection_id) = request.payload.get("connection_id").and_then(Value::as_str)
+        else {
+            return if request.command == "job.cancel" {
+                job_cancel(request)
+            } else {
+                query_cancel(request)
+            };
+        };
+        let Some(connection) = self.lock_connections().get(connection_id).cloned() else {
+            return vec![error_event(
+                request,
+                format!("unknown connection_id: {connection_id}"),
+            )];
+        };
+        let Some(session_id) = connection.session_id else {
+            return vec![error_event(
+                request,
+                format!("server session id is unknown for connection: {connection_id}"),
+            )];
+        };
+        let executing = lock_executing(&connection.executing);
+        let Some(target_request_id) = executing.clone() else {
+            return vec![json!({
+                "event": "result",
+                "request_id": request.request_id,
+                "command": request.command,
+                "success": true,
+                "cancelled": false,
+                "connection_id": connection_id,
+                "session_id": session_id
+            })];
+        };
+        match cancel_session_query(&connection.endpoint, session_id) {
+            Ok(cancelled) => vec![json!({
+                "event": "result",
+                "request_id": request.request_id,
+                "command": request.command,
+                "success": true,
+                "cancelled": cancelled,
+                "cancelled_request_id": target_request_id,
+                "connection_id": connection_id,
+                "session_id": session_id
+            })],
+            Err(err) => vec![error_event(
+                request,
+                redact_endpoint_secret(&err, &connection.endpoint),
+            )],
+        }
+    }
+
+    fn cursor_open(&self, request: &Request) -> Vec<Value> {
+        let batch_size = request
+            .payload
+            .get("row_batch_size")
+            .and_then(Value::as_u64)
+            .unwrap_or(500)
+            .max(1) as usize;
+        let opened = if let Some(rows) = request.payload.get("rows") {
+            // 메모리 행 모드: 라이브 DB 없이 커서 계약(fetch/close/역압)을 검증한다.
+            ServerCursor::open_memory(
+                memory_columns(request, rows),
+                rows.as_array().cloned().unwrap_or_default(),
+                batch_size,
+            )
+        } else {
+            let connection_id = request
+                .payload
+                .get("connection_id")
+                .and_then(Value::as_str)
+                .unwrap_or("");
             let sql = request
                 .payload
                 .get("sql")
@@ -91,34 +375,207 @@ impl CoreService {
                 .unwrap_or("")
                 .trim();
             if sql.is_empty() {
-                return vec![json!({
-                    "event": "error",
+                return vec![error_event(request, "cursor.open requires sql".to_string())];
+            }
+            let bound_sql = bind_query_params(sql, &query_params(&request.payload));
+            if !query_returns_rows(&bound_sql) {
+                return vec![error_event(
+                    request,
+                    "cursor.open only accepts row-returning statements".to_string(),
+                )];
+            }
+            self.stateful_connection(connection_id)
+                .and_then(|connection| {
+                    let cancel_target = connection
+                        .session_id
+                        .map(|session_id| (connection.endpoint.clone(), session_id));
+                    ServerCursor::open_live(
+                        connection_id.to_string(),
+                        connection.adapter,
+                        bound_sql,
+                        batch_size,
+                        cancel_target,
+                    )
+                })
+        };
+        match opened {
+            Ok(cursor) => {
+                let sequence = self.next_cursor_sequence.fetch_add(1, Ordering::Relaxed);
+                let cursor_id = format!("cursor-{sequence}");
+                let columns = cursor.columns.clone();
+                let open = SharedCursor {
+                    connection_id: cursor.connection_id.clone(),
+                    cursor: Arc::new(Mutex::new(cursor)),
+                };
+                self.lock_cursors().insert(cursor_id.clone(), open);
+                vec![json!({
+                    "event": "result",
                     "request_id": request.request_id,
-                    "message": "query.execute requires sql"
-                })];
+                    "command": "cursor.open",
+                    "success": true,
+                    "cursor_id": cursor_id,
+                    "columns": columns
+                })]
             }
-            let Some(adapter) = self.connections.get_mut(connection_id) else {
-                return vec![json!({
-                    "event": "error",
+            Err(err) => vec![error_event(request, err)],
+        }
+    }
+
+    fn cursor_fetch(&self, request: &Request) -> Vec<Value> {
+        let cursor_id = request
+            .payload
+            .get("cursor_id")
+            .and_then(Value::as_str)
+            .unwrap_or("");
+        let Some(open) = self.lock_cursors().get(cursor_id).cloned() else {
+            return vec![error_event(
+                request,
+                format!("unknown cursor_id: {cursor_id}"),
+            )];
+        };
+        let mut cursor = open
+            .cursor
+            .lock()
+            .unwrap_or_else(|poisoned| poisoned.into_inner());
+        let fetched = cursor.next_batch();
+        let done = cursor.is_done();
+        if done {
+            // 끝난 커서는 바로 등록 해제해 연결을 다른 명령에 돌려준다.
+            self.lock_cursors().remove(cursor_id);
+        }
+        let rows = match fetched {
+            Ok(rows) => rows.unwrap_or_default(),
+            Err(err) => return vec![error_event(request, err)],
+        };
+        let mut result = json!({
+            "event": "result",
+            "request_id": request.request_id,
+            "command": "cursor.fetch",
+            "success": true,
+            "cursor_id": cursor_id,
+            "done": done,
+            "columns": cursor.columns,
+            "rows_fetched": cursor.rows_fetched
+        });
+        if columnar_requested(request) {
+            let values: Vec<Value> = rows
+                .into_iter()
+                .map(|row| row_values(&cursor.columns, row))
+                .collect();
+            result["result_format"] = json!("columnar");
+            result["rows"] = json!([]);
+            result["values"] = Value::Array(values);
+        } else {
+            result["rows"] = Value::Array(rows);
+        }
+        vec![result]
+    }
+
+    fn cursor_close(&self, request: &Request) -> Vec<Value> {
+        let cursor_id = request
+            .payload
+            .get("cursor_id")
+            .and_then(Value::as_str)
+            .unwrap_or("");
+        let removed = self.lock_cursors().remove(cursor_id).is_some();
+        vec![json!({
+            "event": "result",
+            "request_id": request.request_id,
+            "command": "cursor.close",
+            "success": true,
+            "closed": removed,
+            "cursor_id": cursor_id
+        })]
+    }
+}
+
+fn error_event(request: &Request, message: String) -> Value {
+    json!({
+        "event": "error",
+        "request_id": request.request_id,
+        "message": message
+    })
+}
+
+/// 상태 연결의 `stream_rows` 실행: 드라이버에서 읽는 대로 row_batch 를 내보낸다.
+/// Python 리더 스레드가 이벤트를 받는 즉시 큐에 쌓으므로 배압은 없다. 결과 크기를
+/// 제한해야 하면 `cursor.open`/`cursor.fetch` 를 쓴다.
+fn stream_query_events<F: FnMut(Value)>(
+    request: &Request,
+    adapter: &mut LiveAdapter,
+    sql: &str,
+    mut emit: F,
+) {
+    let batch_size = request
+        .payload
+        .get("row_batch_size")
+        .and_then(Value::as_u64)
+        .unwrap_or(500)
+        .max(1) as usize;
+    let columnar = columnar_requested(request);
+    let mut columns: Vec<String> = Vec::new();
+    let mut batch_index = 0usize;
+    let outcome = stream_query_adapter(adapter, sql, batch_size, |item| {
+        match item {
+            QueryStreamItem::Columns(names) => {
+                columns = names;
+                emit(json!({
+                    "event": "columns",
                     "request_id": request.request_id,
-                    "message": format!("unknown connection_id: {connection_id}")
-                })];
-            };
-            let params = query_params(&request.payload);
-            let bound_sql = bind_query_params(sql, &params);
-            return match execute_query_adapter(adapter, &bound_sql) {
-                Ok(result) => query_result_events(request, result),
-                Err(err) => vec![json!({
-                    "event": "error",
+                    "command": "query.execute",
+                    "columns": columns.clone()
+                }));
+            }
+            QueryStreamItem::Rows(rows) => {
+                let mut event = json!({
+                    "event": "row_batch",
                     "request_id": request.request_id,
-                    "message": err
-                })],
-            };
+                    "command": "query.execute",
+                    "batch_index": batch_index
+                });
+                if columnar {
+                    let values: Vec<Value> = rows
+                        .into_iter()
+                        .map(|row| row_values(&columns, row))
+                        .collect();
+                    event["result_format"] = json!("columnar");
+                    event["values"] = Value::Array(values);
+                } else {
+                    event["rows"] = Value::Array(rows);
+                }
+                emit(event);
+                batch_index += 1;
+            }
         }
-        query_execute(request)
+        true
+    });
+    match outcome {
+        Ok(streamed) => emit(json!({
+            "event": "result",
+            "request_id": request.request_id,
+            "command": "query.execute",
+            "success": true,
+            "rows": [],
+            "columns": columns,
+            "rows_streamed": streamed,
+            "rows_affected": 0
+        })),
+        Err(err) => emit(error_event(request, err)),
     }
 }
 
+/// stdin 루프가 이 요청을 워커 스레드로 넘겨 동시에 처리해도 되는지 판단한다.
+///
+/// request_id 가 없는 요청은 응답을 구분할 수 없으므로 도착 순서대로 인라인 처리하고,
+/// 서비스 수명주기 명령(hello/shutdown)도 순서를 지키도록 인라인으로 남긴다.
+pub fn dispatches_concurrently(request: &Request) -> bool {
+    request.request_id.is_some()
+        && !matches!(
+            request.command.as_str(),
+            "service.hello" | "service.shutdown"
+        )
+}
+
 impl Default for CoreService {
     fn default() -> Self {
         Self::new()
@@ -162,6 +619,7 @@ pub fn handle_request_streaming<F: FnMut(Value)>(request: Request, mut emit: F)
         "schema.inspect" => emit_all_events(alias_events(&request, "inspect"), emit),
         "schema.diff" => emit_all_events(schema_diff(&request), emit),
         "query.execute" => emit_all_events(query_execute(&request), emit),
+        "query.execute_batch" => emit_all_events(query_execute_batch(&request), emit),
         "query.cancel" => emit_all_events(query_cancel(&request), emit),
         "dump.run" => dump_run_streaming(&request, emit),
         "dump.import" => dump_import_streaming(&request, emit),
@@ -253,6 +711,10 @@ fn service_hello(request: &Request) -> Vec<Value> {
         "success": true,
         "service": "tunnelforge-core",
         "protocol_version": 1,
+        "multiplexed": true,
+        "result_formats": ["rows", "columnar"],
+        "prepared_statements": true,
+        "statement_cache_capacity": STATEMENT_CACHE_CAPACITY,
         "capabilities": [
             "connection.open",
             "connection.close",
@@ -261,7 +723,11 @@ fn service_hello(request: &Request) -> Vec<Value> {
             "schema.inspect",
             "schema.diff",
             "query.execute",
+            "query.execute_batch",
             "query.cancel",
+            "cursor.open",
+            "cursor.fetch",
+            "cursor.close",
             "dump.run",
             "dump.import",
             "migration.plan",
@@ -474,20 +940,15 @@ fn schema_diff(request: &Request) -> Vec<Value> {
 
 fn query_execute(request: &Request) -> Vec<Value> {
     if let Some(rows) = request.payload.get("rows") {
-        let columns = request
-            .payload
-            .get("columns")
-            .cloned()
-            .unwrap_or_else(|| json!(memory_test_columns_from_rows(rows)));
-        return vec![json!({
-            "event": "result",
-            "request_id": request.request_id,
-            "command": "query.execute",
-            "success": true,
-            "rows": rows,
-            "columns": columns,
-            "rows_affected": 0
-        })];
+        // 메모리 행 모드: 라이브 DB 없이 결과 인코딩/스트리밍 경로를 계약 테스트와 벤치마크로 검증한다.
+        return query_result_events(
+            request,
+            QueryExecutionResult {
+                rows: rows.as_array().cloned().unwrap_or_default(),
+                columns: memory_columns(request, rows),
+                rows_affected: 0,
+            },
+        );
     }
 
     let sql = request
@@ -526,6 +987,77 @@ fn query_execute(request: &Request) -> Vec<Value> {
     }
 }
 
+fn query_execute_batch(request: &Request) -> Vec<Value> {
+    let plan = match plan_batch(&request.payload) {
+        Ok(plan) => plan,
+        Err(err) => return vec![error_event(request, err)],
+    };
+    let endpoint = match request_endpoint(request) {
+        Ok(endpoint) => endpoint,
+        Err(err) => return vec![error_event(request, err)],
+    };
+    let (transaction, stop_on_error) = batch_options(request);
+    let outcome = LiveAdapter::connect(&endpoint).and_then(|mut adapter| {
+        execute_batch_adapter(&mut adapter, &plan, transaction, stop_on_error)
+    });
+    match outcome {
+        Ok(outcome) => batch_result_events(request, &plan, outcome),
+        Err(err) => vec![error_event(
+            request,
+            redact_endpoint_secret(&err, &endpoint),
+        )],
+    }
+}
+
+/// (transaction, stop_on_error). 기본값은 한 트랜잭션으로 묶고 첫 오류에서 멈추는 것이다.
+fn batch_options(request: &Request) -> (bool, bool) {
+    let flag = |key: &str| {
+        request
+            .payload
+            .get(key)
+            .and_then(Value::as_bool)
+            .unwrap_or(true)
+    };
+    (flag("transaction"), flag("stop_on_error"))
+}
+
+fn batch_result_events(request: &Request, plan: &BatchPlan, outcome: BatchOutcome) -> Vec<Value> {
+    let total_rows_affected: u64 = outcome.rows_affected.iter().flatten().sum();
+    let errors: Vec<Value> = outcome
+        .errors
+        .iter()
+        .map(|(index, message)| json!({"index": index, "message": message}))
+        .collect();
+    vec![json!({
+        "event": "result",
+        "request_id": request.request_id,
+        "command": "query.execute_batch",
+        "success": errors.is_empty(),
+        "statements": plan.total,
+        "server_statements": plan.statements.len(),
+        "rewritten": plan.rewritten(),
+        "committed": outcome.committed,
+        "rows_affected": outcome.rows_affected,
+        "total_rows_affected": total_rows_affected,
+        "errors": errors
+    })]
+}
+
+fn memory_columns(request: &Request, rows: &Value) -> Vec<String> {
+    request
+        .payload
+        .get("columns")
+        .and_then(Value::as_array)
+        .map(|items| {
+            items
+                .iter()
+                .filter_map(Value::as_str)
+                .map(ToString::to_string)
+                .collect()
+        })
+        .unwrap_or_else(|| memory_test_columns_from_rows(rows))
+}
+
 fn memory_test_columns_from_rows(rows: &Value) -> Vec<String> {
     rows.as_array()
         .and_then(|items| items.first())
@@ -540,13 +1072,67 @@ pub(crate) struct QueryExecutionResult {
     pub(crate) rows_affected: u64,
 }
 
+/// `result_format: "columnar"` 요청이면 컬럼 이름은 한 번만 보내고 행은 컬럼 순서의
+/// 값 배열(`values`)로 보낸다. 행마다 반복되는 키 문자열과 Python 쪽 dict 생성을 없앤다.
+fn columnar_requested(request: &Request) -> bool {
+    request.payload.get("result_format").and_then(Value::as_str) == Some("columnar")
+}
+
+fn row_values(columns: &[String], row: Value) -> Value {
+    match row {
+        Value::Object(mut object) => Value::Array(
+            columns
+                .iter()
+                .map(|column| object.remove(column).unwrap_or(Value::Null))
+                .collect(),
+        ),
+        other => other,
+    }
+}
+
+/// prepared 실행 결과. 결과 이벤트에 statement id 와 캐시 적중 여부를 덧붙인다.
+fn prepared_result_events(request: &Request, prepared: PreparedExecution) -> Vec<Value> {
+    let mut events = query_result_events(request, prepared.result);
+    for event in &mut events {
+        if event.get("event") == Some(&json!("result")) {
+            event["prepared"] = json!(true);
+            event["statement_id"] = json!(prepared.statement_id);
+            event["statement_cache_hit"] = json!(prepared.cache_hit);
+        }
+    }
+    events
+}
+
 fn query_result_events(request: &Request, result: QueryExecutionResult) -> Vec<Value> {
     let stream_rows = request
         .payload
         .get("stream_rows")
         .and_then(Value::as_bool)
         .unwrap_or(false);
+    let columnar = columnar_requested(request);
     if !stream_rows {
+        if columnar {
+            let QueryExecutionResult {
+                rows,
+                columns,
+                rows_affected,
+            } = result;
+            let values: Vec<Value> = rows
+                .into_iter()
+                .map(|row| row_values(&columns, row))
+                .collect();
+            return vec![json!({
+                "event": "result",
+                "request_id": request.request_id,
+                "command": "query.execute",
+                "success": true,
+                "result_format": "columnar",
+                "rows": [],
+                "values": values,
+                "columns": columns,
+                "rows_affected": rows_affected
+            })];
+        }
         return vec![json!({
             "event": "result",
             "request_id": request.request_id,
@@ -572,6 +1158,23 @@ fn query_result_events(request: &Request, result: QueryExecutionResult) -> Vec<V
         "columns": result.columns.clone()
     })];
     for (index, chunk) in result.rows.chunks(batch_size).enumerate() {
+        if columnar {
+            let values: Vec<Value> = chunk
+                .iter()
+                .cloned()
+                .map(|row| row_values(&result.columns, row))
+                .collect();
+            events.push(json!({
+                "event": "row_batch",
+                "request_id": request.request_id,
+                "command": "query.execute",
+                "batch_index": index,
+                "result_format": "columnar",
+                "values": values,
+                "total": total
+            }));
+            continue;
+        }
         events.push(json!({
             "event": "row_batch",
             "request_id": request.request_id,
@@ -601,7 +1204,7 @@ fn query_cancel(request: &Request) -> Vec<Value> {
         "command": "query.cancel",
         "success": true,
         "cancelled": false,
-        "message": "No asynchronous query is registered for this JSONL worker",
+        "message": "query.cancel requires the connection_id of a stateful connection",
         "job_id": request.payload.get("job_id").cloned().unwrap_or(Value::Null)
     })]
 }
@@ -636,6 +1239,36 @@ mod tests {
     
     use crate::adapters::test_support::{schema};
 
+    #[test]
+    fn core_service_is_shareable_across_request_threads() {
+        fn assert_send_sync<T: Send + Sync>() {}
+        assert_send_sync::<CoreService>();
+    }
+
+    #[test]
+    fn only_identified_non_lifecycle_requests_dispatch_concurrently() {
+        let request = |command: &str, request_id: Option<&str>| Request {
+            command: command.to_string(),
+            request_id: request_id.map(str::to_string),
+            payload: json!({}),
+        };
+
+        assert!(dispatches_concurrently(&request(
+            "query.execute",
+            Some("q-1")
+        )));
+        assert!(dispatches_concurrently(&request("dump.run", Some("d-1"))));
+        assert!(!dispatches_concurrently(&request("query.execute", None)));
+        assert!(!dispatches_concurrently(&request(
+            "service.hello",
+            Some("h-1")
+        )));
+        assert!(!dispatches_concurrently(&request(
+            "service.shutdown",
+            Some("s-1")
+        )));
+    }
+
     #[test]
     fn service_hello_advertises_core_protocol() {
         let result = handle_request(Request {
@@ -670,6 +1303,11 @@ mod tests {
             .as_array()
             .unwrap()
             .contains(&json!("oneclick.derive_charset_contracts")));
+        assert!(result["result_formats"]
+            .as_array()
+            .unwrap()
+            .contains(&json!("columnar")));
+        assert_eq!(result["prepared_statements"], true);
     }
 
     #[test]
@@ -1083,6 +1721,203 @@ mod tests {
         assert_eq!(events[3]["columns"], json!(["id"]));
     }
 
+    #[test]
+    fn query_result_columnar_sends_columns_once_and_value_arrays() {
+        let events = handle_request(Request {
+            command: "query.execute".to_string(),
+            request_id: Some("query-1".to_string()),
+            payload: json!({
+                "rows": [{"id": 1, "name": "alpha"}, {"name": "beta", "id": 2}],
+                "columns": ["id", "name"],
+                "result_format": "columnar"
+            }),
+        });
+
+        assert_eq!(events.len(), 1);
+        assert_eq!(events[0]["result_format"], "columnar");
+        assert_eq!(events[0]["columns"], json!(["id", "name"]));
+        assert_eq!(events[0]["values"], json!([[1, "alpha"], [2, "beta"]]));
+        assert_eq!(events[0]["rows"], json!([]));
+    }
+
+    #[test]
+    fn query_result_columnar_streams_value_batches() {
+        let events = query_result_events(
+            &Request {
+                command: "query.execute".to_string(),
+                request_id: Some("query-1".to_string()),
+                payload: json!({
+                    "stream_rows": true,
+                    "row_batch_size": 2,
+                    "result_format": "columnar"
+                }),
+            },
+            QueryExecutionResult {
+                rows: vec![json!({"id": 1}), json!({"id": 2}), json!({})],
+                columns: vec!["id".to_string()],
+                rows_affected: 0,
+            },
+        );
+
+        assert_eq!(events[1]["values"], json!([[1], [2]]));
+        assert!(events[1].get("rows").is_none());
+        assert_eq!(events[2]["values"], json!([[null]]));
+        assert_eq!(events[3]["rows_streamed"], 3);
+    }
+
+    fn cursor_request(service: &CoreService, command: &str, payload: Value) -> Value {
+        let mut events = Vec::new();
+        service.handle_request_streaming(
+            Request {
+                command: command.to_string(),
+                request_id: Some(format!("{command}-1")),
+                payload,
+            },
+            |event| events.push(event),
+        );
+        events.pop().unwrap()
+    }
+
+    #[test]
+    fn cursor_fetch_pulls_memory_rows_one_batch_at_a_time() {
+        let service = CoreService::new();
+        let opened = cursor_request(
+            &service,
+            "cursor.open",
+            json!({"rows": [{"id": 1}, {"id": 2}, {"id": 3}], "row_batch_size": 2}),
+        );
+        assert_eq!(opened["columns"], json!(["id"]));
+        let cursor_id = opened["cursor_id"].as_str().unwrap().to_string();
+
+        let first = cursor_request(&service, "cursor.fetch", json!({"cursor_id": cursor_id}));
+        assert_eq!(first["rows"], json!([{"id": 1}, {"id": 2}]));
+        assert_eq!(first["done"], false);
+
+        let second = cursor_request(
+            &service,
+            "cursor.fetch",
+            json!({"cursor_id": cursor_id, "result_format": "columnar"}),
+        );
+        assert_eq!(second["values"], json!([[3]]));
+        assert_eq!(second["rows_fetched"], 3);
+
+        let last = cursor_request(&service, "cursor.fetch", json!({"cursor_id": cursor_id}));
+        assert_eq!(last["rows"], json!([]));
+        assert_eq!(last["done"], true);
+
+        let gone = cursor_request(&service, "cursor.fetch", json!({"cursor_id": cursor_id}));
+        assert_eq!(gone["event"], "error");
+    }
+
+    #[test]
+    fn cursor_close_releases_a_partially_read_cursor() {
+        let service = CoreService::new();
+        let rows: Vec<Value> = (0..100).map(|id| json!({"id": id})).collect();
+        let opened = cursor_request(
+            &service,
+            "cursor.open",
+            json!({"rows": rows, "row_batch_size": 1}),
+        );
+        let cursor_id = opened["cursor_id"].as_str().unwrap().to_string();
+        cursor_request(&service, "cursor.fetch", json!({"cursor_id": cursor_id}));
+
+        let closed = cursor_request(&service, "cursor.close", json!({"cursor_id": cursor_id}));
+        assert_eq!(closed["closed"], true);
+        let gone = cursor_request(&service, "cursor.fetch", json!({"cursor_id": cursor_id}));
+        assert!(gone["message"]
+            .as_str()
+            .unwrap()
+            .contains("unknown cursor_id"));
+    }
+
+    #[test]
+    fn query_cancel_targets_the_session_of_a_stateful_connection() {
+        let service = CoreService::new();
+        let unknown = cursor_request(
+            &service,
+            "query.cancel",
+            json!({"connection_id": "conn-missing"}),
+        );
+        assert_eq!(unknown["event"], "error");
+        assert!(unknown["message"]
+            .as_str()
+            .unwrap()
+            .contains("unknown connection_id"));
+
+        let without_connection = cursor_request(&service, "query.cancel", json!({}));
+        assert_eq!(without_connection["event"], "result");
+        assert_eq!(without_connection["cancelled"], false);
+    }
+
+    #[test]
+    fn executing_mark_records_the_request_only_while_it_is_alive() {
+        let slot: ExecutingRequest = Arc::new(Mutex::new(None));
+        let request = Request {
+            command: "query.execute".to_string(),
+            request_id: Some("req-7".to_string()),
+            payload: json!({}),
+        };
+        {
+            let _mark = ExecutingMark::new(&slot, &request);
+            assert_eq!(lock_executing(&slot).as_deref(), Some("req-7"));
+        }
+        assert_eq!(*lock_executing(&slot), None);
+    }
+
+    #[test]
+    fn query_execute_batch_validates_payload_and_connection() {
+        let service = CoreService::new();
+        let empty = cursor_request(
+            &service,
+            "query.execute_batch",
+            json!({"connection_id": "conn-1"}),
+        );
+        assert!(empty["message"]
+            .as_str()
+            .unwrap()
+            .contains("requires sql or statements"));
+
+        let unknown = cursor_request(
+            &service,
+            "query.execute_batch",
+            json!({"connection_id": "conn-missing", "statements": ["DELETE FROM t"]}),
+        );
+        assert_eq!(unknown["event"], "error");
+        assert!(unknown["message"]
+            .as_str()
+            .unwrap()
+            .contains("unknown connection_id"));
+    }
+
+    #[test]
+    fn prepared_result_carries_statement_id_and_cache_hit() {
+        let events = prepared_result_events(
+            &Request {
+                command: "query.execute".to_string(),
+                request_id: Some("query-1".to_string()),
+                payload: json!({}),
+            },
+            PreparedExecution {
+                result: QueryExecutionResult {
+                    rows: vec![json!({"id": "1"})],
+                    columns: vec!["id".to_string()],
+                    rows_affected: 0,
+                },
+                statement_id: statement_id("SELECT * FROM t WHERE id = ?"),
+                cache_hit: true,
+            },
+        );
+
+        assert_eq!(events.len(), 1);
+        assert_eq!(events[0]["rows"], json!([{"id": "1"}]));
+        assert_eq!(events[0]["prepared"], true);
+        assert_eq!(events[0]["statement_cache_hit"], true);
+        assert!(events[0]["statement_id"]
+            .as_str()
+            .unwrap()
+            .starts_with("stmt-"));
+    }
+
     #[test]
     fn query_result_includes_non_row_rows_affected() {
         let events = query_result_events(
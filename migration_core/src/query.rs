@@ -1,8 +1,8 @@
 use serde_json::Value;
 use sha2::{Digest, Sha256};
 
-use mysql::prelude::Queryable;
 use crate::*;
+use mysql::prelude::Queryable;
 
 pub(crate) fn request_endpoint(request: &Request) -> Result<Endpoint, String> {
     for key in ["connection", "endpoint", "source", "target"] {
@@ -162,6 +162,151 @@ pub(crate) fn execute_query_adapter(
     }
 }
 
+/// 연결의 서버 세션 id (MySQL 스레드 id / PostgreSQL backend pid). 취소 대상을 가리킨다.
+pub(crate) fn adapter_session_id(adapter: &mut LiveAdapter) -> Option<u64> {
+    match adapter {
+        LiveAdapter::MySql(conn) => Some(u64::from(conn.connection_id())),
+        LiveAdapter::PostgreSql(client) => client
+            .query_one("SELECT pg_backend_pid()", &[])
+            .ok()
+            .and_then(|row| u64::try_from(row.get::<_, i32>(0)).ok()),
+    }
+}
+
+/// 별도 side connection 으로 세션의 실행 중인 statement 를 중단시킨다.
+///
+/// 실행 중인 쿼리가 어댑터 락을 잡고 있으므로 같은 연결로는 보낼 수 없다. MySQL 은
+/// `KILL QUERY`(연결은 유지), PostgreSQL 은 `pg_cancel_backend` 를 사용한다.
+pub(crate) fn cancel_session_query(endpoint: &Endpoint, session_id: u64) -> Result<bool, String> {
+    let mut side = LiveAdapter::connect(endpoint)?;
+    match &mut side {
+        LiveAdapter::MySql(conn) => {
+            conn.query_drop(format!("KILL QUERY {session_id}"))
+                .map_err(|err| format!("mysql cancel error: {err}"))?;
+            Ok(true)
+        }
+        LiveAdapter::PostgreSql(client) => {
+            let pid = i32::try_from(session_id)
+                .map_err(|_| format!("invalid postgresql backend pid: {session_id}"))?;
+            let row = client
+                .query_one("SELECT pg_cancel_backend($1)", &[&pid])
+                .map_err(|err| format!("postgresql cancel error: {err}"))?;
+            Ok(row.get::<_, bool>(0))
+        }
+    }
+}
+
+/// 스트리밍 실행 중 어댑터가 sink 로 넘기는 단위. 컬럼이 항상 먼저 한 번 온다.
+pub(crate) enum QueryStreamItem {
+    Columns(Vec<String>),
+    Rows(Vec<Value>),
+}
+
+/// 행을 반환하는 SQL 을 드라이버에서 점진적으로 읽어 `batch_size` 행 단위로 `sink` 에 넘긴다.
+///
+/// 전체 결과를 메모리에 모으지 않는다. `sink` 가 블로킹(파이프/제한 채널)하면 드라이버
+/// 읽기도 멈추므로 그대로 역압이 걸리고, `false` 를 돌려주면 더 넘기지 않는다.
+/// 반환값은 sink 에 넘긴 행 수.
+///
+/// 중단해도 서버가 바로 멈추지는 않는다. MySQL 은 결과를 drop 할 때 남은 행을 끝까지 읽으므로
+/// 서버 쪽 전송을 끊으려면 호출자가 먼저 `cancel_session_query` 를 보내야 한다
+/// (`ServerCursor` 참고). PostgreSQL 은 트랜잭션 안의 포털에서 `batch_size` 행씩 가져오므로
+/// 중단하면 포털을 닫고 롤백할 뿐 나머지 행은 전송되지 않는다.
+pub(crate) fn stream_query_adapter<F: FnMut(QueryStreamItem) -> bool>(
+    adapter: &mut LiveAdapter,
+    sql: &str,
+    batch_size: usize,
+    mut sink: F,
+) -> Result<u64, String> {
+    let batch_size = batch_size.max(1);
+    let mut streamed = 0u64;
+    let mut batch = Vec::with_capacity(batch_size);
+    match adapter {
+        LiveAdapter::MySql(conn) => {
+            // query_iter 는 텍스트 프로토콜 결과를 버퍼링하지 않고 소켓에서 한 행씩 읽는다.
+            let result = conn
+                .query_iter(sql)
+                .map_err(|err| format!("mysql query error: {err}"))?;
+            let columns: Vec<String> = result
+                .columns()
+                .as_ref()
+                .iter()
+                .map(|column| column.name_str().to_string())
+                .collect();
+            if !sink(QueryStreamItem::Columns(columns.clone())) {
+                return Ok(0);
+            }
+            for row in result {
+                let row = row.map_err(|err| format!("mysql query error: {err}"))?;
+                batch.push(mysql_row_to_json(&columns, row));
+                if batch.len() == batch_size {
+                    streamed += batch.len() as u64;
+                    let full = std::mem::replace(&mut batch, Vec::with_capacity(batch_size));
+                    if !sink(QueryStreamItem::Rows(full)) {
+                        return Ok(streamed);
+                    }
+                }
+            }
+        }
+        LiveAdapter::PostgreSql(client) => {
+            let trimmed = sql.trim().trim_end_matches(';');
+            let statement = client
+                .prepare(trimmed)
+                .map_err(|err| format!("postgresql query error: {err}"))?;
+            let columns: Vec<String> = statement
+                .columns()
+                .iter()
+                .map(|column| column.name().to_string())
+                .collect();
+            if !sink(QueryStreamItem::Columns(columns)) {
+                return Ok(0);
+            }
+            let wrapped = format!("SELECT row_to_json(_tf_row)::text FROM ({trimmed}) AS _tf_row");
+            // 포털은 트랜잭션 안에서만 열린다. 조기 종료로 drop 되면 롤백된다.
+            let mut transaction = client
+                .transaction()
+                .map_err(|err| format!("postgresql query error: {err}"))?;
+            let portal = transaction
+                .bind(wrapped.as_str(), &[])
+                .map_err(|err| format!("postgresql query error: {err}"))?;
+            let max_rows = i32::try_from(batch_size).unwrap_or(i32::MAX);
+            loop {
+                let rows = transaction
+                    .query_portal(&portal, max_rows)
+                    .map_err(|err| format!("postgresql query error: {err}"))?;
+                let last = rows.len() < batch_size;
+                if rows.is_empty() {
+                    break;
+                }
+                let full: Vec<Value> = rows
+                    .iter()
+                    .map(|row| {
+                        let text: Option<String> = row.get(0);
+                        text.and_then(|item| serde_json::from_str::<Value>(&item).ok())
+                            .unwrap_or(Value::Null)
+                    })
+                    .collect();
+                streamed += full.len() as u64;
+                if !sink(QueryStreamItem::Rows(full)) {
+                    return Ok(streamed);
+                }
+                if last {
+                    break;
+                }
+            }
+            drop(portal);
+            transaction
+                .commit()
+                .map_err(|err| format!("postgresql query error: {err}"))?;
+        }
+    }
+    if !batch.is_empty() {
+        streamed += batch.len() as u64;
+        sink(QueryStreamItem::Rows(batch));
+    }
+    Ok(streamed)
+}
+
 /// SQL 주석 스캐너: `bytes[i]` 에서 시작하는 주석을 감지하면 그 주석 토큰 바로 다음
 /// 인덱스를 반환하고, 주석 시작이 아니면 `None` 을 반환한다.
 ///
@@ -227,7 +372,7 @@ fn leading_sql_keyword(sql: &str) -> String {
     text[..end].to_ascii_lowercase()
 }
 
-fn query_returns_rows(sql: &str) -> bool {
+pub(crate) fn query_returns_rows(sql: &str) -> bool {
     let keyword = leading_sql_keyword(sql);
     ["select", "with", "show", "desc", "describe", "explain", "call", "values", "table"]
         .contains(&keyword.as_str())
@@ -324,7 +469,7 @@ mod tests {
 
     #[test]
     fn core_service_reports_unknown_connection_for_stateful_query() {
-        let mut service = CoreService::new();
+        let service = CoreService::new();
         let mut events = Vec::new();
         service.handle_request_streaming(
             Request {
@@ -0,0 +1,506 @@
+use serde_json::{Map, Value};
+use sha2::{Digest, Sha256};
+use std::collections::HashMap;
+
+use mysql::prelude::Queryable;
+use postgres::types::{Kind, ToSql, Type};
+
+use crate::*;
+
+/// 상태 유지 연결 하나가 들고 있는 prepared statement 수.
+/// MySQL 드라이버의 statement 캐시도 같은 크기로 맞춘다(`mysql_opts`).
+pub(crate) const STATEMENT_CACHE_CAPACITY: usize = 64;
+
+/// 캐시된 서버 측 statement.
+///
+/// MySQL statement 는 드라이버가 연결별 LRU 로 보관하므로(`prep` 이 캐시를 먼저 본다)
+/// 여기서는 키만 추적한다. 드라이버가 evict 한 statement 를 닫으므로 핸들을 따로 들고 있으면
+/// 닫힌 id 를 재사용할 수 있다.
+#[derive(Clone)]
+pub(crate) enum PreparedStatement {
+    MySql,
+    PostgreSql {
+        statement: postgres::Statement,
+        columns: Vec<String>,
+        returns_rows: bool,
+    },
+}
+
+/// statement id(정규화된 SQL 의 해시)별 LRU 캐시. evict 된 PostgreSQL statement 는 drop 될 때
+/// 서버에 Close 를 보낸다.
+pub(crate) struct StatementCache<T = PreparedStatement> {
+    capacity: usize,
+    tick: u64,
+    entries: HashMap<String, (u64, T)>,
+    pub(crate) hits: u64,
+    pub(crate) misses: u64,
+}
+
+impl<T: Clone> StatementCache<T> {
+    pub(crate) fn new(capacity: usize) -> Self {
+        Self {
+            capacity: capacity.max(1),
+            tick: 0,
+            entries: HashMap::new(),
+            hits: 0,
+            misses: 0,
+        }
+    }
+
+    pub(crate) fn len(&self) -> usize {
+        self.entries.len()
+    }
+
+    /// 캐시된 항목을 최근 사용으로 표시하고 돌려준다.
+    pub(crate) fn get(&mut self, key: &str) -> Option<T> {
+        self.tick += 1;
+        let tick = self.tick;
+        match self.entries.get_mut(key) {
+            Some(entry) => {
+                entry.0 = tick;
+                self.hits += 1;
+                Some(entry.1.clone())
+            }
+            None => {
+                self.misses += 1;
+                None
+            }
+        }
+    }
+
+    /// 항목을 넣고, 용량을 넘으면 가장 오래 쓰지 않은 항목을 꺼내 돌려준다.
+    pub(crate) fn insert(&mut self, key: String, value: T) -> Option<T> {
+        self.tick += 1;
+        self.entries.insert(key, (self.tick, value));
+        if self.entries.len() <= self.capacity {
+            return None;
+        }
+        let oldest = self
+            .entries
+            .iter()
+            .min_by_key(|(_, (last_used, _))| *last_used)
+            .map(|(key, _)| key.clone())?;
+        self.entries.remove(&oldest).map(|(_, value)| value)
+    }
+}
+
+pub(crate) fn statement_id(sql: &str) -> String {
+    format!("stmt-{}", hex::encode(&Sha256::digest(sql.as_bytes())[..8]))
+}
+
+/// `%s` placeholder 를 서버 측 placeholder(MySQL `?`, PostgreSQL `$n`)로 바꾸고 그 수를 돌려준다.
+/// 따옴표로 감싼 문자열/식별자와 주석 안의 `%s` 는 그대로 둔다.
+pub(crate) fn server_placeholder_sql(sql: &str, postgres: bool) -> (String, usize) {
+    let bytes = sql.as_bytes();
+    let mut rendered = String::with_capacity(sql.len());
+    let mut count = 0;
+    let mut copied = 0;
+    let mut index = 0;
+    while index < bytes.len() {
+        match bytes[index] {
+            quote @ (b'\'' | b'"' | b'`') => {
+                index += 1;
+                while index < bytes.len() {
+                    if bytes[index] == b'\\' && quote == b'\'' && !postgres {
+                        index += 2;
+                        continue;
+                    }
+                    if bytes[index] == quote {
+                        if bytes.get(index + 1) == Some(&quote) {
+                            index += 2;
+                            continue;
+                        }
+                        break;
+                    }
+                    index += 1;
+                }
+                index += 1;
+            }
+            b'-' if bytes.get(index + 1) == Some(&b'-') => {
+                index = skip_line(bytes, index);
+            }
+            b'#' if !postgres => {
+                index = skip_line(bytes, index);
+            }
+            b'/' if bytes.get(index + 1) == Some(&b'*') => {
+                index = sql[index + 2..]
+                    .find("*/")
+                    .map_or(bytes.len(), |end| index + 2 + end + 2);
+            }
+            b'%' if bytes.get(index + 1) == Some(&b's') => {
+                rendered.push_str(&sql[copied..index]);
+                count += 1;
+                if postgres {
+                    rendered.push_str(&format!("${count}"));
+                } else {
+                    rendered.push('?');
+                }
+                index += 2;
+                copied = index;
+            }
+            _ => index += 1,
+        }
+    }
+    rendered.push_str(&sql[copied.min(bytes.len())..]);
+    (rendered, count)
+}
+
+fn skip_line(bytes: &[u8], start: usize) -> usize {
+    bytes[start..]
+        .iter()
+        .position(|byte| *byte == b'\n')
+        .map_or(bytes.len(), |end| start + end + 1)
+}
+
+pub(crate) struct PreparedExecution {
+    pub(crate) result: QueryExecutionResult,
+    pub(crate) statement_id: String,
+    pub(crate) cache_hit: bool,
+}
+
+/// 파라미터를 서버에 따로 보내는 prepared statement 로 실행한다.
+///
+/// placeholder 수가 파라미터와 맞지 않거나, 서버가 statement 를 준비하지 못하거나, 파라미터
+/// 타입을 안전하게 변환할 수 없으면 `Ok(None)` 을 돌려주고 호출자는 리터럴 바인딩 경로로
+/// 되돌아간다. 실행 자체가 실패하면 `Err`.
+pub(crate) fn execute_prepared_adapter(
+    adapter: &mut LiveAdapter,
+    cache: &mut StatementCache,
+    sql: &str,
+    params: &[Value],
+) -> Result<Option<PreparedExecution>, String> {
+    let postgres = matches!(adapter, LiveAdapter::PostgreSql(_));
+    let (server_sql, count) = server_placeholder_sql(sql.trim().trim_end_matches(';'), postgres);
+    if count == 0 || count != params.len() {
+        return Ok(None);
+    }
+    let id = statement_id(&server_sql);
+    let cached = cache.get(&id);
+    let cache_hit = cached.is_some();
+    let result = match adapter {
+        LiveAdapter::MySql(conn) => {
+            // 드라이버 캐시에 있으면 서버 왕복 없이 같은 statement 를 돌려준다.
+            let Ok(statement) = conn.prep(&server_sql) else {
+                return Ok(None);
+            };
+            if usize::from(statement.num_params()) != count {
+                return Ok(None);
+            }
+            if !cache_hit {
+                cache.insert(id.clone(), PreparedStatement::MySql);
+            }
+            let values: Vec<mysql::Value> = params.iter().map(mysql_param).collect();
+            let result = conn
+                .exec_iter(&statement, values)
+                .map_err(|err| format!("mysql query error: {err}"))?;
+            let columns: Vec<mysql::Column> = result.columns().as_ref().to_vec();
+            let rows_affected = result.affected_rows();
+            let mut rows = Vec::new();
+            for row in result {
+                let row = row.map_err(|err| format!("mysql query error: {err}"))?;
+                rows.push(mysql_binary_row_to_json(&columns, row));
+            }
+            QueryExecutionResult {
+                rows,
+                rows_affected: if columns.is_empty() { rows_affected } else { 0 },
+                columns: columns
+                    .iter()
+                    .map(|column| column.name_str().to_string())
+                    .collect(),
+            }
+        }
+        LiveAdapter::PostgreSql(client) => {
+            let prepared = match cached {
+                Some(prepared) => prepared,
+                None => {
+                    let Some(prepared) = prepare_postgres(client, &server_sql, count) else {
+                        return Ok(None);
+                    };
+                    cache.insert(id.clone(), prepared.clone());
+                    prepared
+                }
+            };
+            let PreparedStatement::PostgreSql {
+                statement,
+                columns,
+                returns_rows,
+            } = prepared
+            else {
+                return Ok(None);
+            };
+            let Some(values) = postgres_params(params, statement.params()) else {
+                return Ok(None);
+            };
+            let refs: Vec<&(dyn ToSql + Sync)> =
+                values.iter().map(|value| value.as_ref()).collect();
+            if !returns_rows {
+                let rows_affected = client
+                    .execute(&statement, &refs)
+                    .map_err(|err| format!("postgresql SQL execution error: {err}"))?;
+                QueryExecutionResult {
+                    rows: Vec::new(),
+                    columns: Vec::new(),
+                    rows_affected,
+                }
+            } else {
+                let rows = client
+                    .query(&statement, &refs)
+                    .map_err(|err| format!("postgresql query error: {err}"))?;
+                QueryExecutionResult {
+                    rows: rows
+                        .into_iter()
+                        .map(|row| {
+                            row.get::<_, Option<String>>(0)
+                                .and_then(|item| serde_json::from_str::<Value>(&item).ok())
+                                .unwrap_or(Value::Null)
+                        })
+                        .collect(),
+                    columns,
+                    rows_affected: 0,
+                }
+            }
+        }
+    };
+    Ok(Some(PreparedExecution {
+        result,
+        statement_id: id,
+        cache_hit,
+    }))
+}
+
+/// 행을 돌려주는 statement 는 `execute_query_adapter` 와 같은 `row_to_json` 래퍼로 준비해
+/// 결과 JSON 이 리터럴 바인딩 경로와 같게 한다.
+fn prepare_postgres(
+    client: &mut postgres::Client,
+    sql: &str,
+    count: usize,
+) -> Option<PreparedStatement> {
+    let statement = client.prepare(sql).ok()?;
+    if statement.params().len() != count {
+        return None;
+    }
+    // information_schema 의 sql_identifier 처럼 도메인으로 추론된 파라미터는 기반 타입으로 받는다.
+    let types: Vec<Type> = statement
+        .params()
+        .iter()
+        .map(|ty| match ty.kind() {
+            Kind::Domain(base) => base.clone(),
+            _ => ty.clone(),
+        })
+        .collect();
+    let columns: Vec<String> = statement
+        .columns()
+        .iter()
+        .map(|column| column.name().to_string())
+        .collect();
+    let returns_rows = query_returns_rows(sql);
+    let statement = if returns_rows {
+        let wrapped = format!("SELECT row_to_json(_tf_row)::text FROM ({sql}) AS _tf_row");
+        client.prepare_typed(&wrapped, &types).ok()?
+    } else if types.as_slice() != statement.params() {
+        client.prepare_typed(sql, &types).ok()?
+    } else {
+        statement
+    };
+    Some(PreparedStatement::PostgreSql {
+        statement,
+        columns,
+        returns_rows,
+    })
+}
+
+fn mysql_param(value: &Value) -> mysql::Value {
+    match value {
+        Value::Null => mysql::Value::NULL,
+        Value::Bool(item) => mysql::Value::Int(i64::from(*item)),
+        Value::Number(number) => {
+            if let Some(item) = number.as_i64() {
+                mysql::Value::Int(item)
+            } else if let Some(item) = number.as_u64() {
+                mysql::Value::UInt(item)
+            } else {
+                mysql::Value::Double(number.as_f64().unwrap_or_default())
+            }
+        }
+        Value::String(item) => mysql::Value::Bytes(item.as_bytes().to_vec()),
+        other => mysql::Value::Bytes(other.to_string().into_bytes()),
+    }
+}
+
+/// 바이너리 프로토콜 행을 텍스트 프로토콜(`execute_query_adapter`)과 같은 모양의 JSON 으로 바꾼다.
+/// 날짜/시간만 표현이 다르므로 컬럼 타입과 소수 자릿수에 맞춰 문자열로 되돌린다.
+fn mysql_binary_row_to_json(columns: &[mysql::Column], row: mysql::Row) -> Value {
+    let mut object = Map::new();
+    for (column, value) in columns.iter().zip(row.unwrap()) {
+        object.insert(
+            column.name_str().to_string(),
+            mysql_value_to_json(mysql_text_value(value, column)),
+        );
+    }
+    Value::Object(object)
+}
+
+fn mysql_text_value(value: mysql::Value, column: &mysql::Column) -> mysql::Value {
+    use mysql::consts::ColumnType;
+
+    let fraction = |micros: u32| match usize::from(column.decimals()) {
+        digits @ 1..=6 => format!(".{:06}", micros)[..=digits].to_string(),
+        _ => String::new(),
+    };
+    let text = match value {
+        mysql::Value::Date(year, month, day, hour, minute, second, micros) => {
+            if matches!(
+                column.column_type(),
+                ColumnType::MYSQL_TYPE_DATE | ColumnType::MYSQL_TYPE_NEWDATE
+            ) {
+                format!("{year:04}-{month:02}-{day:02}")
+            } else {
+                format!(
+                    "{year:04}-{month:02}-{day:02} {hour:02}:{minute:02}:{second:02}{}",
+                    fraction(micros)
+                )
+            }
+        }
+        mysql::Value::Time(negative, days, hours, minutes, seconds, micros) => {
+            let sign = if negative { "-" } else { "" };
+            let hours = days * 24 + u32::from(hours);
+            format!(
+                "{sign}{hours:02}:{minutes:02}:{seconds:02}{}",
+                fraction(micros)
+            )
+        }
+        other => return other,
+    };
+    mysql::Value::Bytes(text.into_bytes())
+}
+
+/// JSON 파라미터를 PostgreSQL 이 추론한 타입으로 바꾼다. 지원하지 않는 타입이 있으면 `None`.
+fn postgres_params(params: &[Value], types: &[Type]) -> Option<Vec<Box<dyn ToSql + Sync>>> {
+    params
+        .iter()
+        .zip(types)
+        .map(|(value, ty)| postgres_param(value, ty))
+        .collect()
+}
+
+fn postgres_param(value: &Value, ty: &Type) -> Option<Box<dyn ToSql + Sync>> {
+    let param: Box<dyn ToSql + Sync> = match *ty {
+        Type::BOOL => Box::new(json_bool(value)?),
+        Type::INT2 => Box::new(match json_i64(value)? {
+            Some(item) => Some(i16::try_from(item).ok()?),
+            None => None,
+        }),
+        Type::INT4 => Box::new(match json_i64(value)? {
+            Some(item) => Some(i32::try_from(item).ok()?),
+            None => None,
+        }),
+        Type::INT8 => Box::new(json_i64(value)?),
+        Type::FLOAT4 => Box::new(json_f64(value)?.map(|item| item as f32)),
+        Type::FLOAT8 => Box::new(json_f64(value)?),
+        Type::TEXT | Type::VARCHAR | Type::BPCHAR | Type::NAME | Type::UNKNOWN => {
+            Box::new(match value {
+                Value::Null => None,
+                Value::String(item) => Some(item.clone()),
+                other => Some(other.to_string()),
+            })
+        }
+        _ => return None,
+    };
+    Some(param)
+}
+
+// 바깥 `Option` 은 변환 가능 여부, 안쪽 `Option` 은 SQL NULL 이다.
+
+fn json_bool(value: &Value) -> Option<Option<bool>> {
+    match value {
+        Value::Null => Some(None),
+        Value::Bool(item) => Some(Some(*item)),
+        Value::Number(item) => Some(Some(item.as_f64()? != 0.0)),
+        Value::String(item) => match item.trim().to_ascii_lowercase().as_str() {
+            "true" | "t" | "1" => Some(Some(true)),
+            "false" | "f" | "0" => Some(Some(false)),
+            _ => None,
+        },
+        _ => None,
+    }
+}
+
+fn json_i64(value: &Value) -> Option<Option<i64>> {
+    match value {
+        Value::Null => Some(None),
+        Value::Bool(item) => Some(Some(i64::from(*item))),
+        Value::Number(item) => item.as_i64().map(Some),
+        Value::String(item) => item.trim().parse().ok().map(Some),
+        _ => None,
+    }
+}
+
+fn json_f64(value: &Value) -> Option<Option<f64>> {
+    match value {
+        Value::Null => Some(None),
+        Value::Number(item) => item.as_f64().map(Some),
+        Value::String(item) => item.trim().parse().ok().map(Some),
+        _ => None,
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn placeholders_outside_quotes_and_comments_become_server_placeholders() {
+        let sql = "SELECT '%s', `a%s`, \"b%s\" FROM t -- %s\n\
+                   WHERE a = %s /* %s */ AND b = %s # %s";
+
+        let (mysql_sql, mysql_count) = server_placeholder_sql(sql, false);
+        assert_eq!(mysql_count, 2);
+        assert!(mysql_sql.contains("WHERE a = ? /* %s */ AND b = ? # %s"));
+        assert!(mysql_sql.starts_with("SELECT '%s', `a%s`, \"b%s\" FROM t -- %s\n"));
+
+        let (pg_sql, pg_count) = server_placeholder_sql(
+            "SELECT * FROM t WHERE a = %s AND b = 'it''s %s' AND c = %s",
+            true,
+        );
+        assert_eq!(pg_count, 2);
+        assert_eq!(
+            pg_sql,
+            "SELECT * FROM t WHERE a = $1 AND b = 'it''s %s' AND c = $2"
+        );
+    }
+
+    #[test]
+    fn statement_cache_evicts_least_recently_used_entry() {
+        let mut cache: StatementCache<&str> = StatementCache::new(2);
+        assert_eq!(cache.insert("a".to_string(), "A"), None);
+        assert_eq!(cache.insert("b".to_string(), "B"), None);
+        assert_eq!(cache.get("a"), Some("A"));
+
+        assert_eq!(cache.insert("c".to_string(), "C"), Some("B"));
+        assert_eq!(cache.len(), 2);
+        assert_eq!(cache.get("b"), None);
+        assert_eq!((cache.hits, cache.misses), (1, 1));
+    }
+
+    #[test]
+    fn statement_id_is_stable_for_the_same_sql() {
+        assert_eq!(statement_id("SELECT ?"), statement_id("SELECT ?"));
+        assert_ne!(statement_id("SELECT ?"), statement_id("SELECT ?, ?"));
+        assert!(statement_id("SELECT 1").starts_with("stmt-"));
+    }
+
+    #[test]
+    fn postgres_params_convert_json_to_inferred_types() {
+        let params = [json_value(7), Value::Null, Value::String("x".to_string())];
+        let converted = postgres_params(&params, &[Type::INT4, Type::INT8, Type::TEXT]).unwrap();
+        assert_eq!(converted.len(), 3);
+
+        assert!(postgres_params(&[Value::String("nope".to_string())], &[Type::INT4]).is_none());
+        assert!(postgres_params(&[json_value(1)], &[Type::TIMESTAMPTZ]).is_none());
+        assert!(postgres_params(&[json_value(70000)], &[Type::INT2]).is_none());
+    }
+
+    fn json_value(item: i64) -> Value {
+        Value::from(item)
+    }
+}
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""Compare JSONL dict rows vs columnar value arrays for Rust Core query.execute.
+
+Uses the core's in-memory rows mode, so no live database is required:
+
+    python scripts/benchmark-db-core-result-format.py --rows 200000 --columns 12
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core.db_core_service import (  # noqa: E402
+    RESULT_FORMAT_COLUMNAR,
+    RESULT_FORMAT_ROWS,
+    DbCoreFacade,
+    DbCoreServiceClient,
+    DbCoreServiceError,
+)
+from src.core.db_core_facade import _normalize_query_result  # noqa: E402
+
+
+def build_rows(row_count: int, column_count: int) -> tuple[List[str], List[Dict[str, Any]]]:
+    columns = [f"col_{index}" for index in range(column_count)]
+    rows = [
+        {column: (row_index * column_count + offset) if offset % 2 else f"value-{row_index}-{offset}"
+         for offset, column in enumerate(columns)}
+        for row_index in range(row_count)
+    ]
+    return columns, rows
+
+
+def measure(facade: DbCoreFacade, columns: List[str], rows: List[Dict[str, Any]], result_format: str) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {"rows": rows, "columns": columns}
+    if result_format == RESULT_FORMAT_COLUMNAR:
+        payload["result_format"] = RESULT_FORMAT_COLUMNAR
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = _normalize_query_result(facade.client.request("query.execute", payload), result_format)
+    grid = [[row.get(column) for column in columns] for row in result["rows"]] \
+        if result_format == RESULT_FORMAT_ROWS else result["rows"].values
+    elapsed = time.perf_counter() - started
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "format": result_format,
+        "rows": len(grid),
+        "seconds": round(elapsed, 4),
+        "peak_mib": round(peak / (1024 * 1024), 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--executable", default=None, help="tunnelforge-core path (default: auto-detect)")
+    args = parser.parse_args()
+
+    columns, rows = build_rows(args.rows, args.columns)
+    facade = DbCoreFacade(DbCoreServiceClient(executable=args.executable))
+    try:
+        if not facade.supports_result_format(RESULT_FORMAT_COLUMNAR):
+            print("tunnelforge-core does not advertise columnar results; rebuild migration_core.")
+            return 1
+        report = [measure(facade, columns, rows, fmt) for fmt in (RESULT_FORMAT_ROWS, RESULT_FORMAT_COLUMNAR)]
+    except DbCoreServiceError as exc:
+        print(f"Rust DB Core unavailable: {exc}")
+        return 1
+    finally:
+        facade.client.shutdown()
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
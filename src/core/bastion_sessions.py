@@ -0,0 +1,556 @@
+"""
+Bastion SSH 세션 공유
+- (host, port, user, key) 마다 인증된 paramiko.Transport 하나를 유지
+- 로컬 포워딩과 도달성 확인은 그 위에 direct-tcpip 채널만 연다
+- 참조 카운트로 마지막 사용자가 반납하면 세션을 닫고, 끊긴 세션은 다음 사용 시 재연결
+"""
+import os
+import select
+import socket
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import paramiko
+
+from src.core.constants import DEFAULT_LOCAL_HOST
+from src.core.logger import get_logger
+
+logger = get_logger('bastion_sessions')
+
+# Bastion 연결(TCP + SSH 핸드셰이크 + 인증) 최대 대기 시간 (초)
+BASTION_CONNECT_TIMEOUT_SECONDS = 10.0
+# 공유 세션 keepalive 간격 (초). 터널마다 보내던 keepalive가 세션당 하나로 줄어든다.
+BASTION_KEEPALIVE_SECONDS = 30.0
+# 로컬 소켓 <-> SSH 채널 중계 버퍼 크기
+FORWARD_BUFFER_SIZE = 32 * 1024
+# 처리량(bytes/sec) 계산에 쓰는 최근 구간 (초)
+THROUGHPUT_WINDOW_SECONDS = 10
+# 반납된 임시 터널을 재사용 대기시키는 시간 (초)과 최대 대기 개수
+TEMP_TUNNEL_IDLE_SECONDS = 120.0
+TEMP_TUNNEL_POOL_SIZE = 4
+
+BastionKey = Tuple[str, int, str, str]
+
+
+def bastion_key(config) -> BastionKey:
+    """터널 설정에서 세션 공유 키 (host, port, user, key 경로)를 만든다."""
+    return (
+        str(config['bastion_host']),
+        int(config.get('bastion_port', 22) or 22),
+        str(config['bastion_user']),
+        os.path.expanduser(str(config.get('bastion_key') or '')),
+    )
+
+
+def open_bastion_transport(host, port, username, pkey, timeout):
+    """Bastion에 TCP 연결 후 SSH 핸드셰이크와 공개키 인증을 마친 Transport를 반환"""
+    sock = socket.create_connection((host, port), timeout=timeout)
+    transport = paramiko.Transport(sock)
+    try:
+        transport.banner_timeout = timeout
+        transport.auth_timeout = timeout
+        transport.start_client(timeout=timeout)
+        transport.auth_publickey(username, pkey)
+        if not transport.is_authenticated():
+            raise paramiko.AuthenticationException("Bastion 인증에 실패했습니다.")
+        return transport
+    except Exception:
+        transport.close()
+        raise
+
+
+def temp_tunnel_key(config):
+    """임시 터널 재사용 키: bastion 세션 키 + 대상 host/port"""
+    return bastion_key(config) + (str(config['remote_host']), int(config['remote_port']))
+
+
+class BastionSession:
+    """Bastion 하나에 대한 공유 SSH Transport (참조 카운트는 BastionSessionManager가 관리)"""
+
+    def __init__(self, key: BastionKey, pkey_loader: Callable, connector: Callable,
+                 keepalive: float = BASTION_KEEPALIVE_SECONDS):
+        self.key = key
+        self.refs = 0
+        self.connects = 0
+        self._pkey_loader = pkey_loader
+        self._connector = connector
+        self._keepalive = keepalive
+        self._transport = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_active(self) -> bool:
+        transport = self._transport
+        return transport is not None and transport.is_active()
+
+    def transport(self, timeout: Optional[float] = None):
+        """활성 Transport 반환. 끊겨 있으면 다시 연결한다."""
+        with self._lock:
+            if self._transport is not None and self._transport.is_active():
+                return self._transport
+            if self._transport is not None:
+                logger.info(f"Bastion 세션 끊김, 재연결: {self.key[2]}@{self.key[0]}:{self.key[1]}")
+                self._close_transport()
+            host, port, username, key_path = self.key
+            pkey = self._pkey_loader(key_path)
+            transport = self._connector(
+                host, port, username, pkey,
+                timeout if timeout is not None else BASTION_CONNECT_TIMEOUT_SECONDS,
+            )
+            if self._keepalive:
+                transport.set_keepalive(int(self._keepalive))
+            self._transport = transport
+            self.connects += 1
+            logger.debug(f"Bastion 세션 연결됨: {username}@{host}:{port}")
+            return transport
+
+    def open_channel(self, target_host, target_port, src_addr=None, timeout: Optional[float] = None):
+        """Bastion에서 대상 host:port로 direct-tcpip 채널을 연다.
+
+        Transport가 그 사이 끊겼다면 한 번 재연결해서 다시 시도한다. 대상 쪽에서
+        거부한 경우(Transport는 살아 있음)는 재시도하지 않고 그대로 올린다.
+        """
+        dest = (target_host, int(target_port))
+        src = src_addr or (DEFAULT_LOCAL_HOST, 0)
+        transport = self.transport(timeout)
+        try:
+            return transport.open_channel('direct-tcpip', dest, src, timeout=timeout)
+        except (paramiko.SSHException, EOFError, OSError):
+            if transport.is_active():
+                raise
+        return self.transport(timeout).open_channel('direct-tcpip', dest, src, timeout=timeout)
+
+    def close(self):
+        with self._lock:
+            self._close_transport()
+
+    def _close_transport(self):
+        if self._transport is not None:
+            try:
+                self._transport.close()
+            except Exception as e:
+                logger.debug(f"Bastion 세션 종료 중 오류: {e}")
+            self._transport = None
+
+
+class BastionSessionManager:
+    """Bastion별 공유 세션을 참조 카운트로 관리
+
+    같은 bastion 뒤의 터널 N개가 SSH 세션 N개(키 교환 N번, keepalive N개)를 만들던 것을
+    세션 하나 + 채널 N개로 줄인다.
+    """
+
+    def __init__(self, pkey_loader: Callable, connector: Optional[Callable] = None,
+                 keepalive: float = BASTION_KEEPALIVE_SECONDS):
+        self._pkey_loader = pkey_loader
+        self._connector = connector or open_bastion_transport
+        self._keepalive = keepalive
+        self._sessions: Dict[BastionKey, BastionSession] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, config, timeout: Optional[float] = None) -> BastionSession:
+        """config의 bastion 세션을 빌린다 (없으면 연결). 반드시 release()로 반납해야 한다."""
+        key = bastion_key(config)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = BastionSession(key, self._pkey_loader, self._connector, self._keepalive)
+                self._sessions[key] = session
+            session.refs += 1
+        try:
+            # 같은 bastion을 동시에 빌리는 스레드는 세션 잠금에서 첫 연결을 기다렸다가 공유한다.
+            session.transport(timeout)
+        except Exception:
+            self.release(session)
+            raise
+        return session
+
+    def release(self, session: BastionSession):
+        """세션 반납. 마지막 사용자가 반납하면 Transport를 닫는다."""
+        with self._lock:
+            session.refs -= 1
+            if session.refs > 0:
+                return
+            if self._sessions.get(session.key) is session:
+                del self._sessions[session.key]
+        session.close()
+
+    def close_all(self):
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            sessions = list(self._sessions.values())
+        return {
+            'sessions': len(sessions),
+            'active': sum(1 for session in sessions if session.is_active),
+            'refs': sum(session.refs for session in sessions),
+        }
+
+
+class TrafficCounters:
+    """포워딩 하나의 트래픽 카운터
+
+    누적 바이트/채널 수, 최근 THROUGHPUT_WINDOW_SECONDS 동안의 방향별 처리량,
+    채널 열기(bastion -> 대상) 소요 시간을 기록한다. 중계 스레드 여러 개가 동시에 갱신한다.
+    """
+
+    def __init__(self, window_seconds: int = THROUGHPUT_WINDOW_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.window_seconds = max(1, int(window_seconds))
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (초 단위 시각, 보낸 바이트, 받은 바이트) - 초마다 버킷 하나
+        self._buckets: Deque[List[int]] = deque()
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.channels_opened = 0
+        self.channels_failed = 0
+        self.active_channels = 0
+        self.setup_seconds: Optional[float] = None
+        self._channel_setup_total = 0.0
+        self.last_channel_setup_seconds: Optional[float] = None
+
+    def add_bytes(self, sent: int = 0, received: int = 0):
+        second = int(self._clock())
+        with self._lock:
+            self.bytes_sent += sent
+            self.bytes_received += received
+            if self._buckets and self._buckets[-1][0] == second:
+                bucket = self._buckets[-1]
+                bucket[1] += sent
+                bucket[2] += received
+            else:
+                self._buckets.append([second, sent, received])
+                self._trim_locked(second)
+
+    def channel_opened(self, setup_seconds: float):
+        with self._lock:
+            self.channels_opened += 1
+            self.active_channels += 1
+            self._channel_setup_total += setup_seconds
+            self.last_channel_setup_seconds = setup_seconds
+
+    def channel_failed(self):
+        with self._lock:
+            self.channels_failed += 1
+
+    def channel_closed(self):
+        with self._lock:
+            self.active_channels = max(0, self.active_channels - 1)
+
+    def throughput(self) -> Tuple[float, float]:
+        """최근 구간의 (보내기, 받기) bytes/sec. 진행 중인 현재 초는 제외한다."""
+        now = int(self._clock())
+        with self._lock:
+            self._trim_locked(now)
+            sent = sum(bucket[1] for bucket in self._buckets if bucket[0] < now)
+            received = sum(bucket[2] for bucket in self._buckets if bucket[0] < now)
+        return sent / self.window_seconds, received / self.window_seconds
+
+    def snapshot(self) -> Dict[str, object]:
+        sent_rate, received_rate = self.throughput()
+        with self._lock:
+            return {
+                'bytes_sent': self.bytes_sent,
+                'bytes_received': self.bytes_received,
+                'sent_bytes_per_sec': sent_rate,
+                'received_bytes_per_sec': received_rate,
+                'channels_opened': self.channels_opened,
+                'channels_failed': self.channels_failed,
+                'active_channels': self.active_channels,
+                'setup_seconds': self.setup_seconds,
+                'last_channel_setup_seconds': self.last_channel_setup_seconds,
+                'avg_channel_setup_seconds': (
+                    self._channel_setup_total / self.channels_opened if self.channels_opened else None
+                ),
+            }
+
+    def _trim_locked(self, now_second: int):
+        cutoff = now_second - self.window_seconds
+        while self._buckets and self._buckets[0][0] < cutoff:
+            self._buckets.popleft()
+
+
+class SharedTunnelForwarder:
+    """공유 bastion 세션 위의 로컬 포트 포워딩
+
+    SSHTunnelForwarder와 같은 인터페이스(start/stop/is_active/local_bind_port)를 제공해
+    TunnelEngine의 기존 호출부를 그대로 쓴다. 로컬 연결 하나마다 direct-tcpip 채널 하나를 연다.
+    """
+
+    def __init__(self, sessions: BastionSessionManager, config, local_bind_address,
+                 connect_timeout: Optional[float] = None):
+        self._sessions = sessions
+        self._config = config
+        self._local_bind_address = (local_bind_address[0], int(local_bind_address[1]))
+        self._connect_timeout = connect_timeout
+        self._session: Optional[BastionSession] = None
+        self._server: Optional[socket.socket] = None
+        self._accept_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._connections = set()
+        self._connections_lock = threading.Lock()
+        # 트래픽 카운터 (sent: 로컬 -> 원격, received: 원격 -> 로컬)
+        self.traffic = TrafficCounters()
+
+    @property
+    def local_bind_port(self):
+        if self._server is None:
+            return None
+        return self._server.getsockname()[1]
+
+    @property
+    def bytes_sent(self) -> int:
+        return self.traffic.bytes_sent
+
+    @property
+    def bytes_received(self) -> int:
+        return self.traffic.bytes_received
+
+    @property
+    def is_active(self) -> bool:
+        return (
+            self._server is not None
+            and not self._stop_event.is_set()
+            and self._session is not None
+            and self._session.is_active
+        )
+
+    def start(self):
+        # 포트 충돌은 SSH 연결 전에 확인한다 (bastion 왕복 없이 바로 실패).
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            if os.name != 'nt':
+                # Windows의 SO_REUSEADDR은 사용 중인 포트에도 중복 bind를 허용하므로 제외
+                server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            server.bind(self._local_bind_address)
+            server.listen(16)
+            server.settimeout(0.5)
+        except Exception:
+            server.close()
+            raise
+        started = time.monotonic()
+        try:
+            self._session = self._sessions.acquire(self._config, timeout=self._connect_timeout)
+        except Exception:
+            server.close()
+            raise
+        # 공유 세션을 재사용했다면 bastion 왕복 없이 거의 0에 가깝다
+        self.traffic.setup_seconds = time.monotonic() - started
+        self._server = server
+        self._stop_event.clear()
+        self._accept_thread = threading.Thread(
+            target=self._accept_loop,
+            name=f"tunnel-forward-{self.local_bind_port}",
+            daemon=True,
+        )
+        self._accept_thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        server, self._server = self._server, None
+        if server is not None:
+            try:
+                server.close()
+            except OSError:
+                pass
+        if self._accept_thread is not None and self._accept_thread is not threading.current_thread():
+            self._accept_thread.join(timeout=2)
+        self._accept_thread = None
+        with self._connections_lock:
+            connections = list(self._connections)
+            self._connections.clear()
+        for client, channel in connections:
+            self._close_pair(client, channel)
+        session, self._session = self._session, None
+        if session is not None:
+            self._sessions.release(session)
+
+    def _accept_loop(self):
+        server = self._server
+        while not self._stop_event.is_set():
+            try:
+                client, peer = server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            threading.Thread(
+                target=self._handle_client, args=(client, peer),
+                name="tunnel-forward-conn", daemon=True,
+            ).start()
+
+    def _handle_client(self, client, peer):
+        session = self._session
+        if session is None:
+            client.close()
+            return
+        started = time.monotonic()
+        try:
+            channel = session.open_channel(
+                self._config['remote_host'], self._config['remote_port'],
+                src_addr=peer, timeout=self._connect_timeout or BASTION_CONNECT_TIMEOUT_SECONDS,
+            )
+        except Exception as e:
+            self.traffic.channel_failed()
+            logger.warning(
+                f"터널 채널 열기 실패 ({self._config.get('name')}): {type(e).__name__}: {e}"
+            )
+            client.close()
+            return
+        self.traffic.channel_opened(time.monotonic() - started)
+
+        pair = (client, channel)
+        with self._connections_lock:
+            self._connections.add(pair)
+        try:
+            self._relay(client, channel)
+        except (OSError, EOFError, paramiko.SSHException) as e:
+            logger.debug(f"터널 중계 종료 ({self._config.get('name')}): {e}")
+        finally:
+            with self._connections_lock:
+                self._connections.discard(pair)
+            self._close_pair(client, channel)
+            self.traffic.channel_closed()
+
+    def _relay(self, client, channel):
+        client.settimeout(None)
+        while not self._stop_event.is_set():
+            readable, _, _ = select.select([client, channel], [], [], 1.0)
+            if client in readable:
+                data = client.recv(FORWARD_BUFFER_SIZE)
+                if not data:
+                    break
+                channel.sendall(data)
+                self.traffic.add_bytes(sent=len(data))
+            if channel in readable:
+                data = channel.recv(FORWARD_BUFFER_SIZE)
+                if not data:
+                    break
+                client.sendall(data)
+                self.traffic.add_bytes(received=len(data))
+
+    @staticmethod
+    def _close_pair(client, channel):
+        for endpoint in (channel, client):
+            try:
+                endpoint.close()
+            except Exception:
+                pass
+
+
+class TempTunnelPool:
+    """반납된 임시 터널(SharedTunnelForwarder)을 잠시 살려 두고 재사용하는 풀
+
+    연결 테스트, 스키마/diff 로드처럼 실행 중이 아닌 터널을 잠깐 쓰는 작업이 반복될 때
+    매번 포워딩을 새로 만들지 않는다. 대기 중인 포워딩은 bastion 세션 참조도 유지하므로
+    SSH 핸드셰이크도 다시 하지 않는다. 대기 시간이 지나거나 개수 상한을 넘으면 닫는다.
+    """
+
+    def __init__(self, factory: Callable, max_idle: int = TEMP_TUNNEL_POOL_SIZE,
+                 idle_timeout: float = TEMP_TUNNEL_IDLE_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        self._factory = factory
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._idle: List[Tuple[tuple, object, float]] = []  # (키, 포워딩, 반납 시각) - 오래된 순
+        self._leased: Dict[int, tuple] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._counters = {'created': 0, 'reused': 0, 'closed': 0}
+
+    def lease(self, config):
+        """config 대상의 임시 터널을 빌린다. 살아 있는 대기 터널이 있으면 그것을 돌려준다."""
+        key = temp_tunnel_key(config)
+        closing = self._take_expired()
+        forwarder = None
+        with self._lock:
+            for index in range(len(self._idle) - 1, -1, -1):
+                idle_key, candidate, _ = self._idle[index]
+                if idle_key != key:
+                    continue
+                del self._idle[index]
+                if candidate.is_active:
+                    forwarder = candidate
+                    break
+                closing.append(candidate)
+            if forwarder is not None:
+                self._leased[id(forwarder)] = key
+                self._counters['reused'] += 1
+        self._stop_all(closing)
+        if forwarder is not None:
+            return forwarder
+
+        forwarder = self._factory(config)
+        with self._lock:
+            self._leased[id(forwarder)] = key
+            self._counters['created'] += 1
+        return forwarder
+
+    def release(self, forwarder, reusable: bool = True):
+        """임시 터널 반납. 풀에서 빌린 살아 있는 터널만 대기시키고 나머지는 닫는다."""
+        closing = self._take_expired()
+        with self._lock:
+            key = self._leased.pop(id(forwarder), None)
+            if key is not None and reusable and self.max_idle > 0 and forwarder.is_active:
+                self._idle.append((key, forwarder, self._clock()))
+                while len(self._idle) > self.max_idle:
+                    closing.append(self._idle.pop(0)[1])
+                self._schedule_sweep_locked()
+            else:
+                closing.append(forwarder)
+        self._stop_all(closing)
+
+    def sweep(self):
+        """대기 시간이 지난 임시 터널을 닫는다."""
+        self._stop_all(self._take_expired())
+        with self._lock:
+            self._timer = None
+            self._schedule_sweep_locked()
+
+    def close_all(self):
+        with self._lock:
+            closing = [forwarder for _, forwarder, _ in self._idle]
+            self._idle.clear()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self._stop_all(closing)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'idle': len(self._idle), 'leased': len(self._leased), **self._counters}
+
+    def _take_expired(self) -> list:
+        cutoff = self._clock() - self.idle_timeout
+        with self._lock:
+            expired = [forwarder for _, forwarder, released_at in self._idle if released_at <= cutoff]
+            self._idle = [entry for entry in self._idle if entry[2] > cutoff]
+        return expired
+
+    def _schedule_sweep_locked(self):
+        # 이후 요청이 없어도 대기 터널이 bastion 세션을 계속 붙잡지 않도록 만료 시점에 정리한다.
+        if self._timer is not None or not self._idle:
+            return
+        delay = max(0.0, self._idle[0][2] + self.idle_timeout - self._clock()) + 0.1
+        self._timer = threading.Timer(delay, self.sweep)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _stop_all(self, forwarders):
+        for forwarder in forwarders:
+            try:
+                forwarder.stop()
+            except Exception as e:
+                logger.warning(f"임시 터널 종료 중 오류: {e}")
+        if forwarders:
+            with self._lock:
+                self._counters['closed'] += len(forwarders)
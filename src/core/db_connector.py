@@ -9,6 +9,7 @@ from src.core.logger import get_logger
 from src.core.db_core_service import (
     RustDbConnection,
     RustDbConnector,
+    get_shared_db_connection_pool,
     get_shared_db_core_facade,
     parse_db_version_tuple,
     quote_mysql_ident,
@@ -102,6 +103,9 @@ class MySQLConnector:
             database: 기본 데이터베이스
             use_cache: 메타데이터 캐싱 사용 여부 (기본 True)
             facade: 주입할 Rust DB core facade (없으면 앱 공유 facade 사용)
+
+        공유 facade를 쓰는 경우 연결은 공유 연결 풀에서 임대되며, disconnect() 시
+        세션 상태를 초기화한 뒤 풀로 반환된다 (터널 경유 재핸드셰이크 방지).
         """
         self.host = host
         self.port = port
@@ -110,11 +114,13 @@ class MySQLConnector:
         self.database = database
         self.engine = "mysql"
         self.connection: Optional[RustDbConnection] = None
+        self._injected_facade = facade
         self.facade = facade if facade is not None else get_shared_db_core_facade()
         # 연결 프로토콜은 RustDbConnector에 위임 — 커넥터별 전용 서브프로세스를 띄우지 않는다.
         self._delegate = RustDbConnector(
             "mysql", host, port, user, password,
             database=database, facade=self.facade,
+            pool=get_shared_db_connection_pool() if facade is None else None,
         )
 
         # 캐싱 설정
@@ -130,6 +136,13 @@ class MySQLConnector:
             return True, "연결 성공"
         return False, f"MySQL 오류: {msg}"
 
+    def clone(self) -> 'MySQLConnector':
+        """같은 접속 정보로 연결되지 않은 새 커넥터 생성 (병렬 작업용 별도 세션)"""
+        return MySQLConnector(
+            self.host, self.port, self.user, self.password, self.database,
+            use_cache=self._use_cache, facade=self._injected_facade,
+        )
+
     def disconnect(self):
         """연결 종료"""
         if self.connection:
@@ -143,6 +156,12 @@ class MySQLConnector:
         self._delegate.connection = None
         self._delegate.connection_id = None
 
+    def cancel_running_query(self) -> bool:
+        """실행 중인 쿼리를 서버에서 중단 (KILL QUERY). 다른 스레드에서 호출해도 안전하다."""
+        if not self.connection:
+            return False
+        return self.connection.cancel_running_query()
+
     def is_connected(self) -> bool:
         """연결 상태 확인"""
         if self.connection:
@@ -283,6 +302,24 @@ class MySQLConnector:
             logger.warning(f"sql_mode 설정 오류: {e}")
             return False
 
+    def set_session_stats_expiry(self, seconds: Optional[int]) -> bool:
+        """세션 information_schema_stats_expiry 설정 (MySQL 8.0+)
+
+        0 이면 INFORMATION_SCHEMA.TABLES 의 TABLE_ROWS/UPDATE_TIME 을 캐시하지 않고
+        매번 읽는다. None 이면 전역 기본값으로 되돌린다. 변수가 없는 서버(5.7 등)에서는
+        아무것도 하지 않고 False 를 돌려준다.
+        """
+        if not self.connection:
+            return False
+        value = 'DEFAULT' if seconds is None else str(int(seconds))
+        try:
+            with self.connection.cursor() as cursor:
+                cursor.execute(f"SET SESSION information_schema_stats_expiry = {value}")
+            return True
+        except Exception as e:
+            logger.debug(f"information_schema_stats_expiry 설정 건너뜀: {e}")
+            return False
+
     def execute(self, query: str, params: tuple = None) -> List[Dict[str, Any]]:
         """쿼리 실행 및 결과 반환"""
         if not self.connection:
@@ -0,0 +1,470 @@
+"""asyncio facade over the Rust DB core service.
+
+`DbCoreFacade` blocks the calling thread until the core answers, so every
+dialog used to spawn a `QThread` just to wait on a pipe. `AsyncDbCoreFacade`
+exposes the same operations as coroutines on top of the clients' non-blocking
+`request_async()`: one event loop can keep hundreds of metadata and health
+requests in flight without a thread per call.
+
+Qt code does not need a qasync loop: `DbCoreLoopThread` runs a private event
+loop in a daemon thread and `submit()` returns a `concurrent.futures.Future`
+whose done callback can emit a Qt signal back to the GUI thread.
+"""
+import asyncio
+import concurrent.futures
+import functools
+import threading
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from src.core.db_core_client import DbCoreServiceError
+from src.core.db_core_facade import (
+    DbCoreFacade,
+    DbEndpoint,
+    _advertises_command,
+    _advertises_result_format,
+    _batch_payload,
+    _normalize_batch_result,
+    _normalize_cursor_open,
+    _normalize_prepared_result,
+    _normalize_query_result,
+    get_shared_db_core_facade,
+)
+from src.core.db_core_rows import RESULT_FORMAT_COLUMNAR, RESULT_FORMAT_ROWS, batch_values
+from src.core.logger import get_logger
+
+logger = get_logger("db_core_service")
+
+T = TypeVar("T")
+
+# Requests a single facade keeps in flight at once; more wait for a free slot.
+DEFAULT_MAX_IN_FLIGHT = 64
+
+
+class AsyncDbCoreFacade:
+    """Coroutine version of `DbCoreFacade` sharing its client and feature negotiation.
+
+    The in-flight limit is an `asyncio.Semaphore` created inside the running loop on
+    the first request (on Python 3.9 a semaphore built outside a loop binds to
+    whatever `get_event_loop()` returned). Awaiting from another loop gets that
+    loop its own limit, so use one instance per event loop. Clients without `request_async()` (custom or test clients) fall back to the
+    loop's default executor, which does cost a thread per call.
+    """
+
+    def __init__(self, facade: Optional[DbCoreFacade] = None, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT):
+        self.facade = facade or get_shared_db_core_facade()
+        self.client = self.facade.client
+        self._max_in_flight = max(1, int(max_in_flight))
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _loop_slots(self) -> asyncio.Semaphore:
+        """The in-flight semaphore of the running loop, created on first use."""
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self._max_in_flight)
+            self._slots_loop = loop
+        return self._slots
+
+    async def request(
+        self,
+        command: str,
+        payload: Optional[Dict[str, Any]] = None,
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """Send one core request; `on_event` runs on the loop thread."""
+        async with self._loop_slots():
+            request_async = getattr(self.client, "request_async", None)
+            if asyncio.iscoroutinefunction(request_async):
+                return await request_async(command, payload, on_event=on_event)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, functools.partial(self.client.request, command, payload, on_event=on_event)
+            )
+
+    async def hello(self) -> Dict[str, Any]:
+        return await self.request("service.hello")
+
+    async def _service_features(self) -> Dict[str, Any]:
+        features = self.facade._features
+        if features is not None:
+            return features
+        try:
+            features = await self.hello()
+        except DbCoreServiceError:
+            return {}
+        return self.facade._remember_features(features)
+
+    async def supports_result_format(self, result_format: str) -> bool:
+        return _advertises_result_format(await self._service_features(), result_format)
+
+    async def supports_command(self, command: str) -> bool:
+        return _advertises_command(await self._service_features(), command)
+
+    async def supports_prepared_statements(self) -> bool:
+        return (await self._service_features()).get("prepared_statements") is True
+
+    async def _query_payload(self, payload: Dict[str, Any], result_format: str) -> Dict[str, Any]:
+        if result_format == RESULT_FORMAT_COLUMNAR and await self.supports_result_format(RESULT_FORMAT_COLUMNAR):
+            payload["result_format"] = RESULT_FORMAT_COLUMNAR
+        return payload
+
+    async def test_connection(self, endpoint: DbEndpoint) -> Tuple[bool, str]:
+        result = await self.request("connection.test", {"connection": endpoint.to_payload()})
+        return bool(result.get("success")), str(result.get("message", ""))
+
+    async def open_connection(self, endpoint: DbEndpoint) -> str:
+        result = await self.request("connection.open", {"connection": endpoint.to_payload()})
+        if not result.get("success"):
+            raise DbCoreServiceError(str(result.get("message", "connection failed")))
+        return str(result.get("connection_id", ""))
+
+    async def close_connection(self, connection_id: str) -> bool:
+        result = await self.request("connection.close", {"connection_id": connection_id})
+        return bool(result.get("success"))
+
+    async def inspect_schema(self, endpoint: DbEndpoint) -> Dict[str, Any]:
+        result = await self.request("schema.inspect", {"source": endpoint.to_payload()})
+        return result.get("schema") if isinstance(result.get("schema"), dict) else {"tables": []}
+
+    async def list_tables(self, endpoint: DbEndpoint) -> List[str]:
+        result = await self.request("schema.list", {"connection": endpoint.to_payload()})
+        tables = result.get("tables")
+        return [str(table) for table in tables] if isinstance(tables, list) else []
+
+    async def schema_diff(
+        self, source_schema: Dict[str, Any], target_schema: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        result = await self.request(
+            "schema.diff",
+            {"source_schema": source_schema, "target_schema": target_schema},
+        )
+        differences = result.get("differences")
+        return [item for item in differences if isinstance(item, dict)] if isinstance(differences, list) else []
+
+    async def execute_query(
+        self,
+        endpoint: DbEndpoint,
+        sql: str,
+        params: Optional[Sequence[Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        result = await self.execute_query_result(endpoint, sql, params=params)
+        return result["rows"]
+
+    async def execute_query_result(
+        self,
+        endpoint: DbEndpoint,
+        sql: str,
+        params: Optional[Sequence[Any]] = None,
+        result_format: str = RESULT_FORMAT_ROWS,
+    ) -> Dict[str, Any]:
+        payload = {"connection": endpoint.to_payload(), "sql": sql, "params": list(params or [])}
+        result = await self.request("query.execute", await self._query_payload(payload, result_format))
+        return _normalize_query_result(result, result_format)
+
+    async def execute_on_connection(
+        self,
+        connection_id: str,
+        sql: str,
+        params: Optional[Sequence[Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        result = await self.execute_on_connection_result(connection_id, sql, params=params)
+        return result["rows"]
+
+    async def execute_on_connection_result(
+        self,
+        connection_id: str,
+        sql: str,
+        params: Optional[Sequence[Any]] = None,
+        result_format: str = RESULT_FORMAT_ROWS,
+        prepare: bool = False,
+    ) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {"connection_id": connection_id, "sql": sql, "params": list(params or [])}
+        if prepare and payload["params"] and await self.supports_prepared_statements():
+            payload["prepare"] = True
+        result = await self.request("query.execute", await self._query_payload(payload, result_format))
+        return _normalize_prepared_result(result, result_format)
+
+    async def execute_batch(
+        self,
+        connection_id: str,
+        sql: Optional[str] = None,
+        params: Optional[Sequence[Sequence[Any]]] = None,
+        statements: Optional[Sequence[Union[str, Tuple[str, Sequence[Any]]]]] = None,
+        transaction: bool = True,
+        stop_on_error: bool = True,
+    ) -> Dict[str, Any]:
+        payload = _batch_payload(connection_id, sql, params, statements, transaction, stop_on_error)
+        return _normalize_batch_result(await self.request("query.execute_batch", payload))
+
+    async def cancel_query(self, connection_id: str) -> bool:
+        result = await self.request("query.cancel", {"connection_id": connection_id})
+        return bool(result.get("cancelled"))
+
+    async def open_cursor(
+        self,
+        connection_id: str,
+        sql: str,
+        params: Optional[Sequence[Any]] = None,
+        row_batch_size: int = 500,
+    ) -> Dict[str, Any]:
+        result = await self.request(
+            "cursor.open",
+            {
+                "connection_id": connection_id,
+                "sql": sql,
+                "params": list(params or []),
+                "row_batch_size": int(row_batch_size),
+            },
+        )
+        return _normalize_cursor_open(result)
+
+    async def fetch_cursor(
+        self,
+        connection_id: str,
+        cursor_id: str,
+        result_format: str = RESULT_FORMAT_ROWS,
+    ) -> Dict[str, Any]:
+        result = await self.request(
+            "cursor.fetch",
+            await self._query_payload({"connection_id": connection_id, "cursor_id": cursor_id}, result_format),
+        )
+        normalized = _normalize_query_result(result, result_format)
+        normalized["done"] = bool(result.get("done"))
+        return normalized
+
+    async def close_cursor(self, connection_id: str, cursor_id: str) -> bool:
+        result = await self.request(
+            "cursor.close",
+            {"connection_id": connection_id, "cursor_id": cursor_id},
+        )
+        return bool(result.get("closed"))
+
+    async def iter_cursor(
+        self,
+        connection_id: str,
+        sql: str,
+        params: Optional[Sequence[Any]] = None,
+        row_batch_size: int = 500,
+        result_format: str = RESULT_FORMAT_ROWS,
+    ) -> AsyncIterator[Sequence[Any]]:
+        """Yield row batches from a server-side cursor, fetching the next one only when asked.
+
+        Leaving the loop early closes the cursor so the connection is usable again.
+        """
+        opened = await self.open_cursor(connection_id, sql, params=params, row_batch_size=row_batch_size)
+        cursor_id = opened["cursor_id"]
+        done = False
+        try:
+            while not done:
+                batch = await self.fetch_cursor(connection_id, cursor_id, result_format=result_format)
+                done = batch["done"]
+                if len(batch["rows"]):
+                    yield batch["rows"]
+        finally:
+            if not done:
+                try:
+                    await self.close_cursor(connection_id, cursor_id)
+                except DbCoreServiceError as exc:
+                    logger.warning("DB core 커서 닫기 실패 (%s): %s", cursor_id, exc)
+
+    def stream_events(self, command: str, payload: Optional[Dict[str, Any]] = None) -> "DbCoreEventStream":
+        """Run a long command (`dump.run`, `migration.run`, ...) as an async iterator of its events."""
+        return DbCoreEventStream(self, command, payload)
+
+    async def stream_query_batches(
+        self,
+        connection_id: str,
+        sql: str,
+        params: Optional[Sequence[Any]] = None,
+        row_batch_size: int = 500,
+        result_format: str = RESULT_FORMAT_ROWS,
+    ) -> AsyncIterator[List[Any]]:
+        """Async version of `execute_on_connection_streaming`: yields each `row_batch`."""
+        payload = await self._query_payload(
+            {
+                "connection_id": connection_id,
+                "sql": sql,
+                "params": list(params or []),
+                "stream_rows": True,
+                "row_batch_size": int(row_batch_size),
+            },
+            result_format,
+        )
+        columns: List[str] = []
+        async for event in self.stream_events("query.execute", payload):
+            if event.get("event") == "columns" and isinstance(event.get("columns"), list):
+                columns[:] = [str(column) for column in event["columns"]]
+            elif event.get("event") == "row_batch":
+                if result_format == RESULT_FORMAT_COLUMNAR:
+                    yield batch_values(event, columns)
+                else:
+                    rows = event.get("rows")
+                    yield [row for row in rows if isinstance(row, dict)] if isinstance(rows, list) else []
+
+    async def run_migration(
+        self,
+        payload: Dict[str, Any],
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        return await self.request("migration.run", payload, on_event=on_event)
+
+    async def verify_migration(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.request("migration.verify", payload)
+
+    async def run_dump(
+        self,
+        payload: Dict[str, Any],
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        return await self.request("dump.run", payload, on_event=on_event)
+
+    async def import_dump(
+        self,
+        payload: Dict[str, Any],
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        return await self.request("dump.import", payload, on_event=on_event)
+
+    async def run_oneclick(
+        self,
+        payload: Dict[str, Any],
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        return await self.request("oneclick.run", payload, on_event=on_event)
+
+    async def derive_oneclick_charset_contracts(
+        self,
+        payload: Dict[str, Any],
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        return await self.request("oneclick.derive_charset_contracts", payload, on_event=on_event)
+
+    async def apply_oneclick_fixes(
+        self,
+        payload: Dict[str, Any],
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        return await self.request("oneclick.apply_fixes", payload, on_event=on_event)
+
+
+class DbCoreEventStream:
+    """Async iterator over a request's progress events; `result` holds the final result.
+
+    The request starts on the first `__anext__`. Events are buffered in an
+    unbounded queue: the core does not wait for Python, so a slow consumer only
+    delays when events are handled, never the command itself.
+    """
+
+    def __init__(self, facade: AsyncDbCoreFacade, command: str, payload: Optional[Dict[str, Any]]):
+        self._facade = facade
+        self._command = command
+        self._payload = payload
+        self._queue: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue()
+        self._task: "Optional[asyncio.Task[Dict[str, Any]]]" = None
+        self.result: Optional[Dict[str, Any]] = None
+
+    def __aiter__(self) -> "DbCoreEventStream":
+        return self
+
+    async def _run(self) -> Dict[str, Any]:
+        try:
+            return await self._facade.request(
+                self._command,
+                self._payload,
+                on_event=lambda event: self._queue.put_nowait(event),
+            )
+        finally:
+            self._queue.put_nowait(None)
+
+    async def __anext__(self) -> Dict[str, Any]:
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+        event = await self._queue.get()
+        while event is not None and event.get("event") in ("result", "error"):
+            # The terminal event is surfaced through `result` / the raised error instead.
+            event = await self._queue.get()
+        if event is not None:
+            return event
+        self.result = await self._task
+        raise StopAsyncIteration
+
+    async def aclose(self) -> None:
+        """Stop listening; the core keeps running the command unless it is cancelled there."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, DbCoreServiceError):
+                pass
+
+
+class DbCoreLoopThread:
+    """Private asyncio loop in a daemon thread for callers without a running loop (Qt, workers)."""
+
+    def __init__(self, name: str = "db-core-async"):
+        self._name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                ready = threading.Event()
+                loop = asyncio.new_event_loop()
+
+                def run() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+                    loop.close()
+
+                self._thread = threading.Thread(target=run, name=self._name, daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    def submit(self, coroutine: Awaitable[T]) -> "concurrent.futures.Future[T]":
+        """Schedule `coroutine` on the loop thread. Done callbacks run on that thread."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def call(self, coroutine: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Run `coroutine` on the loop thread and block the caller until it finishes."""
+        return self.submit(coroutine).result(timeout)
+
+    def stop(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+
+
+_shared_loop_lock = threading.Lock()
+_shared_loop: Optional[DbCoreLoopThread] = None
+
+
+def get_shared_db_core_loop() -> DbCoreLoopThread:
+    """Return the app-wide loop thread used to run `AsyncDbCoreFacade` coroutines from Qt code."""
+    global _shared_loop
+    with _shared_loop_lock:
+        if _shared_loop is None:
+            _shared_loop = DbCoreLoopThread()
+        return _shared_loop
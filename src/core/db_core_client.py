@@ -1,5 +1,7 @@
-"""Sequential JSONL client for the long-lived Rust TunnelForge DB core process."""
+"""Multiplexed JSONL client for the long-lived Rust TunnelForge DB core process."""
+import asyncio
 import json
+import queue
 import re
 import subprocess
 import threading
@@ -81,8 +83,41 @@ def default_database_for_engine(engine: str, database: Optional[str] = None) ->
     return "postgres" if normalize_db_engine(engine) == "postgresql" else ""
 
 
+class _PendingRequest:
+    """Mailbox for one in-flight request, filled by the reader thread."""
+
+    __slots__ = ("request_id", "command", "mailbox", "listener")
+
+    def __init__(
+        self,
+        request_id: str,
+        command: str,
+        listener: Optional[Callable[[str, Any], None]] = None,
+    ):
+        self.request_id = request_id
+        self.command = command
+        # (kind, value): kind is "event"/"result"/"error" with an event payload,
+        # or "failure" with an exception raised by the transport itself.
+        self.mailbox: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+        # Async requests get their events pushed instead of draining the mailbox.
+        self.listener = listener
+
+    def deliver(self, kind: str, value: Any) -> None:
+        if self.listener is not None:
+            self.listener(kind, value)
+        else:
+            self.mailbox.put((kind, value))
+
+
 class DbCoreServiceClient:
-    """Sequential JSONL client for the long-lived Rust DB core process."""
+    """Multiplexed JSONL client for the long-lived Rust DB core process.
+
+    Requests are written with their `request_id` and a dedicated reader thread
+    routes every event to the matching in-flight request, so a long `dump.run`
+    no longer blocks health pings or editor queries issued by other threads.
+    Events are handed back to the calling thread, which keeps `on_event`
+    callbacks on the same thread that called `request()`.
+    """
 
     def __init__(
         self,
@@ -92,7 +127,14 @@ class DbCoreServiceClient:
         self.executable = executable or db_core_executable()
         self._popen_factory = popen_factory or subprocess.Popen
         self._process: Optional[subprocess.Popen] = None
+        # `_lock` guards process lifecycle and stdin writes only; it is never held
+        # while waiting for a response (except by shutdown(), which must be exclusive).
         self._lock = threading.Lock()
+        self._pending: Dict[str, _PendingRequest] = {}
+        self._pending_cond = threading.Condition()
+        self._reader_thread: Optional[threading.Thread] = None
+        # Incremented on every process spawn; values above 1 mean the core was restarted.
+        self.generation = 0
         self._stderr_tail: Deque[str] = deque(maxlen=200)
         self._stderr_lock = threading.Lock()
         self._stderr_thread: Optional[threading.Thread] = None
@@ -104,7 +146,13 @@ class DbCoreServiceClient:
     def _start_locked(self) -> None:
         """Start the core process. Caller must already hold `_lock`."""
         if self._process and self._process.poll() is None:
-            return
+            if self._reader_thread is not None and self._reader_thread.is_alive():
+                return
+            # The reader saw EOF while the process still looks alive; replace it.
+            try:
+                self._process.terminate()
+            except Exception:
+                pass
         try:
             process = self._popen_factory(
                 [self.executable],
@@ -123,10 +171,14 @@ class DbCoreServiceClient:
                 "소스 실행이면 `cargo build --manifest-path migration_core\\Cargo.toml --release`를 먼저 실행하고, "
                 "설치본이면 배포 패키지에 tunnelforge-core 실행 파일이 포함되어 있는지 확인하세요."
             ) from exc
-        self._process = process
+        with self._pending_cond:
+            self._process = process
+            self.generation += 1
+            self._pending_cond.notify_all()
         with self._stderr_lock:
             self._stderr_tail.clear()
         self._start_stderr_drain_locked(process)
+        self._start_reader_locked(process)
 
     def _start_stderr_drain_locked(self, process: subprocess.Popen) -> None:
         """Spawn a background thread draining stderr so it never fills the OS pipe buffer."""
@@ -151,18 +203,93 @@ class DbCoreServiceClient:
         self._stderr_thread = thread
         thread.start()
 
+    def _start_reader_locked(self, process: subprocess.Popen) -> None:
+        """Spawn the stdout reader that routes events to in-flight requests."""
+        thread = threading.Thread(
+            target=self._read_events,
+            args=(process,),
+            name="db-core-reader",
+            daemon=True,
+        )
+        self._reader_thread = thread
+        thread.start()
+
     def _stderr_tail_text(self) -> str:
         with self._stderr_lock:
             return "\n".join(self._stderr_tail)
 
-    def _send_locked(
+    def _read_events(self, process: subprocess.Popen) -> None:
+        """Reader loop: only reads stdout while at least one request is in flight."""
+        stdout = process.stdout
+        while True:
+            with self._pending_cond:
+                while not self._pending and self._process is process:
+                    self._pending_cond.wait()
+                if self._process is not process:
+                    return
+            try:
+                line = stdout.readline() if stdout is not None else ""
+            except (ValueError, OSError):
+                line = ""
+            if line == "":
+                self._fail_pending(
+                    DbCoreServiceError(self._stderr_tail_text() or "DB core service stopped before a result"),
+                    process,
+                )
+                return
+            self._dispatch_line(process, line)
+
+    def _dispatch_line(self, process: subprocess.Popen, line: str) -> None:
+        try:
+            event = parse_helper_event(line)
+        except Exception as exc:
+            # A corrupt line cannot be attributed; fail the oldest request like the
+            # sequential client did when it read the same line.
+            with self._pending_cond:
+                if self._process is not process:
+                    return
+                pending = next(iter(self._pending.values()), None)
+                if pending is not None:
+                    del self._pending[pending.request_id]
+            if pending is not None:
+                pending.deliver("failure", exc)
+            return
+
+        with self._pending_cond:
+            if self._process is not process:
+                return
+            if event.request_id is None:
+                # Legacy id-less events belong to the oldest in-flight request.
+                pending = next(iter(self._pending.values()), None)
+            else:
+                pending = self._pending.get(str(event.request_id))
+            if pending is None:
+                logger.debug("DB core event without an in-flight request dropped: %s", event.event)
+                return
+            terminal = event.event in ("result", "error")
+            if terminal:
+                del self._pending[pending.request_id]
+        kind = event.event if terminal else "event"
+        pending.deliver(kind, event.payload)
+
+    def _fail_pending(self, error: Exception, process: Optional[subprocess.Popen] = None) -> None:
+        """Fail every in-flight request; with `process`, only if it is still the current one."""
+        with self._pending_cond:
+            if process is not None and self._process is not process:
+                return
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for item in pending:
+            item.deliver("failure", error)
+
+    def _submit_locked(
         self,
         command: str,
         payload: Optional[Dict[str, Any]],
         request_id: str,
-        on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
-    ) -> Dict[str, Any]:
-        """Send one JSONL request and read its result. Caller must already hold `_lock`."""
+        listener: Optional[Callable[[str, Any], None]] = None,
+    ) -> _PendingRequest:
+        """Register and write one JSONL request. Caller must already hold `_lock`."""
         body = {
             "command": command,
             "request_id": request_id,
@@ -171,27 +298,76 @@ class DbCoreServiceClient:
         process = self._process
         assert process is not None
         stdin = process.stdin
-        stdout = process.stdout
-        if stdin is None or stdout is None:
+        if stdin is None or process.stdout is None:
             raise DbCoreServiceError("DB core service pipes are not available")
 
-        stdin.write(json.dumps(body, ensure_ascii=False) + "\n")
-        stdin.flush()
-
-        while True:
-            line = stdout.readline()
-            if line == "":
-                raise DbCoreServiceError(self._stderr_tail_text() or "DB core service stopped before a result")
-
-            event = parse_helper_event(line)
-            if event.request_id not in (None, request_id):
-                continue
-            if on_event:
-                on_event(event.payload)
-            if event.event == "result":
-                return event.payload
-            if event.event == "error":
-                raise DbCoreServiceError(_format_error_event(event.payload))
+        pending = _PendingRequest(request_id, command, listener)
+        with self._pending_cond:
+            if request_id in self._pending:
+                raise DbCoreServiceError(f"duplicate in-flight request_id: {request_id}")
+            self._pending[request_id] = pending
+            self._pending_cond.notify_all()
+        try:
+            stdin.write(json.dumps(body, ensure_ascii=False) + "\n")
+            stdin.flush()
+        except BaseException:
+            self._discard(pending)
+            raise
+        return pending
+
+    def _discard(self, pending: _PendingRequest) -> None:
+        with self._pending_cond:
+            if self._pending.get(pending.request_id) is pending:
+                del self._pending[pending.request_id]
+
+    def _wait(
+        self,
+        pending: _PendingRequest,
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """Drain one request's mailbox on the calling thread until its result arrives."""
+        try:
+            while True:
+                kind, value = pending.mailbox.get()
+                if kind == "failure":
+                    raise value
+                if on_event:
+                    on_event(value)
+                if kind == "result":
+                    return value
+                if kind == "error":
+                    raise DbCoreServiceError(_format_error_event(value))
+        except BaseException:
+            # The caller gave up (callback raised, error, interrupt); stop routing to it.
+            self._discard(pending)
+            raise
+
+    def in_flight_count(self) -> int:
+        """Number of requests written to the core that have not produced a result yet."""
+        with self._pending_cond:
+            return len(self._pending)
+
+    def is_running(self) -> bool:
+        """True while the core process is alive and its reader is routing events."""
+        process = self._process
+        reader = self._reader_thread
+        return (
+            process is not None
+            and process.poll() is None
+            and reader is not None
+            and reader.is_alive()
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        in_flight = self.in_flight_count()
+        return {
+            "workers": 1,
+            "running_workers": 1 if self.is_running() else 0,
+            "busy_workers": 1 if in_flight else 0,
+            "in_flight": in_flight,
+            "queue_depth": max(0, in_flight - 1),
+            "restarts": max(0, self.generation - 1),
+        }
 
     def request(
         self,
@@ -203,7 +379,65 @@ class DbCoreServiceClient:
         request_id = request_id or f"py-{uuid.uuid4().hex}"
         with self._lock:
             self._start_locked()
-            return self._send_locked(command, payload, request_id, on_event)
+            pending = self._submit_locked(command, payload, request_id)
+        return self._wait(pending, on_event)
+
+    async def request_async(
+        self,
+        command: str,
+        payload: Optional[Dict[str, Any]] = None,
+        request_id: Optional[str] = None,
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """Awaitable `request()` that does not park a thread while the core works.
+
+        The reader thread hands events to the running loop, so `on_event` runs on
+        the loop thread. Cancelling the awaiting task stops routing events to it;
+        the core still finishes (or is cancelled through `query.cancel`) on its own.
+        """
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Dict[str, Any]]" = loop.create_future()
+
+        def settle(kind: str, value: Any) -> None:
+            if future.done():
+                return
+            if kind == "failure":
+                future.set_exception(value)
+                return
+            try:
+                if on_event:
+                    on_event(value)
+            except BaseException as exc:
+                future.set_exception(exc)
+                return
+            if kind == "result":
+                future.set_result(value)
+            elif kind == "error":
+                future.set_exception(DbCoreServiceError(_format_error_event(value)))
+
+        def listener(kind: str, value: Any) -> None:
+            try:
+                loop.call_soon_threadsafe(settle, kind, value)
+            except RuntimeError:
+                # The loop was closed while the request was in flight; nobody is listening.
+                pass
+
+        request_id = request_id or f"py-{uuid.uuid4().hex}"
+        with self._lock:
+            self._start_locked()
+            pending = self._submit_locked(command, payload, request_id, listener)
+        try:
+            return await future
+        except BaseException:
+            self._discard(pending)
+            raise
+
+    def _detach_process_locked(self) -> None:
+        """Forget the current process and release its reader. Caller must hold `_lock`."""
+        with self._pending_cond:
+            self._process = None
+            self._pending_cond.notify_all()
+        self._fail_pending(DbCoreServiceError("DB core service was shut down"))
 
     def shutdown(self) -> None:
         with self._lock:
@@ -212,11 +446,12 @@ class DbCoreServiceClient:
                 return
             try:
                 if process.poll() is None:
-                    self._send_locked("service.shutdown", None, f"py-{uuid.uuid4().hex}")
+                    pending = self._submit_locked("service.shutdown", None, f"py-{uuid.uuid4().hex}")
+                    self._wait(pending)
             except Exception:
                 process.terminate()
             finally:
-                self._process = None
+                self._detach_process_locked()
 
     def __enter__(self) -> "DbCoreServiceClient":
         self.start()
@@ -0,0 +1,216 @@
+"""Endpoint-keyed pool of stateful Rust DB core connections.
+
+Opening a core connection is a full TCP + auth handshake, usually through an
+SSH tunnel. Short-lived workers (SQL editor queries, schema loads) therefore
+lease connections from this pool instead of opening and closing their own.
+The pool only tracks connection ids; `RustDbConnection` leases reset their
+session state before handing the id back (see `RustDbConnection.close`).
+"""
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from src.core.db_core_facade import DbEndpoint
+from src.core.logger import get_logger
+
+logger = get_logger("db_core_service")
+
+
+@dataclass(frozen=True)
+class DbConnectionPoolConfig:
+    """Per-endpoint limits for pooled core connections."""
+
+    # Pooled connections (leased + idle) per endpoint; extra leases are opened
+    # on demand and closed when released.
+    max_size: int = 4
+    # Idle connections older than this are closed instead of reused.
+    idle_timeout: float = 300.0
+    # Idle connections older than this are pinged before being leased again.
+    validate_after: float = 30.0
+
+
+@dataclass
+class _IdleConnection:
+    connection_id: str
+    released_at: float
+    # `facade.core_generation()` when the connection was opened.
+    generation: int = 0
+
+
+@dataclass
+class _PoolBucket:
+    idle: Deque[_IdleConnection]
+    # Pooled connection id -> core generation it was opened in.
+    members: Dict[str, int]
+
+
+_PoolKey = Tuple[Any, DbEndpoint]
+
+
+class DbConnectionPool:
+    """Hands out core connection ids per `(facade, endpoint)` and keeps released ones warm.
+
+    Connection ids only exist inside the core process that opened them, so the
+    facade is part of the key. Idle connections are reused most-recently-released
+    first, validated with `SELECT 1` when they have been idle for a while, and
+    closed once they pass `idle_timeout`. Idle ids released before a core worker
+    restart died with that process and are dropped without being pinged or closed.
+    """
+
+    def __init__(
+        self,
+        config: Optional[DbConnectionPoolConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.config = config or DbConnectionPoolConfig()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: Dict[_PoolKey, _PoolBucket] = {}
+        self._counters = {"opened": 0, "reused": 0, "discarded": 0, "overflow": 0}
+
+    def acquire(self, facade, endpoint: DbEndpoint) -> str:
+        """Return a connection id for `endpoint`, reusing an idle one when possible."""
+        key = (facade, endpoint)
+        while True:
+            self._drop_stale(facade)
+            expired = self._take_expired()
+            self._close_quietly(expired)
+            with self._lock:
+                bucket = self._buckets.setdefault(key, _PoolBucket(deque(), {}))
+                idle = bucket.idle.pop() if bucket.idle else None
+            if idle is None:
+                break
+            if self._validate(facade, idle):
+                with self._lock:
+                    self._counters["reused"] += 1
+                return idle.connection_id
+            self._forget(key, idle.connection_id)
+            self._close_quietly([(facade, idle.connection_id)])
+
+        generation = self._core_generation(facade)
+        connection_id = facade.open_connection(endpoint)
+        with self._lock:
+            self._counters["opened"] += 1
+            bucket = self._buckets.setdefault(key, _PoolBucket(deque(), {}))
+            if len(bucket.members) < max(0, self.config.max_size):
+                bucket.members[connection_id] = generation
+            else:
+                self._counters["overflow"] += 1
+        return connection_id
+
+    def release(self, facade, endpoint: DbEndpoint, connection_id: str, reusable: bool = True) -> None:
+        """Return a lease. Unusable or overflow connections are closed instead of pooled."""
+        key = (facade, endpoint)
+        current = self._core_generation(facade)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            generation = bucket.members.get(connection_id) if bucket is not None else None
+            if generation is not None and reusable and generation == current:
+                bucket.idle.append(_IdleConnection(connection_id, self._clock(), generation))
+                return
+            if generation is not None:
+                del bucket.members[connection_id]
+                self._counters["discarded"] += 1
+                if generation != current:
+                    # Opened before a core restart: the id is already gone.
+                    return
+        self._close_quietly([(facade, connection_id)])
+
+    def close_idle(self) -> int:
+        """Close every idle connection (e.g. after tunnels were restarted)."""
+        with self._lock:
+            closing: List[Tuple[Any, str]] = []
+            for (facade, _endpoint), bucket in self._buckets.items():
+                for idle in bucket.idle:
+                    bucket.members.pop(idle.connection_id, None)
+                    closing.append((facade, idle.connection_id))
+                bucket.idle.clear()
+        self._close_quietly(closing)
+        return len(closing)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            idle = sum(len(bucket.idle) for bucket in self._buckets.values())
+            members = sum(len(bucket.members) for bucket in self._buckets.values())
+            return {
+                "endpoints": sum(1 for bucket in self._buckets.values() if bucket.members),
+                "idle": idle,
+                "leased": members - idle,
+                **self._counters,
+            }
+
+    def _drop_stale(self, facade) -> None:
+        """Forget `facade`'s idle ids that predate a core restart.
+
+        The connections died with the old process, so they are neither pinged nor
+        closed: a restarted core may already use the same id for another lease.
+        """
+        generation = self._core_generation(facade)
+        with self._lock:
+            for (owner, _endpoint), bucket in self._buckets.items():
+                if owner is not facade:
+                    continue
+                stale = [idle for idle in bucket.idle if idle.generation != generation]
+                for idle in stale:
+                    bucket.idle.remove(idle)
+                    bucket.members.pop(idle.connection_id, None)
+                    self._counters["discarded"] += 1
+                if stale:
+                    logger.info("코어 재시작으로 유휴 DB 연결 %d개 폐기", len(stale))
+
+    def _take_expired(self) -> List[Tuple[Any, str]]:
+        cutoff = self._clock() - self.config.idle_timeout
+        expired: List[Tuple[Any, str]] = []
+        with self._lock:
+            for (facade, _endpoint), bucket in self._buckets.items():
+                # Oldest entries sit on the left; stop at the first still-fresh one.
+                while bucket.idle and bucket.idle[0].released_at <= cutoff:
+                    idle = bucket.idle.popleft()
+                    bucket.members.pop(idle.connection_id, None)
+                    expired.append((facade, idle.connection_id))
+        return expired
+
+    def _validate(self, facade, idle: _IdleConnection) -> bool:
+        if self._clock() - idle.released_at < self.config.validate_after:
+            return True
+        try:
+            facade.execute_on_connection(idle.connection_id, "SELECT 1")
+            return True
+        except Exception as exc:
+            logger.info("유휴 DB 연결 검증 실패, 새 연결로 교체 (%s): %s", idle.connection_id, exc)
+            return False
+
+    def _forget(self, key: _PoolKey, connection_id: str) -> None:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.members.pop(connection_id, None)
+            self._counters["discarded"] += 1
+
+    @staticmethod
+    def _core_generation(facade) -> int:
+        current = getattr(facade, "core_generation", None)
+        return current() if callable(current) else 0
+
+    @staticmethod
+    def _close_quietly(connections: List[Tuple[Any, str]]) -> None:
+        for facade, connection_id in connections:
+            try:
+                facade.close_connection(connection_id)
+            except Exception as exc:
+                logger.warning("풀 DB 연결 종료 실패 (%s): %s", connection_id, exc)
+
+
+_shared_pool_lock = threading.Lock()
+_shared_pool: Optional[DbConnectionPool] = None
+
+
+def get_shared_db_connection_pool() -> DbConnectionPool:
+    """Return the app-wide connection pool used by connectors on the shared facade."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = DbConnectionPool()
+        return _shared_pool
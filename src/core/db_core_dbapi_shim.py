@@ -1,6 +1,7 @@
 """DB-API-like shim adapters backed by the Rust TunnelForge DB core service."""
+import threading
 from dataclasses import replace
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
 from src.core.constants import SYSTEM_SCHEMAS
 from src.core.db_core_client import (
@@ -9,9 +10,18 @@ from src.core.db_core_client import (
     normalize_db_engine,
     parse_db_version_tuple,
 )
+from src.core.db_core_connection_pool import DbConnectionPool, get_shared_db_connection_pool
 from src.core.db_core_facade import DbCoreFacade, DbEndpoint, get_shared_db_core_facade
+from src.core.db_core_rows import RESULT_FORMAT_COLUMNAR, RESULT_FORMAT_ROWS, ColumnarRows
 from src.core.logger import get_logger
-from src.core.sql_query_classifier import statement_returns_rows
+from src.core.sql_query_classifier import (
+    SESSION_CHANGE_DATABASE,
+    SESSION_CHANGE_OTHER,
+    SESSION_CHANGE_SQL_MODE,
+    SESSION_CHANGE_TRANSACTION,
+    session_state_change,
+    statement_returns_rows,
+)
 
 logger = get_logger("db_core_service")
 
@@ -31,6 +41,7 @@ class RustDbConnector:
         facade: Optional[DbCoreFacade] = None,
         *,
         endpoint: Optional[DbEndpoint] = None,
+        pool: Optional[DbConnectionPool] = None,
     ):
         self.endpoint = endpoint if endpoint is not None else DbEndpoint(
             engine=engine,
@@ -41,7 +52,12 @@ class RustDbConnector:
             database=database or ("postgres" if engine == "postgresql" else ""),
             schema=schema,
         )
+        # 공유 facade를 쓰는 커넥터는 공유 연결 풀에서 연결을 임대한다. 주입된 facade는
+        # 명시적으로 pool을 넘긴 경우에만 풀링한다.
+        if pool is None and facade is None:
+            pool = get_shared_db_connection_pool()
         self.facade = facade if facade is not None else get_shared_db_core_facade()
+        self.pool = pool
         self.connection_id: Optional[str] = None
         self.connection: Optional["RustDbConnection"] = None
 
@@ -50,18 +66,30 @@ class RustDbConnector:
 
     def connect(self) -> Tuple[bool, str]:
         try:
-            self.connection_id = self.facade.open_connection(self.endpoint)
-            self.connection = RustDbConnection(self.endpoint, self.facade, self.connection_id)
+            if self.pool is not None:
+                self.connection_id = self.pool.acquire(self.facade, self.endpoint)
+            else:
+                self.connection_id = self.facade.open_connection(self.endpoint)
+            self.connection = RustDbConnection(
+                self.endpoint, self.facade, self.connection_id, pool=self.pool
+            )
             return True, "연결 성공"
         except Exception as exc:
             return False, str(exc)
 
     def disconnect(self) -> None:
-        if self.connection_id:
+        if self.pool is not None and self.connection is not None:
+            # 임대 연결은 세션 상태를 초기화한 뒤 풀로 반환된다.
+            self.connection.close()
+        elif self.connection_id:
             self.facade.close_connection(self.connection_id)
         self.connection_id = None
         self.connection = None
 
+    def cancel_running_query(self) -> bool:
+        connection = self.connection
+        return connection.cancel_running_query() if connection is not None else False
+
     def schema_exists(self, schema_name: Optional[str]) -> bool:
         if not schema_name:
             return True
@@ -212,17 +240,44 @@ def create_rust_db_connector(
 
 
 class RustDbConnection:
-    """Minimal DB-API-like connection backed by a Rust service connection."""
+    """Minimal DB-API-like connection backed by a Rust service connection.
+
+    With a `pool`, the connection is a lease: `close()` resets the session state
+    it changed (transaction, autocommit, `sql_mode`, current database) and returns
+    the core connection to the pool. Sessions with state it cannot reset (other
+    `SET`s, temporary tables, open server cursors) are closed instead, and so is a
+    lease whose statement was cancelled.
+    """
 
-    def __init__(self, endpoint: DbEndpoint, facade: DbCoreFacade, connection_id: str):
+    def __init__(
+        self,
+        endpoint: DbEndpoint,
+        facade: DbCoreFacade,
+        connection_id: str,
+        pool: Optional[DbConnectionPool] = None,
+    ):
         self.endpoint = endpoint
         self.facade = facade
         self.connection_id = connection_id
         self.open = True
         self._autocommit = True
         self._in_transaction = False
-
-    def cursor(self) -> "RustDbCursor":
+        self._pool = pool
+        self._pool_endpoint = endpoint
+        self._released = False
+        self._database_changed = False
+        self._sql_mode_changed = False
+        self._session_dirty = False
+        self._open_cursors: Set[str] = set()
+        # A cancel runs under this lock and `close()` releases the lease under it, so a
+        # late cancel can never reach the next lease holder's statement.
+        self._cancel_lock = threading.Lock()
+        self._cancel_sent = False
+
+    def cursor(self, streaming: bool = False, batch_size: int = 500) -> "RustDbCursor":
+        """Buffered cursor by default; `streaming=True` keeps the result in the core."""
+        if streaming:
+            return RustDbStreamingCursor(self, batch_size=batch_size)
         return RustDbCursor(self)
 
     def ping(self, reconnect: bool = False) -> None:
@@ -237,10 +292,76 @@ class RustDbConnection:
             raise
 
     def close(self) -> None:
+        if self._pool is not None:
+            with self._cancel_lock:
+                if self._released:
+                    return
+                self._released = True
+                cancelled = self._cancel_sent
+            reusable = not cancelled and self._reset_session()
+            self.open = False
+            self._pool.release(self.facade, self._pool_endpoint, self.connection_id, reusable=reusable)
+            return
         if self.open:
             self.facade.close_connection(self.connection_id)
             self.open = False
 
+    def _note_statement(self, query: str) -> None:
+        """Record session state a statement changes so a pooled lease can undo it."""
+        change = session_state_change(query)
+        if change == SESSION_CHANGE_DATABASE:
+            self._database_changed = True
+        elif change == SESSION_CHANGE_SQL_MODE:
+            self._sql_mode_changed = True
+        elif change == SESSION_CHANGE_TRANSACTION:
+            self._in_transaction = True
+        elif change == SESSION_CHANGE_OTHER:
+            self._session_dirty = True
+
+    def _reset_session(self) -> bool:
+        """Undo tracked session changes before pooling; False if the session must be closed."""
+        if not self.open or self._open_cursors or self._session_dirty:
+            return False
+        mysql = self.endpoint.engine == "mysql"
+        home_database = self._pool_endpoint.database
+        try:
+            if self._in_transaction:
+                self.facade.execute_on_connection(self.connection_id, "ROLLBACK")
+                self._in_transaction = False
+            if mysql and not self._autocommit:
+                self.facade.execute_on_connection(self.connection_id, "SET autocommit = 1")
+            if mysql and self._sql_mode_changed:
+                self.facade.execute_on_connection(self.connection_id, "SET SESSION sql_mode = DEFAULT")
+            if mysql and (self._database_changed or self.endpoint.database != home_database):
+                if not home_database:
+                    return False
+                self.facade.execute_on_connection(
+                    self.connection_id, f"USE {quote_mysql_ident(home_database)}"
+                )
+        except Exception as exc:
+            logger.warning("풀 반환 전 세션 초기화 실패 (%s): %s", self.connection_id, exc)
+            return False
+        return True
+
+    def cancel_running_query(self) -> bool:
+        """Ask the server to stop this connection's current statement; safe to call from any thread.
+
+        A pooled lease that has already been released is left alone: its core connection
+        may belong to another caller by now. A lease that was cancelled is closed rather
+        than pooled when it is released.
+        """
+        with self._cancel_lock:
+            if not self.open or self._released:
+                return False
+            try:
+                cancelled = self.facade.cancel_query(self.connection_id)
+            except Exception as exc:
+                logger.warning("쿼리 취소 요청 실패 (%s): %s", self.connection_id, exc)
+                return False
+            if cancelled:
+                self._cancel_sent = True
+            return cancelled
+
     def commit(self) -> None:
         if self.open:
             self.facade.execute_on_connection(self.connection_id, "COMMIT")
@@ -286,9 +407,12 @@ class RustDbConnection:
 class RustDbCursor:
     """Small cursor shim for legacy PyQt code using connection.cursor()."""
 
+    arraysize = 1
+
     def __init__(self, connection: RustDbConnection):
         self.connection = connection
-        self._rows: List[Dict[str, Any]] = []
+        self._rows: Sequence[Dict[str, Any]] = []
+        self._position = 0
         self.rowcount = 0
         self.description = None
 
@@ -296,15 +420,43 @@ class RustDbCursor:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
         return False
 
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        while self._fill():
+            row = self._rows[self._position]
+            self._position += 1
+            yield row
+
+    def _columnar_supported(self, query: str) -> bool:
+        supports = getattr(self.connection.facade, "supports_result_format", None)
+        return (
+            callable(supports)
+            and statement_returns_rows(query)
+            and supports(RESULT_FORMAT_COLUMNAR) is True
+        )
+
+    def _prepare_supported(self, params: Optional[Sequence[Any]]) -> bool:
+        supports = getattr(self.connection.facade, "supports_prepared_statements", None)
+        return bool(params) and callable(supports) and supports() is True
+
     def execute(self, query: str, params: Optional[Sequence[Any]] = None) -> int:
+        self.connection._note_statement(query)
+        options: Dict[str, Any] = {}
+        if self._columnar_supported(query):
+            options["result_format"] = RESULT_FORMAT_COLUMNAR
+        if self._prepare_supported(params):
+            # Parameterized statements reuse the connection's server-side prepared statement.
+            options["prepare"] = True
         result = self.connection.facade.execute_on_connection_result(
             self.connection.connection_id,
             query,
             params=params,
+            **options,
         )
         self._rows = result.get("rows", [])
+        self._position = 0
         columns = result.get("columns") or None
         rows_affected = int(result.get("rows_affected") or 0)
 
@@ -320,17 +472,198 @@ class RustDbCursor:
             self.rowcount = rows_affected
         return self.rowcount
 
+    def supports_batch(self) -> bool:
+        """Whether the core can run `executemany`/`execute_batch` as one `query.execute_batch`."""
+        supports = getattr(self.connection.facade, "supports_command", None)
+        return callable(supports) and supports("query.execute_batch") is True
+
     def executemany(self, query: str, data: Sequence[Sequence[Any]]) -> int:
-        raise RuntimeError(
-            "RustDbCursor.executemany is disabled. "
-            "Batch DB operations must be modeled as explicit Rust Core commands."
+        """Run `query` once per parameter row in a single core round trip.
+
+        Outside a transaction the batch is atomic (the core wraps it in its own
+        transaction); inside one it joins the caller's transaction. Raises on the
+        first failing row.
+        """
+        if not self.supports_batch():
+            raise RuntimeError(
+                "RustDbCursor.executemany requires a Rust Core with query.execute_batch; "
+                "batch DB operations are not emulated in Python."
+            )
+        self.connection._note_statement(query)
+        result = self.connection.facade.execute_batch(
+            self.connection.connection_id,
+            sql=query,
+            params=[list(row) for row in data],
+            transaction=not self.connection._in_transaction,
+        )
+        if result["errors"]:
+            error = result["errors"][0]
+            raise DbCoreServiceError(f"executemany row {error.get('index')}: {error.get('message')}")
+        self._rows = []
+        self._position = 0
+        self.description = None
+        self.rowcount = result["total_rows_affected"]
+        return self.rowcount
+
+    def execute_batch(
+        self,
+        statements: Sequence[Tuple[str, Sequence[Any]]],
+        stop_on_error: bool = True,
+    ) -> Dict[str, Any]:
+        """Run `(sql, params)` pairs in one round trip inside the connection's transaction.
+
+        Returns the core's per-statement `rows_affected` and `errors` instead of
+        raising, so callers can report every failed statement.
+        """
+        if not self.supports_batch():
+            raise RuntimeError("RustDbCursor.execute_batch requires a Rust Core with query.execute_batch")
+        for sql, _params in statements:
+            self.connection._note_statement(sql)
+        result = self.connection.facade.execute_batch(
+            self.connection.connection_id,
+            statements=statements,
+            transaction=False,
+            stop_on_error=stop_on_error,
         )
+        self._rows = []
+        self._position = 0
+        self.description = None
+        self.rowcount = result["total_rows_affected"]
+        return result
 
-    def fetchall(self) -> List[Dict[str, Any]]:
-        return list(self._rows)
+    def _fill(self) -> bool:
+        """Whether an unread row is buffered (streaming cursors pull the next batch here)."""
+        return self._position < len(self._rows)
+
+    def _take(self, limit: Optional[int] = None) -> Sequence[Any]:
+        end = len(self._rows) if limit is None else min(len(self._rows), self._position + limit)
+        taken = self._rows[self._position:end]
+        self._position = end
+        return taken
 
     def fetchone(self) -> Optional[Dict[str, Any]]:
-        return self._rows[0] if self._rows else None
+        if not self._fill():
+            return None
+        row = self._rows[self._position]
+        self._position += 1
+        return row
+
+    def fetchmany(self, size: Optional[int] = None) -> List[Dict[str, Any]]:
+        size = self.arraysize if size is None else int(size)
+        rows: List[Dict[str, Any]] = []
+        while len(rows) < size and self._fill():
+            rows.extend(self._take(size - len(rows)))
+        return rows
+
+    def fetchall(self) -> List[Dict[str, Any]]:
+        rows: List[Dict[str, Any]] = []
+        while self._fill():
+            rows.extend(self._take())
+        return rows
+
+    def fetchmany_values(self, size: Optional[int] = None) -> List[List[Any]]:
+        """Up to `size` rows (all remaining when None) as value lists in `description` order.
+
+        Columnar batches are sliced without building dicts, and a streaming cursor
+        pulls only the batches needed to reach `size`.
+        """
+        columns = [desc[0] for desc in self.description or []]
+        values: List[List[Any]] = []
+        while (size is None or len(values) < size) and self._fill():
+            limit = None if size is None else size - len(values)
+            if isinstance(self._rows, ColumnarRows):
+                end = len(self._rows) if limit is None else min(len(self._rows), self._position + limit)
+                values.extend(self._rows.values[self._position:end])
+                self._position = end
+            else:
+                values.extend([row.get(column) for column in columns] for row in self._take(limit))
+        return values
+
+    def fetchall_values(self) -> List[List[Any]]:
+        """Remaining rows as value lists in `description` order, without building dicts when columnar."""
+        return self.fetchmany_values()
+
+    def close(self) -> None:
+        """Buffered results live in Python; there is nothing to release in the core."""
+
+
+class RustDbStreamingCursor(RustDbCursor):
+    """Server-side cursor: rows stay in the core and are pulled one batch at a time.
+
+    Only one batch (`batch_size` rows) is held in Python, and the core reads at most
+    a couple of batches ahead of `fetchmany()`, so a large `SELECT *` no longer has
+    to fit in memory on either side. While the cursor is open the core rejects other
+    commands on the same connection; exhaust or `close()` it first. Closing an unread
+    cursor cancels the statement on the server (`KILL QUERY` / `pg_cancel_backend`),
+    so the connection is not tied up while the rest of the result drains.
+
+    Statements that do not return rows, cores without `cursor.open`, and PostgreSQL
+    sessions inside an explicit transaction use the buffered path; the core reads
+    PostgreSQL results through a portal in a transaction of its own.
+    """
+
+    def __init__(self, connection: RustDbConnection, batch_size: int = 500):
+        super().__init__(connection)
+        self.batch_size = max(1, int(batch_size))
+        self._cursor_id: Optional[str] = None
+        self._result_format = RESULT_FORMAT_ROWS
+
+    def _streaming_supported(self, query: str) -> bool:
+        if self.connection.endpoint.engine == "postgresql" and self.connection._in_transaction:
+            return False
+        supports = getattr(self.connection.facade, "supports_command", None)
+        return callable(supports) and statement_returns_rows(query) and supports("cursor.open") is True
+
+    def execute(self, query: str, params: Optional[Sequence[Any]] = None) -> int:
+        self.close()
+        if not self._streaming_supported(query):
+            return super().execute(query, params)
+        facade = self.connection.facade
+        opened = facade.open_cursor(
+            self.connection.connection_id,
+            query,
+            params=params,
+            row_batch_size=self.batch_size,
+        )
+        self._cursor_id = opened["cursor_id"]
+        self.connection._open_cursors.add(self._cursor_id)
+        self._result_format = (
+            RESULT_FORMAT_COLUMNAR
+            if facade.supports_result_format(RESULT_FORMAT_COLUMNAR)
+            else RESULT_FORMAT_ROWS
+        )
+        self._rows = []
+        self._position = 0
+        self.description = [(column,) for column in opened["columns"]]
+        # DB-API: the row count is unknown until the result has been read.
+        self.rowcount = -1
+        return self.rowcount
+
+    def _fill(self) -> bool:
+        while self._position >= len(self._rows):
+            if self._cursor_id is None:
+                return False
+            batch = self.connection.facade.fetch_cursor(
+                self.connection.connection_id,
+                self._cursor_id,
+                result_format=self._result_format,
+            )
+            if batch.get("done"):
+                # The core drops an exhausted cursor on its own.
+                self.connection._open_cursors.discard(self._cursor_id)
+                self._cursor_id = None
+            self._rows = batch.get("rows") or []
+            self._position = 0
+        return True
+
+    def close(self) -> None:
+        cursor_id, self._cursor_id = self._cursor_id, None
+        self._rows = []
+        self._position = 0
+        if cursor_id:
+            self.connection._open_cursors.discard(cursor_id)
+        if cursor_id and self.connection.open:
+            self.connection.facade.close_cursor(self.connection.connection_id, cursor_id)
 
 
 def quote_mysql_ident(identifier: str) -> str:
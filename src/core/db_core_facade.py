@@ -2,9 +2,16 @@
 import atexit
 import threading
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from src.core.db_core_client import DbCoreServiceClient, DbCoreServiceError
+from src.core.db_core_pool import DbCorePoolConfig, DbCoreProcessPool
+from src.core.db_core_rows import (
+    RESULT_FORMAT_COLUMNAR,
+    RESULT_FORMAT_ROWS,
+    ColumnarRows,
+    batch_values,
+)
 
 
 @dataclass(frozen=True)
@@ -34,10 +41,58 @@ class DbCoreFacade:
 
     def __init__(self, client: Optional[DbCoreServiceClient] = None):
         self.client = client or DbCoreServiceClient()
+        self._features: Optional[Dict[str, Any]] = None
+        self._features_lock = threading.Lock()
 
     def hello(self) -> Dict[str, Any]:
         return self.client.request("service.hello")
 
+    def _service_features(self) -> Dict[str, Any]:
+        """`service.hello` result, cached once it succeeds.
+
+        A failed hello answers ``{}`` for this call only, so a transient error does not
+        switch off feature negotiation for the rest of the facade's life.
+        """
+        with self._features_lock:
+            if self._features is None:
+                try:
+                    self._features = self.hello()
+                except DbCoreServiceError:
+                    return {}
+            return self._features
+
+    def _remember_features(self, features: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache a `service.hello` result fetched elsewhere (the async facade); the first one wins."""
+        with self._features_lock:
+            if self._features is None:
+                self._features = features
+            return self._features
+
+    def supports_result_format(self, result_format: str) -> bool:
+        """Whether the core advertised `result_format` in `service.hello`."""
+        return _advertises_result_format(self._service_features(), result_format)
+
+    def supports_command(self, command: str) -> bool:
+        """Whether the core listed `command` in its `service.hello` capabilities."""
+        return _advertises_command(self._service_features(), command)
+
+    def supports_prepared_statements(self) -> bool:
+        """Whether the core keeps a per-connection prepared statement cache."""
+        return self._service_features().get("prepared_statements") is True
+
+    def _query_payload(self, payload: Dict[str, Any], result_format: str) -> Dict[str, Any]:
+        if result_format == RESULT_FORMAT_COLUMNAR and self.supports_result_format(RESULT_FORMAT_COLUMNAR):
+            payload["result_format"] = RESULT_FORMAT_COLUMNAR
+        return payload
+
+    def stats(self) -> Dict[str, Any]:
+        """Core process counters (workers, in-flight requests, restarts)."""
+        return self.client.stats()
+
+    def core_generation(self) -> int:
+        """Core restart count; connection ids opened before a change are gone."""
+        return int(self.client.stats().get("restarts", 0))
+
     def test_connection(self, endpoint: DbEndpoint) -> Tuple[bool, str]:
         result = self.client.request("connection.test", {"connection": endpoint.to_payload()})
         return bool(result.get("success")), str(result.get("message", ""))
@@ -83,18 +138,16 @@ class DbCoreFacade:
         endpoint: DbEndpoint,
         sql: str,
         params: Optional[Sequence[Any]] = None,
+        result_format: str = RESULT_FORMAT_ROWS,
     ) -> Dict[str, Any]:
         result = self.client.request(
             "query.execute",
-            {"connection": endpoint.to_payload(), "sql": sql, "params": list(params or [])},
+            self._query_payload(
+                {"connection": endpoint.to_payload(), "sql": sql, "params": list(params or [])},
+                result_format,
+            ),
         )
-        rows = result.get("rows")
-        columns = result.get("columns")
-        return {
-            "rows": [row for row in rows if isinstance(row, dict)] if isinstance(rows, list) else [],
-            "columns": [str(column) for column in columns] if isinstance(columns, list) else [],
-            "rows_affected": int(result.get("rows_affected") or 0),
-        }
+        return _normalize_query_result(result, result_format)
 
     def execute_on_connection(
         self,
@@ -110,18 +163,20 @@ class DbCoreFacade:
         connection_id: str,
         sql: str,
         params: Optional[Sequence[Any]] = None,
+        result_format: str = RESULT_FORMAT_ROWS,
+        prepare: bool = False,
     ) -> Dict[str, Any]:
-        result = self.client.request(
-            "query.execute",
-            {"connection_id": connection_id, "sql": sql, "params": list(params or [])},
-        )
-        rows = result.get("rows")
-        columns = result.get("columns")
-        return {
-            "rows": [row for row in rows if isinstance(row, dict)] if isinstance(rows, list) else [],
-            "columns": [str(column) for column in columns] if isinstance(columns, list) else [],
-            "rows_affected": int(result.get("rows_affected") or 0),
-        }
+        """Run `sql` on a stateful connection.
+
+        With `prepare`, parameterized statements run as server-side prepared
+        statements from the connection's statement cache; the core falls back to
+        literal binding when a statement cannot be prepared.
+        """
+        payload: Dict[str, Any] = {"connection_id": connection_id, "sql": sql, "params": list(params or [])}
+        if prepare and payload["params"] and self.supports_prepared_statements():
+            payload["prepare"] = True
+        result = self.client.request("query.execute", self._query_payload(payload, result_format))
+        return _normalize_prepared_result(result, result_format)
 
     def execute_on_connection_streaming(
         self,
@@ -129,27 +184,119 @@ class DbCoreFacade:
         sql: str,
         params: Optional[Sequence[Any]] = None,
         row_batch_size: int = 500,
-        on_batch: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+        on_batch: Optional[Callable[[List[Any]], None]] = None,
+        result_format: str = RESULT_FORMAT_ROWS,
     ) -> Dict[str, Any]:
+        """Stream row batches to `on_batch`.
+
+        With `result_format="columnar"` each batch is a list of value lists in
+        column order (converted locally if the core only speaks dict rows).
+        There is no backpressure: the client's reader thread queues every event
+        as soon as the core writes it, so a slow `on_batch` does not slow the
+        core down. Use a streaming cursor (`open_cursor`/`fetch_cursor`) to
+        bound memory for results that may be large.
+        """
+        columns: List[str] = []
+
         def handle_event(payload: Dict[str, Any]) -> None:
-            # Ignores the leading "columns" progress event; only row_batch is consumed here.
+            if payload.get("event") == "columns" and isinstance(payload.get("columns"), list):
+                columns[:] = [str(column) for column in payload["columns"]]
+                return
             if payload.get("event") != "row_batch" or not on_batch:
                 return
+            if result_format == RESULT_FORMAT_COLUMNAR:
+                on_batch(batch_values(payload, columns))
+                return
             rows = payload.get("rows")
             if isinstance(rows, list):
                 on_batch([row for row in rows if isinstance(row, dict)])
 
         return self.client.request(
             "query.execute",
+            self._query_payload(
+                {
+                    "connection_id": connection_id,
+                    "sql": sql,
+                    "params": list(params or []),
+                    "stream_rows": True,
+                    "row_batch_size": int(row_batch_size),
+                },
+                result_format,
+            ),
+            on_event=handle_event,
+        )
+
+    def execute_batch(
+        self,
+        connection_id: str,
+        sql: Optional[str] = None,
+        params: Optional[Sequence[Sequence[Any]]] = None,
+        statements: Optional[Sequence[Union[str, Tuple[str, Sequence[Any]]]]] = None,
+        transaction: bool = True,
+        stop_on_error: bool = True,
+    ) -> Dict[str, Any]:
+        """Run many statements on `connection_id` in one `query.execute_batch` round trip.
+
+        Pass either one `sql` template with a `params` matrix (plain INSERT templates
+        are rewritten into multi-row INSERTs by the core) or a list of `statements`
+        (SQL strings or `(sql, params)` pairs). With `transaction=True` the core wraps
+        the batch in its own transaction and rolls back on the first error; use False
+        when the connection already has a transaction open. Per-statement failures are
+        reported in `errors` rather than raised.
+        """
+        payload = _batch_payload(connection_id, sql, params, statements, transaction, stop_on_error)
+        return _normalize_batch_result(self.client.request("query.execute_batch", payload))
+
+    def cancel_query(self, connection_id: str) -> bool:
+        """Stop the statement running on `connection_id` (KILL QUERY / pg_cancel_backend).
+
+        The core sends the cancel over a side connection, so this does not wait for the
+        running query; the connection itself stays open.
+        """
+        result = self.client.request("query.cancel", {"connection_id": connection_id})
+        return bool(result.get("cancelled"))
+
+    def open_cursor(
+        self,
+        connection_id: str,
+        sql: str,
+        params: Optional[Sequence[Any]] = None,
+        row_batch_size: int = 500,
+    ) -> Dict[str, Any]:
+        """Open a server-side cursor; rows stay in the core until `fetch_cursor` pulls them."""
+        result = self.client.request(
+            "cursor.open",
             {
                 "connection_id": connection_id,
                 "sql": sql,
                 "params": list(params or []),
-                "stream_rows": True,
                 "row_batch_size": int(row_batch_size),
             },
-            on_event=handle_event,
         )
+        return _normalize_cursor_open(result)
+
+    def fetch_cursor(
+        self,
+        connection_id: str,
+        cursor_id: str,
+        result_format: str = RESULT_FORMAT_ROWS,
+    ) -> Dict[str, Any]:
+        """Pull the next batch. `done` is set once the core has no rows left (cursor released)."""
+        # connection_id is only routing information: the pool pins it to the owning core process.
+        result = self.client.request(
+            "cursor.fetch",
+            self._query_payload({"connection_id": connection_id, "cursor_id": cursor_id}, result_format),
+        )
+        normalized = _normalize_query_result(result, result_format)
+        normalized["done"] = bool(result.get("done"))
+        return normalized
+
+    def close_cursor(self, connection_id: str, cursor_id: str) -> bool:
+        result = self.client.request(
+            "cursor.close",
+            {"connection_id": connection_id, "cursor_id": cursor_id},
+        )
+        return bool(result.get("closed"))
 
     def run_migration(
         self,
@@ -197,16 +344,108 @@ class DbCoreFacade:
         return self.client.request("oneclick.apply_fixes", payload, on_event=on_event)
 
 
+def _advertises_result_format(features: Dict[str, Any], result_format: str) -> bool:
+    if result_format == RESULT_FORMAT_ROWS:
+        return True
+    formats = features.get("result_formats")
+    return isinstance(formats, list) and result_format in formats
+
+
+def _advertises_command(features: Dict[str, Any], command: str) -> bool:
+    capabilities = features.get("capabilities")
+    return isinstance(capabilities, list) and command in capabilities
+
+
+def _batch_payload(
+    connection_id: str,
+    sql: Optional[str],
+    params: Optional[Sequence[Sequence[Any]]],
+    statements: Optional[Sequence[Union[str, Tuple[str, Sequence[Any]]]]],
+    transaction: bool,
+    stop_on_error: bool,
+) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {
+        "connection_id": connection_id,
+        "transaction": bool(transaction),
+        "stop_on_error": bool(stop_on_error),
+    }
+    if statements is not None:
+        payload["statements"] = [
+            item if isinstance(item, str)
+            else {"sql": item[0], "params": list(item[1] or [])}
+            for item in statements
+        ]
+    else:
+        payload["sql"] = sql or ""
+        payload["params"] = [list(row) for row in params or []]
+    return payload
+
+
+def _normalize_batch_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    rows_affected = result.get("rows_affected")
+    errors = result.get("errors")
+    return {
+        "rows_affected": list(rows_affected) if isinstance(rows_affected, list) else [],
+        "total_rows_affected": int(result.get("total_rows_affected") or 0),
+        "errors": [item for item in errors if isinstance(item, dict)] if isinstance(errors, list) else [],
+        "committed": bool(result.get("committed")),
+        "rewritten": bool(result.get("rewritten")),
+    }
+
+
+def _normalize_cursor_open(result: Dict[str, Any]) -> Dict[str, Any]:
+    columns = result.get("columns")
+    return {
+        "cursor_id": str(result.get("cursor_id") or ""),
+        "columns": [str(column) for column in columns] if isinstance(columns, list) else [],
+    }
+
+
+def _normalize_prepared_result(result: Dict[str, Any], result_format: str) -> Dict[str, Any]:
+    normalized = _normalize_query_result(result, result_format)
+    if result.get("prepared"):
+        normalized["statement_id"] = str(result.get("statement_id", ""))
+        normalized["statement_cache_hit"] = bool(result.get("statement_cache_hit"))
+    return normalized
+
+
+def _normalize_query_result(result: Dict[str, Any], result_format: str) -> Dict[str, Any]:
+    rows = result.get("rows")
+    columns = result.get("columns")
+    column_names = [str(column) for column in columns] if isinstance(columns, list) else []
+    dict_rows = [row for row in rows if isinstance(row, dict)] if isinstance(rows, list) else []
+    values = result.get("values")
+    if isinstance(values, list):
+        normalized_rows: Any = ColumnarRows(column_names, [row for row in values if isinstance(row, list)])
+    elif result_format == RESULT_FORMAT_COLUMNAR:
+        normalized_rows = ColumnarRows.from_dict_rows(column_names, dict_rows)
+    else:
+        normalized_rows = dict_rows
+    return {
+        "rows": normalized_rows,
+        "columns": column_names,
+        "rows_affected": int(result.get("rows_affected") or 0),
+    }
+
+
 _shared_facade_lock = threading.Lock()
 _shared_facade: Optional[DbCoreFacade] = None
+_shared_pool_config = DbCorePoolConfig()
+
+
+def configure_shared_db_core_pool(config: DbCorePoolConfig) -> None:
+    """Set the process pool size used when the shared facade is first created."""
+    global _shared_pool_config
+    with _shared_facade_lock:
+        _shared_pool_config = config
 
 
 def get_shared_db_core_facade() -> DbCoreFacade:
-    """Return the app-wide Rust DB core facade."""
+    """Return the app-wide Rust DB core facade backed by the core process pool."""
     global _shared_facade
     with _shared_facade_lock:
         if _shared_facade is None:
-            _shared_facade = DbCoreFacade()
+            _shared_facade = DbCoreFacade(DbCoreProcessPool(_shared_pool_config))
         return _shared_facade
 
 
@@ -0,0 +1,231 @@
+"""Managed pool of Rust TunnelForge DB core processes.
+
+Interactive work (queries, connection lifecycle, metadata) and bulk jobs
+(dump/import/migration) run on separate `tunnelforge-core` processes so a
+saturated or crashing bulk job cannot freeze SQL editor or health checks.
+"""
+import itertools
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from src.core.db_core_client import DbCoreServiceClient, DbCoreServiceError
+from src.core.logger import get_logger
+
+logger = get_logger("db_core_service")
+
+LANE_INTERACTIVE = "interactive"
+LANE_BULK = "bulk"
+
+BULK_COMMANDS = frozenset({
+    "dump.run",
+    "dump.import",
+    "migration.run",
+    "migration.resume",
+    "migration.cleanup",
+    "oneclick.run",
+    "oneclick.apply_fixes",
+})
+
+MAX_WORKERS_PER_LANE = 8
+
+
+def _clamp_workers(value: Any, default: int) -> int:
+    try:
+        count = int(value)
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(MAX_WORKERS_PER_LANE, count))
+
+
+@dataclass(frozen=True)
+class DbCorePoolConfig:
+    """Process counts per lane; each lane starts its processes lazily."""
+
+    interactive_workers: int = 1
+    bulk_workers: int = 1
+
+    @classmethod
+    def from_config_manager(cls, config_manager) -> "DbCorePoolConfig":
+        """Build from app settings (`db_core_interactive_workers`, `db_core_bulk_workers`)."""
+        defaults = cls()
+        return cls(
+            interactive_workers=_clamp_workers(
+                config_manager.get_app_setting("db_core_interactive_workers"),
+                defaults.interactive_workers,
+            ),
+            bulk_workers=_clamp_workers(
+                config_manager.get_app_setting("db_core_bulk_workers"),
+                defaults.bulk_workers,
+            ),
+        )
+
+
+def command_lane(command: str) -> str:
+    return LANE_BULK if command in BULK_COMMANDS else LANE_INTERACTIVE
+
+
+class DbCoreProcessPool:
+    """Client-compatible router over several `DbCoreServiceClient` workers.
+
+    Exposes the same `request()`/`start()`/`shutdown()` surface as a single
+    client so `DbCoreFacade` can use either. Connection-scoped requests
+    (`connection_id` in the payload) are pinned to the worker that opened the
+    connection, because connection ids only exist inside one core process.
+    """
+
+    def __init__(
+        self,
+        config: Optional[DbCorePoolConfig] = None,
+        client_factory: Optional[Callable[[], DbCoreServiceClient]] = None,
+    ):
+        self.config = config or DbCorePoolConfig()
+        factory = client_factory or DbCoreServiceClient
+        interactive_count = _clamp_workers(self.config.interactive_workers, 1)
+        bulk_count = _clamp_workers(self.config.bulk_workers, 1)
+        self._lanes: Dict[str, List[DbCoreServiceClient]] = {
+            LANE_INTERACTIVE: [factory() for _ in range(interactive_count)],
+            LANE_BULK: [factory() for _ in range(bulk_count)],
+        }
+        self._lock = threading.Lock()
+        self._round_robin = itertools.count()
+        self._connection_owner: Dict[str, DbCoreServiceClient] = {}
+        self._crash_count = 0
+
+    @property
+    def workers(self) -> List[DbCoreServiceClient]:
+        return [worker for lane in self._lanes.values() for worker in lane]
+
+    def start(self) -> None:
+        """Start one interactive worker eagerly; every other worker starts on demand."""
+        self._lanes[LANE_INTERACTIVE][0].start()
+
+    def _pick_worker(self, command: str, payload: Optional[Dict[str, Any]]) -> DbCoreServiceClient:
+        connection_id = (payload or {}).get("connection_id")
+        if connection_id:
+            with self._lock:
+                owner = self._connection_owner.get(str(connection_id))
+            if owner is not None:
+                return owner
+        lane = self._lanes[command_lane(command)]
+        if len(lane) == 1:
+            return lane[0]
+        offset = next(self._round_robin)
+        # Least in-flight first; round-robin among equally loaded workers spreads warm-up.
+        _load, _order, worker = min(
+            (worker.in_flight_count(), (index - offset) % len(lane), worker)
+            for index, worker in enumerate(lane)
+        )
+        return worker
+
+    def _track_connection(
+        self,
+        worker: DbCoreServiceClient,
+        command: str,
+        payload: Optional[Dict[str, Any]],
+        result: Dict[str, Any],
+    ) -> None:
+        if command == "connection.open" and result.get("success") and result.get("connection_id"):
+            with self._lock:
+                self._connection_owner[str(result["connection_id"])] = worker
+        elif command == "connection.close":
+            connection_id = (payload or {}).get("connection_id")
+            if connection_id:
+                with self._lock:
+                    self._connection_owner.pop(str(connection_id), None)
+
+    def _handle_worker_failure(self, worker: DbCoreServiceClient) -> None:
+        """Restart a crashed worker and forget the connections that died with it."""
+        if worker.is_running():
+            return
+        with self._lock:
+            self._crash_count += 1
+            stale = [
+                connection_id
+                for connection_id, owner in self._connection_owner.items()
+                if owner is worker
+            ]
+            for connection_id in stale:
+                del self._connection_owner[connection_id]
+        logger.warning(
+            "Rust DB Core worker crashed; restarting (dropped %d connection(s))", len(stale)
+        )
+        try:
+            worker.start()
+        except DbCoreServiceError as exc:
+            logger.error("Rust DB Core worker restart failed: %s", exc)
+
+    def request(
+        self,
+        command: str,
+        payload: Optional[Dict[str, Any]] = None,
+        request_id: Optional[str] = None,
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        worker = self._pick_worker(command, payload)
+        try:
+            result = worker.request(command, payload, request_id=request_id, on_event=on_event)
+        except DbCoreServiceError:
+            self._handle_worker_failure(worker)
+            raise
+        self._track_connection(worker, command, payload, result)
+        return result
+
+    async def request_async(
+        self,
+        command: str,
+        payload: Optional[Dict[str, Any]] = None,
+        request_id: Optional[str] = None,
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """Awaitable `request()` with the same worker routing and crash handling."""
+        worker = self._pick_worker(command, payload)
+        try:
+            result = await worker.request_async(command, payload, request_id=request_id, on_event=on_event)
+        except DbCoreServiceError:
+            self._handle_worker_failure(worker)
+            raise
+        self._track_connection(worker, command, payload, result)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool-level counters: in-flight/queued requests, busy workers and restarts."""
+        lanes: Dict[str, Dict[str, Any]] = {}
+        totals = {
+            "workers": 0,
+            "running_workers": 0,
+            "busy_workers": 0,
+            "in_flight": 0,
+            "queue_depth": 0,
+            "restarts": 0,
+        }
+        for lane_name, lane in self._lanes.items():
+            lane_stats = {key: 0 for key in totals}
+            for worker in lane:
+                for key, value in worker.stats().items():
+                    lane_stats[key] += value
+            lanes[lane_name] = lane_stats
+            for key in totals:
+                totals[key] += lane_stats[key]
+        with self._lock:
+            totals["crashes"] = self._crash_count
+            totals["open_connections"] = len(self._connection_owner)
+        totals["lanes"] = lanes
+        return totals
+
+    def shutdown(self) -> None:
+        for worker in self.workers:
+            try:
+                worker.shutdown()
+            except Exception as exc:
+                logger.warning("Rust DB Core worker shutdown failed: %s", exc)
+        with self._lock:
+            self._connection_owner.clear()
+
+    def __enter__(self) -> "DbCoreProcessPool":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.shutdown()
+        return False
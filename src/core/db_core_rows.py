@@ -0,0 +1,63 @@
+"""Columnar query results returned by the Rust DB core."""
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+RESULT_FORMAT_ROWS = "rows"
+RESULT_FORMAT_COLUMNAR = "columnar"
+
+
+class ColumnarRows(Sequence[Dict[str, Any]]):
+    """Row sequence stored as column names plus one value list per row.
+
+    Consumers that only need values (grid views, exports) read `values`
+    directly. Legacy callers that index or iterate still get dict rows, but
+    each dict is built only when that row is actually accessed.
+    """
+
+    __slots__ = ("columns", "values")
+
+    def __init__(self, columns: Sequence[str], values: Optional[List[List[Any]]] = None):
+        self.columns: List[str] = [str(column) for column in columns]
+        self.values: List[List[Any]] = values if values is not None else []
+
+    @classmethod
+    def from_dict_rows(cls, columns: Sequence[str], rows: Sequence[Dict[str, Any]]) -> "ColumnarRows":
+        """Convert legacy JSONL dict rows (cores without columnar support)."""
+        if not columns and rows:
+            columns = list(rows[0].keys())
+        return cls(columns, [[row.get(column) for column in columns] for row in rows])
+
+    def _row(self, values: List[Any]) -> Dict[str, Any]:
+        return dict(zip(self.columns, values))
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self._row(values) for values in self.values[index]]
+        return self._row(self.values[index])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for values in self.values:
+            yield self._row(values)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ColumnarRows):
+            return self.columns == other.columns and self.values == other.values
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ColumnarRows(columns={self.columns!r}, rows={len(self.values)})"
+
+
+def batch_values(payload: Dict[str, Any], columns: Sequence[str]) -> List[List[Any]]:
+    """Return a `row_batch` event's rows as value lists, whichever format the core used."""
+    values = payload.get("values")
+    if isinstance(values, list):
+        return [row for row in values if isinstance(row, list)]
+    rows = payload.get("rows")
+    if not isinstance(rows, list):
+        return []
+    return [[row.get(column) for column in columns] for row in rows if isinstance(row, dict)]
@@ -4,7 +4,11 @@ This module is a pure re-export shim kept for backward-compatible imports.
 The actual implementation lives in:
 - `src.core.db_core_client` (JSONL client + engine/version helpers)
 - `src.core.db_core_facade` (DbEndpoint + DbCoreFacade + shared facade lifecycle)
-- `src.core.db_core_dbapi_shim` (RustDbConnector/RustDbConnection/RustDbCursor)
+- `src.core.db_core_async` (AsyncDbCoreFacade + loop thread for callers without a running loop)
+- `src.core.db_core_pool` (interactive/bulk core process pool behind the shared facade)
+- `src.core.db_core_rows` (columnar query result rows)
+- `src.core.db_core_connection_pool` (endpoint-keyed pool of stateful core connections)
+- `src.core.db_core_dbapi_shim` (RustDbConnector/RustDbConnection/RustDbCursor/RustDbStreamingCursor)
 """
 from src.core.db_core_client import (
     DbCoreServiceClient,
@@ -15,19 +19,34 @@ from src.core.db_core_client import (
     normalize_db_engine,
     parse_db_version_tuple,
 )
+from src.core.db_core_async import (
+    AsyncDbCoreFacade,
+    DbCoreEventStream,
+    DbCoreLoopThread,
+    get_shared_db_core_loop,
+)
+from src.core.db_core_connection_pool import (
+    DbConnectionPool,
+    DbConnectionPoolConfig,
+    get_shared_db_connection_pool,
+)
 from src.core.db_core_dbapi_shim import (
     RustDbConnection,
     RustDbConnector,
     RustDbCursor,
+    RustDbStreamingCursor,
     create_rust_db_connector,
     quote_mysql_ident,
 )
 from src.core.db_core_facade import (
     DbCoreFacade,
     DbEndpoint,
+    configure_shared_db_core_pool,
     get_shared_db_core_facade,
     shutdown_shared_db_core_facade,
 )
+from src.core.db_core_pool import DbCorePoolConfig, DbCoreProcessPool
+from src.core.db_core_rows import RESULT_FORMAT_COLUMNAR, RESULT_FORMAT_ROWS, ColumnarRows
 
 __all__ = [
     "DbCoreServiceError",
@@ -39,11 +58,25 @@ __all__ = [
     "DbEndpoint",
     "DbCoreServiceClient",
     "DbCoreFacade",
+    "AsyncDbCoreFacade",
+    "DbCoreEventStream",
+    "DbCoreLoopThread",
+    "get_shared_db_core_loop",
+    "DbCorePoolConfig",
+    "DbCoreProcessPool",
+    "DbConnectionPool",
+    "DbConnectionPoolConfig",
+    "get_shared_db_connection_pool",
+    "ColumnarRows",
+    "RESULT_FORMAT_ROWS",
+    "RESULT_FORMAT_COLUMNAR",
+    "configure_shared_db_core_pool",
     "get_shared_db_core_facade",
     "shutdown_shared_db_core_facade",
     "RustDbConnector",
     "create_rust_db_connector",
     "RustDbConnection",
     "RustDbCursor",
+    "RustDbStreamingCursor",
     "quote_mysql_ident",
 ]
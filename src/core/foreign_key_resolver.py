@@ -97,6 +97,7 @@ class ForeignKeyResolver:
         tables: Optional[List[str]] = None,
         sample_limit: int = 5,
         progress_callback: Optional[Callable[[str], None]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
     ) -> List[OrphanRecordInfo]:
         fk_details = self.get_fk_details(schema)
         if tables:
@@ -105,6 +106,9 @@ class ForeignKeyResolver:
 
         results = []
         for index, fk in enumerate(fk_details, 1):
+            # 취소되면 남은 FK는 건너뛰고 그때까지의 결과만 반환한다.
+            if is_cancelled and is_cancelled():
+                break
             table = fk["table"]
             column = fk["column"]
             ref_table = fk["referenced_table"]
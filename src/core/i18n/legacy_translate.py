@@ -169,6 +169,19 @@ _EN_TEXT_TRANSLATIONS = {
         "A query is running. The current DB operation may not stop immediately. Wait for it to finish before closing?"
     ),
     "저장되지 않은 셀 편집 {}건": "{} unsaved cell edit(s)",
+    "⏹ 분석 중지": "⏹ Stop Analysis",
+    "남은 검사를 건너뛰고 실행 중인 검사 쿼리를 서버에서 중단합니다.": (
+        "Skip the remaining checks and stop the running check query on the server."
+    ),
+    "실행 중인 고아 레코드 검사 쿼리를 서버에서 중단합니다.": "Stop the running orphan record check query on the server.",
+    "분석이 중지되었습니다.": "Analysis stopped.",
+    "중지 중...": "Stopping...",
+    "실행 중인 쿼리 중지\n서버에서 실행 중인 statement를 중단하고 남은 쿼리는 건너뜀": (
+        "Stop the running query\nStops the running statement on the server and skips the remaining queries"
+    ),
+    "⏹ 쿼리 중지 요청 — 실행 중인 statement를 서버에서 중단합니다": (
+        "⏹ Query stop requested — stopping the running statement on the server"
+    ),
 }
 
 _EN_PHRASE_TRANSLATIONS = {
@@ -198,6 +211,17 @@ _EN_PHRASE_TRANSLATIONS = {
     "앱 시작 시 자동으로 업데이트 확인": "Automatically check for updates on app startup",
     "백업 목록": "Backup List",
     "최근 5개": "latest 5",
+    "최근 5분": "last 5 min",
+    "측정 실패율": "Probe failure rate",
+    "빈 포트 찾기": "Find Free Port",
+    "설정 범위에 빈 포트가 없습니다.": "No free port in the configured range.",
+    "연결 설정 시간": "Setup time",
+    "채널 평균": "channel avg",
+    "활성 채널": "Active channels",
+    "트래픽": "Traffic",
+    "처리량": "Throughput",
+    "전송량": "Transferred",
+    "누적 ": "total ",
     "설정 백업/복원": "Settings Backup/Restore",
     "설정을 복원하시겠습니까?": "Do you want to restore settings?",
     "현재 설정은 자동으로 백업됩니다.": "Current settings will be backed up automatically.",
@@ -231,6 +255,9 @@ _EN_PHRASE_TRANSLATIONS = {
     "SSH 터널": "SSH tunnel",
     "스키마 목록 로드 실패": "Failed to load schema list",
     "분석 중 오류 발생": "An error occurred during analysis",
+    "분석 캐시 읽기 실패, 전체 분석으로 진행": "Failed to read analysis cache, running a full analysis",
+    "분석 캐시 로드 실패": "Failed to load analysis cache",
+    "분석 캐시 저장 실패": "Failed to save analysis cache",
     "파일 저장 실패": "Failed to save file",
     "파일 불러오기 실패": "Failed to load file",
     "찾을 수 없음": "not found",
@@ -976,7 +1003,12 @@ _EN_REGEX_TRANSLATIONS = (
     (r"선택된 (?P<count>\{[^}]*\}|[0-9,]+)개 항목에 대해 정리 작업을 실행합니다\.\n\n이 작업은 되돌릴 수 없습니다\. 계속하시겠습니까\?", r"Cleanup will run for \g<count> selected items.\n\nThis operation cannot be undone. Do you want to continue?"),
     (r"이 SQL에 위험한 쿼리가 포함되어 있습니다\.\n\n(?P<sql>.*)\n\n정말 저장하시겠습니까\?", r"This SQL contains dangerous queries.\n\n\g<sql>\n\nDo you really want to save?"),
     (r"'(?P<name>[^']+)'의 변경사항을 저장하시겠습니까\?", r"Do you want to save changes to '\g<name>'?"),
+    (r"결과가 (?P<count>\{[^}]*\}|[0-9,]+)행 상한에 도달해 이후 행은 가져오지 않았습니다 \(LIMIT으로 범위를 좁히세요\)", r"The result reached the \g<count>-row cap; later rows were not fetched (narrow it with LIMIT)"),
     (r"(?P<count>\{[^}]*\}|[0-9,]+)초", r"\g<count>s"),
+    (r"(?P<count>\{[^}]*\}|[0-9,]+)개 터널 연결 시도 중\.\.\.", r"Connecting \g<count> tunnels..."),
+    (r"포트 (?P<port>\{[^}]*\}|[0-9]+)이\(가\) 이미 사용 중입니다\.", r"Port \g<port> is already in use."),
+    (r"포트 (?P<port>\{[^}]*\}|[0-9]+)이\(가\) 다른 터널과 겹칩니다\.", r"Port \g<port> is already used by another tunnel."),
+    (r"\(빈 포트: (?P<port>\{[^}]*\}|[0-9]+)\)", r"(free port: \g<port>)"),
     (r"(?P<count>\{[^}]*\}|[0-9,]+)개 터널 연결됨", r"\g<count> tunnels connected"),
     (r"(?P<count>\{[^}]*\}|[0-9,]+)개 스킵", r"\g<count> skipped"),
     (r"(?P<count>\{[^}]*\}|[0-9,]+)개 테이블", r"\g<count> tables"),
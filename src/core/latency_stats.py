@@ -0,0 +1,139 @@
+"""
+터널 Latency 통계
+- 고정 크기 링 버퍼(array)에 측정값과 측정 시각 저장 (추가 O(1), 재할당 없음)
+- 시간 창별 백분위(p50/p95/p99), jitter, 실패율 요약
+"""
+import math
+import threading
+import time
+from array import array
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 터널당 보관하는 최근 측정 수. 5초 간격이면 약 40분, 적응형 간격에서는 그 이상이다.
+LATENCY_SAMPLE_CAPACITY = 512
+# 상태 다이얼로그 등에서 기본으로 쓰는 요약 창 (초)
+LATENCY_SUMMARY_WINDOW_SECONDS = 300.0
+
+# 실패한 측정은 값 대신 이 표식으로 저장한다
+_FAILED = -1.0
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    """시간 창 하나에 대한 latency 요약 (ms 단위, 성공 측정이 없으면 값은 None)"""
+    window_seconds: Optional[float]
+    samples: int
+    failures: int
+    failure_rate: float
+    min_ms: Optional[float] = None
+    max_ms: Optional[float] = None
+    mean_ms: Optional[float] = None
+    p50_ms: Optional[float] = None
+    p95_ms: Optional[float] = None
+    p99_ms: Optional[float] = None
+    jitter_ms: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Optional[float]]:
+        return asdict(self)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    """정렬된 값에서 선형 보간 백분위 (fraction: 0.0~1.0)"""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * fraction
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return sorted_values[lower]
+    weight = position - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+class LatencyStats:
+    """터널 하나의 latency 측정 링 버퍼
+
+    가장 오래된 측정부터 덮어쓰므로 메모리는 capacity에 고정되고, 리스트 슬라이싱으로
+    매번 복사하던 비용이 없다. 전체 누적 측정/실패 수는 링 크기와 무관하게 따로 센다.
+    """
+
+    def __init__(self, capacity: int = LATENCY_SAMPLE_CAPACITY,
+                 clock: Callable[[], float] = time.monotonic):
+        self.capacity = max(1, int(capacity))
+        self._clock = clock
+        self._values = array('d', [0.0]) * self.capacity
+        self._times = array('d', [0.0]) * self.capacity
+        self._next = 0
+        self._size = 0
+        self._lock = threading.Lock()
+        self.total_samples = 0
+        self.total_failures = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def record(self, latency_ms: float, at: Optional[float] = None):
+        """측정 결과 추가. 음수는 실패로 기록한다."""
+        failed = latency_ms is None or latency_ms < 0
+        with self._lock:
+            self._values[self._next] = _FAILED if failed else float(latency_ms)
+            self._times[self._next] = self._clock() if at is None else at
+            self._next = (self._next + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+            self.total_samples += 1
+            if failed:
+                self.total_failures += 1
+
+    def clear(self):
+        with self._lock:
+            self._next = 0
+            self._size = 0
+
+    def samples(self, window_seconds: Optional[float] = None,
+                now: Optional[float] = None) -> List[Tuple[float, float]]:
+        """(측정 시각, 값) 목록 - 오래된 순. 실패는 값이 음수다."""
+        with self._lock:
+            start = (self._next - self._size) % self.capacity
+            indexes = [(start + offset) % self.capacity for offset in range(self._size)]
+            result = [(self._times[index], self._values[index]) for index in indexes]
+        if window_seconds is not None:
+            cutoff = (self._clock() if now is None else now) - window_seconds
+            result = [(at, value) for at, value in result if at >= cutoff]
+        return result
+
+    def recent_latencies(self, limit: Optional[int] = None) -> List[float]:
+        """최근 성공 측정값 (오래된 순, 최대 limit개)"""
+        values = [value for _, value in self.samples() if value >= 0]
+        if limit is not None:
+            values = values[-limit:] if limit > 0 else []
+        return values
+
+    def summary(self, window_seconds: Optional[float] = None,
+                now: Optional[float] = None) -> LatencySummary:
+        """창 안의 측정을 요약한다. window_seconds가 None이면 링 전체."""
+        window = self.samples(window_seconds, now)
+        latencies = [value for _, value in window if value >= 0]
+        failures = len(window) - len(latencies)
+        failure_rate = failures / len(window) if window else 0.0
+        if not latencies:
+            return LatencySummary(window_seconds, len(window), failures, failure_rate)
+
+        ordered = sorted(latencies)
+        # jitter: 연속한 성공 측정 간 차이의 평균 (RFC 3550의 interarrival jitter와 같은 취지)
+        jitter = None
+        if len(latencies) > 1:
+            jitter = sum(abs(b - a) for a, b in zip(latencies, latencies[1:])) / (len(latencies) - 1)
+        return LatencySummary(
+            window_seconds=window_seconds,
+            samples=len(window),
+            failures=failures,
+            failure_rate=failure_rate,
+            min_ms=ordered[0],
+            max_ms=ordered[-1],
+            mean_ms=sum(ordered) / len(ordered),
+            p50_ms=percentile(ordered, 0.50),
+            p95_ms=percentile(ordered, 0.95),
+            p99_ms=percentile(ordered, 0.99),
+            jitter_ms=jitter,
+        )
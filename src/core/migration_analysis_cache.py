@@ -0,0 +1,116 @@
+"""
+증분 마이그레이션 분석 캐시
+
+데이터 스캔 검사(고아 레코드, 0000-00-00 날짜값)의 결과를 검사 단위(테이블 / FK)별로
+그 대상 테이블의 지문(fingerprint)과 함께 보관한다. 다시 분석할 때 지문이 같은 단위는
+스캔하지 않고 저장된 결과를 재사용하고, 바뀐 테이블만 다시 스캔한다.
+
+테이블 지문은 카탈로그 스냅샷의 테이블 정의(컬럼/인덱스/엔진/콜레이션)와 데이터 변경
+힌트(UPDATE_TIME, TABLE_ROWS, CHECKSUM)의 해시다. 카탈로그 검사는 스냅샷 덕분에
+싸므로 캐시하지 않는다.
+
+결과는 JSON 으로 직렬화할 수 있는 dict 로만 보관하며, 파일 저장은 호출 측
+(MigrationResultStore)이 to_dict()/from_dict()로 맡는다.
+"""
+import hashlib
+import json
+from typing import Dict, Iterable, List, Optional
+
+# 검사 로직이나 저장 형식이 바뀌면 올려서 이전 캐시를 버린다
+ANALYSIS_CACHE_VERSION = 1
+
+# 테이블 정의/데이터 변경 힌트로 쓰는 카탈로그 필드
+_TABLE_FIELDS = (
+    'TABLE_TYPE', 'ENGINE', 'TABLE_COLLATION', 'ROW_FORMAT', 'CREATE_OPTIONS',
+    'UPDATE_TIME', 'TABLE_ROWS', 'CHECKSUM',
+)
+_COLUMN_FIELDS = (
+    'COLUMN_NAME', 'ORDINAL_POSITION', 'COLUMN_TYPE', 'CHARACTER_SET_NAME',
+    'COLLATION_NAME', 'IS_NULLABLE', 'COLUMN_DEFAULT', 'COLUMN_KEY', 'EXTRA',
+)
+_INDEX_FIELDS = ('INDEX_NAME', 'NON_UNIQUE', 'SEQ_IN_INDEX', 'COLUMN_NAME', 'SUB_PART', 'INDEX_TYPE')
+
+
+def _digest(payload) -> str:
+    text = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def table_fingerprints(catalog) -> Dict[str, str]:
+    """카탈로그 스냅샷의 테이블별 지문 {테이블명: 해시}"""
+    fingerprints = {}
+    for table in catalog.tables():
+        name = table['TABLE_NAME']
+        fingerprints[name] = _digest({
+            'table': [table.get(key) for key in _TABLE_FIELDS],
+            'columns': [[c.get(key) for key in _COLUMN_FIELDS] for c in catalog.columns(name)],
+            'indexes': [[i.get(key) for key in _INDEX_FIELDS] for i in catalog.indexes(name)],
+        })
+    return fingerprints
+
+
+def combine_fingerprints(*parts: Optional[str]) -> Optional[str]:
+    """여러 테이블에 걸친 검사 단위의 지문 (하나라도 모르면 None → 재사용 불가)"""
+    if any(part is None for part in parts):
+        return None
+    return _digest(list(parts))
+
+
+class AnalysisCache:
+    """스키마 하나의 검사 단위별 결과 캐시
+
+    entries 구조: {검사 이름: {단위 키: {'fingerprint': str, 'results': [dict, ...]}}}
+    """
+
+    def __init__(self, schema: str, server: str = '', entries: Optional[Dict[str, Dict[str, dict]]] = None):
+        self.schema = schema
+        self.server = server
+        self._entries: Dict[str, Dict[str, dict]] = entries or {}
+
+    def lookup(self, check: str, unit: str, fingerprint: Optional[str]) -> Optional[List[dict]]:
+        """지문이 같으면 저장된 결과, 아니면 None"""
+        if fingerprint is None:
+            return None
+        entry = self._entries.get(check, {}).get(unit)
+        if entry is None or entry.get('fingerprint') != fingerprint:
+            return None
+        return list(entry.get('results', []))
+
+    def store(self, check: str, unit: str, fingerprint: Optional[str], results: List[dict]):
+        if fingerprint is None:
+            self.discard(check, [unit])
+            return
+        self._entries.setdefault(check, {})[unit] = {'fingerprint': fingerprint, 'results': list(results)}
+
+    def discard(self, check: str, units: Iterable[str]):
+        entries = self._entries.get(check, {})
+        for unit in units:
+            entries.pop(unit, None)
+
+    def retain(self, check: str, units: Iterable[str]):
+        """units 에 없는 단위(삭제된 테이블/FK)의 결과를 버린다"""
+        keep = set(units)
+        entries = self._entries.get(check, {})
+        for unit in [unit for unit in entries if unit not in keep]:
+            del entries[unit]
+
+    def to_dict(self) -> dict:
+        return {
+            'version': ANALYSIS_CACHE_VERSION,
+            'schema': self.schema,
+            'server': self.server,
+            'entries': self._entries,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, schema: str, server: str = '') -> 'AnalysisCache':
+        """저장된 캐시 복원 (버전/스키마/서버가 다르면 빈 캐시)"""
+        if (
+            not isinstance(data, dict)
+            or data.get('version') != ANALYSIS_CACHE_VERSION
+            or data.get('schema') != schema
+            or data.get('server', '') != server
+            or not isinstance(data.get('entries'), dict)
+        ):
+            return cls(schema, server)
+        return cls(schema, server, data['entries'])
@@ -5,6 +5,7 @@ MigrationAnalyzer 협력 모듈이 공유하는 데이터클래스/Enum 정의.
 순환 import 방지를 위해 협력 모듈은 데이터클래스를 오직 이 모듈에서만 import한다.
 """
 from typing import List, Dict, Optional, Any
+import dataclasses
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -28,6 +29,8 @@ class OrphanRecord:
     parent_column: str
     orphan_count: int
     sample_values: List[Any] = field(default_factory=list)
+    # 시간 예산 안에 일부 구간만 검사했으면 True (orphan_count 는 "최소 N개")
+    is_partial: bool = False
 
 
 @dataclass
@@ -84,6 +87,39 @@ class SchemaCheckOptions:
     check_int_display_width: bool = True
 
 
+def compatibility_issue_to_dict(issue: CompatibilityIssue) -> dict:
+    """CompatibilityIssue → JSON 직렬화용 딕셔너리"""
+    return {**dataclasses.asdict(issue), 'issue_type': issue.issue_type.value}
+
+
+def compatibility_issue_from_dict(data: dict) -> CompatibilityIssue:
+    """딕셔너리에서 CompatibilityIssue 복원"""
+    return CompatibilityIssue(
+        issue_type=IssueType(data['issue_type']),
+        severity=data['severity'],
+        location=data['location'],
+        description=data['description'],
+        suggestion=data['suggestion'],
+        fix_query=data.get('fix_query'),
+        doc_link=data.get('doc_link'),
+        upgrade_check_id=data.get('upgrade_check_id'),
+        code_snippet=data.get('code_snippet'),
+        table_name=data.get('table_name'),
+        column_name=data.get('column_name')
+    )
+
+
+@dataclass(frozen=True)
+class DataScanLimits:
+    """데이터 스캔 검사의 비용 상한 (None 이면 제한 없음 = 전체 스캔)"""
+    # 테이블당 대략 이 행 수만 샘플링 (정수 PK 가 있으면 PK 범위 구간, 없으면 앞쪽 행)
+    sample_rows: Optional[int] = None
+    # 테이블 스캔 쿼리 하나의 시간 예산(초) — 넘기면 서버가 쿼리를 중단하고 미완료로 보고
+    table_time_budget: Optional[float] = None
+    # FK 하나의 고아 레코드 검사 시간 예산(초) — 넘기면 검사한 구간까지의 "최소 N개"로 보고
+    fk_time_budget: Optional[float] = None
+
+
 @dataclass
 class AnalysisResult:
     """분석 결과"""
@@ -95,25 +131,29 @@ class AnalysisResult:
     compatibility_issues: List[CompatibilityIssue] = field(default_factory=list)
     cleanup_actions: List[CleanupAction] = field(default_factory=list)
     fk_tree: Dict[str, List[str]] = field(default_factory=dict)
+    # 검사 스텝 라벨 → 소요 시간(초)
+    check_timings: Dict[str, float] = field(default_factory=dict)
+    # 검사 스텝 라벨 → 분석 캐시에서 재사용한 대상 (테이블명 / FK 키)
+    reused_results: Dict[str, List[str]] = field(default_factory=dict)
+    # 분석에 쓴 SchemaCatalogSnapshot (Fix 위저드 재사용용, 직렬화하지 않음)
+    catalog: Optional[Any] = field(default=None, repr=False, compare=False)
 
     def to_dict(self) -> dict:
         """JSON 직렬화용 딕셔너리 변환"""
-        import dataclasses
         return {
             'schema': self.schema,
             'analyzed_at': self.analyzed_at,
             'total_tables': self.total_tables,
             'total_fk_relations': self.total_fk_relations,
             'orphan_records': [dataclasses.asdict(o) for o in self.orphan_records],
-            'compatibility_issues': [
-                {**dataclasses.asdict(i), 'issue_type': i.issue_type.value}
-                for i in self.compatibility_issues
-            ],
+            'compatibility_issues': [compatibility_issue_to_dict(i) for i in self.compatibility_issues],
             'cleanup_actions': [
                 {**dataclasses.asdict(a), 'action_type': a.action_type.value}
                 for a in self.cleanup_actions
             ],
-            'fk_tree': self.fk_tree
+            'fk_tree': self.fk_tree,
+            'check_timings': self.check_timings,
+            'reused_results': self.reused_results
         }
 
     @classmethod
@@ -121,20 +161,7 @@ class AnalysisResult:
         """딕셔너리에서 AnalysisResult 복원"""
         orphan_records = [OrphanRecord(**o) for o in data.get('orphan_records', [])]
         compatibility_issues = [
-            CompatibilityIssue(
-                issue_type=IssueType(i['issue_type']),
-                severity=i['severity'],
-                location=i['location'],
-                description=i['description'],
-                suggestion=i['suggestion'],
-                fix_query=i.get('fix_query'),
-                doc_link=i.get('doc_link'),
-                upgrade_check_id=i.get('upgrade_check_id'),
-                code_snippet=i.get('code_snippet'),
-                table_name=i.get('table_name'),
-                column_name=i.get('column_name')
-            )
-            for i in data.get('compatibility_issues', [])
+            compatibility_issue_from_dict(i) for i in data.get('compatibility_issues', [])
         ]
         cleanup_actions = [
             CleanupAction(
@@ -158,5 +185,7 @@ class AnalysisResult:
             orphan_records=orphan_records,
             compatibility_issues=compatibility_issues,
             cleanup_actions=cleanup_actions,
-            fk_tree=data.get('fk_tree', {})
+            fk_tree=data.get('fk_tree', {}),
+            check_timings=data.get('check_timings', {}),
+            reused_results=data.get('reused_results', {})
         )
@@ -10,6 +10,8 @@ MigrationAnalyzer 는 아래 협력 모듈을 오케스트레이션하는 얇은
 데이터클래스는 migration_analysis_models 에 정의돼 있으며, 하위호환을 위해
 이 모듈 최상위에서 re-export 한다 (src/core/__init__.py 및 UI/테스트가 의존).
 """
+import dataclasses
+from dataclasses import dataclass
 from typing import List, Dict, Tuple, Optional, Callable
 
 from src.core.db_connector import MySQLConnector
@@ -25,24 +27,32 @@ from src.core.migration_analysis_models import (
     CleanupAction,
     AnalysisResult,
     SchemaCheckOptions,
+    DataScanLimits,
+    compatibility_issue_from_dict,
+    compatibility_issue_to_dict,
 )
 
 # 협력 모듈
 from src.core.migration_fk_analyzer import ForeignKeyAnalyzer
 from src.core.migration_compat_checker import MySQLUpgradeCompatibilityChecker
 from src.core.migration_cleanup_planner import OrphanCleanupPlanner
+from src.core.migration_schema_catalog import SchemaCatalogSnapshot
+from src.core.migration_check_executor import CheckExecutor, CheckStep
+from src.core.migration_analysis_cache import AnalysisCache, combine_fingerprints, table_fingerprints
 
 # 덤프 파일 분석기 (하위호환 re-export)
 from src.core.migration_dump_analyzer import DumpAnalysisResult, DumpFileAnalyzer
 
 __all__ = [
     'MigrationAnalyzer',
+    'MigrationAnalysisCancelled',
     'AnalysisResult',
     'OrphanRecord',
     'CleanupAction',
     'ActionType',
     'ForeignKeyInfo',
     'SchemaCheckOptions',
+    'DataScanLimits',
     'CompatibilityIssue',
     'IssueType',
     'DumpFileAnalyzer',
@@ -50,6 +60,44 @@ __all__ = [
 ]
 
 
+# 테이블 단위로 결과를 캐시하는 데이터 스캔 검사: 검사 메서드 → 캐시 검사 이름.
+# 이 메서드들은 tables(검사 대상 제한)와 skipped(검사 실패 테이블) 인자를 받는다.
+_TABLE_SCOPED_CHECKS = {
+    'check_invalid_date_values': 'invalid_dates',
+}
+_ORPHAN_CACHE_CHECK = 'orphans'
+
+
+_ORPHAN_STEP_LABEL = "고아 레코드 검사"
+
+
+def _fk_unit(record) -> str:
+    """FK(ForeignKeyInfo/OrphanRecord) 캐시 단위 키"""
+    return f"{record.child_table}.{record.child_column}->{record.parent_table}.{record.parent_column}"
+
+
+@dataclass
+class _IncrementalScan:
+    """증분 분석 상태 (캐시, 이번 카탈로그의 테이블 지문, 스텝 라벨별 재사용 대상)"""
+    cache: AnalysisCache
+    fingerprints: Dict[str, str]
+    reused: Dict[str, List[str]]
+
+
+def _connect_clone(connector: MySQLConnector) -> Callable[[], MySQLConnector]:
+    def open_clone() -> MySQLConnector:
+        clone = connector.clone()
+        success, msg = clone.connect()
+        if not success:
+            raise ConnectionError(msg)
+        return clone
+    return open_clone
+
+
+class MigrationAnalysisCancelled(Exception):
+    """분석 도중 취소 요청(set_cancel_check)이 감지됨"""
+
+
 class MigrationAnalyzer:
     """마이그레이션 분석기 (협력 모듈 파사드)
 
@@ -57,11 +105,29 @@ class MigrationAnalyzer:
     100% 유지하되, 실제 구현은 협력 객체(_fk/_compat/_cleanup)로 위임한다.
     """
 
-    def __init__(self, connector: MySQLConnector):
+    def __init__(
+        self,
+        connector: MySQLConnector,
+        connector_factory: Optional[Callable[[], MySQLConnector]] = None,
+    ):
+        """
+        Args:
+            connector: 분석할 DB 연결
+            connector_factory: 데이터 스캔 검사를 병렬로 돌릴 추가 연결을 여는 함수
+                (연결된 커넥터 반환). 생략하면 MySQLConnector 는 clone()으로 열고,
+                그 밖의 커넥터는 모든 검사를 순차 실행한다.
+        """
         self.connector = connector
+        if connector_factory is None and isinstance(connector, MySQLConnector):
+            connector_factory = _connect_clone(connector)
+        self._connector_factory = connector_factory
         self._progress_callback: Optional[Callable[[str], None]] = None
+        self._cancel_check: Optional[Callable[[], bool]] = None
+        self._analysis_cache: Optional[AnalysisCache] = None
+        self._scan_limits: Optional[DataScanLimits] = None
         # 공유 _log 를 각 협력 객체에 주입해 진행 상황을 동일 콜백으로 전달한다.
-        self._fk = ForeignKeyAnalyzer(connector, self._log)
+        self._fk = ForeignKeyAnalyzer(connector, self._log, self._is_cancelled)
+        self._fk.connector_factory = self._check_connector_factory()
         self._compat = MySQLUpgradeCompatibilityChecker(connector, self._log)
         self._cleanup = OrphanCleanupPlanner(connector, self._log)
 
@@ -69,11 +135,187 @@ class MigrationAnalyzer:
         """진행 상황 콜백 설정"""
         self._progress_callback = callback
 
+    def set_cancel_check(self, callback: Callable[[], bool]):
+        """취소 여부 콜백 설정 (검사 스텝 사이마다 확인)"""
+        self._cancel_check = callback
+
+    def set_analysis_cache(self, cache: Optional[AnalysisCache]):
+        """증분 분석 캐시 설정
+
+        캐시의 스키마를 분석할 때 데이터 스캔 검사는 지문이 바뀐 테이블만 다시
+        스캔하고 나머지는 캐시 결과를 재사용한다. 분석이 끝나면 캐시가 갱신돼 있다.
+        """
+        self._analysis_cache = cache
+
+    def set_scan_limits(self, limits: Optional[DataScanLimits]):
+        """데이터 스캔 검사의 샘플링/테이블·FK 당 시간 예산 설정 (None 이면 전체 스캔)"""
+        self._scan_limits = limits
+        self._compat.scan_limits = limits
+        self._fk.scan_limits = limits
+
+    def _cache_for(self, schema: str) -> Optional[AnalysisCache]:
+        cache = self._analysis_cache
+        return cache if cache is not None and cache.schema == schema else None
+
+    def _check_connector_factory(self) -> Optional[Callable[[], MySQLConnector]]:
+        return self._open_check_connector if self._connector_factory is not None else None
+
+    def _check_executor(self) -> CheckExecutor:
+        return CheckExecutor(self.connector, self._check_connector_factory(), self._log, self._is_cancelled)
+
+    def _open_check_connector(self):
+        """데이터 스캔 검사용 추가 연결 (주 연결과 같게 sql_mode 완화)"""
+        conn = self._connector_factory()
+        conn.set_session_sql_mode('')
+        return conn
+
+    def _orphan_step(self, schema: str, catalog: SchemaCatalogSnapshot, total_steps: int,
+                     incremental: Optional[_IncrementalScan] = None):
+        def run(connector, log):
+            log(f"📌 [1/{total_steps}] 고아 레코드 검사 시작...")
+            fk = ForeignKeyAnalyzer(connector, log, self._is_cancelled)
+            fk.catalog = catalog
+            fk.scan_limits = self._scan_limits
+            # 큰 자식 테이블의 PK 범위 청크는 추가 연결에서 동시에 센다
+            fk.connector_factory = self._check_connector_factory()
+            if incremental is None:
+                orphans = fk.find_orphan_records(schema)
+            else:
+                orphans = self._find_orphans_incremental(fk, schema, incremental, log)
+            if not self._is_cancelled():
+                log(f"✅ [1/{total_steps}] 고아 레코드 검사 완료 (발견: {len(orphans)}건)")
+            return orphans
+        return run
+
+    def _compat_step(self, header: str, label: str, method: str, args: tuple,
+                     catalog: SchemaCatalogSnapshot, incremental: Optional[_IncrementalScan] = None):
+        def run(connector, log):
+            log(header)
+            # 스텝마다 자기 연결/로그에 묶인 검사기를 쓴다 (병렬 스텝끼리 상태 공유 없음)
+            checker = MySQLUpgradeCompatibilityChecker(connector, log)
+            checker.catalog = catalog
+            checker.scan_limits = self._scan_limits
+            check = _TABLE_SCOPED_CHECKS.get(method)
+            if incremental is None or check is None:
+                return getattr(checker, method)(*args)
+            if self._scan_limits is not None and self._scan_limits.sample_rows:
+                # 샘플링 결과는 전체 스캔 결과와 따로 캐시한다
+                check = f"{check}@sample{self._scan_limits.sample_rows}"
+            return self._scan_tables_incremental(
+                check, label, incremental, log,
+                lambda tables, skipped: getattr(checker, method)(*args, tables=tables, skipped=skipped),
+            )
+        return run
+
+    def _scan_tables_incremental(
+        self,
+        check: str,
+        label: str,
+        incremental: _IncrementalScan,
+        log: Callable[[str], None],
+        scan: Callable[[List[str], List[str]], List[CompatibilityIssue]],
+    ) -> List[CompatibilityIssue]:
+        """지문이 바뀐 테이블만 scan 하고 나머지 테이블은 캐시 결과를 쓴다"""
+        cache, fingerprints = incremental.cache, incremental.fingerprints
+        cached: Dict[str, List[dict]] = {}
+        for table, fingerprint in fingerprints.items():
+            rows = cache.lookup(check, table, fingerprint)
+            if rows is not None:
+                cached[table] = rows
+        stale = [table for table in fingerprints if table not in cached]
+        if cached:
+            log(f"  ♻️ 캐시 재사용: {len(cached)}개 테이블 (변경된 {len(stale)}개 테이블만 검사)")
+
+        skipped: List[str] = []
+        fresh = scan(stale, skipped) if stale else []
+        # 취소로 중간에 끝난 스캔 결과는 캐시하지 않는다
+        if not self._is_cancelled():
+            by_table: Dict[str, List[dict]] = {table: [] for table in stale}
+            for issue in fresh:
+                by_table.setdefault(issue.table_name, []).append(compatibility_issue_to_dict(issue))
+            for table in stale:
+                if table in skipped:
+                    cache.discard(check, [table])
+                else:
+                    cache.store(check, table, fingerprints[table], by_table.get(table, []))
+            cache.retain(check, fingerprints)
+
+        incremental.reused[label] = sorted(cached)
+        issues = fresh + [compatibility_issue_from_dict(row) for rows in cached.values() for row in rows]
+        issues.sort(key=lambda issue: (issue.table_name or '', issue.column_name or ''))
+        return issues
+
+    def _find_orphans_incremental(
+        self,
+        fk: ForeignKeyAnalyzer,
+        schema: str,
+        incremental: _IncrementalScan,
+        log: Callable[[str], None],
+    ) -> List[OrphanRecord]:
+        """자식/부모 테이블 지문이 모두 같은 FK 는 캐시 결과를 쓰고 나머지만 검사"""
+        cache, fingerprints = incremental.cache, incremental.fingerprints
+        fk_list = fk.get_foreign_keys(schema)
+        units = {}
+        for info in fk_list:
+            unit = _fk_unit(info)
+            units[unit] = combine_fingerprints(
+                fingerprints.get(info.child_table), fingerprints.get(info.parent_table)
+            )
+        cached: Dict[str, List[dict]] = {}
+        for unit, fingerprint in units.items():
+            rows = cache.lookup(_ORPHAN_CACHE_CHECK, unit, fingerprint)
+            if rows is not None:
+                cached[unit] = rows
+        if cached:
+            log(f"  ♻️ 캐시 재사용: {len(cached)}개 FK (변경된 {len(units) - len(cached)}개 FK만 검사)")
+
+        def is_stale(info: ForeignKeyInfo) -> bool:
+            return _fk_unit(info) not in cached
+
+        skipped: List[ForeignKeyInfo] = []
+        fresh = []
+        if len(cached) < len(units):
+            fresh = fk.find_orphan_records(schema, fk_filter=is_stale, skipped=skipped)
+        fresh_by_unit: Dict[str, List[OrphanRecord]] = {}
+        for orphan in fresh:
+            unit = _fk_unit(orphan)
+            fresh_by_unit.setdefault(unit, []).append(orphan)
+
+        if not self._is_cancelled():
+            failed = {_fk_unit(info) for info in skipped}
+            for unit, fingerprint in units.items():
+                if unit in cached:
+                    continue
+                if unit in failed:
+                    cache.discard(_ORPHAN_CACHE_CHECK, [unit])
+                else:
+                    rows = [dataclasses.asdict(orphan) for orphan in fresh_by_unit.get(unit, [])]
+                    cache.store(_ORPHAN_CACHE_CHECK, unit, fingerprint, rows)
+            cache.retain(_ORPHAN_CACHE_CHECK, units)
+
+        incremental.reused[_ORPHAN_STEP_LABEL] = sorted(cached)
+        # FK 순서대로 캐시 결과와 새 결과를 합친다
+        orphans: List[OrphanRecord] = []
+        for unit in units:
+            if unit in cached:
+                orphans.extend(OrphanRecord(**row) for row in cached[unit])
+            else:
+                orphans.extend(fresh_by_unit.get(unit, []))
+        return orphans
+
     def _log(self, message: str):
         """진행 상황 로깅"""
         if self._progress_callback:
             self._progress_callback(message)
 
+    def _is_cancelled(self) -> bool:
+        return bool(self._cancel_check and self._cancel_check())
+
+    def _raise_if_cancelled(self):
+        if self._is_cancelled():
+            self._log("⏹ 분석이 취소되었습니다")
+            raise MigrationAnalysisCancelled("분석이 취소되었습니다")
+
     # ------------------------------------------------------------
     # FK 관계 / 고아 레코드 (ForeignKeyAnalyzer 위임)
     # ------------------------------------------------------------
@@ -256,11 +498,40 @@ class MigrationAnalyzer:
         schema: str,
         options: SchemaCheckOptions
     ) -> 'AnalysisResult':
-        """analyze_schema 내부 구현 (sql_mode 완화 상태에서 실행)"""
+        """analyze_schema 내부 구현 (sql_mode 완화 상태에서 실행)
+
+        INFORMATION_SCHEMA 는 시작할 때 SchemaCatalogSnapshot 으로 한 번만 읽고,
+        분석 동안 FK 분석기/호환성 검사기가 그 스냅샷을 공유한다.
+        """
+        incremental = self._cache_for(schema) is not None
+        if incremental:
+            # 테이블 지문의 UPDATE_TIME/TABLE_ROWS 가 캐시된 통계가 아닌 현재 값이 되도록 한다
+            self.connector.set_session_stats_expiry(0)
+        try:
+            catalog = SchemaCatalogSnapshot.load(self.connector, schema)
+        finally:
+            if incremental:
+                self.connector.set_session_stats_expiry(None)
+        self._fk.catalog = catalog
+        self._compat.catalog = catalog
+        try:
+            result = self._run_analysis(schema, options, catalog)
+        finally:
+            self._fk.catalog = None
+            self._compat.catalog = None
+        result.catalog = catalog
+        return result
+
+    def _run_analysis(
+        self,
+        schema: str,
+        options: SchemaCheckOptions,
+        catalog: SchemaCatalogSnapshot
+    ) -> 'AnalysisResult':
         from datetime import datetime
 
         # 기본 정보 수집
-        tables = self.connector.get_tables(schema)
+        tables = catalog.table_names()
         fk_list = self.get_foreign_keys(schema)
         fk_tree = self.build_fk_tree(schema)
 
@@ -274,38 +545,62 @@ class MigrationAnalyzer:
             fk_tree=fk_tree
         )
 
-        # 호환성 검사 스텝을 선언형으로 정의한다: (활성화 플래그, 로그 라벨, 검사 호출).
-        # 고아 레코드 검사(check_orphans)는 두 줄 로그 + cleanup 생성이 얽혀 있어
-        # 아래에서 [1/N]로 별도 처리하고, 나머지는 [2/N]...[N/N]로 자동 번호매김한다.
+        cache = self._cache_for(schema)
+        incremental = _IncrementalScan(cache, table_fingerprints(catalog), {}) if cache is not None else None
+
+        # 호환성 검사 스텝을 선언형으로 정의한다: (활성화 플래그, 로그 라벨, 검사 메서드, 인자, 데이터 스캔 여부).
+        # 고아 레코드 검사(check_orphans)는 두 줄 로그가 얽혀 있어 [1/N]로 별도 스텝을 만들고,
+        # 나머지는 [2/N]...[N/N]로 자동 번호매김한다. 데이터 스캔 검사만 병렬로 돈다.
         compat_steps = [
-            (options.check_charset, "문자셋 이슈 검사...", lambda: self.check_charset_issues(schema)),
-            (options.check_keywords, "예약어 충돌 검사...", lambda: self.check_reserved_keywords(schema)),
-            (options.check_routines, "저장 프로시저/함수 검사...", lambda: self.check_deprecated_in_routines(schema)),
-            (options.check_sql_mode, "SQL 모드 검사...", lambda: self.check_sql_modes()),
-            (options.check_auth_plugins, "인증 플러그인 검사...", lambda: self.check_auth_plugins()),
-            (options.check_zerofill, "ZEROFILL 속성 검사...", lambda: self.check_zerofill_columns(schema)),
-            (options.check_float_precision, "FLOAT(M,D) 구문 검사...", lambda: self.check_float_precision(schema)),
-            (options.check_fk_name_length, "FK 이름 길이 검사...", lambda: self.check_fk_name_length(schema)),
-            (options.check_invalid_dates, "0000-00-00 날짜값 검사...", lambda: self.check_invalid_date_values(schema)),
-            (options.check_year2, "YEAR(2) 타입 검사...", lambda: self.check_year2_type(schema)),
-            (options.check_deprecated_engines, "deprecated 스토리지 엔진 검사...", lambda: self.check_deprecated_engines(schema)),
-            (options.check_enum_empty, "ENUM 빈 문자열 검사...", lambda: self.check_enum_empty_value(schema)),
-            (options.check_timestamp_range, "TIMESTAMP 범위 검사...", lambda: self.check_timestamp_range(schema)),
-            (options.check_int_display_width, "INT 표시 너비 검사...", lambda: self.check_int_display_width(schema)),
+            (options.check_charset, "문자셋 이슈 검사...", 'check_charset_issues', (schema,), False),
+            (options.check_keywords, "예약어 충돌 검사...", 'check_reserved_keywords', (schema,), False),
+            (options.check_routines, "저장 프로시저/함수 검사...", 'check_deprecated_in_routines', (schema,), False),
+            (options.check_sql_mode, "SQL 모드 검사...", 'check_sql_modes', (), False),
+            (options.check_auth_plugins, "인증 플러그인 검사...", 'check_auth_plugins', (), False),
+            (options.check_zerofill, "ZEROFILL 속성 검사...", 'check_zerofill_columns', (schema,), False),
+            (options.check_float_precision, "FLOAT(M,D) 구문 검사...", 'check_float_precision', (schema,), False),
+            (options.check_fk_name_length, "FK 이름 길이 검사...", 'check_fk_name_length', (schema,), False),
+            (options.check_invalid_dates, "0000-00-00 날짜값 검사...", 'check_invalid_date_values', (schema,), True),
+            (options.check_year2, "YEAR(2) 타입 검사...", 'check_year2_type', (schema,), False),
+            (options.check_deprecated_engines, "deprecated 스토리지 엔진 검사...", 'check_deprecated_engines', (schema,), False),
+            (options.check_enum_empty, "ENUM 빈 문자열 검사...", 'check_enum_empty_value', (schema,), False),
+            (options.check_timestamp_range, "TIMESTAMP 범위 검사...", 'check_timestamp_range', (schema,), False),
+            (options.check_int_display_width, "INT 표시 너비 검사...", 'check_int_display_width', (schema,), False),
         ]
         total_steps = len(compat_steps) + 1  # +1: 고아 레코드 검사 스텝
 
+        steps: List[CheckStep] = []
         # 고아 레코드 검사 (스텝 1)
         if options.check_orphans and fk_list:
-            self._log(f"📌 [1/{total_steps}] 고아 레코드 검사 시작...")
-            result.orphan_records = self.find_orphan_records(schema)
-            self._log(f"✅ [1/{total_steps}] 고아 레코드 검사 완료 (발견: {len(result.orphan_records)}건)")
-
+            steps.append(CheckStep(
+                _ORPHAN_STEP_LABEL,
+                self._orphan_step(schema, catalog, total_steps, incremental),
+                scans_data=True,
+            ))
         # 호환성 검사들 (스텝 2..N — 번호/총계 자동 계산)
-        for step_no, (enabled, label, run_check) in enumerate(compat_steps, start=2):
+        compat_indexes = []
+        for step_no, (enabled, label, method, args, scans_data) in enumerate(compat_steps, start=2):
             if enabled:
-                self._log(f"📌 [{step_no}/{total_steps}] {label}")
-                result.compatibility_issues.extend(run_check())
+                compat_indexes.append(len(steps))
+                steps.append(CheckStep(
+                    label,
+                    self._compat_step(
+                        f"📌 [{step_no}/{total_steps}] {label}", label, method, args, catalog, incremental
+                    ),
+                    scans_data=scans_data,
+                ))
+
+        outcomes = self._check_executor().run(steps)
+        self._raise_if_cancelled()
+        if options.check_orphans and fk_list:
+            result.orphan_records = outcomes[0].result or []
+        for index in compat_indexes:
+            result.compatibility_issues.extend(outcomes[index].result or [])
+        result.check_timings = {
+            outcome.step.label: round(outcome.elapsed, 3) for outcome in outcomes if not outcome.skipped
+        }
+        if incremental is not None:
+            result.reused_results = {label: units for label, units in incremental.reused.items() if units}
 
         # 정리 작업 생성 (고아 레코드에 대해)
         for orphan in result.orphan_records:
@@ -316,5 +611,8 @@ class MigrationAnalyzer:
         self._log("✅ 분석 완료")
         self._log(f"  - 고아 레코드: {len(result.orphan_records)}개 FK 관계에서 발견")
         self._log(f"  - 호환성 이슈: {len(result.compatibility_issues)}개")
+        if result.reused_results:
+            reused = sum(len(units) for units in result.reused_results.values())
+            self._log(f"  - 캐시 재사용: {reused}개 대상 (변경 없는 테이블/FK)")
 
         return result
@@ -0,0 +1,275 @@
+"""
+마이그레이션 검사 실행기
+
+검사 스텝을 두 종류로 나눠 실행한다:
+- 카탈로그 검사 (scans_data=False): 스냅샷/가벼운 서버 조회라 호출 스레드에서 바로 실행
+- 데이터 스캔 검사 (scans_data=True): 테이블 데이터를 훑는 느린 검사라 작은 커넥션 풀에서
+  동시에 실행 (서버별 동시 실행 수 상한)
+
+각 스텝의 진행 로그는 스텝별로 모았다가 스텝 순서대로 내보내므로, 병렬로 실행해도
+순차 실행과 같은 순서로 보인다. 스텝마다 소요 시간을 잰다.
+
+데이터 스캔 스텝 안에서 다시 실행기를 돌리면(FK 청크 스캔 등) 바깥 스텝이 쥔 서버
+슬롯을 안쪽 스텝들에 넘겨주므로, 중첩돼도 서버 하나에 도는 스캔 수는 상한을 넘지 않는다.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from src.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 데이터 스캔 검사에 쓸 추가 커넥션 수와 서버 하나에 동시에 돌릴 스캔 수
+MIGRATION_CHECK_WORKERS = 3
+MIGRATION_SCANS_PER_SERVER = 3
+# 이보다 오래 걸린 스텝은 소요 시간을 로그에 남긴다
+STEP_TIMING_LOG_SECONDS = 1.0
+# 취소 요청을 확인하는 간격 (초)
+_CANCEL_POLL_SECONDS = 0.2
+
+_server_slots_lock = threading.Lock()
+_server_slots: Dict[Hashable, threading.BoundedSemaphore] = {}
+# 작업 스레드가 지금 쥐고 있는 서버 슬롯 (중첩 실행기가 넘겨받는다)
+_held = threading.local()
+
+
+def _server_slot(key: Hashable, limit: int) -> threading.BoundedSemaphore:
+    """서버별 동시 스캔 수 제한 세마포어 (같은 서버를 보는 실행기끼리 공유)"""
+    with _server_slots_lock:
+        slot = _server_slots.get(key)
+        if slot is None:
+            slot = _server_slots[key] = threading.BoundedSemaphore(max(1, int(limit)))
+        return slot
+
+
+def _server_key(connector) -> Hashable:
+    host = getattr(connector, 'host', None)
+    port = getattr(connector, 'port', None)
+    return (host, port) if host is not None else id(connector)
+
+
+@dataclass
+class CheckStep:
+    """검사 스텝 하나
+
+    run(connector, log)는 받은 커넥터로만 DB 에 접근하고 진행 상황은 log 로 남긴다.
+    데이터 스캔 스텝은 작업 스레드에서 풀 커넥터를 받아 실행될 수 있다.
+    """
+    label: str
+    run: Callable[[Any, Callable[[str], None]], Any]
+    scans_data: bool = False
+
+
+@dataclass
+class CheckOutcome:
+    """스텝 실행 결과 (스텝 순서 유지)"""
+    step: CheckStep
+    result: Any = None
+    elapsed: float = 0.0
+    skipped: bool = False
+
+
+class _OrderedLog:
+    """스텝별 로그를 모아 스텝 순서대로 내보낸다.
+
+    가장 앞의 미완료 스텝(head)의 로그는 바로 내보내고, 뒤 스텝의 로그는 head 가
+    끝날 때까지 모아 둔다.
+    """
+
+    def __init__(self, log: Callable[[str], None], count: int):
+        self._log = log
+        self._lock = threading.Lock()
+        self._buffers: List[List[str]] = [[] for _ in range(count)]
+        self._done = [False] * count
+        self._head = 0
+
+    def writer(self, index: int) -> Callable[[str], None]:
+        def write(message: str):
+            with self._lock:
+                if index == self._head:
+                    self._log(message)
+                else:
+                    self._buffers[index].append(message)
+        return write
+
+    def finish(self, index: int):
+        with self._lock:
+            self._done[index] = True
+            while self._head < len(self._done):
+                for message in self._buffers[self._head]:
+                    self._log(message)
+                self._buffers[self._head] = []
+                if not self._done[self._head]:
+                    break
+                self._head += 1
+
+
+class CheckExecutor:
+    """검사 스텝 실행기
+
+    connector_factory 가 있으면 데이터 스캔 스텝용으로 커넥터를 최대
+    min(max_workers, per_server_limit)개 더 열어 동시에 실행한다. 없거나 열지
+    못하면 모든 스텝을 주 커넥터로 차례대로 실행한다 (기존 동작).
+    """
+
+    def __init__(
+        self,
+        connector,
+        connector_factory: Optional[Callable[[], Any]] = None,
+        log: Optional[Callable[[str], None]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+        max_workers: int = MIGRATION_CHECK_WORKERS,
+        per_server_limit: int = MIGRATION_SCANS_PER_SERVER,
+    ):
+        self.connector = connector
+        self._connector_factory = connector_factory
+        self._log = log or (lambda message: None)
+        self._is_cancelled = is_cancelled or (lambda: False)
+        self._max_workers = max(1, int(max_workers))
+        self._per_server_limit = max(1, int(per_server_limit))
+        self._leased: List[Any] = []
+        self._leased_lock = threading.Lock()
+
+    def run(self, steps: List[CheckStep]) -> List[CheckOutcome]:
+        """스텝들을 실행하고 스텝 순서대로 결과를 돌려준다.
+
+        스텝이 예외를 던지면 앞 스텝들이 끝난 뒤 같은 예외를 다시 던진다.
+        취소되면 아직 시작하지 않은 스텝은 skipped 로 남긴다.
+        """
+        outcomes = [CheckOutcome(step) for step in steps]
+        ordered = _OrderedLog(self._log, len(steps))
+        data_indexes = [i for i, step in enumerate(steps) if step.scans_data]
+        pool = self._open_pool(len(data_indexes)) if data_indexes else []
+
+        errors: Dict[int, BaseException] = {}
+        futures: Dict[Future, int] = {}
+        executor = None
+        handed_over = None
+        try:
+            if pool:
+                connectors: 'queue.Queue' = queue.Queue()
+                for conn in pool:
+                    connectors.put(conn)
+                slot = _server_slot(_server_key(self.connector), self._per_server_limit)
+                if getattr(_held, 'slot', None) is slot:
+                    # 바깥 스텝은 안쪽 스텝들을 기다리기만 하므로 자기 슬롯을 넘겨준다
+                    handed_over = slot
+                    slot.release()
+                executor = ThreadPoolExecutor(max_workers=len(pool), thread_name_prefix='migration-check')
+                for index in data_indexes:
+                    future = executor.submit(
+                        self._run_pooled, outcomes[index], ordered, index, connectors, slot
+                    )
+                    futures[future] = index
+
+            for index, outcome in enumerate(outcomes):
+                if pool and outcome.step.scans_data:
+                    continue
+                try:
+                    self._run_step(outcome, self.connector, ordered, index)
+                except Exception as e:
+                    # 순차 실행과 같게 첫 실패 뒤 스텝은 시작하지 않는다
+                    errors[index] = e
+                    ordered.finish(index)
+                    for future in futures:
+                        future.cancel()
+                    break
+
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=_CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.cancelled():
+                        continue
+                    error = future.exception()
+                    if error is not None:
+                        errors[futures[future]] = error
+                if pending and self._is_cancelled():
+                    self._cancel_running(pending)
+            for future, index in futures.items():
+                if future.cancelled():
+                    outcomes[index].skipped = True
+                    ordered.finish(index)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+            self._close_pool(pool)
+            if handed_over is not None:
+                handed_over.acquire()
+
+        if errors:
+            raise errors[min(errors)]
+        return outcomes
+
+    def _run_step(self, outcome: CheckOutcome, connector, ordered: _OrderedLog, index: int):
+        if self._is_cancelled():
+            outcome.skipped = True
+            ordered.finish(index)
+            return
+        write = ordered.writer(index)
+        started = time.perf_counter()
+        outcome.result = outcome.step.run(connector, write)
+        outcome.elapsed = time.perf_counter() - started
+        if outcome.elapsed >= STEP_TIMING_LOG_SECONDS:
+            write(f"  ⏱️ 소요시간: {outcome.elapsed:.1f}초")
+        ordered.finish(index)
+
+    def _run_pooled(self, outcome: CheckOutcome, ordered: _OrderedLog, index: int,
+                    connectors: 'queue.Queue', slot: threading.BoundedSemaphore):
+        conn = connectors.get()
+        try:
+            with slot:
+                _held.slot = slot
+                try:
+                    self._run_step(outcome, conn, ordered, index)
+                finally:
+                    _held.slot = None
+        except Exception:
+            ordered.finish(index)
+            raise
+        finally:
+            connectors.put(conn)
+
+    def _cancel_running(self, pending):
+        for future in pending:
+            future.cancel()
+        with self._leased_lock:
+            leased = list(self._leased)
+        for conn in leased:
+            cancel = getattr(conn, 'cancel_running_query', None)
+            if callable(cancel):
+                try:
+                    cancel()
+                except Exception as e:
+                    logger.debug(f"검사 쿼리 중단 실패: {e}")
+
+    def _open_pool(self, data_steps: int) -> List[Any]:
+        if self._connector_factory is None:
+            return []
+        size = min(self._max_workers, self._per_server_limit, data_steps)
+        pool = []
+        for _ in range(size):
+            try:
+                conn = self._connector_factory()
+            except Exception as e:
+                logger.warning(f"검사용 추가 DB 연결 실패, 열린 연결만 사용: {e}")
+                break
+            if conn is None:
+                break
+            pool.append(conn)
+        with self._leased_lock:
+            self._leased = list(pool)
+        return pool
+
+    def _close_pool(self, pool: List[Any]):
+        with self._leased_lock:
+            self._leased = []
+        for conn in pool:
+            try:
+                conn.disconnect()
+            except Exception as e:
+                logger.debug(f"검사용 DB 연결 종료 실패: {e}")
@@ -5,10 +5,15 @@ INFORMATION_SCHEMA 를 스캔해 호환성 이슈(CompatibilityIssue)를 수집
 컬럼 스캔형 8개 검사는 선언형 CheckSpec + 단일 _run_column_scan 헬퍼로 통합했고,
 형태가 다른 검사(charset/reserved_keywords/routines/sql_modes/auth_plugins/invalid_date)는
 그대로 둔다.
+
+catalog(SchemaCatalogSnapshot)가 주어지면 스키마 메타데이터 검사는 쿼리 대신
+스냅샷 행을 CheckSpec.select 등 쿼리 WHERE 절과 같은 조건으로 걸러 쓴다.
 """
 import re
+import time
 from dataclasses import dataclass
-from typing import List, Callable, Optional
+from itertools import groupby
+from typing import List, Callable, Iterable, Optional, Tuple
 
 from src.core.migration_constants import (
     ALL_REMOVED_FUNCTIONS,
@@ -19,6 +24,8 @@ from src.core.migration_constants import (
     CompatibilityIssue,
     ENGINE_POLICIES,
 )
+from src.core.migration_analysis_models import DataScanLimits
+from src.core.migration_schema_catalog import SchemaCatalogSnapshot
 
 
 # ============================================================
@@ -26,9 +33,13 @@ from src.core.migration_constants import (
 # ============================================================
 @dataclass
 class _CheckSpec:
-    """단일 INFORMATION_SCHEMA 쿼리 → 행 루프 → 요약 log 형태의 검사 선언"""
+    """단일 INFORMATION_SCHEMA 쿼리 → 행 루프 → 요약 log 형태의 검사 선언
+
+    select 는 카탈로그 스냅샷에서 query 와 같은 행을 고르는 함수다.
+    """
     start_log: str
     query: str
+    select: Callable[[SchemaCatalogSnapshot], Iterable[dict]]
     build_issue: Callable[[str, dict], Optional[CompatibilityIssue]]
     summary_found: Callable[[int], str]
     summary_clean: str
@@ -128,6 +139,63 @@ def _issue_int_display_width(schema: str, col: dict) -> Optional[CompatibilityIs
     )
 
 
+# ============================================================
+# 카탈로그 스냅샷 선택자 (각 CheckSpec.query 의 WHERE 절과 같은 조건)
+# ============================================================
+_FLOAT_PRECISION_TYPE = re.compile(r'^(float|double)\([0-9]+,[0-9]+\)', re.IGNORECASE)
+_INT_DISPLAY_WIDTH_TYPE = re.compile(r'^(tinyint|smallint|mediumint|int|bigint)\([0-9]+\)', re.IGNORECASE)
+_INT_TYPES = ('tinyint', 'smallint', 'mediumint', 'int', 'bigint')
+
+
+def _column_type(col: dict) -> str:
+    return str(col.get('COLUMN_TYPE') or '').lower()
+
+
+def _select_zerofill(catalog: SchemaCatalogSnapshot) -> List[dict]:
+    return [c for c in catalog.columns() if 'zerofill' in _column_type(c)]
+
+
+def _select_float_precision(catalog: SchemaCatalogSnapshot) -> List[dict]:
+    return [
+        c for c in catalog.columns(data_types=('float', 'double'))
+        if _FLOAT_PRECISION_TYPE.match(_column_type(c))
+    ]
+
+
+def _select_long_fk_names(catalog: SchemaCatalogSnapshot) -> List[dict]:
+    # FK 행은 컬럼 단위라 복합 FK 는 제약 이름 하나로 합친다 (LENGTH()는 바이트 길이)
+    found = {}
+    for fk in catalog.foreign_keys():
+        name = fk['CONSTRAINT_NAME']
+        if len(name.encode('utf-8')) > 64 and (fk['CHILD_TABLE'], name) not in found:
+            found[(fk['CHILD_TABLE'], name)] = {'CONSTRAINT_NAME': name, 'TABLE_NAME': fk['CHILD_TABLE']}
+    return list(found.values())
+
+
+def _select_year2(catalog: SchemaCatalogSnapshot) -> List[dict]:
+    return [c for c in catalog.columns() if _column_type(c) == 'year(2)']
+
+
+def _select_engine_tables(catalog: SchemaCatalogSnapshot) -> List[dict]:
+    return [t for t in catalog.tables(base_only=True) if t.get('ENGINE') is not None]
+
+
+def _select_enum_empty(catalog: SchemaCatalogSnapshot) -> List[dict]:
+    return [c for c in catalog.columns(data_types=('enum',)) if "''" in _column_type(c)]
+
+
+def _select_timestamp(catalog: SchemaCatalogSnapshot) -> List[dict]:
+    return catalog.columns(data_types=('timestamp',))
+
+
+def _select_int_display_width(catalog: SchemaCatalogSnapshot) -> List[dict]:
+    return [
+        c for c in catalog.columns(data_types=_INT_TYPES)
+        if _INT_DISPLAY_WIDTH_TYPE.match(_column_type(c))
+        and not _column_type(c).startswith('tinyint(1)')
+    ]
+
+
 _ZEROFILL_SPEC = _CheckSpec(
     start_log="🔍 ZEROFILL 속성 확인 중...",
     query="""
@@ -136,6 +204,7 @@ _ZEROFILL_SPEC = _CheckSpec(
         WHERE TABLE_SCHEMA = %s
             AND COLUMN_TYPE LIKE '%%ZEROFILL%%'
         """,
+    select=_select_zerofill,
     build_issue=_issue_zerofill,
     summary_found=lambda n: f"  ⚠️ ZEROFILL 사용 {n}개 발견",
     summary_clean="  ✅ ZEROFILL 사용 없음",
@@ -150,6 +219,7 @@ _FLOAT_PRECISION_SPEC = _CheckSpec(
             AND DATA_TYPE IN ('float', 'double')
             AND COLUMN_TYPE REGEXP '^(float|double)\\\\([0-9]+,[0-9]+\\\\)'
         """,
+    select=_select_float_precision,
     build_issue=_issue_float_precision,
     summary_found=lambda n: f"  ⚠️ FLOAT/DOUBLE 정밀도 구문 {n}개 발견",
     summary_clean="  ✅ FLOAT/DOUBLE 구문 정상",
@@ -164,6 +234,7 @@ _FK_NAME_LENGTH_SPEC = _CheckSpec(
             AND CONSTRAINT_TYPE = 'FOREIGN KEY'
             AND LENGTH(CONSTRAINT_NAME) > 64
         """,
+    select=_select_long_fk_names,
     build_issue=_issue_fk_name_length,
     summary_found=lambda n: f"  ⚠️ FK 이름 길이 초과 {n}개 발견",
     summary_clean="  ✅ FK 이름 길이 정상",
@@ -177,6 +248,7 @@ _YEAR2_SPEC = _CheckSpec(
         WHERE TABLE_SCHEMA = %s
             AND COLUMN_TYPE = 'year(2)'
         """,
+    select=_select_year2,
     build_issue=_issue_year2,
     summary_found=lambda n: f"  ⚠️ YEAR(2) 타입 {n}개 발견",
     summary_clean="  ✅ YEAR(2) 타입 없음",
@@ -191,6 +263,7 @@ _DEPRECATED_ENGINE_SPEC = _CheckSpec(
             AND TABLE_TYPE = 'BASE TABLE'
             AND ENGINE IS NOT NULL
         """,
+    select=_select_engine_tables,
     build_issue=_issue_deprecated_engine,
     summary_found=lambda n: f"  ⚠️ deprecated 엔진 {n}개 발견",
     summary_clean="  ✅ deprecated 엔진 없음",
@@ -205,6 +278,7 @@ _ENUM_EMPTY_SPEC = _CheckSpec(
             AND DATA_TYPE = 'enum'
             AND COLUMN_TYPE LIKE "%%''%%"
         """,
+    select=_select_enum_empty,
     build_issue=_issue_enum_empty,
     summary_found=lambda n: f"  ⚠️ ENUM 빈 문자열 {n}개 발견",
     summary_clean="  ✅ ENUM 빈 문자열 없음",
@@ -218,6 +292,7 @@ _TIMESTAMP_RANGE_SPEC = _CheckSpec(
         WHERE TABLE_SCHEMA = %s
             AND DATA_TYPE = 'timestamp'
         """,
+    select=_select_timestamp,
     build_issue=_issue_timestamp_range,
     summary_found=lambda n: f"  ⚠️ TIMESTAMP 범위 제한 컬럼 {n}개 발견",
     summary_clean="  ✅ TIMESTAMP 컬럼 없음",
@@ -233,12 +308,37 @@ _INT_DISPLAY_WIDTH_SPEC = _CheckSpec(
             AND COLUMN_TYPE REGEXP '^(tinyint|smallint|mediumint|int|bigint)\\\\([0-9]+\\\\)'
             AND NOT (DATA_TYPE = 'tinyint' AND COLUMN_TYPE LIKE 'tinyint(1)%%')
         """,
+    select=_select_int_display_width,
     build_issue=_issue_int_display_width,
     summary_found=lambda n: f"  ℹ️ INT 표시 너비 {n}개 발견 (경미)",
     summary_clean="  ✅ INT 표시 너비 없음",
 )
 
 
+# 잘못된 날짜값 샘플링: PK 범위를 이 수만큼의 구간으로 나눠 읽는다
+_SAMPLE_WINDOWS = 8
+
+
+def _invalid_date_condition(column: str, data_type: str) -> str:
+    zero = "'0000-00-00'" if data_type == 'date' else "'0000-00-00 00:00:00'"
+    return (
+        f"`{column}` = {zero} OR (`{column}` IS NOT NULL "
+        f"AND (MONTH(`{column}`) = 0 OR DAY(`{column}`) = 0))"
+    )
+
+
+def _invalid_date_batch_query(col_list: List[dict], source: str, time_budget: Optional[float]) -> str:
+    """테이블 하나의 모든 날짜 컬럼 잘못된 값 건수를 한 번에 세는 쿼리"""
+    counts = ", ".join(
+        f"SUM(CASE WHEN {_invalid_date_condition(c['COLUMN_NAME'], c['DATA_TYPE'])} THEN 1 ELSE 0 END) "
+        f"AS `{c['COLUMN_NAME']}`"
+        for c in col_list
+    )
+    # MAX_EXECUTION_TIME 힌트: 예산을 넘기면 서버가 쿼리를 중단한다 (MySQL 5.7.8+)
+    hint = f"/*+ MAX_EXECUTION_TIME({int(time_budget * 1000)}) */ " if time_budget else ""
+    return f"SELECT {hint}{counts} FROM {source}"
+
+
 class MySQLUpgradeCompatibilityChecker:
     """MySQL 8.4 Upgrade Checker 호환성 검사 모음"""
 
@@ -251,13 +351,25 @@ class MySQLUpgradeCompatibilityChecker:
         self.connector = connector
         # 파사드가 공유하는 _log 를 주입받아 진행 상황을 동일 콜백으로 전달한다.
         self._log = log
+        # 파사드가 analyze_schema 동안 넣어 두는 카탈로그 스냅샷 (없으면 검사마다 쿼리)
+        self.catalog: Optional[SchemaCatalogSnapshot] = None
+        # 데이터 스캔 검사의 샘플링/시간 예산 (없으면 전체 스캔)
+        self.scan_limits: Optional[DataScanLimits] = None
+
+    def _catalog_for(self, schema: str) -> Optional[SchemaCatalogSnapshot]:
+        catalog = self.catalog
+        return catalog if catalog is not None and catalog.covers(schema) else None
 
     def _run_column_scan(self, schema: str, spec: _CheckSpec) -> List[CompatibilityIssue]:
-        """선언형 CheckSpec 실행: 시작 log → 단일 쿼리 → 행 루프 → 요약 log"""
+        """선언형 CheckSpec 실행: 시작 log → 단일 쿼리(또는 스냅샷 선택) → 행 루프 → 요약 log"""
         self._log(spec.start_log)
 
         issues = []
-        rows = self.connector.execute(spec.query, (schema,))
+        catalog = self._catalog_for(schema)
+        if catalog is not None:
+            rows = spec.select(catalog)
+        else:
+            rows = self.connector.execute(spec.query, (schema,))
         for row in rows:
             issue = spec.build_issue(schema, row)
             if issue is not None:
@@ -320,6 +432,7 @@ class MySQLUpgradeCompatibilityChecker:
         self._log("🔍 문자셋 이슈 확인 중...")
 
         issues = []
+        catalog = self._catalog_for(schema)
 
         # 테이블 레벨 charset 확인
         table_query = """
@@ -329,7 +442,13 @@ class MySQLUpgradeCompatibilityChecker:
             AND TABLE_TYPE = 'BASE TABLE'
             AND (TABLE_COLLATION LIKE 'utf8\\_%%' OR TABLE_COLLATION LIKE 'utf8mb3\\_%%')
         """
-        tables = self.connector.execute(table_query, (schema,))
+        if catalog is not None:
+            tables = [
+                t for t in catalog.tables(base_only=True)
+                if str(t.get('TABLE_COLLATION') or '').lower().startswith(('utf8_', 'utf8mb3_'))
+            ]
+        else:
+            tables = self.connector.execute(table_query, (schema,))
 
         for t in tables:
             issues.append(CompatibilityIssue(
@@ -351,7 +470,14 @@ class MySQLUpgradeCompatibilityChecker:
             AND c.CHARACTER_SET_NAME IN ('utf8', 'utf8mb3')
             AND t.TABLE_TYPE = 'BASE TABLE'
         """
-        columns = self.connector.execute(column_query, (schema,))
+        if catalog is not None:
+            columns = [
+                c for c in catalog.columns()
+                if str(c.get('CHARACTER_SET_NAME') or '').lower() in ('utf8', 'utf8mb3')
+                and catalog.is_base_table(c['TABLE_NAME'])
+            ]
+        else:
+            columns = self.connector.execute(column_query, (schema,))
 
         for c in columns:
             issues.append(CompatibilityIssue(
@@ -375,9 +501,10 @@ class MySQLUpgradeCompatibilityChecker:
 
         issues = []
         keywords_upper = set(k.upper() for k in ALL_RESERVED_KEYWORDS)
+        catalog = self._catalog_for(schema)
 
         # 테이블명 확인
-        tables = self.connector.get_tables(schema)
+        tables = catalog.table_names() if catalog is not None else self.connector.get_tables(schema)
         for table in tables:
             if table.upper() in keywords_upper:
                 issues.append(CompatibilityIssue(
@@ -394,7 +521,10 @@ class MySQLUpgradeCompatibilityChecker:
         FROM INFORMATION_SCHEMA.COLUMNS
         WHERE TABLE_SCHEMA = %s
         """
-        columns = self.connector.execute(column_query, (schema,))
+        if catalog is not None:
+            columns = catalog.columns()
+        else:
+            columns = self.connector.execute(column_query, (schema,))
 
         for c in columns:
             if c['COLUMN_NAME'].upper() in keywords_upper:
@@ -426,7 +556,11 @@ class MySQLUpgradeCompatibilityChecker:
         WHERE ROUTINE_SCHEMA = %s
             AND ROUTINE_DEFINITION IS NOT NULL
         """
-        routines = self.connector.execute(routine_query, (schema,))
+        catalog = self._catalog_for(schema)
+        if catalog is not None:
+            routines = [r for r in catalog.routines() if r.get('ROUTINE_DEFINITION') is not None]
+        else:
+            routines = self.connector.execute(routine_query, (schema,))
 
         for routine in routines:
             definition = routine['ROUTINE_DEFINITION'].upper() if routine['ROUTINE_DEFINITION'] else ""
@@ -541,11 +675,22 @@ class MySQLUpgradeCompatibilityChecker:
 
         return issues
 
-    def check_invalid_date_values(self, schema: str) -> List[CompatibilityIssue]:
+    def check_invalid_date_values(
+        self,
+        schema: str,
+        tables: Optional[Iterable[str]] = None,
+        skipped: Optional[List[str]] = None
+    ) -> List[CompatibilityIssue]:
         """0000-00-00 및 잘못된 날짜값 검사 (MySQL 8.4 호환성)
 
         MySQL 8.4에서는 NO_ZERO_DATE, NO_ZERO_IN_DATE가 기본 sql_mode에 포함됨.
         0000-00-00 또는 2024-00-15 같은 날짜는 더 이상 허용되지 않음.
+        테이블마다 한 번만 스캔해 모든 날짜 컬럼의 건수를 SUM(CASE ...)로 센다.
+        scan_limits 로 샘플링/테이블당 시간 예산을 줄 수 있다.
+
+        Args:
+            tables: 주면 이 테이블들의 컬럼만 검사 (증분 분석용)
+            skipped: 주면 검사하지 못한 테이블명을 담는다
         """
         self._log("🔍 0000-00-00 날짜값 확인 중...")
 
@@ -559,65 +704,129 @@ class MySQLUpgradeCompatibilityChecker:
             AND DATA_TYPE IN ('date', 'datetime', 'timestamp')
         ORDER BY TABLE_NAME, COLUMN_NAME
         """
-        columns = self.connector.execute(col_query, (schema,))
+        catalog = self._catalog_for(schema)
+        if catalog is not None:
+            columns = sorted(
+                catalog.columns(data_types=('date', 'datetime', 'timestamp')),
+                key=lambda c: (c['TABLE_NAME'], c['COLUMN_NAME']),
+            )
+        else:
+            columns = self.connector.execute(col_query, (schema,))
+        if tables is not None:
+            wanted = set(tables)
+            columns = [c for c in columns if c['TABLE_NAME'] in wanted]
 
         if not columns:
             self._log("  ✅ DATE/DATETIME 컬럼 없음")
             return issues
 
-        self._log(f"  DATE/DATETIME 컬럼 {len(columns)}개 검사 중...")
+        limits = self.scan_limits or DataScanLimits()
+        mode = f", 테이블당 약 {limits.sample_rows:,}행 샘플링" if limits.sample_rows else ""
+        self._log(f"  DATE/DATETIME 컬럼 {len(columns)}개 검사 중 (테이블당 1회 스캔{mode})...")
 
         checked_count = 0
-        for col in columns:
-            table = col['TABLE_NAME']
-            column = col['COLUMN_NAME']
-            data_type = col['DATA_TYPE']
-
+        over_budget = []
+        # 테이블별로 컬럼을 묶어 배치 처리 (테이블당 1회 쿼리)
+        for table, col_group in groupby(columns, key=lambda col: col['TABLE_NAME']):
+            col_list = list(col_group)
+            started = time.perf_counter()
             try:
-                # 0000-00-00 값 존재 확인 (COUNT로 빠르게)
-                if data_type == 'date':
-                    check_query = f"""
-                    SELECT COUNT(*) as cnt
-                    FROM `{schema}`.`{table}`
-                    WHERE `{column}` = '0000-00-00'
-                        OR (`{column}` IS NOT NULL
-                            AND (MONTH(`{column}`) = 0 OR DAY(`{column}`) = 0))
-                    """
-                else:  # datetime, timestamp
-                    check_query = f"""
-                    SELECT COUNT(*) as cnt
-                    FROM `{schema}`.`{table}`
-                    WHERE `{column}` = '0000-00-00 00:00:00'
-                        OR (`{column}` IS NOT NULL
-                            AND (MONTH(`{column}`) = 0 OR DAY(`{column}`) = 0))
-                    """
-
-                result = self.connector.execute(check_query)
-                invalid_count = result[0]['cnt'] if result else 0
+                # 샘플링 구간을 정하는 MIN/MAX 조회도 실패하면 이 테이블만 스킵한다
+                source, sampled = self._invalid_date_source(schema, table, col_list, catalog, limits.sample_rows)
+                query = _invalid_date_batch_query(col_list, source, limits.table_time_budget)
+                result = self.connector.execute(query)
+            except Exception as e:
+                # 특정 테이블 검사 실패 시 스킵 (권한 등)
+                self._log(f"    ⏭️ {table} 검사 스킵: {str(e)[:50]}")
+                if skipped is not None:
+                    skipped.append(table)
+                continue
+            # 집계 쿼리는 항상 한 행을 돌려주므로 빈 결과는 중단/실패다
+            # (MySQLConnector.execute 는 쿼리 오류를 빈 결과로 돌려준다)
+            if not result:
+                if skipped is not None:
+                    skipped.append(table)
+                budget = limits.table_time_budget
+                if budget and time.perf_counter() - started >= budget * 0.9:
+                    self._log(f"    ⏱️ {table}: 시간 예산({budget:g}초) 초과로 검사 중단")
+                    over_budget.append(table)
+                else:
+                    self._log(f"    ⏭️ {table} 검사 스킵: 결과 없음")
+                continue
 
+            row = result[0]
+            for col in col_list:
+                column = col['COLUMN_NAME']
+                invalid_count = int(row.get(column) or 0)
                 if invalid_count > 0:
+                    scope = "샘플링한 행에서 " if sampled else ""
                     issues.append(CompatibilityIssue(
                         issue_type=IssueType.INVALID_DATE,
                         severity="error",
                         location=f"{schema}.{table}.{column}",
-                        description=f"잘못된 날짜값 {invalid_count:,}개 발견 (0000-00-00 등)",
+                        description=f"{scope}잘못된 날짜값 {invalid_count:,}개 발견 (0000-00-00 등)",
                         suggestion="NULL로 변경하거나 유효한 날짜로 수정 필요 (8.4 NO_ZERO_DATE)",
                         table_name=table,
                         column_name=column,
                         fix_query=f"UPDATE `{schema}`.`{table}` SET `{column}` = NULL WHERE `{column}` = '0000-00-00' OR MONTH(`{column}`) = 0 OR DAY(`{column}`) = 0;"
                     ))
-                    self._log(f"    ⚠️ {table}.{column}: 잘못된 날짜 {invalid_count:,}개")
+                    self._log(f"    ⚠️ {table}.{column}: {scope}잘못된 날짜 {invalid_count:,}개")
+            checked_count += len(col_list)
 
-                checked_count += 1
-
-            except Exception as e:
-                # 특정 테이블 검사 실패 시 스킵 (권한 등)
-                self._log(f"    ⏭️ {table}.{column} 검사 스킵: {str(e)[:50]}")
-                continue
+        if over_budget:
+            issues.append(CompatibilityIssue(
+                issue_type=IssueType.INVALID_DATE,
+                severity="info",
+                location=schema,
+                description=(
+                    f"시간 예산 안에 검사하지 못한 테이블 {len(over_budget)}개: "
+                    f"{', '.join(over_budget[:10])}{' 등' if len(over_budget) > 10 else ''}"
+                ),
+                suggestion="샘플링 검사로 다시 확인하거나 유지보수 시간에 전체 검사 권장"
+            ))
 
-        if issues:
-            self._log(f"  ⚠️ 잘못된 날짜값 {len(issues)}개 컬럼에서 발견")
+        found = [i for i in issues if i.severity == "error"]
+        if found:
+            self._log(f"  ⚠️ 잘못된 날짜값 {len(found)}개 컬럼에서 발견")
         else:
             self._log(f"  ✅ 잘못된 날짜값 없음 ({checked_count}개 컬럼 검사)")
 
         return issues
+
+    def _invalid_date_source(
+        self,
+        schema: str,
+        table: str,
+        col_list: List[dict],
+        catalog: Optional[SchemaCatalogSnapshot],
+        sample_rows: Optional[int]
+    ) -> Tuple[str, bool]:
+        """날짜값 배치 쿼리의 FROM 절과 샘플링 여부
+
+        샘플링은 정수 단일 PK 가 있으면 MIN/MAX 사이에 고르게 놓인 PK 구간들만 읽고
+        (TABLESAMPLE 과 비슷하게 테이블 전체에 걸친 표본), 없으면 앞쪽 sample_rows 행만 읽는다.
+        """
+        full = f"`{schema}`.`{table}`"
+        if not sample_rows:
+            return full, False
+        if catalog is not None and catalog.table(table) is not None and catalog.table_rows(table) <= sample_rows:
+            return full, False
+
+        pk = catalog.integer_primary_key(table) if catalog is not None else None
+        if pk is not None:
+            bounds = self.connector.execute(f"SELECT MIN(`{pk}`) AS lo, MAX(`{pk}`) AS hi FROM {full}")
+            if bounds and bounds[0].get('lo') is not None:
+                lo, hi = int(bounds[0]['lo']), int(bounds[0]['hi'])
+                span = hi - lo + 1
+                if span <= sample_rows:
+                    return full, False
+                width = max(1, sample_rows // _SAMPLE_WINDOWS)
+                step = span // _SAMPLE_WINDOWS
+                ranges = " OR ".join(
+                    f"`{pk}` BETWEEN {lo + i * step} AND {lo + i * step + width - 1}"
+                    for i in range(_SAMPLE_WINDOWS)
+                )
+                return f"{full} WHERE {ranges}", True
+
+        inner = ", ".join(f"`{c['COLUMN_NAME']}`" for c in col_list)
+        return f"(SELECT {inner} FROM {full} LIMIT {int(sample_rows)}) AS sampled", True
@@ -18,6 +18,7 @@ from src.core.migration_fix_models import (
 )
 from src.core.migration_fk_graph import CollationFKGraphBuilder, build_fk_graph
 from src.core.migration_fk_safe_charset import FKSafeCharsetChanger
+from src.core.migration_schema_catalog import SchemaCatalogSnapshot
 
 
 class SmartFixGenerator:
@@ -26,18 +27,23 @@ class SmartFixGenerator:
     호환성 이슈에 대해 적절한 수정 옵션을 생성합니다.
     - 날짜 이슈: nullable 여부 확인 후 옵션 제시
     - Collation 이슈: FK 연관 테이블 포함 옵션 제시
+
+    catalog(분석 때 읽은 SchemaCatalogSnapshot)를 주면 컬럼 정의/FK 그래프를
+    이슈마다 조회하지 않고 스냅샷에서 찾는다.
     """
 
-    def __init__(self, connector: MySQLConnector, schema: str):
+    def __init__(self, connector: MySQLConnector, schema: str,
+                 catalog: Optional[SchemaCatalogSnapshot] = None):
         self.connector = connector
         self.schema = schema
+        self.catalog = catalog
         self._column_nullable_cache: Dict[str, bool] = {}
         self._fk_graph_builder: Optional['CollationFKGraphBuilder'] = None
 
     def get_fk_graph_builder(self) -> 'CollationFKGraphBuilder':
         """FK 그래프 빌더 (lazy init)"""
         if self._fk_graph_builder is None:
-            self._fk_graph_builder = build_fk_graph(self.connector, self.schema)
+            self._fk_graph_builder = build_fk_graph(self.connector, self.schema, self.catalog)
         return self._fk_graph_builder
 
     def get_fix_options(self, issue: Any) -> List[FixOption]:
@@ -81,17 +87,26 @@ class SmartFixGenerator:
         if cache_key in self._column_nullable_cache:
             return self._column_nullable_cache[cache_key]
 
-        query = """
-        SELECT IS_NULLABLE
-        FROM INFORMATION_SCHEMA.COLUMNS
-        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND COLUMN_NAME = %s
-        """
-        result = self.connector.execute(query, (self.schema, table, column))
+        result = self._catalog_column(self.schema, table, column)
+        if result is None:
+            query = """
+            SELECT IS_NULLABLE
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND COLUMN_NAME = %s
+            """
+            result = self.connector.execute(query, (self.schema, table, column))
 
         is_nullable = result[0]['IS_NULLABLE'] == 'YES' if result else False
         self._column_nullable_cache[cache_key] = is_nullable
         return is_nullable
 
+    def _catalog_column(self, schema: str, table: str, column: str) -> Optional[List[dict]]:
+        """스냅샷의 컬럼 행을 쿼리 결과 형태로 반환 (스냅샷이 없으면 None → 직접 조회)"""
+        if self.catalog is None or not self.catalog.covers(schema):
+            return None
+        col = self.catalog.column(table, column)
+        return [col] if col is not None else []
+
     def _get_column_definition(
         self,
         schema: str,
@@ -116,16 +131,18 @@ class SmartFixGenerator:
             반드시 NOT NULL / DEFAULT 앞에 위치해야 합니다.
             (NOT NULL 뒤에 CHARACTER SET을 두면 1064 문법 오류 발생)
         """
-        query = """
-        SELECT
-            COLUMN_TYPE,
-            IS_NULLABLE,
-            COLUMN_DEFAULT,
-            EXTRA
-        FROM INFORMATION_SCHEMA.COLUMNS
-        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND COLUMN_NAME = %s
-        """
-        result = self.connector.execute(query, (schema, table, column))
+        result = self._catalog_column(schema, table, column)
+        if result is None:
+            query = """
+            SELECT
+                COLUMN_TYPE,
+                IS_NULLABLE,
+                COLUMN_DEFAULT,
+                EXTRA
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND COLUMN_NAME = %s
+            """
+            result = self.connector.execute(query, (schema, table, column))
 
         if not result:
             return None
@@ -437,7 +454,8 @@ class SmartFixGenerator:
 def create_wizard_steps(
     issues: List[Any],
     connector: MySQLConnector,
-    schema: str
+    schema: str,
+    catalog: Optional[SchemaCatalogSnapshot] = None
 ) -> List[FixWizardStep]:
     """이슈 목록에서 위저드 단계 생성
 
@@ -445,11 +463,12 @@ def create_wizard_steps(
         issues: CompatibilityIssue 목록
         connector: DB 연결
         schema: 스키마명
+        catalog: 분석 때 읽은 카탈로그 스냅샷 (없으면 이슈마다 조회)
 
     Returns:
         FixWizardStep 목록
     """
-    generator = SmartFixGenerator(connector, schema)
+    generator = SmartFixGenerator(connector, schema, catalog)
     steps = []
 
     for i, issue in enumerate(issues):
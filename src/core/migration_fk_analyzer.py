@@ -3,27 +3,62 @@ FK 관계 분석기
 
 FK 관계 조회/트리 구성/시각화 및 고아 레코드(orphan rows) 탐지를 담당한다.
 데이터클래스는 migration_analysis_models 에서만 import 한다 (순환 import 방지).
+catalog(SchemaCatalogSnapshot)가 있으면 FK 목록과 테이블 행 수를 스냅샷에서 읽는다.
+
+큰 자식 테이블은 정수 PK 범위 청크로 나눠 CheckExecutor 풀에서 동시에 세고,
+scan_limits.fk_time_budget 이 있으면 FK 마다 예산 안에 센 구간까지를
+"최소 N개"(is_partial) 결과로 보고한다.
 """
+import math
 import time
-from typing import List, Dict, Callable, Optional
+from typing import Any, List, Dict, Callable, Optional, Tuple
 
-from src.core.migration_analysis_models import OrphanRecord, ForeignKeyInfo
+from src.core.migration_analysis_models import DataScanLimits, OrphanRecord, ForeignKeyInfo
+from src.core.migration_check_executor import CheckExecutor, CheckStep
+from src.core.migration_schema_catalog import SchemaCatalogSnapshot
 
 # 고아 레코드 탐지 임계값 (인라인 매직넘버 대체)
 LARGE_TABLE_ROW_THRESHOLD = 500_000  # 50만 행 이상이면 큰 테이블(최적화 쿼리 사용)
 SIZE_INFO_LOG_THRESHOLD = 100_000    # 10만 행 이상이면 크기 정보 로그 표시
+ORPHAN_CHUNK_ROWS = 1_000_000        # 자식 테이블 이 행 수마다 PK 범위 청크 하나
+ORPHAN_MAX_CHUNKS = 256              # FK 하나의 최대 청크 수
+ORPHAN_CHUNK_WORKERS = 3             # 청크를 동시에 셀 추가 연결 수
+
+# (시작 PK, 끝 PK) — 양 끝 포함
+PkRange = Tuple[int, int]
 
 
 class ForeignKeyAnalyzer:
     """FK 관계 분석 및 고아 레코드 탐지"""
 
-    def __init__(self, connector, log: Callable[[str], None]):
+    def __init__(
+        self,
+        connector,
+        log: Callable[[str], None],
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ):
         self.connector = connector
         # 파사드가 공유하는 _log 를 주입받아 진행 상황을 동일 콜백으로 전달한다.
         self._log = log
+        # 취소되면 남은 FK 검사를 건너뛴다 (실행 중인 쿼리는 워커가 서버에서 중단).
+        self._is_cancelled = is_cancelled or (lambda: False)
+        # 파사드가 analyze_schema 동안 넣어 두는 카탈로그 스냅샷
+        self.catalog: Optional[SchemaCatalogSnapshot] = None
+        # FK 당 시간 예산 (없으면 끝까지 센다)
+        self.scan_limits: Optional[DataScanLimits] = None
+        # 청크를 동시에 셀 추가 연결을 여는 함수 (없으면 주 연결로 차례대로)
+        self.connector_factory: Optional[Callable[[], Any]] = None
+
+    def _catalog_for(self, schema: str) -> Optional[SchemaCatalogSnapshot]:
+        catalog = self.catalog
+        return catalog if catalog is not None and catalog.covers(schema) else None
 
     def get_foreign_keys(self, schema: str) -> List[ForeignKeyInfo]:
         """스키마의 모든 FK 관계 조회"""
+        catalog = self._catalog_for(schema)
+        if catalog is not None:
+            return [self._fk_info(row) for row in catalog.foreign_keys()]
+
         query = """
         SELECT
             tc.CONSTRAINT_NAME,
@@ -46,19 +81,19 @@ class ForeignKeyAnalyzer:
         """
         rows = self.connector.execute(query, (schema,))
 
-        fk_list = []
-        for row in rows:
-            fk_list.append(ForeignKeyInfo(
-                constraint_name=row['CONSTRAINT_NAME'],
-                child_table=row['CHILD_TABLE'],
-                child_column=row['CHILD_COLUMN'],
-                parent_table=row['PARENT_TABLE'],
-                parent_column=row['PARENT_COLUMN'],
-                on_delete=row['DELETE_RULE'],
-                on_update=row['UPDATE_RULE']
-            ))
+        return [self._fk_info(row) for row in rows]
 
-        return fk_list
+    @staticmethod
+    def _fk_info(row: dict) -> ForeignKeyInfo:
+        return ForeignKeyInfo(
+            constraint_name=row['CONSTRAINT_NAME'],
+            child_table=row['CHILD_TABLE'],
+            child_column=row['CHILD_COLUMN'],
+            parent_table=row['PARENT_TABLE'],
+            parent_column=row['PARENT_COLUMN'],
+            on_delete=row['DELETE_RULE'],
+            on_update=row['UPDATE_RULE']
+        )
 
     def build_fk_tree(self, schema: str) -> Dict[str, List[str]]:
         """FK 관계 트리 구성 (부모 → 자식 목록)"""
@@ -75,21 +110,58 @@ class ForeignKeyAnalyzer:
 
     def _get_table_row_count(self, schema: str, table: str) -> int:
         """테이블 대략적인 행 수 조회 (INFORMATION_SCHEMA 사용, 빠름)"""
-        query = f"""
+        catalog = self._catalog_for(schema)
+        if catalog is not None:
+            return catalog.table_rows(table)
+        query = """
         SELECT TABLE_ROWS
         FROM INFORMATION_SCHEMA.TABLES
-        WHERE TABLE_SCHEMA = '{schema}' AND TABLE_NAME = '{table}'
+        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
         """
-        result = self.connector.execute(query)
+        result = self.connector.execute(query, (schema, table))
         return result[0]['TABLE_ROWS'] if result and result[0]['TABLE_ROWS'] else 0
 
+    def _table_row_counts(self, schema: str) -> Dict[str, int]:
+        """스키마 전체 테이블의 대략적인 행 수 (한 번에 조회)"""
+        catalog = self._catalog_for(schema)
+        if catalog is not None:
+            return {name: catalog.table_rows(name) for name in catalog.table_names()}
+        query = """
+        SELECT TABLE_NAME, TABLE_ROWS
+        FROM INFORMATION_SCHEMA.TABLES
+        WHERE TABLE_SCHEMA = %s
+        """
+        rows = self.connector.execute(query, (schema,))
+        return {row['TABLE_NAME']: int(row.get('TABLE_ROWS') or 0) for row in rows}
+
+    def _pk_chunks(self, schema: str, table: str, rows: int) -> Optional[Tuple[str, List[PkRange]]]:
+        """자식 테이블을 정수 PK 범위 청크로 나눈다 → (PK 컬럼, 범위 목록)
+
+        나눌 필요가 없거나(작은 테이블) 나눌 수 없으면(정수 단일 PK 없음) None.
+        """
+        catalog = self._catalog_for(schema)
+        if rows <= ORPHAN_CHUNK_ROWS or catalog is None:
+            return None
+        pk = catalog.integer_primary_key(table)
+        if pk is None:
+            return None
+        bounds = self.connector.execute(f"SELECT MIN(`{pk}`) AS lo, MAX(`{pk}`) AS hi FROM `{schema}`.`{table}`")
+        if not bounds or bounds[0].get('lo') is None or bounds[0].get('hi') is None:
+            return None
+        lo, hi = int(bounds[0]['lo']), int(bounds[0]['hi'])
+        count = max(2, min(ORPHAN_MAX_CHUNKS, math.ceil(rows / ORPHAN_CHUNK_ROWS)))
+        step = max(1, math.ceil((hi - lo + 1) / count))
+        return pk, [(start, min(start + step - 1, hi)) for start in range(lo, hi + 1, step)]
+
     def _build_orphan_query(
         self,
         schema: str,
         fk: ForeignKeyInfo,
         is_large: bool,
         select_expr: str,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        pk_range: Optional[Tuple[str, int, int]] = None,
+        max_time: Optional[float] = None
     ) -> str:
         """고아 레코드 조회 쿼리 생성 (count/sample 두 형태를 한 곳에서 생성)
 
@@ -97,23 +169,31 @@ class ForeignKeyAnalyzer:
         - 일반 테이블: LEFT JOIN
         select_expr 로 count("COUNT(*) as cnt")/sample("DISTINCT ... as orphan_value")를
         구분하고, limit 이 주어지면 LIMIT 절을 덧붙인다.
+        pk_range(PK 컬럼, 시작, 끝)가 주어지면 자식 테이블의 그 PK 구간만 보고,
+        max_time(초)이 주어지면 서버가 그 시간에 쿼리를 중단하도록 힌트를 단다.
         """
+        # MAX_EXECUTION_TIME 힌트: 예산을 넘기면 서버가 쿼리를 중단한다 (MySQL 5.7.8+)
+        hint = f"/*+ MAX_EXECUTION_TIME({max(1, int(max_time * 1000))}) */ " if max_time else ""
+        range_cond = ""
+        if pk_range is not None:
+            pk, start, end = pk_range
+            range_cond = f"\n            AND c.`{pk}` BETWEEN {int(start)} AND {int(end)}"
         if is_large:
             query = f"""
-        SELECT {select_expr}
+        SELECT {hint}{select_expr}
         FROM `{schema}`.`{fk.child_table}` c
-        WHERE c.`{fk.child_column}` IS NOT NULL
+        WHERE c.`{fk.child_column}` IS NOT NULL{range_cond}
             AND NOT EXISTS (
                 SELECT 1 FROM `{schema}`.`{fk.parent_table}` p
                 WHERE p.`{fk.parent_column}` = c.`{fk.child_column}`
             )"""
         else:
             query = f"""
-        SELECT {select_expr}
+        SELECT {hint}{select_expr}
         FROM `{schema}`.`{fk.child_table}` c
         LEFT JOIN `{schema}`.`{fk.parent_table}` p
             ON c.`{fk.child_column}` = p.`{fk.parent_column}`
-        WHERE c.`{fk.child_column}` IS NOT NULL
+        WHERE c.`{fk.child_column}` IS NOT NULL{range_cond}
             AND p.`{fk.parent_column}` IS NULL"""
 
         if limit is not None:
@@ -125,19 +205,34 @@ class ForeignKeyAnalyzer:
         self,
         schema: str,
         sample_limit: int = 5,
-        large_table_threshold: int = LARGE_TABLE_ROW_THRESHOLD
+        large_table_threshold: int = LARGE_TABLE_ROW_THRESHOLD,
+        fk_filter: Optional[Callable[[ForeignKeyInfo], bool]] = None,
+        skipped: Optional[List[ForeignKeyInfo]] = None
     ) -> List[OrphanRecord]:
-        """고아 레코드 탐지 (부모 없는 자식 레코드)"""
+        """고아 레코드 탐지 (부모 없는 자식 레코드)
+
+        Args:
+            fk_filter: 주면 True 를 돌려준 FK 만 검사 (증분 분석용)
+            skipped: 주면 검사에 실패했거나 끝까지 세지 못한 FK 를 담는다
+        """
         self._log("🔍 고아 레코드 탐지 중...")
 
         fk_list = self.get_foreign_keys(schema)
+        if fk_filter is not None:
+            fk_list = [fk for fk in fk_list if fk_filter(fk)]
         orphans = []
+        # 행 수는 FK 마다 조회하지 않고 스키마 전체를 한 번에 읽어 둔다
+        row_counts = self._table_row_counts(schema) if fk_list else {}
+        budget = self.scan_limits.fk_time_budget if self.scan_limits is not None else None
 
         for i, fk in enumerate(fk_list, 1):
+            if self._is_cancelled():
+                self._log("    ⏹ 고아 레코드 탐지 취소됨")
+                break
             try:
                 # 테이블 크기 사전 확인
-                child_rows = self._get_table_row_count(schema, fk.child_table)
-                parent_rows = self._get_table_row_count(schema, fk.parent_table)
+                child_rows = row_counts.get(fk.child_table, 0)
+                parent_rows = row_counts.get(fk.parent_table, 0)
                 is_large = child_rows > large_table_threshold or parent_rows > large_table_threshold
 
                 size_info = ""
@@ -147,25 +242,45 @@ class ForeignKeyAnalyzer:
                 self._log(f"  검사 중: {fk.child_table}.{fk.child_column} → {fk.parent_table}.{fk.parent_column} ({i}/{len(fk_list)}){size_info}")
 
                 start_time = time.time()
+                started = time.monotonic()
+                deadline = started + budget if budget else None
 
                 if is_large:
                     # 큰 테이블: NOT EXISTS 사용 (더 빠름)
                     self._log(f"    📊 대용량 테이블 - 최적화 쿼리 사용")
-                count_query = self._build_orphan_query(schema, fk, is_large, "COUNT(*) as cnt")
-
-                result = self.connector.execute(count_query)
-                orphan_count = result[0]['cnt'] if result else 0
+                chunks = self._pk_chunks(schema, fk.child_table, child_rows)
+                if chunks is not None:
+                    orphan_count, complete, sample_range = self._count_orphans_chunked(
+                        schema, fk, is_large, chunks, deadline
+                    )
+                else:
+                    orphan_count, complete = self._count_orphans(schema, fk, is_large, budget)
+                    sample_range = None
 
                 elapsed = time.time() - start_time
                 if elapsed > 3:  # 3초 이상 걸리면 경고
                     self._log(f"    ⏱️ 쿼리 소요시간: {elapsed:.1f}초")
 
+                if not complete:
+                    # 끝까지 세지 못한 FK 는 다음 분석에서 다시 검사한다 (캐시하지 않음)
+                    if skipped is not None:
+                        skipped.append(fk)
+                    if self._is_cancelled():
+                        reason = "취소됨"
+                    elif budget and time.monotonic() - started >= budget * 0.9:
+                        reason = f"시간 예산 {budget:g}초 초과"
+                    else:
+                        reason = "쿼리 결과 없음"
+                    if orphan_count == 0:
+                        self._log(f"    ⏭️ 검사 미완료 ({reason}) - 고아 레코드 수를 확인하지 못함")
+
                 if orphan_count > 0:
-                    # 샘플 값 조회 (항상 LIMIT으로 제한)
+                    # 샘플 값 조회 (항상 LIMIT으로 제한, 청크 검사면 고아가 나온 구간만)
                     sample_query = self._build_orphan_query(
                         schema, fk, is_large,
                         f"DISTINCT c.`{fk.child_column}` as orphan_value",
-                        limit=sample_limit
+                        limit=sample_limit,
+                        pk_range=sample_range
                     )
                     samples = self.connector.execute(sample_query)
                     sample_values = [s['orphan_value'] for s in samples]
@@ -176,17 +291,98 @@ class ForeignKeyAnalyzer:
                         parent_table=fk.parent_table,
                         parent_column=fk.parent_column,
                         orphan_count=orphan_count,
-                        sample_values=sample_values
+                        sample_values=sample_values,
+                        is_partial=not complete
                     ))
 
-                    self._log(f"    ⚠️ 고아 레코드 발견: {orphan_count}개")
+                    if complete:
+                        self._log(f"    ⚠️ 고아 레코드 발견: {orphan_count}개")
+                    else:
+                        self._log(f"    ⚠️ 고아 레코드 발견: 최소 {orphan_count}개 ({reason}, 일부 구간만 검사)")
 
             except Exception as e:
                 self._log(f"    ❌ 검사 실패: {fk.child_table}.{fk.child_column} - {str(e)}")
+                if skipped is not None:
+                    skipped.append(fk)
                 continue
 
         return orphans
 
+    def _count_orphans(
+        self,
+        schema: str,
+        fk: ForeignKeyInfo,
+        is_large: bool,
+        budget: Optional[float]
+    ) -> Tuple[int, bool]:
+        """FK 하나의 고아 레코드 수를 쿼리 한 번으로 센다 → (개수, 끝까지 셌는지)"""
+        count_query = self._build_orphan_query(schema, fk, is_large, "COUNT(*) as cnt", max_time=budget)
+        result = self.connector.execute(count_query)
+        # COUNT 는 항상 한 행을 돌려주므로 빈 결과는 서버 중단/쿼리 실패다
+        # (MySQLConnector.execute 는 쿼리 오류를 빈 결과로 돌려준다)
+        if not result:
+            return 0, False
+        return result[0]['cnt'], True
+
+    def _count_orphans_chunked(
+        self,
+        schema: str,
+        fk: ForeignKeyInfo,
+        is_large: bool,
+        chunks: Tuple[str, List[PkRange]],
+        deadline: Optional[float]
+    ) -> Tuple[int, bool, Optional[Tuple[str, int, int]]]:
+        """PK 범위 청크별로 고아 레코드를 센다
+
+        청크는 CheckExecutor 로 실행해 connector_factory 가 있으면 동시에 돌고
+        (바깥 검사 스텝과 같은 서버별 동시 실행 상한을 나눠 쓴다), deadline 이
+        지나면 남은 청크는 건너뛰고 실행 중인 쿼리는 중단된다. 결과가 빈 청크는
+        세지 못한 것으로 본다.
+
+        Returns:
+            (센 청크들의 고아 수 합, 모든 청크를 셌는지, 고아가 처음 나온 청크 범위)
+        """
+        pk, ranges = chunks
+        total = len(ranges)
+        self._log(f"    🧩 {pk} 범위 {total}개 청크로 나눠 검사")
+
+        def chunk_step(index: int, start: int, end: int) -> CheckStep:
+            def run(connector, log) -> Optional[int]:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                query = self._build_orphan_query(
+                    schema, fk, is_large, "COUNT(*) as cnt", pk_range=(pk, start, end), max_time=remaining
+                )
+                started = time.monotonic()
+                result = connector.execute(query)
+                if not result:
+                    if remaining is not None and time.monotonic() - started >= remaining * 0.9:
+                        log(f"    청크 {index}/{total}: 시간 예산 초과로 중단")
+                    else:
+                        log(f"    청크 {index}/{total}: 결과 없음 (쿼리 실패)")
+                    return None
+                count = result[0]['cnt'] or 0
+                log(f"    청크 {index}/{total} [{start:,}~{end:,}]: 고아 {count:,}개")
+                return count
+            return CheckStep(f"{fk.child_table} 청크 {index}/{total}", run, scans_data=True)
+
+        def stop() -> bool:
+            return self._is_cancelled() or (deadline is not None and time.monotonic() >= deadline)
+
+        executor = CheckExecutor(
+            self.connector, self.connector_factory, self._log, stop, max_workers=ORPHAN_CHUNK_WORKERS,
+        )
+        outcomes = executor.run([chunk_step(i, start, end) for i, (start, end) in enumerate(ranges, 1)])
+
+        counts = [outcome.result for outcome in outcomes]
+        sample_range = next(
+            ((pk, start, end) for (start, end), count in zip(ranges, counts) if count),
+            None
+        )
+        complete = all(count is not None for count in counts)
+        return sum(count for count in counts if count), complete, sample_range
+
     def get_fk_visualization(self, schema: str) -> str:
         """FK 관계를 트리 형태로 시각화"""
         fk_tree = self.build_fk_tree(schema)
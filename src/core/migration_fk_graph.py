@@ -4,10 +4,11 @@
 Collation 변경 시 FK로 연결된 테이블을 함께 변경하기 위한 그래프 유틸리티.
 이 모듈은 leaf 계층으로, connector 외의 wizard-domain 모듈을 import하지 않는다.
 """
-from typing import List, Dict, Set
+from typing import List, Dict, Optional, Set
 from collections import deque
 
 from src.core.db_connector import MySQLConnector
+from src.core.migration_schema_catalog import SchemaCatalogSnapshot
 
 
 class CollationFKGraphBuilder:
@@ -19,9 +20,11 @@ class CollationFKGraphBuilder:
     2. 변경 순서 결정 (위상 정렬)
     """
 
-    def __init__(self, connector: MySQLConnector, schema: str):
+    def __init__(self, connector: MySQLConnector, schema: str,
+                 catalog: Optional[SchemaCatalogSnapshot] = None):
         self.connector = connector
         self.schema = schema
+        self.catalog = catalog if catalog is not None and catalog.covers(schema) else None
         # 양방향 그래프: table -> set of related tables
         self.graph: Dict[str, Set[str]] = {}
         # 방향 그래프: child -> parent (위상 정렬용)
@@ -32,6 +35,15 @@ class CollationFKGraphBuilder:
 
         Note: VIEW는 FK 관계 대상에서 제외 (BASE TABLE만 포함)
         """
+        if self.catalog is not None:
+            rows = [
+                fk for fk in self.catalog.foreign_keys()
+                if self.catalog.is_base_table(fk['CHILD_TABLE'])
+                and self.catalog.is_base_table(fk['PARENT_TABLE'])
+            ]
+            self._add_edges(rows)
+            return
+
         query = """
         SELECT
             kcu.TABLE_NAME as CHILD_TABLE,
@@ -49,7 +61,9 @@ class CollationFKGraphBuilder:
             AND t_parent.TABLE_TYPE = 'BASE TABLE'
         """
         rows = self.connector.execute(query, (self.schema,))
+        self._add_edges(rows)
 
+    def _add_edges(self, rows: List[dict]):
         for row in rows:
             child = row['CHILD_TABLE']
             parent = row['PARENT_TABLE']
@@ -205,13 +219,17 @@ class CollationFKGraphBuilder:
         return cascade_skip
 
 
-def build_fk_graph(connector: MySQLConnector, schema: str) -> CollationFKGraphBuilder:
+def build_fk_graph(
+    connector: MySQLConnector,
+    schema: str,
+    catalog: Optional[SchemaCatalogSnapshot] = None
+) -> CollationFKGraphBuilder:
     """FK 관계 그래프 빌더를 생성하고 build_graph()까지 수행 (lazy-init 공유 헬퍼)
 
     SmartFixGenerator / FKSafeCharsetChanger / BatchFixExecutor /
     CharsetFixPlanBuilder가 verbatim 중복하던 생성+build 코드를 통합한다.
     각 클래스는 per-instance 캐시 가드만 유지하고 생성은 이 헬퍼에 위임한다.
     """
-    builder = CollationFKGraphBuilder(connector, schema)
+    builder = CollationFKGraphBuilder(connector, schema, catalog)
     builder.build_graph()
     return builder
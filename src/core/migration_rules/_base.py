@@ -3,12 +3,18 @@ migration_rules 공통 베이스
 
 세 규칙 클래스(DataIntegrityRules/SchemaRules/StorageRules)가 공유하는
 커넥터 보관, 진행 상황 콜백/로깅, 요약 로그, 소스 라인 추출을 한 곳에 모은다.
+catalog(SchemaCatalogSnapshot)를 주면 라이브 DB 규칙은 INFORMATION_SCHEMA 를
+다시 조회하지 않고 스냅샷 행을 쓴다. check_all_live_db 는 CheckExecutor 로
+실행해 데이터 스캔 규칙을 병렬로 돌릴 수 있다.
 """
 
+import copy
 import re
-from typing import Callable, List, Optional, TYPE_CHECKING
+from typing import Callable, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
+from ..migration_check_executor import CheckExecutor, CheckStep
 from ..migration_constants import CompatibilityIssue
+from ..migration_schema_catalog import SchemaCatalogSnapshot
 
 if TYPE_CHECKING:
     from ..db_connector import MySQLConnector
@@ -17,10 +23,20 @@ if TYPE_CHECKING:
 class ProgressLoggingRuleBase:
     """진행 상황 콜백/로깅과 소스 라인 추출을 제공하는 규칙 베이스 클래스"""
 
-    def __init__(self, connector: Optional['MySQLConnector'] = None):
+    def __init__(
+        self,
+        connector: Optional['MySQLConnector'] = None,
+        catalog: Optional[SchemaCatalogSnapshot] = None,
+    ):
         self.connector = connector
+        self.catalog = catalog
         self._progress_callback: Optional[Callable[[str], None]] = None
 
+    def _catalog_for(self, schema: str) -> Optional[SchemaCatalogSnapshot]:
+        """schema 를 담은 카탈로그 스냅샷 (없으면 None → 호출부가 직접 조회)"""
+        catalog = self.catalog
+        return catalog if catalog is not None and catalog.covers(schema) else None
+
     def set_progress_callback(self, callback: Callable[[str], None]):
         """진행 상황 콜백 설정"""
         self._progress_callback = callback
@@ -30,6 +46,33 @@ class ProgressLoggingRuleBase:
         if self._progress_callback:
             self._progress_callback(message)
 
+    def _run_live_checks(
+        self,
+        schema: str,
+        checks: Sequence[Tuple[str, bool]],
+        executor: Optional[CheckExecutor] = None,
+    ) -> List[CompatibilityIssue]:
+        """(검사 메서드 이름, 데이터 스캔 여부) 목록을 실행기로 돌려 이슈를 순서대로 모은다.
+
+        executor 를 주지 않으면 주 연결로 차례대로 실행한다. 스텝마다 연결/로그만
+        바꾼 규칙 사본을 써서 병렬 스텝끼리 상태를 공유하지 않는다.
+        """
+        def step(method: str):
+            def run(connector, log):
+                rules = copy.copy(self)
+                rules.connector = connector
+                rules._progress_callback = log
+                return getattr(rules, method)(schema)
+            return run
+
+        steps = [CheckStep(method, step(method), scans_data=scans_data) for method, scans_data in checks]
+        if executor is None:
+            executor = CheckExecutor(self.connector, log=self._log)
+        issues = []
+        for outcome in executor.run(steps):
+            issues.extend(outcome.result or [])
+        return issues
+
     def _log_summary(
         self,
         issues: List[CompatibilityIssue],
@@ -32,6 +32,7 @@ from ..migration_constants import (
     TIMESTAMP_PATTERN,
 )
 from ..migration_parsers import CreateTableParser, SqlStatementScanner
+from ..migration_check_executor import CheckExecutor
 from ._base import ProgressLoggingRuleBase
 
 
@@ -60,7 +61,11 @@ class DataIntegrityRules(ProgressLoggingRuleBase):
         WHERE TABLE_SCHEMA = %s
             AND DATA_TYPE = 'enum'
         """
-        columns = self.connector.execute(query, (schema,))
+        catalog = self._catalog_for(schema)
+        if catalog is not None:
+            columns = catalog.columns(data_types=('enum',))
+        else:
+            columns = self.connector.execute(query, (schema,))
 
         for col in columns:
             # COLUMN_TYPE의 ENUM 요소를 파싱하여 실제 빈 문자열 요소만 확인
@@ -248,7 +253,11 @@ class DataIntegrityRules(ProgressLoggingRuleBase):
         WHERE TABLE_SCHEMA = %s
             AND DATA_TYPE = 'enum'
         """
-        columns = self.connector.execute(query, (schema,))
+        catalog = self._catalog_for(schema)
+        if catalog is not None:
+            columns = catalog.columns(data_types=('enum',))
+        else:
+            columns = self.connector.execute(query, (schema,))
 
         for col in columns:
             elements = self._extract_enum_elements(col['COLUMN_TYPE'])
@@ -286,7 +295,11 @@ class DataIntegrityRules(ProgressLoggingRuleBase):
         WHERE TABLE_SCHEMA = %s
             AND DATA_TYPE = 'set'
         """
-        columns = self.connector.execute(query, (schema,))
+        catalog = self._catalog_for(schema)
+        if catalog is not None:
+            columns = catalog.columns(data_types=('set',))
+        else:
+            columns = self.connector.execute(query, (schema,))
 
         for col in columns:
             elements = self._extract_enum_elements(col['COLUMN_TYPE'])  # SET도 동일 형식
@@ -618,7 +631,17 @@ class DataIntegrityRules(ProgressLoggingRuleBase):
             AND DATA_TYPE IN ('varchar', 'char', 'text', 'mediumtext', 'longtext')
         ORDER BY TABLE_NAME, COLUMN_NAME
         """
-        columns = self.connector.execute(query, (schema,))
+        catalog = self._catalog_for(schema)
+        if catalog is not None:
+            columns = sorted(
+                (
+                    c for c in catalog.columns(data_types=('varchar', 'char', 'text', 'mediumtext', 'longtext'))
+                    if str(c.get('CHARACTER_SET_NAME') or '').lower() == 'latin1'
+                ),
+                key=lambda c: (c['TABLE_NAME'], c['COLUMN_NAME']),
+            )
+        else:
+            columns = self.connector.execute(query, (schema,))
 
         if not columns:
             self._log("  ✅ latin1 비ASCII 데이터 없음")
@@ -677,7 +700,14 @@ class DataIntegrityRules(ProgressLoggingRuleBase):
             AND COLUMN_TYPE LIKE '%%ZEROFILL%%'
         ORDER BY TABLE_NAME, COLUMN_NAME
         """
-        columns = self.connector.execute(query, (schema,))
+        catalog = self._catalog_for(schema)
+        if catalog is not None:
+            columns = sorted(
+                (c for c in catalog.columns() if 'zerofill' in str(c.get('COLUMN_TYPE') or '').lower()),
+                key=lambda c: (c['TABLE_NAME'], c['COLUMN_NAME']),
+            )
+        else:
+            columns = self.connector.execute(query, (schema,))
 
         if not columns:
             self._log("  ✅ ZEROFILL 의존 데이터 없음")
@@ -799,18 +829,20 @@ class DataIntegrityRules(ProgressLoggingRuleBase):
     # ================================================================
     # 통합 검사 메서드
     # ================================================================
-    def check_all_live_db(self, schema: str) -> List[CompatibilityIssue]:
-        """라이브 DB의 모든 데이터 무결성 검사 실행"""
+    def check_all_live_db(
+        self, schema: str, executor: Optional[CheckExecutor] = None
+    ) -> List[CompatibilityIssue]:
+        """라이브 DB의 모든 데이터 무결성 검사 실행 (데이터 스캔 검사는 executor 로 병렬 가능)"""
         if not self.connector:
             return []
 
-        issues = []
-        issues.extend(self.check_enum_empty_value_definition(schema))
-        issues.extend(self.check_enum_element_length(schema))
-        issues.extend(self.check_set_element_length(schema))
-        issues.extend(self.check_latin1_non_ascii(schema))
-        issues.extend(self.check_zerofill_data_dependency(schema))
-        return issues
+        return self._run_live_checks(schema, [
+            ('check_enum_empty_value_definition', False),
+            ('check_enum_element_length', False),
+            ('check_set_element_length', False),
+            ('check_latin1_non_ascii', True),
+            ('check_zerofill_data_dependency', True),
+        ], executor)
 
     def check_all_sql_content(self, content: str, location: str) -> List[CompatibilityIssue]:
         """SQL 파일 내용의 모든 데이터 무결성 검사 실행"""
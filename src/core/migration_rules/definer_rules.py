@@ -29,7 +29,8 @@ class DefinerRulesMixin:
         self._log("🔍 MySQL 스키마 충돌 검사 중...")
         issues = []
 
-        tables = self.connector.get_tables(schema)
+        catalog = self._catalog_for(schema)
+        tables = catalog.table_names() if catalog is not None else self.connector.get_tables(schema)
         conflicts = [t for t in tables if t.lower() in MYSQL_SCHEMA_TABLES]
 
         for table in conflicts:
@@ -88,7 +89,11 @@ class DefinerRulesMixin:
         FROM INFORMATION_SCHEMA.ROUTINES
         WHERE ROUTINE_SCHEMA = %s
         """
-        routines = self.connector.execute(query, (schema,))
+        catalog = self._catalog_for(schema)
+        if catalog is not None:
+            routines = catalog.routines()
+        else:
+            routines = self.connector.execute(query, (schema,))
 
         if not routines:
             return issues
@@ -127,7 +132,11 @@ class DefinerRulesMixin:
         FROM INFORMATION_SCHEMA.VIEWS
         WHERE TABLE_SCHEMA = %s
         """
-        views = self.connector.execute(query, (schema,))
+        catalog = self._catalog_for(schema)
+        if catalog is not None:
+            views = catalog.views()
+        else:
+            views = self.connector.execute(query, (schema,))
 
         if not views:
             return issues
@@ -41,7 +41,14 @@ class IndexCharsetRulesMixin:
             AND TABLE_TYPE = 'BASE TABLE'
             AND TABLE_COLLATION LIKE 'latin1_%%'
         """
-        tables = self.connector.execute(table_query, (schema,))
+        catalog = self._catalog_for(schema)
+        if catalog is not None:
+            tables = [
+                t for t in catalog.tables(base_only=True)
+                if str(t.get('TABLE_COLLATION') or '').lower().startswith('latin1')
+            ]
+        else:
+            tables = self.connector.execute(table_query, (schema,))
 
         for t in tables:
             issues.append(CompatibilityIssue(
@@ -60,7 +67,13 @@ class IndexCharsetRulesMixin:
         WHERE TABLE_SCHEMA = %s
             AND CHARACTER_SET_NAME = 'latin1'
         """
-        columns = self.connector.execute(column_query, (schema,))
+        if catalog is not None:
+            columns = [
+                c for c in catalog.columns()
+                if str(c.get('CHARACTER_SET_NAME') or '').lower() == 'latin1'
+            ]
+        else:
+            columns = self.connector.execute(column_query, (schema,))
 
         for c in columns:
             issues.append(CompatibilityIssue(
@@ -130,6 +143,21 @@ class IndexCharsetRulesMixin:
             return int(sub_part)
         return INDEX_SIZE_LIMITS['DEFAULT_PREFIX_LENGTH']
 
+    @staticmethod
+    def _index_rows_from_catalog(catalog) -> List[dict]:
+        """STATISTICS JOIN COLUMNS 결과와 같은 행을 스냅샷에서 구성"""
+        rows = []
+        for stat in catalog.indexes():
+            col = catalog.column(stat['TABLE_NAME'], stat.get('COLUMN_NAME'))
+            if col is None:
+                continue
+            row = dict(stat)
+            row['DATA_TYPE'] = col.get('DATA_TYPE')
+            row['CHARACTER_MAXIMUM_LENGTH'] = col.get('CHARACTER_MAXIMUM_LENGTH')
+            row['CHARACTER_SET_NAME'] = col.get('CHARACTER_SET_NAME')
+            rows.append(row)
+        return rows
+
     def check_index_too_large(self, schema: str) -> List[CompatibilityIssue]:
         """인덱스 크기 3072바이트 초과 확인"""
         if not self.connector:
@@ -153,7 +181,11 @@ class IndexCharsetRulesMixin:
         WHERE s.TABLE_SCHEMA = %s
         ORDER BY s.TABLE_NAME, s.INDEX_NAME, s.SEQ_IN_INDEX
         """
-        stats = self.connector.execute(index_query, (schema,))
+        catalog = self._catalog_for(schema)
+        if catalog is not None:
+            stats = self._index_rows_from_catalog(catalog)
+        else:
+            stats = self.connector.execute(index_query, (schema,))
 
         # 인덱스별로 그룹화하여 크기 계산
         index_sizes: Dict[str, int] = {}  # "table.index" -> size
@@ -28,7 +28,7 @@ ProgressLoggingRuleBase를 상속하는 얇은 조합 클래스이며, S01/S26 
 검사(check_all_*)만 직접 보유한다.
 """
 
-from typing import List
+from typing import List, Optional
 
 from ..migration_constants import (
     IssueType,
@@ -36,6 +36,7 @@ from ..migration_constants import (
     YEAR2_PATTERN,
     PARTITION_PREFIX_KEY_PATTERN,
 )
+from ..migration_check_executor import CheckExecutor
 from ._base import ProgressLoggingRuleBase
 from .identifier_rules import IdentifierRulesMixin
 from .index_charset_rules import IndexCharsetRulesMixin
@@ -70,7 +71,14 @@ class SchemaRules(
             AND DATA_TYPE = 'year'
             AND COLUMN_TYPE LIKE 'year(2)%%'
         """
-        columns = self.connector.execute(query, (schema,))
+        catalog = self._catalog_for(schema)
+        if catalog is not None:
+            columns = [
+                c for c in catalog.columns(data_types=('year',))
+                if str(c.get('COLUMN_TYPE') or '').lower().startswith('year(2)')
+            ]
+        else:
+            columns = self.connector.execute(query, (schema,))
 
         for col in columns:
             issues.append(CompatibilityIssue(
@@ -132,20 +140,22 @@ class SchemaRules(
     # ================================================================
     # 통합 검사 메서드
     # ================================================================
-    def check_all_live_db(self, schema: str) -> List[CompatibilityIssue]:
-        """라이브 DB의 모든 스키마 검사 실행"""
+    def check_all_live_db(
+        self, schema: str, executor: Optional[CheckExecutor] = None
+    ) -> List[CompatibilityIssue]:
+        """라이브 DB의 모든 스키마 검사 실행 (모두 카탈로그 검사)"""
         if not self.connector:
             return []
 
-        issues = []
-        issues.extend(self.check_year2_type(schema))
-        issues.extend(self.check_latin1_charset(schema))
-        issues.extend(self.check_index_too_large(schema))
-        issues.extend(self.check_old_geometry_types(schema))
-        issues.extend(self.check_mysql_schema_conflict(schema))
-        issues.extend(self.check_routine_definer_missing(schema))
-        issues.extend(self.check_view_definer_missing(schema))
-        return issues
+        return self._run_live_checks(schema, [
+            ('check_year2_type', False),
+            ('check_latin1_charset', False),
+            ('check_index_too_large', False),
+            ('check_old_geometry_types', False),
+            ('check_mysql_schema_conflict', False),
+            ('check_routine_definer_missing', False),
+            ('check_view_definer_missing', False),
+        ], executor)
 
     def check_all_sql_content(self, content: str, location: str) -> List[CompatibilityIssue]:
         """SQL 파일 내용의 모든 스키마 검사 실행"""
@@ -12,7 +12,7 @@ MySQL 8.0 → 8.4 업그레이드 시 스토리지 엔진 관련 호환성 검
 """
 
 import re
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from ..migration_constants import (
     IssueType,
@@ -20,6 +20,7 @@ from ..migration_constants import (
     STORAGE_ENGINE_STATUS,
     ENGINE_POLICIES,
 )
+from ..migration_check_executor import CheckExecutor
 from ._base import ProgressLoggingRuleBase
 
 
@@ -59,7 +60,15 @@ class StorageRules(ProgressLoggingRuleBase):
             AND TABLE_TYPE = 'BASE TABLE'
             AND ENGINE IN ({engines_str})
         """
-        tables = self.connector.execute(query, (schema,))
+        catalog = self._catalog_for(schema)
+        if catalog is not None:
+            deprecated_upper = {e.upper() for e in deprecated_engines}
+            tables = [
+                t for t in catalog.tables(base_only=True)
+                if str(t.get('ENGINE') or '').upper() in deprecated_upper
+            ]
+        else:
+            tables = self.connector.execute(query, (schema,))
 
         for table in tables:
             engine = table['ENGINE']
@@ -210,6 +219,14 @@ class StorageRules(ProgressLoggingRuleBase):
         if not self.connector:
             return {}
 
+        catalog = self._catalog_for(schema)
+        if catalog is not None:
+            counts = {}
+            for table in catalog.tables(base_only=True):
+                engine = table.get('ENGINE') or 'None'
+                counts[engine] = counts.get(engine, 0) + 1
+            return dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+
         query = """
         SELECT ENGINE, COUNT(*) as table_count
         FROM INFORMATION_SCHEMA.TABLES
@@ -229,15 +246,17 @@ class StorageRules(ProgressLoggingRuleBase):
     # ================================================================
     # 통합 검사 메서드
     # ================================================================
-    def check_all_live_db(self, schema: str) -> List[CompatibilityIssue]:
-        """라이브 DB의 모든 스토리지 엔진 검사 실행"""
+    def check_all_live_db(
+        self, schema: str, executor: Optional[CheckExecutor] = None
+    ) -> List[CompatibilityIssue]:
+        """라이브 DB의 모든 스토리지 엔진 검사 실행 (모두 카탈로그 검사)"""
         if not self.connector:
             return []
 
-        issues = []
-        issues.extend(self.check_deprecated_engines(schema))
-        issues.extend(self.check_partition_shared_tablespace(schema))
-        return issues
+        return self._run_live_checks(schema, [
+            ('check_deprecated_engines', False),
+            ('check_partition_shared_tablespace', False),
+        ], executor)
 
     def check_all_sql_content(self, content: str, location: str) -> List[CompatibilityIssue]:
         """SQL 파일 내용의 모든 스토리지 엔진 검사 실행"""
@@ -151,7 +151,14 @@ class SyntaxRulesMixin:
                              'multipoint', 'multilinestring', 'multipolygon',
                              'geometrycollection')
         """
-        columns = self.connector.execute(query, (schema,))
+        catalog = self._catalog_for(schema)
+        if catalog is not None:
+            columns = catalog.columns(data_types=(
+                'geometry', 'point', 'linestring', 'polygon', 'multipoint',
+                'multilinestring', 'multipolygon', 'geometrycollection',
+            ))
+        else:
+            columns = self.connector.execute(query, (schema,))
 
         for col in columns:
             issues.append(CompatibilityIssue(
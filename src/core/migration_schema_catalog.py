@@ -0,0 +1,206 @@
+"""
+스키마 카탈로그 스냅샷
+
+INFORMATION_SCHEMA 의 TABLES/COLUMNS/STATISTICS/FK/ROUTINES/VIEWS 를 스키마당
+한 번씩 벌크 조회해 메모리에 인덱싱한다. 호환성 검사기, FK 분석기, 마이그레이션
+규칙, Fix 옵션 생성기가 같은 스냅샷을 공유하면 검사마다 INFORMATION_SCHEMA 를
+다시 훑지 않는다 (테이블 수천 개 스키마에서는 그 한 번이 수 초씩 걸린다).
+
+행 dict 키는 INFORMATION_SCHEMA 컬럼명(대문자) 그대로라서, 기존 쿼리 결과를
+받던 코드가 스냅샷 행을 그대로 소비할 수 있다.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 카탈로그 벌크 쿼리 (스키마당 한 번씩)
+_TABLES_QUERY = """
+SELECT TABLE_NAME, TABLE_TYPE, ENGINE, TABLE_ROWS, TABLE_COLLATION,
+       ROW_FORMAT, CREATE_OPTIONS, UPDATE_TIME, CHECKSUM
+FROM INFORMATION_SCHEMA.TABLES
+WHERE TABLE_SCHEMA = %s
+ORDER BY TABLE_NAME
+"""
+
+_COLUMNS_QUERY = """
+SELECT TABLE_NAME, COLUMN_NAME, ORDINAL_POSITION, DATA_TYPE, COLUMN_TYPE,
+       CHARACTER_MAXIMUM_LENGTH, CHARACTER_SET_NAME, COLLATION_NAME,
+       IS_NULLABLE, COLUMN_DEFAULT, COLUMN_KEY, EXTRA
+FROM INFORMATION_SCHEMA.COLUMNS
+WHERE TABLE_SCHEMA = %s
+ORDER BY TABLE_NAME, ORDINAL_POSITION
+"""
+
+_INDEXES_QUERY = """
+SELECT TABLE_NAME, INDEX_NAME, NON_UNIQUE, SEQ_IN_INDEX, COLUMN_NAME, SUB_PART, INDEX_TYPE
+FROM INFORMATION_SCHEMA.STATISTICS
+WHERE TABLE_SCHEMA = %s
+ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+"""
+
+_FOREIGN_KEYS_QUERY = """
+SELECT
+    tc.CONSTRAINT_NAME,
+    kcu.TABLE_NAME as CHILD_TABLE,
+    kcu.COLUMN_NAME as CHILD_COLUMN,
+    kcu.REFERENCED_TABLE_NAME as PARENT_TABLE,
+    kcu.REFERENCED_COLUMN_NAME as PARENT_COLUMN,
+    rc.DELETE_RULE,
+    rc.UPDATE_RULE
+FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
+JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
+    ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
+    AND tc.TABLE_SCHEMA = kcu.TABLE_SCHEMA
+JOIN INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS rc
+    ON tc.CONSTRAINT_NAME = rc.CONSTRAINT_NAME
+    AND tc.TABLE_SCHEMA = rc.CONSTRAINT_SCHEMA
+WHERE tc.TABLE_SCHEMA = %s
+    AND tc.CONSTRAINT_TYPE = 'FOREIGN KEY'
+ORDER BY kcu.TABLE_NAME, kcu.COLUMN_NAME
+"""
+
+_ROUTINES_QUERY = """
+SELECT ROUTINE_NAME, ROUTINE_TYPE, ROUTINE_DEFINITION, DEFINER
+FROM INFORMATION_SCHEMA.ROUTINES
+WHERE ROUTINE_SCHEMA = %s
+ORDER BY ROUTINE_NAME
+"""
+
+_VIEWS_QUERY = """
+SELECT TABLE_NAME, DEFINER, SECURITY_TYPE
+FROM INFORMATION_SCHEMA.VIEWS
+WHERE TABLE_SCHEMA = %s
+ORDER BY TABLE_NAME
+"""
+
+
+# PK 범위로 나눠 스캔할 수 있는 정수 타입
+_INTEGER_TYPES = ('tinyint', 'smallint', 'mediumint', 'int', 'bigint')
+
+
+def _name_key(name) -> str:
+    # MySQL 식별자 비교는 대소문자를 구분하지 않는 경우가 많아 조회 키는 소문자로 둔다
+    return str(name or '').lower()
+
+
+class SchemaCatalogSnapshot:
+    """스키마 하나의 INFORMATION_SCHEMA 스냅샷 (읽기 전용)
+
+    load()로 벌크 조회해 만들고, 검사 코드는 tables()/columns()/column() 등
+    인덱스 조회만 한다. 분석 한 번 동안의 일관된 시점을 나타내므로 DDL 을
+    실행한 뒤에는 새로 load 해야 한다.
+    """
+
+    def __init__(
+        self,
+        schema: str,
+        tables: Iterable[dict] = (),
+        columns: Iterable[dict] = (),
+        indexes: Iterable[dict] = (),
+        foreign_keys: Iterable[dict] = (),
+        routines: Iterable[dict] = (),
+        views: Iterable[dict] = (),
+    ):
+        self.schema = schema
+        self._tables: List[dict] = list(tables)
+        self._columns: List[dict] = list(columns)
+        self._indexes: List[dict] = list(indexes)
+        self._foreign_keys: List[dict] = list(foreign_keys)
+        self._routines: List[dict] = list(routines)
+        self._views: List[dict] = list(views)
+
+        self._table_by_name: Dict[str, dict] = {
+            _name_key(t['TABLE_NAME']): t for t in self._tables
+        }
+        self._columns_by_table: Dict[str, List[dict]] = {}
+        self._column_by_name: Dict[Tuple[str, str], dict] = {}
+        for col in self._columns:
+            table_key = _name_key(col['TABLE_NAME'])
+            self._columns_by_table.setdefault(table_key, []).append(col)
+            self._column_by_name[(table_key, _name_key(col['COLUMN_NAME']))] = col
+        self._indexes_by_table: Dict[str, List[dict]] = {}
+        for row in self._indexes:
+            self._indexes_by_table.setdefault(_name_key(row['TABLE_NAME']), []).append(row)
+
+    @classmethod
+    def load(cls, connector, schema: str) -> 'SchemaCatalogSnapshot':
+        """스키마 카탈로그를 벌크 쿼리 6번으로 읽어 스냅샷 생성"""
+        params = (schema,)
+        return cls(
+            schema,
+            tables=connector.execute(_TABLES_QUERY, params),
+            columns=connector.execute(_COLUMNS_QUERY, params),
+            indexes=connector.execute(_INDEXES_QUERY, params),
+            foreign_keys=connector.execute(_FOREIGN_KEYS_QUERY, params),
+            routines=connector.execute(_ROUTINES_QUERY, params),
+            views=connector.execute(_VIEWS_QUERY, params),
+        )
+
+    def covers(self, schema: str) -> bool:
+        """이 스냅샷으로 schema 검사를 대신할 수 있는지"""
+        return self.schema == schema
+
+    # ------------------------------------------------------------
+    # 테이블
+    # ------------------------------------------------------------
+    def table_names(self) -> List[str]:
+        """뷰를 포함한 테이블 이름 (SHOW TABLES 와 같은 범위)"""
+        return [t['TABLE_NAME'] for t in self._tables]
+
+    def tables(self, base_only: bool = False) -> List[dict]:
+        if not base_only:
+            return list(self._tables)
+        return [t for t in self._tables if t.get('TABLE_TYPE') == 'BASE TABLE']
+
+    def table(self, name: str) -> Optional[dict]:
+        return self._table_by_name.get(_name_key(name))
+
+    def is_base_table(self, name: str) -> bool:
+        table = self.table(name)
+        return table is not None and table.get('TABLE_TYPE') == 'BASE TABLE'
+
+    def table_rows(self, name: str) -> int:
+        """대략적인 행 수 (INFORMATION_SCHEMA.TABLES.TABLE_ROWS, 없으면 0)"""
+        table = self.table(name)
+        return int(table.get('TABLE_ROWS') or 0) if table else 0
+
+    # ------------------------------------------------------------
+    # 컬럼 / 인덱스
+    # ------------------------------------------------------------
+    def columns(self, table: Optional[str] = None, data_types: Optional[Iterable[str]] = None) -> List[dict]:
+        """컬럼 행 (테이블명, ORDINAL_POSITION 순). data_types 는 소문자 DATA_TYPE 목록"""
+        rows = self._columns if table is None else self._columns_by_table.get(_name_key(table), [])
+        if data_types is None:
+            return list(rows)
+        wanted = {t.lower() for t in data_types}
+        return [c for c in rows if str(c.get('DATA_TYPE') or '').lower() in wanted]
+
+    def column(self, table: str, column: str) -> Optional[dict]:
+        return self._column_by_name.get((_name_key(table), _name_key(column)))
+
+    def indexes(self, table: Optional[str] = None) -> List[dict]:
+        """STATISTICS 행 (테이블, 인덱스, SEQ_IN_INDEX 순)"""
+        if table is None:
+            return list(self._indexes)
+        return list(self._indexes_by_table.get(_name_key(table), []))
+
+    def integer_primary_key(self, table: str) -> Optional[str]:
+        """정수 단일 컬럼 PK 이름 (PK 범위 샘플링/청크 분할용, 없으면 None)"""
+        pk_columns = [i['COLUMN_NAME'] for i in self.indexes(table) if i.get('INDEX_NAME') == 'PRIMARY']
+        if len(pk_columns) != 1:
+            return None
+        column = self.column(table, pk_columns[0])
+        if column is None or str(column.get('DATA_TYPE') or '').lower() not in _INTEGER_TYPES:
+            return None
+        return pk_columns[0]
+
+    # ------------------------------------------------------------
+    # FK / 루틴 / 뷰
+    # ------------------------------------------------------------
+    def foreign_keys(self) -> List[dict]:
+        """FK 컬럼 행 (CONSTRAINT_NAME, CHILD_TABLE, CHILD_COLUMN, PARENT_TABLE, ...)"""
+        return list(self._foreign_keys)
+
+    def routines(self) -> List[dict]:
+        return list(self._routines)
+
+    def views(self) -> List[dict]:
+        return list(self._views)
@@ -27,6 +27,10 @@ def is_macos(platform_name: Optional[str] = None) -> bool:
     return _platform_name(platform_name) == "Darwin"
 
 
+def is_linux(platform_name: Optional[str] = None) -> bool:
+    return _platform_name(platform_name).lower().startswith("linux")
+
+
 def detached_process_kwargs(platform_name: Optional[str] = None) -> dict:
     """Return subprocess kwargs for detached child processes on Windows."""
     if not is_windows(platform_name):
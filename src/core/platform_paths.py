@@ -132,3 +132,6 @@ def analysis_dir() -> Path:
 def rollback_dir() -> Path:
     return app_support_dir() / "rollback"
 
+
+def tunnel_events_dir() -> Path:
+    return log_dir() / "tunnel_events"
@@ -0,0 +1,260 @@
+"""
+로컬 포트 할당기
+- OS의 LISTEN 소켓 목록을 한 번에 읽어(리눅스 /proc/net/tcp*, 그 외 netstat 1회) 포트마다
+  bind를 시도하지 않고 충돌을 판정
+- 실행 중인 터널의 로컬 포트 예약, 설정 간 중복/OS 리스너 충돌 사전 검사
+- 설정 범위에서 빈 포트 추천/자동 할당
+"""
+import re
+import socket
+import subprocess
+import threading
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from src.core.logger import get_logger
+from src.core.platform_integration import is_linux, is_windows, no_window_creation_flags
+
+logger = get_logger(__name__)
+
+# 빈 포트를 추천/자동 할당할 때 찾는 범위 (양 끝 포함)
+LOCAL_PORT_RANGE_START = 3307
+LOCAL_PORT_RANGE_END = 3999
+
+_PROC_NET_FILES = ('/proc/net/tcp', '/proc/net/tcp6')
+_PROC_LISTEN_STATE = '0A'
+_NETSTAT_TIMEOUT_SECONDS = 5
+# netstat의 LISTEN 행: 상태 문구는 OS 언어에 따라 바뀌므로 상대 주소 형태로도 판정한다
+_NETSTAT_LISTEN_PEERS = {'0.0.0.0:0', '[::]:0', '*:*', '*.*'}
+_NETSTAT_PORT = re.compile(r'[.:](\d+)$')
+
+
+@dataclass(frozen=True)
+class PortConflict:
+    """터널 하나의 로컬 포트 충돌"""
+    tunnel_id: str
+    port: int
+    reason: str                    # 'duplicate' | 'tunnel' | 'listener'
+    other_tunnel_id: Optional[str] = None
+    suggested_port: Optional[int] = None
+
+    def with_suggestion(self, port: Optional[int]) -> 'PortConflict':
+        return replace(self, suggested_port=port)
+
+    def describe(self) -> str:
+        if self.reason == 'listener':
+            return f"포트 {self.port}이(가) 이미 사용 중입니다."
+        return f"포트 {self.port}이(가) 다른 터널과 겹칩니다."
+
+
+def _parse_proc_net_tcp(text: str) -> Set[int]:
+    ports = set()
+    for line in text.splitlines()[1:]:
+        fields = line.split()
+        if len(fields) > 3 and fields[3] == _PROC_LISTEN_STATE:
+            ports.add(int(fields[1].rsplit(':', 1)[1], 16))
+    return ports
+
+
+def _parse_netstat(text: str) -> Set[int]:
+    ports = set()
+    for line in text.splitlines():
+        fields = line.split()
+        if len(fields) < 4 or not fields[0].lower().startswith('tcp'):
+            continue
+        # Windows: Proto Local Foreign State / macOS: Proto Recv-Q Send-Q Local Foreign (state)
+        local, peer = (fields[1], fields[2]) if len(fields) < 6 else (fields[3], fields[4])
+        if peer in _NETSTAT_LISTEN_PEERS or 'LISTEN' in line.upper():
+            match = _NETSTAT_PORT.search(local)
+            if match:
+                ports.add(int(match.group(1)))
+    return ports
+
+
+def listening_ports(platform_name: Optional[str] = None) -> Optional[Set[int]]:
+    """LISTEN 중인 TCP 포트 집합. 알아낼 수 없으면 None"""
+    if is_linux(platform_name):
+        ports = set()
+        try:
+            for path in _PROC_NET_FILES:
+                try:
+                    with open(path, 'r', encoding='ascii') as f:
+                        ports |= _parse_proc_net_tcp(f.read())
+                except FileNotFoundError:
+                    continue
+            return ports
+        except (OSError, ValueError, IndexError) as e:
+            logger.debug(f"/proc/net/tcp 읽기 실패, netstat로 대체: {e}")
+
+    args = ['netstat', '-an'] if is_windows(platform_name) else ['netstat', '-an', '-p', 'tcp']
+    try:
+        result = subprocess.run(
+            args, capture_output=True, text=True, timeout=_NETSTAT_TIMEOUT_SECONDS,
+            creationflags=no_window_creation_flags(),
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"netstat 실행 실패: {e}")
+        return None
+    if result.returncode != 0:
+        return None
+    return _parse_netstat(result.stdout)
+
+
+def port_bindable(port: int, host: str = '0.0.0.0') -> bool:
+    """bind 시도로 포트 사용 가능 여부 확인 (리스너 목록을 얻지 못했을 때의 대체 경로)"""
+    try:
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        s.settimeout(1)
+        s.bind((host, port))
+        s.close()
+        return True
+    except OSError:
+        return False
+
+
+class PortAllocator:
+    """터널 로컬 포트 예약/충돌 검사/빈 포트 할당
+
+    실행 중인 터널의 포트는 reserve()로 기록해 두고, 그 포트를 잡고 있는 OS 리스너는
+    해당 터널 자신으로 간주한다. 검사 메서드는 listeners 인자로 scan() 결과를 받아
+    한 번 읽은 목록을 여러 판정에 재사용할 수 있다.
+    """
+
+    def __init__(self, start: int = LOCAL_PORT_RANGE_START, end: int = LOCAL_PORT_RANGE_END,
+                 scanner: Callable[[], Optional[Set[int]]] = listening_ports,
+                 bind_probe: Callable[[int], bool] = port_bindable):
+        if start > end:
+            raise ValueError(f"잘못된 포트 범위: {start}-{end}")
+        self.start = start
+        self.end = end
+        self._scanner = scanner
+        self._bind_probe = bind_probe
+        self._lock = threading.Lock()
+        self._reservations: Dict[int, str] = {}
+
+    def reserve(self, owner: str, port: int) -> bool:
+        """owner(터널 ID)에게 포트 예약. 다른 터널이 이미 예약했으면 False"""
+        with self._lock:
+            holder = self._reservations.get(port)
+            if holder is not None and holder != owner:
+                return False
+            self._reservations[port] = owner
+            return True
+
+    def release(self, owner: str):
+        """owner의 예약을 모두 해제"""
+        with self._lock:
+            for port in [port for port, holder in self._reservations.items() if holder == owner]:
+                del self._reservations[port]
+
+    def reservations(self) -> Dict[int, str]:
+        with self._lock:
+            return dict(self._reservations)
+
+    def scan(self) -> Optional[Set[int]]:
+        """OS 리스너 목록을 한 번 읽는다 (실패하면 None: 판정 시 bind 시도로 대체)"""
+        try:
+            return self._scanner()
+        except Exception as e:
+            logger.warning(f"포트 리스너 목록 조회 실패: {e}")
+            return None
+
+    def is_free(self, port: int, owner: Optional[str] = None,
+                listeners: Optional[Set[int]] = None) -> bool:
+        """owner가 port를 쓸 수 있는지 (다른 터널 예약, OS 리스너 모두 확인)"""
+        holder = self.reservations().get(port)
+        if holder is not None:
+            return holder == owner
+        if listeners is None:
+            return self._bind_probe(port)
+        return port not in listeners
+
+    def find_conflicts(self, configs: Iterable[dict],
+                       listeners: Optional[Set[int]] = None) -> List[PortConflict]:
+        """SSH 터널 설정들의 로컬 포트 충돌 목록
+
+        같은 묶음 안에서 포트가 겹치면 먼저 나온 설정이 포트를 가져가고 뒤의 설정이 충돌이다.
+        listeners를 주지 않으면 여기서 한 번 스캔한다.
+        """
+        tunnels = [
+            config for config in configs
+            if config.get('connection_mode') != 'direct' and int(config.get('local_port') or 0) > 0
+        ]
+        if not tunnels:
+            return []
+        if listeners is None:
+            listeners = self.scan()
+        reserved = self.reservations()
+
+        conflicts = []
+        claimed: Dict[int, str] = {}
+        for config in tunnels:
+            tunnel_id = config['id']
+            port = int(config['local_port'])
+            holder = reserved.get(port)
+            if port in claimed:
+                conflicts.append(PortConflict(tunnel_id, port, 'duplicate', claimed[port]))
+                continue
+            claimed[port] = tunnel_id
+            if holder == tunnel_id:
+                continue
+            if holder is not None:
+                conflicts.append(PortConflict(tunnel_id, port, 'tunnel', holder))
+            elif not (self._bind_probe(port) if listeners is None else port not in listeners):
+                conflicts.append(PortConflict(tunnel_id, port, 'listener'))
+        return conflicts
+
+    def suggest(self, count: int = 1, exclude: Iterable[int] = (),
+                listeners: Optional[Set[int]] = None,
+                preferred: Optional[int] = None,
+                owner: Optional[str] = None) -> List[int]:
+        """범위 안의 빈 포트를 낮은 번호부터 최대 count개 (preferred가 비어 있으면 맨 앞)
+
+        owner(터널 ID)를 주면 그 터널 자신의 예약 포트도 빈 포트로 본다 (find_conflicts와
+        같이, 그 포트의 OS 리스너는 실행 중인 터널 자신이다).
+        """
+        if listeners is None:
+            listeners = self.scan()
+        excluded = set(exclude)
+        reserved = self.reservations()
+
+        def available(port: int) -> bool:
+            if port in excluded:
+                return False
+            holder = reserved.get(port)
+            if holder is not None:
+                return holder == owner
+            return self._bind_probe(port) if listeners is None else port not in listeners
+
+        found = []
+        if preferred is not None and available(preferred):
+            found.append(preferred)
+            excluded.add(preferred)
+        for port in range(self.start, self.end + 1):
+            if len(found) >= count:
+                break
+            if available(port):
+                found.append(port)
+        return found
+
+    def assign(self, configs: Iterable[dict], taken: Iterable[int] = (),
+               listeners: Optional[Set[int]] = None) -> Dict[str, int]:
+        """충돌하는 설정마다 새 빈 포트를 골라 {터널 ID: 포트}로 돌려준다 (설정은 바꾸지 않음)
+
+        taken: 충돌이 없더라도 피해야 할 포트 (저장된 다른 터널 설정의 포트 등)
+        """
+        configs = list(configs)
+        if listeners is None:
+            listeners = self.scan()
+        conflicts = self.find_conflicts(configs, listeners)
+        if not conflicts:
+            return {}
+        conflicting = {conflict.tunnel_id for conflict in conflicts}
+        keep = {
+            int(config['local_port']) for config in configs
+            if config['id'] not in conflicting and int(config.get('local_port') or 0) > 0
+        }
+        ports = self.suggest(len(conflicts), exclude=keep | set(taken), listeners=listeners)
+        if len(ports) < len(conflicts):
+            logger.warning(f"포트 범위 {self.start}-{self.end}에 빈 포트가 부족합니다.")
+        return {conflict.tunnel_id: port for conflict, port in zip(conflicts, ports)}
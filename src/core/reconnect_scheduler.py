@@ -0,0 +1,184 @@
+"""
+자동 재연결 스케줄러
+- 우선순위 큐(시각 기준 힙) 하나와 디스패처 스레드 하나로 모든 터널의 재연결을 예약
+- jitter를 섞은 지수 백오프로 VPN 단절 뒤 터널들이 같은 순간에 재시도하지 않게 분산
+- bastion별 동시 SSH 핸드셰이크 수 제한
+- stop()으로 대기 중인 재연결을 즉시 취소
+"""
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from src.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 재연결 백오프: 1, 2, 4, 8, ... 초를 상한으로 하고 그 절반~전체 사이에서 무작위로 고른다.
+RECONNECT_BASE_DELAY_SECONDS = 1.0
+RECONNECT_MAX_DELAY_SECONDS = 60.0
+# 같은 bastion으로 동시에 진행할 재연결(SSH 핸드셰이크) 수와 전체 재연결 워커 수
+RECONNECT_HANDSHAKES_PER_BASTION = 2
+RECONNECT_WORKERS = 4
+
+# (실행 시각, 순번, 터널 ID, bastion 키, 터널 설정)
+_ScheduleEntry = Tuple[float, int, str, Hashable, Optional[Dict[str, Any]]]
+
+
+def reconnect_delay(attempt: int,
+                    base: float = RECONNECT_BASE_DELAY_SECONDS,
+                    cap: float = RECONNECT_MAX_DELAY_SECONDS,
+                    rng: Callable[[], float] = random.random) -> float:
+    """attempt번째(0부터) 재연결 전 대기 시간 (초)
+
+    상한 min(cap, base * 2^attempt)의 절반은 고정, 나머지 절반은 무작위(equal jitter)다.
+    고정분이 있어 시도가 거듭될수록 대기는 확실히 늘고, 무작위분이 동시에 끊긴
+    터널들의 재시도 시점을 흩뜨린다.
+    """
+    ceiling = min(cap, base * (2 ** max(0, attempt)))
+    return ceiling / 2 + rng() * ceiling / 2
+
+
+class ReconnectScheduler:
+    """터널 재연결 예약/실행기
+
+    schedule()로 넣은 재연결은 시점이 되면 워커 풀에서 run_attempt(tunnel_id, config)로
+    실행된다. config는 예약할 때 넘긴 터널 설정 그대로다 (재연결 도중 엔진에서 설정이
+    지워져도 다음 시도가 같은 설정으로 이어지도록).
+    같은 bastion 키의 재연결이 이미 per_key_limit개 진행 중이면 하나가 끝날 때까지 미룬다.
+    터널당 예약은 하나만 유지하며, 다시 예약하면 이전 예약을 대체한다.
+    """
+
+    def __init__(self, run_attempt: Callable[[str, Optional[Dict[str, Any]]], None],
+                 max_workers: int = RECONNECT_WORKERS,
+                 per_key_limit: int = RECONNECT_HANDSHAKES_PER_BASTION,
+                 clock: Callable[[], float] = time.monotonic):
+        self._run_attempt = run_attempt
+        self._max_workers = max(1, int(max_workers))
+        self._per_key_limit = max(1, int(per_key_limit))
+        self._clock = clock
+        self._cond = threading.Condition()
+        # 실행 시각 기준 힙. 취소/재예약된 항목은 꺼낼 때 버린다.
+        self._heap: List[_ScheduleEntry] = []
+        self._pending: Dict[str, int] = {}
+        # 시점이 됐지만 bastion 한도 때문에 기다리는 항목
+        self._blocked: Dict[Hashable, List[_ScheduleEntry]] = {}
+        self._in_flight: Dict[Hashable, int] = {}
+        self._seq = itertools.count()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._dispatcher: Optional[threading.Thread] = None
+        self._generation = 0
+
+    def schedule(self, tunnel_id: str, delay: float, key: Hashable = None,
+                 config: Optional[Dict[str, Any]] = None):
+        """delay초 뒤 재연결 예약
+
+        Args:
+            key: 동시 핸드셰이크를 제한할 bastion 키 (None이면 터널 ID)
+            config: 시도할 때 run_attempt에 그대로 넘길 터널 설정
+        """
+        with self._cond:
+            seq = next(self._seq)
+            self._pending[tunnel_id] = seq
+            heapq.heappush(self._heap, (self._clock() + max(0.0, delay), seq,
+                                        tunnel_id, tunnel_id if key is None else key, config))
+            self._ensure_started()
+            self._cond.notify_all()
+
+    def cancel(self, tunnel_id: str) -> bool:
+        """대기 중인 재연결 취소. 이미 실행 중인 시도는 막지 않는다."""
+        with self._cond:
+            return self._pending.pop(tunnel_id, None) is not None
+
+    def is_scheduled(self, tunnel_id: str) -> bool:
+        with self._cond:
+            return tunnel_id in self._pending
+
+    def pending_count(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def stop(self):
+        """대기 중인 재연결을 모두 취소하고 디스패처를 멈춘다.
+
+        진행 중인 핸드셰이크는 기다리지 않는다. 이후 schedule()하면 다시 시작된다.
+        """
+        with self._cond:
+            self._generation += 1
+            self._heap.clear()
+            self._pending.clear()
+            self._blocked.clear()
+            # 취소된 작업은 _run의 정리를 거치지 않으므로 진행 수도 새로 센다
+            self._in_flight.clear()
+            executor, self._executor = self._executor, None
+            self._dispatcher = None
+            self._cond.notify_all()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _ensure_started(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix='tunnel-reconnect'
+            )
+        if self._dispatcher is None or not self._dispatcher.is_alive():
+            self._dispatcher = threading.Thread(
+                target=self._dispatch_loop, args=(self._generation,),
+                name='tunnel-reconnect-scheduler', daemon=True,
+            )
+            self._dispatcher.start()
+
+    def _dispatch_loop(self, generation: int):
+        while True:
+            with self._cond:
+                if generation != self._generation:
+                    return
+                ready = self._take_ready_locked(self._clock())
+                if not ready:
+                    timeout = self._heap[0][0] - self._clock() if self._heap else None
+                    self._cond.wait(None if timeout is None else max(0.0, timeout))
+                    continue
+                executor = self._executor
+            for tunnel_id, key, config in ready:
+                try:
+                    executor.submit(self._run, tunnel_id, key, config, generation)
+                except RuntimeError:
+                    # stop()이 풀을 내린 직후다. 남은 항목은 이미 취소됐다.
+                    return
+
+    def _take_ready_locked(self, now: float) -> List[Tuple[str, Hashable, Optional[Dict[str, Any]]]]:
+        ready = []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            _due, seq, tunnel_id, key, config = entry
+            if self._pending.get(tunnel_id) != seq:
+                continue
+            if self._in_flight.get(key, 0) >= self._per_key_limit:
+                self._blocked.setdefault(key, []).append(entry)
+                continue
+            del self._pending[tunnel_id]
+            self._in_flight[key] = self._in_flight.get(key, 0) + 1
+            ready.append((tunnel_id, key, config))
+        return ready
+
+    def _run(self, tunnel_id: str, key: Hashable, config: Optional[Dict[str, Any]],
+             generation: int):
+        try:
+            self._run_attempt(tunnel_id, config)
+        except Exception as e:
+            logger.error(f"재연결 실행 오류 ({tunnel_id}): {e}")
+        finally:
+            with self._cond:
+                if generation == self._generation:
+                    remaining = self._in_flight.get(key, 0) - 1
+                    if remaining > 0:
+                        self._in_flight[key] = remaining
+                    else:
+                        self._in_flight.pop(key, None)
+                    # 한도 때문에 밀린 항목을 원래 시각 그대로 힙에 되돌려 바로 재평가한다
+                    for entry in self._blocked.pop(key, []):
+                        heapq.heappush(self._heap, entry)
+                    self._cond.notify_all()
@@ -5,6 +5,7 @@ and leading parentheses, so callers can decide whether a statement returns
 rows or triggers a MySQL implicit commit without re-implementing ad-hoc
 `sql.lower().startswith(...)` checks.
 """
+import re
 from dataclasses import dataclass
 from typing import List
 
@@ -26,6 +27,17 @@ _IMPLICIT_COMMIT_KEYWORD_PAIRS = frozenset({
     ("repair", "table"),
 })
 
+SESSION_CHANGE_NONE = ""
+SESSION_CHANGE_DATABASE = "database"
+SESSION_CHANGE_SQL_MODE = "sql_mode"
+SESSION_CHANGE_TRANSACTION = "transaction"
+SESSION_CHANGE_OTHER = "other"
+
+_SQL_MODE_ASSIGNMENT = re.compile(
+    r"set\s+(?:(?:session|local)\s+|@@(?:session\.|local\.)?)?sql_mode\s*:?=[^,]*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
 
 @dataclass(frozen=True)
 class SQLQueryClassification:
@@ -101,3 +113,26 @@ def classify_sql_statement(sql: str) -> SQLQueryClassification:
         returns_rows=statement_returns_rows(sql),
         mysql_implicit_commit_ddl=is_mysql_implicit_commit_ddl(sql),
     )
+
+
+def session_state_change(sql: str) -> str:
+    """Return which connection session state a statement changes (`SESSION_CHANGE_*`).
+
+    Used by pooled connections to decide what to reset before reuse. Any `SET`
+    other than a lone `sql_mode` assignment, temporary tables and table locks are
+    reported as `SESSION_CHANGE_OTHER`.
+    """
+    tokens = _leading_tokens(sql, max_tokens=2)
+    if not tokens:
+        return SESSION_CHANGE_NONE
+    keyword = tokens[0]
+    if keyword == "use":
+        return SESSION_CHANGE_DATABASE
+    if keyword == "begin" or tokens[:2] == ["start", "transaction"]:
+        return SESSION_CHANGE_TRANSACTION
+    if keyword == "set":
+        statement = _strip_leading_comments_and_parens(sql).strip().rstrip(";").rstrip()
+        return SESSION_CHANGE_SQL_MODE if _SQL_MODE_ASSIGNMENT.match(statement) else SESSION_CHANGE_OTHER
+    if tokens[:2] == ["create", "temporary"] or tokens[:2] == ["lock", "tables"]:
+        return SESSION_CHANGE_OTHER
+    return SESSION_CHANGE_NONE
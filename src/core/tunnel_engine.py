@@ -1,34 +1,77 @@
-from sshtunnel import SSHTunnelForwarder
 import paramiko
 import socket
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from src.core.logger import get_logger
 from src.core.constants import DEFAULT_LOCAL_HOST
+from src.core.bastion_sessions import (
+    BastionSessionManager, SharedTunnelForwarder, TempTunnelPool, TrafficCounters,
+)
+from src.core.port_allocator import PortAllocator, port_bindable
 
 logger = get_logger('tunnel_engine')
 
+# 일괄 시작(그룹 연결, 세션 복원) 시 동시에 진행할 최대 SSH 연결 수
+TUNNEL_START_WORKERS = 4
+
 
 class TunnelEngine:
     def __init__(self):
         self.active_tunnels = {}  # { tunnel_id: server_object or None(직접 연결) }
         self.tunnel_configs = {}  # { tunnel_id: config } - 연결 정보 저장용
+        # 일괄 시작 시 여러 스레드가 위 두 dict를 동시에 갱신하므로 변경은 잠금 안에서 한다.
+        self._lock = threading.RLock()
+        # 파싱한 SSH 키 캐시 { 경로: ((mtime_ns, size), 키 형식 이름, 키 객체) }
+        self._key_cache = {}
+        self._key_cache_lock = threading.Lock()
+        self.key_cache_stats = {'hits': 0, 'misses': 0}
+        # 같은 bastion 뒤의 터널/임시 터널/도달성 확인이 SSH 세션 하나를 공유한다.
+        # 실행 중 터널의 로컬 포트 예약 + 일괄 충돌 검사
+        self.ports = PortAllocator()
+        self.bastion_sessions = BastionSessionManager(
+            pkey_loader=lambda key_path: self._load_private_key(key_path)
+        )
+        # 반납된 임시 터널은 잠시 대기시켰다가 같은 대상의 다음 일회성 작업에 재사용한다.
+        self.temp_tunnels = TempTunnelPool(self._start_temp_forwarder)
 
     def is_port_available(self, port: int) -> bool:
         """포트가 사용 가능한지 확인"""
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.settimeout(1)
-            s.bind(('0.0.0.0', port))
-            s.close()
-            return True
-        except OSError:
-            return False
+        return port_bindable(port)
+
+    def check_local_ports(self, configs):
+        """SSH 터널 설정들의 로컬 포트 충돌을 OS 리스너 목록 한 번 조회로 검사
+
+        Returns:
+            PortConflict 목록 (다른 실행 중 터널, 같은 묶음 안의 중복, 다른 프로그램의 리스너)
+        """
+        return self.ports.find_conflicts(configs)
+
+    def suggest_local_port(self, saved_configs=(), tunnel_id=None, preferred=None):
+        """저장된 다른 터널 설정, 실행 중 터널, OS 리스너와 겹치지 않는 로컬 포트 추천
+
+        Args:
+            saved_configs: 저장된 터널 설정 목록 (tunnel_id 자신은 제외하고 포트를 피한다)
+            tunnel_id: 포트를 고르는 터널 ID (실행 중이면 자신이 예약한 포트도 후보로 본다)
+            preferred: 비어 있으면 그대로 쓰고 싶은 포트
+
+        Returns:
+            포트 번호, 범위 안에 빈 포트가 없으면 None
+        """
+        taken = {
+            int(config.get('local_port') or 0) for config in saved_configs
+            if config.get('id') != tunnel_id and config.get('connection_mode') != 'direct'
+        }
+        ports = self.ports.suggest(1, exclude=taken, preferred=preferred, owner=tunnel_id)
+        return ports[0] if ports else None
 
     def _load_private_key(self, key_path):
         """
-        SSH 키를 명시적으로 로드합니다.
-        순서: RSA -> Ed25519 -> ECDSA -> (DSS는 paramiko 3.x 미지원)
+        SSH 키를 명시적으로 로드합니다. (파싱 결과 캐시 사용)
+
+        (경로, mtime, 크기)가 같으면 이전에 파싱한 키 객체를 그대로 돌려준다.
+        파일이 바뀌었으면 다시 파싱하되, 지난번에 성공한 키 형식부터 시도한다.
         """
         key_path = os.path.expanduser(key_path)
 
@@ -36,6 +79,26 @@ class TunnelEngine:
         if not os.path.exists(key_path):
             raise FileNotFoundError(f"키 파일을 찾을 수 없습니다: {key_path}")
 
+        stat = os.stat(key_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._key_cache_lock:
+            cached = self._key_cache.get(key_path)
+            if cached is not None and cached[0] == signature:
+                self.key_cache_stats['hits'] += 1
+                return cached[2]
+            self.key_cache_stats['misses'] += 1
+
+        preferred = cached[1] if cached is not None else None
+        key_name, key = self._parse_private_key(key_path, preferred)
+        with self._key_cache_lock:
+            self._key_cache[key_path] = (signature, key_name, key)
+        return key
+
+    def _parse_private_key(self, key_path, preferred=None):
+        """
+        키 파일을 파싱해 (키 형식 이름, 키 객체)를 반환합니다.
+        순서: (이전 성공 형식) -> RSA -> Ed25519 -> ECDSA -> (DSS는 paramiko 3.x 미지원)
+        """
         # 모든 시도에 대한 로그 수집
         attempt_logs = []
 
@@ -51,13 +114,15 @@ class TunnelEngine:
         # paramiko 3.x에서 DSSKey(DSA) 지원이 제거됨 - 필요시에만 추가
         if hasattr(paramiko, 'DSSKey'):
             key_classes.append(("DSS", paramiko.DSSKey))
+        # 같은 경로의 키는 보통 형식이 바뀌지 않으므로 지난번 성공 형식을 먼저 시도
+        key_classes.sort(key=lambda item: item[0] != preferred)
 
         for key_name, k_cls in key_classes:
             try:
                 # 암호가 있는 키라면 password 인자가 필요하지만, 일단 없는 것으로 가정
                 key = k_cls.from_private_key_file(key_path)
                 logger.info(f"SSH 키 로드 성공: {key_name} 형식")
-                return key
+                return key_name, key
             except paramiko.ssh_exception.PasswordRequiredException:
                 raise Exception("키 파일에 비밀번호(Passphrase)가 걸려있습니다. 현재 버전은 비밀번호를 지원하지 않습니다.")
             except Exception as e:
@@ -74,30 +139,22 @@ class TunnelEngine:
             f"💡 OpenSSH 포맷인 경우 'pip install cryptography' 필요"
         )
 
-    def _build_forwarder(self, config, local_bind_address, pkey_obj, set_keepalive=None):
-        """SSHTunnelForwarder 공통 kwargs 조립 (모듈 전역 SSHTunnelForwarder 참조 필수)
+    def _build_forwarder(self, config, local_bind_address, connect_timeout=None):
+        """공유 bastion 세션 위의 로컬 포워딩 생성 (모듈 전역 SharedTunnelForwarder 참조 필수)
 
         Args:
-            config: 터널 설정 (bastion_host/bastion_port/bastion_user/remote_host/remote_port)
+            config: 터널 설정 (bastion_host/bastion_port/bastion_user/bastion_key/remote_host/remote_port)
             local_bind_address: 로컬 바인드 주소 튜플
-            pkey_obj: 이미 로드된 SSH 키 객체
-            set_keepalive: keepalive 간격(초). None이면 kwarg 자체를 생략(라이브러리 기본값 유지)
+            connect_timeout: bastion 첫 연결 대기 시간(초). None이면 세션 기본값
 
         Returns:
-            생성된 (미시작) SSHTunnelForwarder 인스턴스
+            생성된 (미시작) SharedTunnelForwarder 인스턴스
         """
-        kwargs = dict(
-            ssh_username=config['bastion_user'],
-            ssh_pkey=pkey_obj,  # 경로 대신 키 객체 전달
-            remote_bind_address=(config['remote_host'], int(config['remote_port'])),
+        return SharedTunnelForwarder(
+            self.bastion_sessions,
+            config,
             local_bind_address=local_bind_address,
-        )
-        if set_keepalive is not None:
-            kwargs['set_keepalive'] = set_keepalive
-
-        return SSHTunnelForwarder(
-            (config['bastion_host'], int(config['bastion_port'])),
-            **kwargs,
+            connect_timeout=connect_timeout,
         )
 
     def start_tunnel(self, config, check_port: bool = True):
@@ -113,27 +170,126 @@ class TunnelEngine:
         tunnel_id = config['id']
 
         # 이미 실행 중인지 확인
-        if tunnel_id in self.active_tunnels:
-            if config.get('connection_mode') == 'direct':
-                return True, "이미 연결 중입니다."
-            elif self.active_tunnels[tunnel_id] and self.active_tunnels[tunnel_id].is_active:
-                return True, "이미 실행 중입니다."
+        with self._lock:
+            if tunnel_id in self.active_tunnels:
+                if config.get('connection_mode') == 'direct':
+                    return True, "이미 연결 중입니다."
+                elif self.active_tunnels[tunnel_id] and self.active_tunnels[tunnel_id].is_active:
+                    return True, "이미 실행 중입니다."
 
         # 직접 연결 모드
         if config.get('connection_mode') == 'direct':
-            self.active_tunnels[tunnel_id] = None  # 터널 객체 없음 (직접 연결)
-            self.tunnel_configs[tunnel_id] = config
+            with self._lock:
+                self.active_tunnels[tunnel_id] = None  # 터널 객체 없음 (직접 연결)
+                self.tunnel_configs[tunnel_id] = config
             logger.info(f"직접 연결 모드: {config['name']} -> {config['remote_host']}:{config['remote_port']}")
             return True, f"직접 연결: {config['remote_host']}:{config['remote_port']}"
 
-        # SSH 터널 모드 - 포트 충돌 체크
-        if check_port:
-            local_port = int(config.get('local_port', 0))
-            if local_port > 0 and not self.is_port_available(local_port):
-                return False, f"포트 {local_port}이(가) 이미 사용 중입니다."
+        # SSH 터널 모드 - 다른 터널과 같은 포트는 예약 단계에서 막는다 (동시 시작 포함)
+        local_port = int(config.get('local_port', 0))
+        if local_port > 0 and not self.ports.reserve(tunnel_id, local_port):
+            return False, f"포트 {local_port}이(가) 다른 터널과 겹칩니다."
+
+        # 포트 충돌 체크 (다른 프로그램의 리스너)
+        if check_port and local_port > 0 and not self.is_port_available(local_port):
+            self.ports.release(tunnel_id)
+            return False, f"포트 {local_port}이(가) 이미 사용 중입니다."
 
         # SSH 터널 모드
-        return self._start_ssh_tunnel(config)
+        success, msg = self._start_ssh_tunnel(config)
+        if not success:
+            self.ports.release(tunnel_id)
+        return success, msg
+
+    def start_tunnels(self, configs, max_parallel: int = TUNNEL_START_WORKERS,
+                      check_port: bool = True, on_result=None):
+        """여러 터널을 워커 풀에서 동시에 시작
+
+        bastion마다 SSH 핸드셰이크를 기다리는 시간이 대부분이므로 순차 시작하면
+        전체 소요 시간이 각 연결 시간의 합이 된다. 병렬로 시작하면 가장 느린
+        bastion 하나의 시간으로 줄어든다.
+
+        Args:
+            configs: 터널 설정 목록 (같은 id는 한 번만 시작)
+            max_parallel: 동시에 진행할 최대 연결 수
+            check_port: 포트 충돌 체크 여부. 터널마다 bind를 시도하지 않고 시작 전에
+                        OS 리스너 목록을 한 번 읽어 모두 판정한다.
+            on_result: 터널 하나가 끝날 때마다 호출자 스레드에서 호출되는
+                       콜백 (config, success, message)
+
+        Returns:
+            입력 순서대로 정렬된 (config, success, message) 튜플 목록
+        """
+        unique = []
+        seen = set()
+        for config in configs:
+            if config['id'] not in seen:
+                seen.add(config['id'])
+                unique.append(config)
+        if not unique:
+            return []
+
+        results = [None] * len(unique)
+
+        def report(index, success, msg):
+            config = unique[index]
+            results[index] = (config, success, msg)
+            if on_result is not None:
+                try:
+                    on_result(config, success, msg)
+                except Exception as e:
+                    logger.warning(f"터널 시작 결과 콜백 오류 ({config.get('name')}): {e}")
+
+        pending = list(range(len(unique)))
+        if check_port:
+            conflicts = {conflict.tunnel_id: conflict for conflict in self._bulk_port_conflicts(unique)}
+            for index in [index for index in pending if unique[index]['id'] in conflicts]:
+                conflict = conflicts[unique[index]['id']]
+                msg = conflict.describe()
+                if conflict.suggested_port:
+                    msg += f" (빈 포트: {conflict.suggested_port})"
+                report(index, False, msg)
+            pending = [index for index in pending if results[index] is None]
+        if not pending:
+            return results
+
+        workers = max(1, min(int(max_parallel), len(pending)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='tunnel-start') as executor:
+            # 포트 검사는 위에서 끝냈으므로 터널별 bind 시도는 하지 않는다
+            futures = {
+                executor.submit(self._start_tunnel_safely, unique[index], False): index
+                for index in pending
+            }
+            for future in as_completed(futures):
+                success, msg = future.result()
+                report(futures[future], success, msg)
+        return results
+
+    def _bulk_port_conflicts(self, configs):
+        """일괄 시작 전 포트 충돌 검사. 이미 실행 중인 터널은 제외하고, 충돌마다 빈 포트를 제안한다."""
+        with self._lock:
+            running = {
+                tunnel_id for tunnel_id, server in self.active_tunnels.items()
+                if server is not None and server.is_active
+            }
+        candidates = [config for config in configs if config['id'] not in running]
+        listeners = self.ports.scan()
+        conflicts = self.ports.find_conflicts(candidates, listeners)
+        if not conflicts:
+            return []
+        suggestions = self.ports.assign(candidates, listeners=listeners)
+        return [
+            conflict.with_suggestion(suggestions.get(conflict.tunnel_id))
+            for conflict in conflicts
+        ]
+
+    def _start_tunnel_safely(self, config, check_port):
+        """start_tunnel 래퍼 - 워커 스레드의 예외를 실패 결과로 바꾼다."""
+        try:
+            return self.start_tunnel(config, check_port=check_port)
+        except Exception as e:
+            logger.error(f"터널 시작 중 예외 ({config.get('name')}): {e}")
+            return False, str(e)
 
     def _start_ssh_tunnel(self, config):
         """SSH 터널 시작 (내부 메서드)"""
@@ -150,26 +306,20 @@ class TunnelEngine:
             for log in connection_logs:
                 logger.debug(log)
 
-            # 키 객체 직접 로드
-            connection_logs.append("SSH 키 로드 시도...")
-            logger.debug("SSH 키 로드 시도...")
-            pkey_obj = self._load_private_key(config['bastion_key'])
-            connection_logs.append("✅ SSH 키 로드 성공")
-
             connection_logs.append("SSH 터널 생성 중...")
             logger.debug("SSH 터널 생성 중...")
             server = self._build_forwarder(
                 config,
                 local_bind_address=('0.0.0.0', int(config['local_port'])),
-                pkey_obj=pkey_obj,
-                set_keepalive=30.0,
             )
 
-            connection_logs.append("터널 연결 시작...")
+            # 같은 bastion 세션이 이미 있으면 재사용하고, 없을 때만 키 로드 + SSH 연결
+            connection_logs.append("터널 연결 시작 (bastion 세션 공유)...")
             logger.debug("터널 연결 시작...")
             server.start()
-            self.active_tunnels[tunnel_id] = server
-            self.tunnel_configs[tunnel_id] = config
+            with self._lock:
+                self.active_tunnels[tunnel_id] = server
+                self.tunnel_configs[tunnel_id] = config
             logger.info(f"터널 연결 성공! (Local {config['local_port']} -> Remote {config['remote_host']})")
             return True, "연결 성공"
 
@@ -194,9 +344,10 @@ class TunnelEngine:
                 server = self.active_tunnels[tunnel_id]
                 if server is not None:  # SSH 터널인 경우만 stop 호출
                     server.stop()
-                del self.active_tunnels[tunnel_id]
-                if tunnel_id in self.tunnel_configs:
-                    del self.tunnel_configs[tunnel_id]
+                with self._lock:
+                    self.active_tunnels.pop(tunnel_id, None)
+                    self.tunnel_configs.pop(tunnel_id, None)
+                self.ports.release(tunnel_id)
                 logger.info(f"터널 종료됨: {tunnel_id}")
                 return True
             except Exception as e:
@@ -212,6 +363,28 @@ class TunnelEngine:
             return server.is_active
         return False
 
+    def get_tunnel_traffic_bytes(self, tunnel_id):
+        """터널 포워딩을 지난 누적 바이트 수 (양방향 합). 직접 연결/미실행이면 None"""
+        server = self.active_tunnels.get(tunnel_id)
+        if server is None:
+            return None
+        sent = getattr(server, 'bytes_sent', None)
+        received = getattr(server, 'bytes_received', None)
+        if not isinstance(sent, int) or not isinstance(received, int):
+            return None
+        return sent + received
+
+    def get_tunnel_traffic(self, tunnel_id):
+        """터널 트래픽 카운터 스냅샷 (누적 바이트, 방향별 처리량, 채널 수, 연결 설정 시간)
+
+        직접 연결/미실행이면 None
+        """
+        server = self.active_tunnels.get(tunnel_id)
+        traffic = getattr(server, 'traffic', None) if server is not None else None
+        if not isinstance(traffic, TrafficCounters):
+            return None
+        return traffic.snapshot()
+
     def get_connection_info(self, tunnel_id):
         """실제 연결할 호스트/포트 반환"""
         if tunnel_id not in self.tunnel_configs:
@@ -226,6 +399,7 @@ class TunnelEngine:
     def create_temp_tunnel(self, config):
         """
         테스트용 임시 터널 생성 (local_port=0으로 자동 할당)
+        같은 대상의 대기 중인 임시 터널이 있으면 재사용한다.
         반환: (success, temp_server, error_msg)
         """
         # 직접 연결 모드인 경우 터널 불필요
@@ -233,30 +407,29 @@ class TunnelEngine:
             return True, None, ""
 
         try:
-            # SSH 키 로드
-            pkey_obj = self._load_private_key(config['bastion_key'])
-
-            # 임시 터널 생성 (포트 자동 할당)
-            temp_server = self._build_forwarder(
-                config,
-                local_bind_address=(DEFAULT_LOCAL_HOST, 0),  # 0 = 자동 할당
-                pkey_obj=pkey_obj,
-            )
-
-            temp_server.start()
-            logger.debug(f"임시 터널 생성: localhost:{temp_server.local_bind_port} -> {config['remote_host']}:{config['remote_port']}")
+            temp_server = self.temp_tunnels.lease(config)
             return True, temp_server, ""
 
         except Exception as e:
             error_msg = f"{type(e).__name__}: {str(e)}"
             return False, None, error_msg
 
+    def _start_temp_forwarder(self, config):
+        """임시 터널 풀의 새 포워딩 생성 (포트 자동 할당, bastion 세션은 공유)"""
+        temp_server = self._build_forwarder(
+            config,
+            local_bind_address=(DEFAULT_LOCAL_HOST, 0),  # 0 = 자동 할당
+        )
+        temp_server.start()
+        logger.debug(f"임시 터널 생성: localhost:{temp_server.local_bind_port} -> {config['remote_host']}:{config['remote_port']}")
+        return temp_server
+
     def close_temp_tunnel(self, temp_server):
-        """임시 터널 종료"""
+        """임시 터널 반납 (재사용 대기 후 만료 시 종료)"""
         if temp_server:
             try:
-                temp_server.stop()
-                logger.debug("임시 터널 종료됨")
+                self.temp_tunnels.release(temp_server)
+                logger.debug("임시 터널 반납됨")
             except Exception as e:
                 logger.warning(f"임시 터널 종료 중 오류: {e}")
 
@@ -271,38 +444,18 @@ class TunnelEngine:
         if config.get('connection_mode') == 'direct':
             return self._test_direct_connection(config)
 
-        client = None
+        session = None
         channel = None
         target_host = config.get('remote_host')
         target_port = int(config.get('remote_port', 0) or 0)
-        bastion_host = config.get('bastion_host')
-        bastion_port = int(config.get('bastion_port', 22) or 22)
-        bastion_user = config.get('bastion_user')
 
         try:
-            pkey_obj = self._load_private_key(config['bastion_key'])
-            client = paramiko.SSHClient()
-            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            client.connect(
-                hostname=bastion_host,
-                port=bastion_port,
-                username=bastion_user,
-                pkey=pkey_obj,
-                timeout=timeout,
-                banner_timeout=timeout,
-                auth_timeout=timeout,
-            )
-
-            transport = client.get_transport()
-            if not transport or not transport.is_active():
+            # 공유 bastion 세션 위에 채널만 열어 확인 (세션이 없을 때만 새로 연결)
+            session = self.bastion_sessions.acquire(config, timeout=timeout)
+            if not session.is_active:
                 return False, "Bastion SSH transport가 활성 상태가 아닙니다."
 
-            channel = transport.open_channel(
-                "direct-tcpip",
-                (target_host, target_port),
-                (DEFAULT_LOCAL_HOST, 0),
-                timeout=timeout,
-            )
+            channel = session.open_channel(target_host, target_port, timeout=timeout)
             return True, f"Bastion에서 Target DB 포트 도달 성공: {target_host}:{target_port}"
 
         except paramiko.ssh_exception.ChannelException as e:
@@ -329,16 +482,15 @@ class TunnelEngine:
                     channel.close()
                 except Exception:
                     pass
-            if client:
-                try:
-                    client.close()
-                except Exception:
-                    pass
+            if session:
+                self.bastion_sessions.release(session)
 
     def get_active_tunnels(self):
         """활성화된 터널/연결 목록 반환 (DB Export용)"""
         result = []
-        for tunnel_id, server in self.active_tunnels.items():
+        with self._lock:
+            active_items = list(self.active_tunnels.items())
+        for tunnel_id, server in active_items:
             if tunnel_id in self.tunnel_configs:
                 config = self.tunnel_configs[tunnel_id]
                 host, port = self.get_connection_info(tunnel_id)
@@ -348,14 +500,17 @@ class TunnelEngine:
                     'name': config.get('name', 'Unknown'),
                     'host': host,
                     'port': port,
-                    'mode': config.get('connection_mode', 'ssh_tunnel')
+                    'mode': config.get('connection_mode', 'ssh_tunnel'),
+                    'traffic': self.get_tunnel_traffic(tunnel_id),
                 })
         return result
 
     def stop_all(self):
-        ids = list(self.active_tunnels.keys())
+        with self._lock:
+            ids = list(self.active_tunnels.keys())
         for tunnel_id in ids:
             self.stop_tunnel(tunnel_id)
+        self.temp_tunnels.close_all()
 
     def test_connection(self, config):
         """테스트 연결"""
@@ -391,20 +546,9 @@ class TunnelEngine:
             if not config.get('bastion_key'):
                 return False, "❌ SSH 키 파일 경로가 비어있습니다."
 
-            # 키 객체 직접 로드 (테스트 시에도 동일하게 적용)
-            connection_logs.append("🔑 SSH 키 로드 시도...")
-            pkey_obj = self._load_private_key(config['bastion_key'])
-            connection_logs.append("✅ SSH 키 로드 성공")
-
-            connection_logs.append("🔗 임시 SSH 터널 생성 중...")
-            temp_server = self._build_forwarder(
-                config,
-                local_bind_address=(DEFAULT_LOCAL_HOST, 0),
-                pkey_obj=pkey_obj,
-            )
-
+            # 대기 중인 임시 터널이 있으면 그 bastion 세션을 그대로 쓴다
             connection_logs.append("🚀 Bastion Host 연결 시도...")
-            temp_server.start()
+            temp_server = self.temp_tunnels.lease(config)
             bastion_msg = "✅ 1. Bastion Host 연결 성공"
             connection_logs.append(bastion_msg)
 
@@ -431,4 +575,4 @@ class TunnelEngine:
 
         finally:
             if temp_server:
-                temp_server.stop()
+                self.temp_tunnels.release(temp_server)
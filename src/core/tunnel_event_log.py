@@ -0,0 +1,343 @@
+"""
+터널 이벤트 로그
+- 메모리: 최대 max_events개를 시간순으로 보관 (추가/제거 분할 상환 O(1)), 터널별 인덱스
+- 시간 범위 조회는 시각 이분 탐색
+- 선택적 디스크 보존: 추가 전용 JSON Lines 세그먼트 파일, 크기 기준 회전, 오래된 세그먼트 삭제
+  앱을 다시 시작하면 마지막 세그먼트들에서 최근 이벤트를 다시 읽어 온다.
+  recent 는 메모리만 본다. history/between 으로 메모리 창보다 오래된 구간을 조회하면
+  남아 있는 세그먼트 파일에서 (락 밖에서) 읽어 채운다.
+"""
+import json
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from src.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 세그먼트 파일 하나의 최대 크기와 보관할 세그먼트 수 (합계 약 8MB)
+EVENT_SEGMENT_BYTES = 1024 * 1024
+EVENT_SEGMENT_COUNT = 8
+EVENT_SEGMENT_PREFIX = 'tunnel-events-'
+EVENT_SEGMENT_SUFFIX = '.jsonl'
+
+# 앞쪽에서 제거된 칸이 이만큼 쌓이고 절반을 넘으면 리스트를 압축한다
+_COMPACT_THRESHOLD = 64
+
+
+@dataclass
+class TunnelEvent:
+    """터널 이벤트"""
+    timestamp: datetime
+    tunnel_id: str
+    event_type: str  # "connected", "disconnected", "reconnected", "error"
+    message: str
+
+    def to_record(self) -> Dict[str, str]:
+        return {
+            'timestamp': self.timestamp.isoformat(),
+            'tunnel_id': self.tunnel_id,
+            'event_type': self.event_type,
+            'message': self.message,
+        }
+
+    @classmethod
+    def from_record(cls, record: Dict[str, str]) -> 'TunnelEvent':
+        return cls(
+            timestamp=datetime.fromisoformat(record['timestamp']),
+            tunnel_id=str(record['tunnel_id']),
+            event_type=str(record['event_type']),
+            message=str(record.get('message', '')),
+        )
+
+
+class _EventSeries:
+    """시간순 이벤트 목록: 뒤에 추가, 앞에서 제거, 시각으로 이분 탐색
+
+    리스트 앞을 매번 잘라내지 않고 head 위치만 옮긴 뒤 가끔 한 번에 압축한다.
+    """
+    __slots__ = ('_events', '_times', '_head')
+
+    def __init__(self):
+        self._events: List[Optional[TunnelEvent]] = []
+        self._times: List[float] = []
+        self._head = 0
+
+    def __len__(self) -> int:
+        return len(self._events) - self._head
+
+    def append(self, event: TunnelEvent):
+        self._events.append(event)
+        self._times.append(event.timestamp.timestamp())
+
+    def popleft(self) -> TunnelEvent:
+        event = self._events[self._head]
+        self._events[self._head] = None
+        self._head += 1
+        if self._head >= _COMPACT_THRESHOLD and self._head * 2 >= len(self._events):
+            del self._events[:self._head]
+            del self._times[:self._head]
+            self._head = 0
+        return event
+
+    def oldest_time(self) -> Optional[float]:
+        return self._times[self._head] if len(self) else None
+
+    def latest(self, limit: int) -> List[TunnelEvent]:
+        """최신순 최대 limit개"""
+        if limit <= 0:
+            return []
+        start = max(self._head, len(self._events) - limit)
+        return self._events[start:][::-1]
+
+    def between(self, start: Optional[datetime], end: Optional[datetime]) -> List[TunnelEvent]:
+        """[start, end] 범위의 이벤트 (오래된 순)"""
+        lo = self._head
+        hi = len(self._events)
+        if start is not None:
+            lo = bisect_left(self._times, start.timestamp(), lo, hi)
+        if end is not None:
+            hi = bisect_right(self._times, end.timestamp(), lo, hi)
+        return self._events[lo:hi]
+
+
+class TunnelEventLog:
+    """터널 이벤트 저장소
+
+    persist_dir를 주면 모든 이벤트를 세그먼트 파일에 덧붙여 기록하고, 생성 시
+    기존 세그먼트에서 최근 max_events개를 불러온다. recent 는 주기적으로 불리므로
+    메모리만 보고, 메모리에 없는 더 오래된 이벤트는 history/between 을 명시적으로
+    호출할 때만 세그먼트 파일에서 읽는다. 파일 읽기는 락 밖에서 하므로 그동안에도
+    append 는 막히지 않는다. 디스크 오류가 나면 경고를 남기고 메모리 보관만 계속한다.
+    """
+
+    def __init__(self, max_events: int = 100, persist_dir: Optional[str] = None,
+                 segment_bytes: int = EVENT_SEGMENT_BYTES,
+                 max_segments: int = EVENT_SEGMENT_COUNT):
+        self.max_events = max(1, int(max_events))
+        self.persist_dir = persist_dir
+        self.segment_bytes = max(1, int(segment_bytes))
+        self.max_segments = max(1, int(max_segments))
+        self._lock = threading.Lock()
+        self._all = _EventSeries()
+        self._by_tunnel: Dict[str, _EventSeries] = {}
+        self._file = None
+        self._segment_index = 0
+        # 메모리 창 밖으로 밀려나 디스크에만 남은 이벤트가 있는지
+        self._older_on_disk = False
+        if persist_dir:
+            self._load_segments()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._all)
+
+    def append(self, event: TunnelEvent):
+        with self._lock:
+            self._remember(event)
+            if self.persist_dir:
+                self._write(event)
+
+    def recent(self, tunnel_id: Optional[str] = None, limit: int = 20) -> List[TunnelEvent]:
+        """메모리에 있는 최근 이벤트 (최신순, 디스크는 읽지 않는다)"""
+        with self._lock:
+            series = self._all if tunnel_id is None else self._by_tunnel.get(tunnel_id)
+            return series.latest(limit) if series is not None else []
+
+    def history(self, tunnel_id: Optional[str] = None, limit: int = 100) -> List[TunnelEvent]:
+        """최근 이벤트 (최신순, 메모리에 limit개가 없으면 세그먼트 파일에서 더 읽는다)"""
+        with self._lock:
+            series = self._all if tunnel_id is None else self._by_tunnel.get(tunnel_id)
+            events = series.latest(limit) if series is not None else []
+            directory = self._older_directory()
+            oldest = self._all.oldest_time()
+        if len(events) < limit and directory:
+            events.extend(self._disk_latest(directory, tunnel_id, limit - len(events), oldest))
+        return events
+
+    def between(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                tunnel_id: Optional[str] = None) -> List[TunnelEvent]:
+        """시간 범위 [start, end]의 이벤트 (오래된 순, None이면 그쪽 끝 제한 없음)
+
+        범위가 메모리 창보다 오래된 구간에 걸치면 그 부분은 세그먼트 파일에서 읽는다.
+        """
+        with self._lock:
+            series = self._all if tunnel_id is None else self._by_tunnel.get(tunnel_id)
+            events = series.between(start, end) if series is not None else []
+            directory = self._older_directory()
+            oldest = self._all.oldest_time()
+        if not directory or (start is not None and oldest is not None and start.timestamp() >= oldest):
+            return events
+        return self._disk_between(directory, start, end, tunnel_id, oldest) + events
+
+    def tunnel_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._by_tunnel)
+
+    def close(self):
+        """열린 세그먼트 파일을 닫는다. 이후 append하면 다시 연다."""
+        with self._lock:
+            self._close_file()
+
+    def _remember(self, event: TunnelEvent):
+        self._all.append(event)
+        self._by_tunnel.setdefault(event.tunnel_id, _EventSeries()).append(event)
+        if len(self._all) > self.max_events:
+            # 전체에서 가장 오래된 이벤트는 그 터널 인덱스에서도 가장 오래된 것이다
+            oldest = self._all.popleft()
+            self._older_on_disk = True
+            series = self._by_tunnel[oldest.tunnel_id]
+            series.popleft()
+            if not len(series):
+                del self._by_tunnel[oldest.tunnel_id]
+
+    # ------------------------------------------------------------------
+    # 디스크 보존
+    # ------------------------------------------------------------------
+
+    def _segment_path(self, index: int, directory: Optional[str] = None) -> str:
+        return os.path.join(directory or self.persist_dir,
+                            f"{EVENT_SEGMENT_PREFIX}{index:06d}{EVENT_SEGMENT_SUFFIX}")
+
+    def _segment_indexes(self, directory: Optional[str] = None) -> List[int]:
+        indexes = []
+        for name in os.listdir(directory or self.persist_dir):
+            if name.startswith(EVENT_SEGMENT_PREFIX) and name.endswith(EVENT_SEGMENT_SUFFIX):
+                number = name[len(EVENT_SEGMENT_PREFIX):-len(EVENT_SEGMENT_SUFFIX)]
+                if number.isdigit():
+                    indexes.append(int(number))
+        return sorted(indexes)
+
+    def _load_segments(self):
+        try:
+            os.makedirs(self.persist_dir, exist_ok=True)
+            indexes = self._segment_indexes()
+        except OSError as e:
+            logger.warning(f"터널 이벤트 로그 디렉토리 사용 불가, 메모리에만 보관: {e}")
+            self.persist_dir = None
+            return
+
+        self._segment_index = indexes[-1] if indexes else 1
+        # 최근 max_events개를 채울 만큼만 뒤쪽 세그먼트부터 읽는다
+        loaded: List[List[TunnelEvent]] = []
+        count = 0
+        for position in range(len(indexes) - 1, -1, -1):
+            events = self._read_segment(self._segment_path(indexes[position]))
+            loaded.append(events)
+            count += len(events)
+            if count >= self.max_events:
+                self._older_on_disk = position > 0
+                break
+        for events in reversed(loaded):
+            for event in events:
+                self._remember(event)
+
+    def _older_directory(self) -> Optional[str]:
+        """메모리 창 밖의 이벤트가 남아 있는 세그먼트 디렉토리 (없으면 None, 락 안에서 호출)"""
+        return self.persist_dir if self._older_on_disk else None
+
+    def _disk_indexes(self, directory: str) -> List[int]:
+        try:
+            return self._segment_indexes(directory)
+        except OSError as e:
+            logger.warning(f"터널 이벤트 세그먼트 목록 읽기 실패: {e}")
+            return []
+
+    def _disk_latest(self, directory: str, tunnel_id: Optional[str], limit: int,
+                     before: Optional[float]) -> List[TunnelEvent]:
+        """메모리 창(before)보다 오래된 이벤트를 최신 세그먼트부터 limit개까지 (최신순)"""
+        found: List[TunnelEvent] = []
+        for index in reversed(self._disk_indexes(directory)):
+            for event in reversed(self._read_segment(self._segment_path(index, directory))):
+                if before is not None and event.timestamp.timestamp() >= before:
+                    continue
+                if tunnel_id is None or event.tunnel_id == tunnel_id:
+                    found.append(event)
+                    if len(found) >= limit:
+                        return found
+        return found
+
+    def _disk_between(self, directory: str, start: Optional[datetime], end: Optional[datetime],
+                      tunnel_id: Optional[str], before: Optional[float]) -> List[TunnelEvent]:
+        """메모리 창(before)보다 오래된 [start, end] 범위 이벤트 (오래된 순)"""
+        lo = start.timestamp() if start is not None else None
+        hi = end.timestamp() if end is not None else None
+        found: List[TunnelEvent] = []
+        for index in self._disk_indexes(directory):
+            for event in self._read_segment(self._segment_path(index, directory)):
+                moment = event.timestamp.timestamp()
+                if (before is not None and moment >= before) or (hi is not None and moment > hi):
+                    # 세그먼트는 시간순이라 이후 이벤트는 모두 범위 밖이거나 메모리에 있다
+                    return found
+                if (lo is None or moment >= lo) and (tunnel_id is None or event.tunnel_id == tunnel_id):
+                    found.append(event)
+        return found
+
+    @staticmethod
+    def _read_segment(path: str) -> List[TunnelEvent]:
+        events = []
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        events.append(TunnelEvent.from_record(json.loads(line)))
+                    except (ValueError, KeyError, TypeError):
+                        # 비정상 종료로 잘린 마지막 줄 등은 건너뛴다
+                        continue
+        except FileNotFoundError:
+            # 락 밖에서 읽는 동안 회전으로 삭제된 세그먼트
+            pass
+        except OSError as e:
+            logger.warning(f"터널 이벤트 세그먼트 읽기 실패 ({path}): {e}")
+        return events
+
+    def _write(self, event: TunnelEvent):
+        try:
+            if self._file is None:
+                self._file = self._open_segment(self._segment_path(self._segment_index))
+            if self._file.tell() >= self.segment_bytes:
+                self._rotate()
+            self._file.write(json.dumps(event.to_record(), ensure_ascii=False) + '\n')
+            self._file.flush()
+        except OSError as e:
+            logger.warning(f"터널 이벤트 기록 실패, 이후 메모리에만 보관: {e}")
+            self._close_file()
+            self.persist_dir = None
+
+    @staticmethod
+    def _open_segment(path: str):
+        needs_newline = False
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            with open(path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) != b'\n'
+        segment = open(path, 'a', encoding='utf-8')
+        if needs_newline:
+            # 비정상 종료로 잘린 줄 뒤에 이어 쓰지 않도록 줄을 끊는다
+            segment.write('\n')
+        return segment
+
+    def _rotate(self):
+        self._close_file()
+        self._segment_index += 1
+        self._file = self._open_segment(self._segment_path(self._segment_index))
+        for index in self._segment_indexes()[:-self.max_segments]:
+            try:
+                os.remove(self._segment_path(index))
+            except OSError as e:
+                logger.warning(f"오래된 터널 이벤트 세그먼트 삭제 실패: {e}")
+
+    def _close_file(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
@@ -5,20 +5,36 @@
 - 자동 재연결
 - 이벤트 히스토리
 """
+import heapq
 import time
 import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional, Callable
 from enum import Enum
 
+from src.core.bastion_sessions import bastion_key
+from src.core.latency_stats import LATENCY_SUMMARY_WINDOW_SECONDS, LatencyStats, LatencySummary
 from src.core.logger import get_logger
+from src.core.reconnect_scheduler import ReconnectScheduler, reconnect_delay
+from src.core.tunnel_event_log import TunnelEvent, TunnelEventLog
 from src.core.tunnel_health_checker import TunnelHealthChecker
 
 logger = get_logger(__name__)
 
-# 재연결 백오프 정책: 시도 횟수가 늘어날수록 대기 시간을 늘려 재시도 폭주를 방지한다.
-RECONNECT_BACKOFF_SECONDS = (1, 2, 5, 10, 30, 60)
+# Latency 측정 동시 실행 수. 한 터널의 ping이 멈춰도 나머지 터널 측정은 계속 진행된다.
+LATENCY_PROBE_WORKERS = 8
+# 측정 하나가 시작된 뒤 결과를 기다리는 최대 시간 (초). 넘으면 이번 주기에서는 측정 실패로 본다.
+LATENCY_PROBE_TIMEOUT_SECONDS = 3.0
+
+# 적응형 측정 주기: 측정이 연속으로 성공하면 간격을 늘리고(최대값까지), 실패 직후에는 짧게 다시 잰다.
+# 연결 끊김 감지(is_running)는 측정 주기와 무관하게 매 체크 간격마다 수행된다.
+PROBE_BACKOFF_FACTOR = 2.0
+PROBE_MAX_INTERVAL_SECONDS = 60.0
+PROBE_RETRY_INTERVAL_SECONDS = 1.0
+# 이 속도 이상의 트래픽이 흐르는 터널은 실행 중인 작업(덤프 등)이 쓰고 있으므로 측정을 미룬다.
+BUSY_TRAFFIC_BYTES_PER_SECOND = 64 * 1024
 
 
 class TunnelState(Enum):
@@ -40,7 +56,19 @@ class TunnelStatus:
     latency_ms: Optional[float] = None
     error_message: Optional[str] = None
     reconnect_count: int = 0
-    latency_history: List[float] = field(default_factory=list)
+    # 최근 측정 링 버퍼 (성공/실패 모두 기록)
+    latency_stats: LatencyStats = field(default_factory=LatencyStats, repr=False, compare=False)
+
+    @property
+    def latency_history(self) -> List[float]:
+        """최근 성공 측정값 (오래된 순, 최대 100개)"""
+        return self.latency_stats.recent_latencies(100)
+
+    @latency_history.setter
+    def latency_history(self, values: List[float]):
+        self.latency_stats.clear()
+        for value in values:
+            self.latency_stats.record(value)
 
     def get_connection_duration(self) -> Optional[float]:
         """연결 지속 시간 (초)"""
@@ -50,11 +78,15 @@ class TunnelStatus:
 
     def get_average_latency(self) -> Optional[float]:
         """평균 Latency (최근 10회)"""
-        if not self.latency_history:
+        recent = self.latency_stats.recent_latencies(10)
+        if not recent:
             return None
-        recent = self.latency_history[-10:]
         return sum(recent) / len(recent)
 
+    def get_latency_summary(self, window_seconds: Optional[float] = LATENCY_SUMMARY_WINDOW_SECONDS) -> LatencySummary:
+        """창 안의 latency 백분위/jitter/실패율 요약"""
+        return self.latency_stats.summary(window_seconds)
+
     def format_duration(self) -> str:
         """연결 지속 시간 포맷팅"""
         duration = self.get_connection_duration()
@@ -72,28 +104,33 @@ class TunnelStatus:
 
 
 @dataclass
-class TunnelEvent:
-    """터널 이벤트"""
-    timestamp: datetime
-    tunnel_id: str
-    event_type: str  # "connected", "disconnected", "reconnected", "error"
-    message: str
+class _ProbeSchedule:
+    """터널별 latency 측정 일정"""
+    next_due: float
+    interval: float
+    traffic_bytes: Optional[int] = None
+    traffic_at: float = 0.0
 
 
 class TunnelMonitor:
     """터널 상태 모니터"""
 
-    def __init__(self, tunnel_engine, config_manager=None, max_events: int = 100):
+    def __init__(self, tunnel_engine, config_manager=None, max_events: int = 100,
+                 probe_workers: int = LATENCY_PROBE_WORKERS,
+                 probe_timeout: float = LATENCY_PROBE_TIMEOUT_SECONDS,
+                 event_log_dir: Optional[str] = None):
         """
         Args:
             tunnel_engine: TunnelEngine 인스턴스
             config_manager: ConfigManager 인스턴스 (자동 재연결 설정용)
-            max_events: 저장할 최대 이벤트 수
+            max_events: 메모리에 보관할 최대 이벤트 수
+            probe_workers: 동시에 실행할 latency 측정 수
+            probe_timeout: 측정 하나의 제한 시간 (초)
+            event_log_dir: 이벤트를 디스크에 남길 디렉토리 (None이면 메모리에만 보관)
         """
         self.tunnel_engine = tunnel_engine
         self._statuses: Dict[str, TunnelStatus] = {}
-        self._events: List[TunnelEvent] = []
-        self._max_events = max_events
+        self.event_log = TunnelEventLog(max_events=max_events, persist_dir=event_log_dir)
         self._running = False
         self._auto_reconnect = True
         self._max_reconnect_attempts = 5
@@ -102,6 +139,22 @@ class TunnelMonitor:
         self._stop_event = threading.Event()
         self._lock = threading.RLock()  # RLock: 재진입 가능 (on_tunnel_connected 등 내부 중첩 호출 대응)
 
+        # Latency 측정 풀 (첫 측정 때 생성, stop_monitoring에서 정리)
+        self._probe_workers = max(1, int(probe_workers))
+        self._probe_timeout = max(0.1, float(probe_timeout))
+        self._probe_executor: Optional[ThreadPoolExecutor] = None
+        # 이전 주기에서 제한 시간을 넘기고 아직 끝나지 않은 측정 (터널당 하나만 허용)
+        self._probes_in_flight: Dict[str, Future] = {}
+
+        # 적응형 측정 일정: (다음 측정 시각, 터널 ID) 힙 + 터널별 일정.
+        # 다시 예약하면 힙에 새 항목을 넣고, 일정과 시각이 다른 옛 항목은 꺼낼 때 버린다.
+        self._probe_interval = 5.0
+        self._probe_heap: List[tuple] = []
+        self._probe_schedules: Dict[str, _ProbeSchedule] = {}
+
+        # 자동 재연결: 예약/백오프/bastion별 동시 핸드셰이크 제한은 스케줄러 하나가 맡는다
+        self._reconnects = ReconnectScheduler(self._reconnect_now)
+
         # Health check 책임은 TunnelHealthChecker로 위임 (터널별 연결 캐시 포함)
         self._health_checker = TunnelHealthChecker(tunnel_engine, config_manager, self._lock)
 
@@ -159,6 +212,7 @@ class TunnelMonitor:
             return
 
         self._running = True
+        self._probe_interval = max(0.1, float(interval))
         self._stop_event.clear()
         self._thread = threading.Thread(
             target=self._monitor_loop,
@@ -176,8 +230,19 @@ class TunnelMonitor:
             self._thread.join(timeout=5)
         self._thread = None
 
+        # 대기 중인 재연결 취소 (진행 중인 핸드셰이크는 결과만 버려진다)
+        self._reconnects.stop()
+
+        with self._lock:
+            executor, self._probe_executor = self._probe_executor, None
+            self._probes_in_flight.clear()
+        if executor is not None:
+            # 멈춘 ping을 기다리지 않는다. 대기 중인 측정만 취소된다.
+            executor.shutdown(wait=False, cancel_futures=True)
+
         # Health check 연결 모두 정리
         self._cleanup_all_health_connections()
+        self.event_log.close()
         logger.info("터널 모니터링 중지")
 
     def _cleanup_health_connection(self, tunnel_id: str):
@@ -204,6 +269,41 @@ class TunnelMonitor:
         with self._lock:
             return dict(self._statuses)
 
+    def get_latency_summary(self, tunnel_id: str,
+                            window_seconds: Optional[float] = LATENCY_SUMMARY_WINDOW_SECONDS) -> LatencySummary:
+        """터널의 latency 요약 (window_seconds가 None이면 보관 중인 전체 측정)"""
+        return self.get_status(tunnel_id).get_latency_summary(window_seconds)
+
+    def export_latency_stats(self, window_seconds: Optional[float] = LATENCY_SUMMARY_WINDOW_SECONDS) -> Dict[str, Dict[str, object]]:
+        """모든 터널의 latency 통계를 JSON으로 직렬화 가능한 dict로 내보낸다.
+
+        Returns:
+            { tunnel_id: { 'summary': {...}, 'total_samples': n, 'total_failures': n,
+                           'samples': [[경과 초, latency_ms 또는 null], ...] } }
+            samples의 경과 초는 내보낸 시점 기준 음수 오프셋이다 (-30.0 = 30초 전).
+        """
+        with self._lock:
+            statuses = list(self._statuses.items())
+        now = time.monotonic()
+        exported = {}
+        for tunnel_id, status in statuses:
+            stats = status.latency_stats
+            exported[tunnel_id] = {
+                'summary': stats.summary(window_seconds, now).to_dict(),
+                'total_samples': stats.total_samples,
+                'total_failures': stats.total_failures,
+                'samples': [
+                    [round(at - now, 3), value if value >= 0 else None]
+                    for at, value in stats.samples(window_seconds, now)
+                ],
+            }
+        return exported
+
+    def get_traffic_stats(self, tunnel_id: str) -> Optional[Dict[str, object]]:
+        """터널 트래픽 카운터 (처리량, 활성 채널, 연결 설정 시간). 직접 연결/미실행이면 None"""
+        traffic = self.tunnel_engine.get_tunnel_traffic(tunnel_id)
+        return traffic if isinstance(traffic, dict) else None
+
     def get_recent_events(self, tunnel_id: Optional[str] = None,
                           limit: int = 20) -> List[TunnelEvent]:
         """최근 이벤트 조회
@@ -215,13 +315,33 @@ class TunnelMonitor:
         Returns:
             이벤트 목록 (최신순)
         """
-        with self._lock:
-            if tunnel_id:
-                filtered = [e for e in self._events if e.tunnel_id == tunnel_id]
-            else:
-                filtered = list(self._events)
+        return self.event_log.recent(tunnel_id or None, limit)
 
-            return filtered[-limit:][::-1]  # 최신순
+    def get_event_history(self, tunnel_id: Optional[str] = None,
+                          limit: int = 100) -> List[TunnelEvent]:
+        """메모리 창보다 오래된 이벤트까지 세그먼트 파일에서 읽어 오는 이벤트 조회
+
+        디스크를 읽으므로 타이머 갱신이 아니라 사용자가 이력을 요청할 때만 호출한다.
+
+        Args:
+            tunnel_id: 특정 터널 ID (None이면 전체)
+            limit: 최대 반환 개수
+
+        Returns:
+            이벤트 목록 (최신순)
+        """
+        return self.event_log.history(tunnel_id or None, limit)
+
+    def get_events_between(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                           tunnel_id: Optional[str] = None) -> List[TunnelEvent]:
+        """시간 범위 [start, end]의 이벤트 (오래된 순)
+
+        Args:
+            start: 시작 시각 (None이면 보관 중인 가장 오래된 이벤트부터)
+            end: 끝 시각 (None이면 최신까지)
+            tunnel_id: 특정 터널 ID (None이면 전체)
+        """
+        return self.event_log.between(start, end, tunnel_id)
 
     def set_auto_reconnect(self, enabled: bool):
         """자동 재연결 설정"""
@@ -247,21 +367,37 @@ class TunnelMonitor:
         return self._max_reconnect_attempts
 
     def _monitor_loop(self, interval: int):
-        """모니터링 메인 루프"""
+        """모니터링 메인 루프
+
+        연결 상태는 매 `interval`마다 확인하고, latency 측정은 터널별 일정에 따라
+        시점이 된 터널만 수행한다. 측정 시점이 더 빠르면 그때 깨어난다.
+        """
         while self._running and not self._stop_event.is_set():
             try:
-                self._check_all_tunnels()
+                self._check_all_tunnels(scheduled=True)
             except Exception as e:
                 logger.error(f"모니터링 루프 오류: {e}")
 
-            self._stop_event.wait(interval)
+            self._stop_event.wait(self._next_wakeup(interval))
+
+    def _next_wakeup(self, interval: float) -> float:
+        """다음 루프까지 대기 시간 (초): 체크 간격과 가장 이른 측정 시점 중 빠른 쪽"""
+        with self._lock:
+            delay = float(interval)
+            if self._probe_heap:
+                delay = min(delay, self._probe_heap[0][0] - time.monotonic())
+        return max(0.05, delay)
 
-    def _check_all_tunnels(self):
+    def _check_all_tunnels(self, scheduled: bool = False):
         """모든 활성 터널 상태 확인
 
         Latency 측정(네트워크 I/O)은 self._lock을 점유하지 않은 상태에서 수행한다.
         상태 전이는 1단계(락 보유)에서 처리하고, 연결 중인 터널 목록만 모아
         락 밖에서 측정한 뒤 2단계(락 재획득)에서 결과를 반영한다.
+
+        Args:
+            scheduled: True면 측정 일정상 시점이 된 터널만 잰다 (모니터링 루프).
+                       False면 연결 중인 모든 터널을 바로 잰다.
         """
         # 현재 활성 터널 목록
         active_ids = set(self.tunnel_engine.active_tunnels.keys())
@@ -319,32 +455,182 @@ class TunnelMonitor:
                         self._cleanup_health_connection(tunnel_id)
                         self._notify_callbacks(tunnel_id, status)
 
-        # 2단계: 락 밖에서 Latency 측정 (DB 프로토콜 통신 포함)
-        latency_results = {
-            tunnel_id: self._measure_latency(tunnel_id)
-            for tunnel_id in latency_targets
-        }
+            latency_targets = self._take_due_probes(latency_targets, time.monotonic(), force=not scheduled)
 
-        # 3단계: 측정 결과 반영 (락 재획득)
+        # 2~3단계: 락 밖에서 Latency 측정 (DB 프로토콜 통신 포함), 결과는 도착하는 대로 반영
+        self._probe_latencies(latency_targets)
+
+    def _probe_latencies(self, tunnel_ids: List[str]):
+        """터널들의 latency를 측정 풀에서 동시에 재고, 끝나는 순서대로 상태에 반영한다.
+
+        측정마다 시작 시점부터 `probe_timeout` 제한이 적용된다. 제한을 넘긴 측정은
+        실패(-1)로 반영하고, 그 터널은 측정이 실제로 끝날 때까지 다음 주기에도 새 측정을
+        제출하지 않는다. 풀이 멈춘 측정으로 꽉 차 시작조차 못 한 측정은 취소한다.
+        """
+        if not tunnel_ids:
+            return
+
+        targets: List[str] = []
         with self._lock:
-            for tunnel_id, latency in latency_results.items():
-                status = self._statuses.get(tunnel_id)
-                if not status:
+            if self._probe_executor is None:
+                self._probe_executor = ThreadPoolExecutor(
+                    max_workers=self._probe_workers, thread_name_prefix="latency-probe"
+                )
+            executor = self._probe_executor
+            for tunnel_id in tunnel_ids:
+                previous = self._probes_in_flight.get(tunnel_id)
+                if previous is not None and not previous.done():
+                    logger.debug(f"이전 latency 측정이 아직 진행 중: {tunnel_id}")
+                    self._apply_latency(tunnel_id, -1)
+                    # 멈춘 측정이 끝나기 전에는 빠른 재측정이 의미 없으므로 기본 간격 뒤로 미룬다
+                    self._schedule_probe(tunnel_id, time.monotonic() + self._probe_interval)
                     continue
-                # 측정 도중 터널이 끊어졌으면 결과를 반영하지 않는다
-                if not self.tunnel_engine.is_running(tunnel_id):
+                targets.append(tunnel_id)
+
+        # 제출은 락 밖에서: 워커가 곧바로 측정을 시작해도 락을 기다리지 않는다.
+        started: Dict[str, float] = {}
+        try:
+            futures: Dict[Future, str] = {
+                executor.submit(self._timed_probe, tunnel_id, started): tunnel_id
+                for tunnel_id in targets
+            }
+        except RuntimeError:
+            # stop_monitoring()이 그사이 풀을 닫았다
+            return
+        with self._lock:
+            for future, tunnel_id in futures.items():
+                self._probes_in_flight[tunnel_id] = future
+
+        cycle_started = time.monotonic()
+        pending = set(futures)
+        while pending and not self._stop_event.is_set():
+            now = time.monotonic()
+            deadlines = [
+                started.get(futures[future], cycle_started + self._probe_timeout) + self._probe_timeout
+                for future in pending
+            ]
+            done, pending = wait(
+                pending, timeout=max(0.0, min(deadlines) - now), return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                tunnel_id = futures[future]
+                try:
+                    latency = future.result() if not future.cancelled() else -1
+                except Exception as e:
+                    logger.debug(f"Latency 측정 오류 ({tunnel_id}): {e}")
+                    latency = -1
+                with self._lock:
+                    self._probes_in_flight.pop(tunnel_id, None)
+                    self._apply_latency(tunnel_id, latency)
+                    self._reschedule_after_probe(tunnel_id, latency)
+
+            now = time.monotonic()
+            for future in list(pending):
+                tunnel_id = futures[future]
+                begun = started.get(tunnel_id)
+                if begun is None:
+                    # 아직 시작 못 함: 두 번의 제한 시간 안에 워커를 얻지 못하면 취소
+                    if now - cycle_started < 2 * self._probe_timeout or not future.cancel():
+                        continue
+                elif now - begun < self._probe_timeout:
                     continue
+                pending.discard(future)
+                logger.debug(f"Latency 측정 제한 시간 초과 ({tunnel_id})")
+                with self._lock:
+                    if future.cancelled():
+                        self._probes_in_flight.pop(tunnel_id, None)
+                    self._apply_latency(tunnel_id, -1)
+                    self._reschedule_after_probe(tunnel_id, -1)
 
-                if latency >= 0:
-                    status.latency_ms = latency
-                    status.latency_history.append(latency)
-                    # 히스토리 최대 100개 유지
-                    if len(status.latency_history) > 100:
-                        status.latency_history = status.latency_history[-100:]
-                else:
-                    status.latency_ms = None
+    def _take_due_probes(self, connected: List[str], now: float, force: bool = False) -> List[str]:
+        """측정할 터널 선택 (호출자가 self._lock 보유)
 
-                self._notify_callbacks(tunnel_id, status)
+        새로 연결된 터널은 바로 측정 대상이 되고, 연결이 끊긴 터널의 일정은 버린다.
+        `force`가 아니면 힙에서 시점이 된 터널만 꺼내며, 트래픽이 많은 터널은 건너뛰고
+        기본 간격 뒤로 다시 예약한다 (흐르는 트래픽 자체가 터널이 살아 있다는 증거).
+        """
+        connected_set = set(connected)
+        for tunnel_id in list(self._probe_schedules):
+            if tunnel_id not in connected_set:
+                del self._probe_schedules[tunnel_id]
+        for tunnel_id in connected:
+            if tunnel_id not in self._probe_schedules:
+                self._schedule_probe(tunnel_id, now)
+        if force:
+            return list(connected)
+
+        due: List[str] = []
+        while self._probe_heap and self._probe_heap[0][0] <= now:
+            when, tunnel_id = heapq.heappop(self._probe_heap)
+            schedule = self._probe_schedules.get(tunnel_id)
+            if schedule is None or schedule.next_due != when:
+                continue  # 끊겼거나 다시 예약된 터널의 옛 항목
+            if self._carries_heavy_traffic(tunnel_id, schedule, now):
+                logger.debug(f"트래픽 사용 중, latency 측정 건너뜀: {tunnel_id}")
+                self._schedule_probe(tunnel_id, now + self._probe_interval)
+                continue
+            due.append(tunnel_id)
+        return due
+
+    def _carries_heavy_traffic(self, tunnel_id: str, schedule: _ProbeSchedule, now: float) -> bool:
+        """지난 확인 이후 평균 트래픽이 BUSY_TRAFFIC_BYTES_PER_SECOND 이상인지 (호출자가 self._lock 보유)"""
+        traffic = self.tunnel_engine.get_tunnel_traffic_bytes(tunnel_id)
+        if not isinstance(traffic, int):
+            return False
+        previous, previous_at = schedule.traffic_bytes, schedule.traffic_at
+        schedule.traffic_bytes, schedule.traffic_at = traffic, now
+        if previous is None or now <= previous_at:
+            return False
+        return (traffic - previous) / (now - previous_at) >= BUSY_TRAFFIC_BYTES_PER_SECOND
+
+    def _schedule_probe(self, tunnel_id: str, due: float):
+        """터널의 다음 측정 시각 예약 (호출자가 self._lock 보유)"""
+        schedule = self._probe_schedules.get(tunnel_id)
+        if schedule is None:
+            schedule = _ProbeSchedule(next_due=due, interval=self._probe_interval)
+            self._probe_schedules[tunnel_id] = schedule
+        schedule.next_due = due
+        heapq.heappush(self._probe_heap, (due, tunnel_id))
+
+    def _reschedule_after_probe(self, tunnel_id: str, latency: float):
+        """측정 결과에 따라 다음 측정 예약 (호출자가 self._lock 보유)
+
+        성공하면 현재 간격 뒤에 다시 재고 간격을 PROBE_BACKOFF_FACTOR배로 늘린다.
+        실패하면 PROBE_RETRY_INTERVAL_SECONDS 뒤에 다시 재고 간격을 기본값으로 되돌린다.
+        """
+        schedule = self._probe_schedules.get(tunnel_id)
+        if schedule is None:
+            return
+        now = time.monotonic()
+        if latency >= 0:
+            due = now + schedule.interval
+            schedule.interval = min(
+                schedule.interval * PROBE_BACKOFF_FACTOR,
+                max(self._probe_interval, PROBE_MAX_INTERVAL_SECONDS),
+            )
+        else:
+            due = now + min(PROBE_RETRY_INTERVAL_SECONDS, self._probe_interval)
+            schedule.interval = self._probe_interval
+        self._schedule_probe(tunnel_id, due)
+
+    def _timed_probe(self, tunnel_id: str, started: Dict[str, float]) -> float:
+        """측정 풀 워커에서 실행: 시작 시점을 기록하고 latency를 잰다."""
+        started[tunnel_id] = time.monotonic()
+        return self._measure_latency(tunnel_id)
+
+    def _apply_latency(self, tunnel_id: str, latency: float):
+        """측정 결과 반영 (호출자가 self._lock 보유)"""
+        status = self._statuses.get(tunnel_id)
+        if not status:
+            return
+        # 측정 도중 터널이 끊어졌으면 결과를 반영하지 않는다
+        if not self.tunnel_engine.is_running(tunnel_id):
+            return
+
+        status.latency_stats.record(latency)
+        status.latency_ms = latency if latency >= 0 else None
+
+        self._notify_callbacks(tunnel_id, status)
 
     def _get_health_credentials(self, tunnel_id: str, config: Dict[str, object]) -> tuple:
         """Health check용 DB 자격 증명 조회 (TunnelHealthChecker로 위임)"""
@@ -363,7 +649,7 @@ class TunnelMonitor:
             tunnel_id, engine, host, port, username, password, database
         )
 
-    def _attempt_reconnect(self, tunnel_id: str):
+    def _attempt_reconnect(self, tunnel_id: str, config: Optional[Dict] = None):
         """자동 재연결 시도
 
         재연결 상태(state/error_message/reconnect_count) 변경은 항상 self._lock을
@@ -371,7 +657,12 @@ class TunnelMonitor:
 
         Args:
             tunnel_id: 터널 ID
+            config: 이전 시도에서 넘겨받은 터널 설정. 첫 시도(None)에서는 엔진에서
+                조회해 두고, 재시도마다 스케줄러를 통해 그대로 넘긴다. 첫 시도의
+                stop_tunnel이 엔진의 설정을 지우기 때문이다.
         """
+        if config is None:
+            config = self.tunnel_engine.tunnel_configs.get(tunnel_id)
         with self._lock:
             status = self._statuses.get(tunnel_id)
             if not status:
@@ -387,38 +678,52 @@ class TunnelMonitor:
                 )
                 return
 
-            # 백오프 딜레이: RECONNECT_BACKOFF_SECONDS 참조 (증가 정책은 모듈 상수 주석 참조)
-            delay = RECONNECT_BACKOFF_SECONDS[min(status.reconnect_count, len(RECONNECT_BACKOFF_SECONDS) - 1)]
+            # 백오프 딜레이: jitter가 섞인 지수 백오프 (reconnect_scheduler 모듈 상수 참조)
+            delay = reconnect_delay(status.reconnect_count)
 
             status.state = TunnelState.RECONNECTING
             status.reconnect_count += 1
 
             self._add_event(
                 tunnel_id, "reconnecting",
-                f"재연결 시도 {status.reconnect_count}/{self._max_reconnect_attempts} ({delay}초 대기)"
+                f"재연결 시도 {status.reconnect_count}/{self._max_reconnect_attempts} ({delay:.1f}초 대기)"
             )
 
-        # 별도 스레드에서 재연결 시도 (락을 점유하지 않은 상태로 예약)
-        threading.Thread(
-            target=self._reconnect_after_delay,
-            args=(tunnel_id, delay, status),
-            daemon=True
-        ).start()
+            self._reconnects.schedule(
+                tunnel_id, delay, key=self._reconnect_key(tunnel_id, config), config=config
+            )
 
-    def _reconnect_after_delay(self, tunnel_id, delay, status):
-        """지연 시간 대기 후 재연결 시도 (별도 스레드에서 실행)
+    @staticmethod
+    def _reconnect_key(tunnel_id: str, config: Optional[Dict]):
+        """동시 재연결을 제한할 단위: SSH 터널은 bastion, 직접 연결은 대상 서버"""
+        if not isinstance(config, dict):
+            return tunnel_id
+        if config.get('connection_mode') == 'direct':
+            return ('direct', config.get('remote_host'), config.get('remote_port'))
+        try:
+            return bastion_key(config)
+        except (KeyError, TypeError, ValueError):
+            return tunnel_id
 
-        _attempt_reconnect가 예약한 백오프 지연을 소비한 뒤 실제 재연결을 수행한다.
-        """
-        time.sleep(delay)
+    def _reconnect_now(self, tunnel_id: str, config: Optional[Dict] = None):
+        """예약된 재연결 실행 (스케줄러 워커 스레드에서 실행)
 
+        _attempt_reconnect가 예약한 백오프 지연이 지난 뒤, 예약할 때 잡아 둔 설정으로
+        실제 재연결을 수행한다.
+        """
         if not self._running:
             return
 
+        with self._lock:
+            status = self._statuses.get(tunnel_id)
+        if status is None:
+            return
+
         try:
             # start_tunnel은 config dict를 요구함. stop_tunnel이 tunnel_configs를
-            # 삭제하므로, 반드시 stop 호출 전에 config를 조회/보관한다.
-            config = self.tunnel_engine.tunnel_configs.get(tunnel_id)
+            # 삭제하므로 예약 때 잡아 둔 설정을 쓰고, 없을 때만 엔진에서 조회한다.
+            if not config:
+                config = self.tunnel_engine.tunnel_configs.get(tunnel_id)
             if not config:
                 with self._lock:
                     status.state = TunnelState.ERROR
@@ -453,10 +758,9 @@ class TunnelMonitor:
 
                 self._notify_callbacks(tunnel_id, status)
 
-            # 재귀 호출(및 그에 이은 sleep)은 락을 놓은 뒤 수행하여
-            # 대기 중에도 다른 스레드가 상태를 조회/갱신할 수 있게 한다.
+            # 다음 시도는 다시 스케줄러에 예약한다 (워커 스레드를 붙잡고 기다리지 않음)
             if should_retry:
-                self._attempt_reconnect(tunnel_id)
+                self._attempt_reconnect(tunnel_id, config)
 
         except Exception as e:
             logger.error(f"재연결 오류 ({tunnel_id}): {e}")
@@ -472,11 +776,7 @@ class TunnelMonitor:
             event_type=event_type,
             message=message
         )
-        self._events.append(event)
-
-        # 최대 이벤트 수 유지
-        if len(self._events) > self._max_events:
-            self._events = self._events[-self._max_events:]
+        self.event_log.append(event)
 
         logger.debug(f"터널 이벤트: [{tunnel_id}] {event_type} - {message}")
 
@@ -489,6 +789,10 @@ class TunnelMonitor:
             status.reconnect_count = 0
             status.error_message = None
             self._add_event(tunnel_id, "connected", "터널 연결됨")
+            self._reconnects.cancel(tunnel_id)
+            # 새 연결은 일정과 무관하게 다음 루프에서 바로 측정한다
+            self._probe_schedules.pop(tunnel_id, None)
+            self._schedule_probe(tunnel_id, time.monotonic())
             self._notify_callbacks(tunnel_id, status)
 
     def on_tunnel_disconnected(self, tunnel_id: str, error: str = None):
@@ -503,6 +807,8 @@ class TunnelMonitor:
                 self._add_event(tunnel_id, "error", f"연결 오류: {error}")
             else:
                 self._add_event(tunnel_id, "disconnected", "터널 연결 종료")
+            self._probe_schedules.pop(tunnel_id, None)
+            self._reconnects.cancel(tunnel_id)
             # Health check 연결 정리
             self._cleanup_health_connection(tunnel_id)
             self._notify_callbacks(tunnel_id, status)
@@ -15,6 +15,7 @@ from datetime import datetime
 from src.core.db_connector import MySQLConnector
 from src.core.i18n import translate_text
 from src.exporters.rust_dump_exporter import ForeignKeyResolver, OrphanRecordInfo
+from src.ui.workers.cancellable_worker import cancel_running_query_async
 
 
 def _build_orphan_queries_sql(schema: str, orphan_results: List[OrphanRecordInfo]) -> str:
@@ -41,21 +42,34 @@ class OrphanAnalysisWorker(QThread):
     progress = pyqtSignal(str)
     analysis_finished = pyqtSignal(list)
     failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
 
     def __init__(self, connector, schema: str):
         super().__init__()
         self.connector = connector
         self.schema = schema
 
+    def cancel(self):
+        """분석 중지: 남은 FK 검사는 건너뛰고 실행 중인 COUNT 쿼리는 서버에서 중단한다."""
+        self.requestInterruption()
+        cancel_running_query_async(self.connector)
+
     def run(self):
         try:
             resolver = ForeignKeyResolver(self.connector)
             results = resolver.find_orphan_records(
                 self.schema,
                 progress_callback=lambda msg: self.progress.emit(msg),
+                is_cancelled=self.isInterruptionRequested,
             )
+            if self.isInterruptionRequested():
+                self.cancelled.emit()
+                return
             self.analysis_finished.emit(results)
         except Exception as exc:
+            if self.isInterruptionRequested():
+                self.cancelled.emit()
+                return
             self.failed.emit(str(exc))
 
 
@@ -133,6 +147,12 @@ class OrphanRecordDialog(QDialog):
         self.analyze_btn.clicked.connect(self.start_analysis)
         schema_layout.addWidget(self.analyze_btn)
 
+        self.stop_btn = QPushButton("⏹ 중지")
+        self.stop_btn.setToolTip("실행 중인 고아 레코드 검사 쿼리를 서버에서 중단합니다.")
+        self.stop_btn.setEnabled(False)
+        self.stop_btn.clicked.connect(self.stop_analysis)
+        schema_layout.addWidget(self.stop_btn)
+
         schema_layout.addStretch()
         layout.addWidget(schema_group)
 
@@ -251,21 +271,39 @@ class OrphanRecordDialog(QDialog):
         self.worker.progress.connect(self.progress_label.setText)
         self.worker.analysis_finished.connect(self._on_orphan_analysis_finished)
         self.worker.failed.connect(self._on_orphan_worker_failed)
+        self.worker.cancelled.connect(self._on_orphan_analysis_cancelled)
         self.worker.finished.connect(self._clear_orphan_worker)
+        self.stop_btn.setEnabled(True)
         self.worker.start()
 
+    def stop_analysis(self):
+        """분석 중지 (실행 중인 검사 쿼리는 KILL QUERY로 중단)"""
+        if isinstance(self.worker, OrphanAnalysisWorker) and self.worker.isRunning():
+            self.stop_btn.setEnabled(False)
+            self.progress_label.setText("중지 중...")
+            self.worker.cancel()
+
     def _on_orphan_analysis_finished(self, results: list):
         """분석 워커 완료 처리"""
         self.orphan_results = results
         self.display_results()
         self.analyze_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
         self.progress_bar.setVisible(False)
         self.progress_label.setText("")
 
+    def _on_orphan_analysis_cancelled(self):
+        """분석 워커 중지 처리"""
+        self.analyze_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+        self.progress_bar.setVisible(False)
+        self.progress_label.setText("분석이 중지되었습니다.")
+
     def _on_orphan_worker_failed(self, message: str):
         """분석 워커 실패 처리"""
         QMessageBox.critical(self, "오류", f"분석 중 오류 발생:\n{message}")
         self.analyze_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
         self.progress_bar.setVisible(False)
         self.progress_label.setText("")
 
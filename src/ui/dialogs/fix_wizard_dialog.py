@@ -42,12 +42,15 @@ class FixWizardDialog(QWizard):
         parent=None,
         connector: MySQLConnector = None,
         issues: List[CompatibilityIssue] = None,
-        schema: str = ""
+        schema: str = "",
+        catalog=None
     ):
         super().__init__(parent)
         self.connector = connector
         self.issues = issues or []
         self.schema = schema
+        # 분석 때 읽은 SchemaCatalogSnapshot (있으면 수정 옵션 생성 시 재조회 생략)
+        self.catalog = catalog
 
         # 위저드 단계 생성
         self.wizard_steps: List[FixWizardStep] = []
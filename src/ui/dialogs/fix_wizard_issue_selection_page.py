@@ -246,7 +246,8 @@ class IssueSelectionPage(QWizardPage):
         self.wizard_dialog.wizard_steps = create_wizard_steps(
             other_issues,
             self.wizard_dialog.connector,
-            self.wizard_dialog.schema
+            self.wizard_dialog.schema,
+            self.wizard_dialog.catalog
         )
 
         return True
@@ -22,6 +22,7 @@ from typing import Iterator, List, Optional, Dict
 from datetime import datetime
 
 from src.core.db_connector import MySQLConnector
+from src.core.migration_analysis_cache import AnalysisCache
 from src.core.migration_analyzer import (
     MigrationAnalyzer, AnalysisResult, OrphanRecord,
     CompatibilityIssue, ActionType
@@ -211,8 +212,9 @@ def iter_fk_tree(fk_tree: Dict[str, List[str]]) -> Iterator[tuple[str, int, bool
 
 def build_orphan_select_sql(orphan: OrphanRecord, schema: str) -> str:
     """고아 레코드 조회 쿼리 생성"""
+    count_label = f"최소 {orphan.orphan_count:,}개 (일부 구간만 검사)" if orphan.is_partial else f"{orphan.orphan_count:,}개"
     return f"""-- {orphan.child_table}.{orphan.child_column} → {orphan.parent_table}.{orphan.parent_column}
--- 고아 레코드 수: {orphan.orphan_count:,}개
+-- 고아 레코드 수: {count_label}
 SELECT c.*
 FROM `{schema}`.`{orphan.child_table}` c
 LEFT JOIN `{schema}`.`{orphan.parent_table}` p
@@ -262,6 +264,7 @@ class MigrationAnalyzerDialog(QDialog):
         self.result_store = MigrationResultStore()
         self._is_closing = False  # 닫기 진행 중 플래그
         self._auto_saved_path: Optional[str] = None  # 자동 저장 경로
+        self._analysis_cache: Optional[AnalysisCache] = None  # 증분 분석 캐시 (분석 중인 스키마)
         self._disconnect_deferred_to_worker_completion = False  # 커넥터 해제를 Worker 완료로 위임했는지 여부
 
         self.init_ui()
@@ -313,9 +316,12 @@ class MigrationAnalyzerDialog(QDialog):
 
             for name, worker in workers_running:
                 logger.info(f"🔀 {name} Worker를 백그라운드로 분리하여 계속 실행합니다 (강제 종료하지 않음)")
-                request_interruption = getattr(worker, "requestInterruption", None)
-                if callable(request_interruption):
-                    request_interruption()
+                # 분석 워커는 cancel()로 실행 중인 검사 쿼리까지 서버에서 중단한다.
+                stop = getattr(worker, "cancel", None)
+                if not callable(stop):
+                    stop = getattr(worker, "requestInterruption", None)
+                if callable(stop):
+                    stop()
 
             # quit()/wait()/terminate()로 블로킹하거나 강제 종료하지 않고,
             # Worker가 스스로 끝날 때까지 백그라운드에서 추적한 뒤 커넥터를 정리한다.
@@ -458,6 +464,12 @@ class MigrationAnalyzerDialog(QDialog):
         self.btn_analyze.clicked.connect(self.start_analysis)
         btn_layout.addWidget(self.btn_analyze)
 
+        self.btn_stop_analysis = QPushButton("⏹ 분석 중지")
+        self.btn_stop_analysis.setToolTip("남은 검사를 건너뛰고 실행 중인 검사 쿼리를 서버에서 중단합니다.")
+        self.btn_stop_analysis.setEnabled(False)
+        self.btn_stop_analysis.clicked.connect(self.stop_analysis)
+        btn_layout.addWidget(self.btn_stop_analysis)
+
         self.btn_oneclick = _make_action_button("🚀 One-Click Migration", "#27ae60", "#219a52")
         self.btn_oneclick.setToolTip(
             "Rust Core 기반 One-Click 사전 검사/분석/권장/검증을 기본 dry-run으로 실행합니다.\n"
@@ -715,6 +727,7 @@ class MigrationAnalyzerDialog(QDialog):
     def set_ui_enabled(self, enabled: bool):
         """UI 활성화/비활성화"""
         self.btn_analyze.setEnabled(enabled)
+        self.btn_stop_analysis.setEnabled(not enabled)
         self.combo_schema.setEnabled(enabled)
         self.chk_orphans.setEnabled(enabled)
         self.chk_charset.setEnabled(enabled)
@@ -755,11 +768,13 @@ class MigrationAnalyzerDialog(QDialog):
         self.progress_bar.setRange(0, 0)  # 무한 프로그레스
 
         self.add_log(f"📊 스키마 '{schema}' 분석 시작...")
+        self._analysis_cache = self._load_analysis_cache(schema)
 
         # 워커 생성 및 시작
         self.worker = MigrationAnalyzerWorker(
             connector=self.connector,
             schema=schema,
+            analysis_cache=self._analysis_cache,
             options=MigrationCheckOptions(
                 check_orphans=self.chk_orphans.isChecked(),
                 check_charset=self.chk_charset.isChecked(),
@@ -778,6 +793,14 @@ class MigrationAnalyzerDialog(QDialog):
         self.worker.finished.connect(self.on_analysis_finished)
         self.worker.start()
 
+    def stop_analysis(self):
+        """분석 중지 (실행 중인 검사 쿼리는 KILL QUERY로 중단)"""
+        if self.worker is None or not self.worker.isRunning():
+            return
+        self.btn_stop_analysis.setEnabled(False)
+        self.add_log("⏹ 분석 중지 요청...")
+        self.worker.cancel()
+
     def on_analysis_complete(self, result: AnalysisResult):
         """분석 완료 시"""
         if self._is_closing:
@@ -791,6 +814,7 @@ class MigrationAnalyzerDialog(QDialog):
 
             # 백그라운드 자동 저장 (기록 보관용)
             self._auto_save_result(result)
+            self._save_analysis_cache()
 
             # 저장 버튼 활성화
             self.btn_save.setEnabled(True)
@@ -830,6 +854,11 @@ class MigrationAnalyzerDialog(QDialog):
 <p><b>❌ 오류:</b> {error_count}개</p>
 <p><b>⚠️ 경고:</b> {warning_count}개</p>
 """
+        if result.reused_results:
+            reused = ", ".join(
+                f"{label.rstrip('.')} {len(units)}개" for label, units in result.reused_results.items()
+            )
+            summary += f"<p><b>♻️ 캐시 재사용:</b> {reused} (변경 없는 테이블/FK)</p>\n"
         self.lbl_summary.setText(summary)
 
         # 통계 테이블
@@ -859,7 +888,9 @@ class MigrationAnalyzerDialog(QDialog):
             self.table_orphans.setItem(i, 2, QTableWidgetItem(orphan.parent_table))
             self.table_orphans.setItem(i, 3, QTableWidgetItem(orphan.parent_column))
 
-            count_item = QTableWidgetItem(f"{orphan.orphan_count:,}")
+            # 시간 예산 안에 일부 구간만 센 결과는 하한값으로 표시
+            count_text = f"≥ {orphan.orphan_count:,}" if orphan.is_partial else f"{orphan.orphan_count:,}"
+            count_item = QTableWidgetItem(count_text)
             count_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
             if orphan.orphan_count > ORPHAN_COUNT_CRITICAL_THRESHOLD:
                 count_item.setForeground(QColor("#e74c3c"))
@@ -1193,7 +1224,8 @@ class MigrationAnalyzerDialog(QDialog):
                 parent=self,
                 connector=self.connector,
                 issues=auto_fixable_issues,  # 자동 수정 가능 이슈만 전달
-                schema=self.analysis_result.schema
+                schema=self.analysis_result.schema,
+                catalog=self.analysis_result.catalog
             )
             result = wizard.exec()
 
@@ -1247,6 +1279,24 @@ class MigrationAnalyzerDialog(QDialog):
         """분석 결과 저장 디렉토리"""
         return str(self.result_store.analysis_dir())
 
+    def _load_analysis_cache(self, schema: str) -> Optional[AnalysisCache]:
+        """증분 분석 캐시 로드 (실패하면 캐시 없이 전체 분석)"""
+        server = f"{getattr(self.connector, 'host', '')}:{getattr(self.connector, 'port', '')}"
+        try:
+            return self.result_store.read_cache(schema, server)
+        except Exception as e:
+            logger.warning(f"분석 캐시 로드 실패: {e}")
+            return None
+
+    def _save_analysis_cache(self):
+        """분석이 갱신한 증분 캐시 저장"""
+        if self._analysis_cache is None:
+            return
+        try:
+            self.result_store.write_cache(self._analysis_cache)
+        except Exception as e:
+            logger.warning(f"분석 캐시 저장 실패: {e}")
+
     def _auto_save_result(self, result: AnalysisResult):
         """분석 결과 자동 저장 (백그라운드, 기록 보관용)"""
         try:
@@ -4,12 +4,18 @@ from datetime import datetime
 from pathlib import Path
 from typing import Callable, Iterable, Optional, Union
 
+from src.core.logger import get_logger
+from src.core.migration_analysis_cache import AnalysisCache
 from src.core.migration_analyzer import AnalysisResult, OrphanRecord
 from src.core.path_safety import safe_child_file, safe_filename_component
 from src.core.platform_paths import analysis_dir
 
 PathLike = Union[str, Path]
 
+logger = get_logger(__name__)
+
+CACHE_DIR_NAME = "cache"
+
 
 class MigrationResultStore:
     """Pure file I/O for migration analysis result persistence."""
@@ -48,6 +54,34 @@ class MigrationResultStore:
             data = json.load(file)
         return AnalysisResult.from_dict(data)
 
+    def cache_path(self, schema: str, server: str) -> Path:
+        """Incremental analysis cache file: analysis_dir/cache/<server>_<schema>.json."""
+        cache_dir = self.analysis_dir() / CACHE_DIR_NAME
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        name = f"{safe_filename_component(server, 'server')}_{safe_filename_component(schema, 'schema')}.json"
+        return safe_child_file(cache_dir, name, "schema_cache.json")
+
+    def read_cache(self, schema: str, server: str) -> AnalysisCache:
+        """Load the incremental analysis cache; an empty cache if missing or unreadable."""
+        path = self.cache_path(schema, server)
+        try:
+            with path.open("r", encoding="utf-8") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return AnalysisCache(schema, server)
+        except (OSError, ValueError) as e:
+            logger.warning(f"분석 캐시 읽기 실패, 전체 분석으로 진행: {e}")
+            return AnalysisCache(schema, server)
+        return AnalysisCache.from_dict(data, schema, server)
+
+    def write_cache(self, cache: AnalysisCache) -> Path:
+        target = self.cache_path(cache.schema, cache.server)
+        temp = target.with_suffix(".tmp")
+        with temp.open("w", encoding="utf-8") as file:
+            json.dump(cache.to_dict(), file, ensure_ascii=False, default=str)
+        temp.replace(target)
+        return target
+
     @staticmethod
     def export_orphan_queries(
         schema: str,
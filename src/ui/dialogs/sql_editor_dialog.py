@@ -51,6 +51,7 @@ from src.ui.dialogs.sql_editor_editability import (
     quote_editor_identifier,
 )
 from src.ui.dialogs.sql_editor_workers import (
+    MAX_RESULT_GRID_ROWS,
     SQLQueryWorker,
     SQLTransactionExecutionWorker,
     create_sql_editor_connector,
@@ -371,6 +372,13 @@ class SQLEditorDialog(QDialog):
         self.btn_execute_all.setToolTip("전체 쿼리 실행 (F5)\n에디터의 모든 쿼리 실행")
         self.btn_execute_all.clicked.connect(self.execute_all_queries)
         toolbar.addWidget(self.btn_execute_all)
+
+        self.btn_stop_query = QPushButton("■ 중지")
+        self.btn_stop_query.setStyleSheet(SECONDARY_BUTTON_QSS)
+        self.btn_stop_query.setToolTip("실행 중인 쿼리 중지\n서버에서 실행 중인 statement를 중단하고 남은 쿼리는 건너뜀")
+        self.btn_stop_query.setEnabled(False)
+        self.btn_stop_query.clicked.connect(self.stop_query)
+        toolbar.addWidget(self.btn_stop_query)
 
         btn_open = QPushButton("📂 열기")
         btn_open.setToolTip("SQL 파일 열기 (Ctrl+O)")
@@ -1059,6 +1067,7 @@ class SQLEditorDialog(QDialog):
             # columns == [] 인 0행 결과도 결과 탭으로 표시 (SELECT 실행 자체는 성공)
             self._add_result_table(columns, rows, exec_time, query)
             self.message_text.append(f"✅ {len(rows)}행 반환 ({exec_time:.3f}초)")
+            self._append_row_cap_notice(rows)
             self.message_text.append(f"   └ {preview}")
             self.history_manager.add_query(query, True, len(rows), exec_time)
         else:
@@ -1308,6 +1317,13 @@ class SQLEditorDialog(QDialog):
         """접힌 실행 로그에 표시할 한 줄 상태 요약."""
         self.message_summary.setText(text or "실행 대기 중")
 
+    def _append_row_cap_notice(self, rows):
+        """워커가 결과 그리드 상한에서 읽기를 멈췄으면 나머지 행이 생략됐음을 알린다."""
+        if len(rows) >= MAX_RESULT_GRID_ROWS:
+            self.message_text.append(
+                f"⚠️ 결과가 {MAX_RESULT_GRID_ROWS:,}행 상한에 도달해 이후 행은 가져오지 않았습니다 (LIMIT으로 범위를 좁히세요)"
+            )
+
     def _show_result_tab_context_menu(self, position):
         """결과 탭 컨텍스트 메뉴"""
         tab_bar = self.result_tabs.tabBar()
@@ -1471,6 +1487,7 @@ class SQLEditorDialog(QDialog):
             self._add_result_table(columns, rows, exec_time, worker_query)
 
             self.message_text.append(f"✅ 쿼리 {idx + 1}: {len(rows)}행 반환 ({exec_time:.3f}초)")
+            self._append_row_cap_notice(rows)
             self._set_message_summary(f"쿼리 {idx + 1} 완료 · {len(rows)}행 반환 · {exec_time:.3f}초")
             self._set_message_panel_collapsed(True)
             self.history_manager.add_query(worker_query, True, len(rows), exec_time)
@@ -1680,6 +1697,19 @@ class SQLEditorDialog(QDialog):
         self._connected_target = None
         self._pg_rolled_back_due_to_error = False
 
+    def stop_query(self):
+        """실행 중인 쿼리 중지 (서버 측 KILL QUERY / pg_cancel_backend)"""
+        worker = self.worker
+        if worker is None or not worker.isRunning():
+            return
+        cancel = getattr(worker, "cancel", None)
+        if callable(cancel):
+            cancel()
+        else:
+            worker.requestInterruption()
+        self.btn_stop_query.setEnabled(False)
+        self.message_text.append("⏹ 쿼리 중지 요청 — 실행 중인 statement를 서버에서 중단합니다")
+
     def _set_executing_state(self, is_executing: bool):
         """쿼리 실행 상태 UI 전환.
 
@@ -1687,6 +1717,7 @@ class SQLEditorDialog(QDialog):
         """
         self.btn_execute_current.setEnabled(not is_executing)
         self.btn_execute_all.setEnabled(not is_executing)
+        self.btn_stop_query.setEnabled(is_executing)
         self.db_combo.setEnabled(not is_executing)
         self.auto_commit_check.setEnabled(not is_executing)
         self.progress_bar.setVisible(is_executing)
@@ -2002,8 +2033,9 @@ class SQLEditorDialog(QDialog):
 
         동일 트랜잭션 내에서 실행되므로 autocommit/commit 관리는 호출자 책임.
         반환: failed 리스트 [(table, row_idx, error_msg), ...]. 비어있으면 전체 성공.
+        Rust Core가 query.execute_batch를 지원하면 모든 UPDATE를 한 번의 왕복으로 보낸다.
         """
-        failed = []
+        updates = []
         for table, ctx in table_edits:
             schema, tbl = ctx['schema'], ctx['table']
             qualified = (
@@ -2040,12 +2072,38 @@ class SQLEditorDialog(QDialog):
                     f"UPDATE {qualified} SET {', '.join(set_parts)} "
                     f"WHERE {' AND '.join(where_parts)}"
                 )
-                try:
-                    affected = cursor.execute(sql, params)
-                    if affected != 1:
-                        failed.append((table, row_idx, f'영향받은 행 수: {affected}'))
-                except Exception as e:
-                    failed.append((table, row_idx, str(e)))
+                updates.append((table, row_idx, sql, params))
+
+        supports_batch = getattr(cursor, "supports_batch", None)
+        if updates and callable(supports_batch) and supports_batch() is True:
+            return self._execute_cell_edit_batch(cursor, updates)
+
+        failed = []
+        for table, row_idx, sql, params in updates:
+            try:
+                affected = cursor.execute(sql, params)
+                if affected != 1:
+                    failed.append((table, row_idx, f'영향받은 행 수: {affected}'))
+            except Exception as e:
+                failed.append((table, row_idx, str(e)))
+        return failed
+
+    def _execute_cell_edit_batch(self, cursor, updates):
+        """셀 편집 UPDATE 목록을 query.execute_batch 한 번으로 실행하고 실패 목록을 반환."""
+        result = cursor.execute_batch(
+            [(sql, params) for _, _, sql, params in updates],
+            stop_on_error=False,
+        )
+        errors = {item.get('index'): item.get('message', '') for item in result['errors']}
+        affected_counts = result['rows_affected']
+        failed = []
+        for index, (table, row_idx, _sql, _params) in enumerate(updates):
+            if index in errors:
+                failed.append((table, row_idx, str(errors[index])))
+                continue
+            affected = affected_counts[index] if index < len(affected_counts) else None
+            if affected != 1:
+                failed.append((table, row_idx, f'영향받은 행 수: {affected}'))
         return failed
 
     def _finalize_cell_edits(self, table_edits):
@@ -6,12 +6,19 @@ import logging
 import time
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from src.core.db_core_service import create_rust_db_connector, normalize_db_engine
+from src.core.db_core_service import (
+    RustDbCursor,
+    create_rust_db_connector,
+    normalize_db_engine,
+)
 from src.core.sql_query_classifier import classify_sql_statement, statement_returns_rows
+from src.ui.workers.cancellable_worker import cancel_running_query_async
 
 logger = logging.getLogger(__name__)
 
 WORKER_PROGRESS_PREVIEW_LEN = 100
+# 결과 그리드에 올리는 최대 행 수 — 초과분은 읽지 않고 서버 측 커서를 닫는다
+MAX_RESULT_GRID_ROWS = 100_000
 
 
 @dataclass
@@ -56,8 +63,11 @@ def connector_from_params(params: ConnectionParams):
 
 
 def _rows_from_cursor(cursor) -> tuple[list, list]:
+    """결과를 값 리스트로 MAX_RESULT_GRID_ROWS행까지만 읽는다 (스트리밍 커서는 필요한 배치만 가져온다)."""
     columns = [desc[0] for desc in cursor.description]
-    rows = cursor.fetchall()
+    if isinstance(cursor, RustDbCursor):
+        return columns, cursor.fetchmany_values(MAX_RESULT_GRID_ROWS)
+    rows = cursor.fetchmany(MAX_RESULT_GRID_ROWS)
     row_list = []
     for row in rows:
         if isinstance(row, dict):
@@ -92,11 +102,19 @@ class SQLQueryWorker(QThread):
             self.schema,
         )
         self.queries = queries  # List of query strings
+        self._connector = None
+
+    def cancel(self):
+        """중지: 다음 statement 진행을 막고, 실행 중인 statement는 서버에서 중단한다."""
+        self.requestInterruption()
+        if self._connector is not None:
+            cancel_running_query_async(self._connector)
 
     def run(self):
         connector = None
         try:
             connector = connector_from_params(self.params)
+            self._connector = connector
             success, msg = connector.connect()
 
             if not success:
@@ -123,27 +141,8 @@ class SQLQueryWorker(QThread):
 
                 start_time = time.time()
                 try:
-                    if statement_returns_rows(query):
-                        rows = []
-
-                        def collect_batch(batch):
-                            rows.extend(batch)
-
-                        result = connector.connection.facade.execute_on_connection_streaming(
-                            connector.connection.connection_id,
-                            query,
-                            row_batch_size=500,
-                            on_batch=collect_batch,
-                        )
-                        columns = result.get("columns") or []
-                        row_list = [[row.get(col) for col in columns] for row in rows]
-                        execution_time = time.time() - start_time
-                        self.query_result.emit(idx, True, columns, row_list, "", len(row_list), execution_time)
-                        success_count += 1
-                        continue
-
-                    # 직접 커서 사용하여 실행
-                    with connector.connection.cursor() as cursor:
+                    # 행 반환 쿼리는 서버 측 커서로 배치 단위로 읽고, 그리드 상한을 넘는 행은 가져오지 않는다
+                    with connector.connection.cursor(streaming=True) as cursor:
                         cursor.execute(query)
 
                         # 행을 반환하는 statement인지 확인 (None만 비행-statement)
@@ -179,6 +178,7 @@ class SQLQueryWorker(QThread):
 
         finally:
             # 연결 정리
+            self._connector = None
             if connector:
                 try:
                     connector.disconnect()
@@ -203,6 +203,14 @@ class SQLTransactionExecutionWorker(QThread):
         self.queries = queries
         self.engine = engine
 
+    def cancel(self):
+        """중지: 남은 statement는 건너뛰고 실행 중인 statement는 서버에서 중단한다.
+
+        PostgreSQL은 중단된 statement 때문에 트랜잭션이 aborted 상태가 되어 롤백된다.
+        """
+        self.requestInterruption()
+        cancel_running_query_async(self.connection)
+
     def run(self):
         total = len(self.queries)
         for idx, raw_query in enumerate(self.queries):
@@ -221,7 +229,7 @@ class SQLTransactionExecutionWorker(QThread):
 
             start_time = time.time()
             try:
-                with self.connection.cursor() as cursor:
+                with self.connection.cursor(streaming=True) as cursor:
                     cursor.execute(query)
 
                     if cursor.description is not None:
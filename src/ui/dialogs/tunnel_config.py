@@ -241,8 +241,17 @@ class TunnelConfigDialog(QDialog):
         self.input_local_port = QSpinBox()
         self.input_local_port.setRange(1, 65535)
         self.input_local_port.setValue(int(self.tunnel_data.get('local_port', 3308)))
+        self.btn_find_port = QPushButton("빈 포트 찾기")
+        self.btn_find_port.clicked.connect(self._find_free_local_port)
+
+        self.local_port_widget = QWidget()
+        local_port_layout = QHBoxLayout(self.local_port_widget)
+        local_port_layout.setContentsMargins(0, 0, 0, 0)
+        local_port_layout.addWidget(self.input_local_port)
+        local_port_layout.addWidget(self.btn_find_port)
+
         self.lbl_local_port = QLabel("Local Bind Port:")
-        form_layout.addRow(self.lbl_local_port, self.input_local_port)
+        form_layout.addRow(self.lbl_local_port, self.local_port_widget)
 
         # 터널 테스트 버튼 - 중앙화된 스타일 사용
         self.btn_tunnel_test = QPushButton("🔌 터널 테스트")
@@ -319,7 +328,7 @@ class TunnelConfigDialog(QDialog):
         self.btn_copy_bastion.setEnabled(is_ssh_mode and bool(self.bastion_templates))
 
         # Local Port 토글
-        local_widgets = [self.lbl_local, self.lbl_local_port, self.input_local_port]
+        local_widgets = [self.lbl_local, self.lbl_local_port, self.local_port_widget]
         for widget in local_widgets:
             widget.setEnabled(is_ssh_mode)
 
@@ -357,6 +366,21 @@ class TunnelConfigDialog(QDialog):
                 return []
         return []
 
+    def _find_free_local_port(self):
+        """저장된 다른 터널, 실행 중 터널, 다른 프로그램과 겹치지 않는 로컬 포트로 바꾼다"""
+        if not self.engine:
+            QMessageBox.critical(self, "오류", "터널 엔진이 초기화되지 않았습니다.")
+            return
+        port = self.engine.suggest_local_port(
+            self._available_tunnels(),
+            tunnel_id=self.tunnel_data.get('id'),
+            preferred=self.input_local_port.value(),
+        )
+        if port is None:
+            QMessageBox.warning(self, "경고", "설정 범위에 빈 포트가 없습니다.")
+            return
+        self.input_local_port.setValue(port)
+
     def _show_bastion_copy_menu(self):
         if not self.bastion_templates:
             QMessageBox.information(self, "다른 연결 복사", "복사할 수 있는 SSH 터널 연결이 없습니다.")
@@ -2,6 +2,8 @@
 터널 상태 상세 다이얼로그
 - 현재 상태 정보
 - 연결 지속 시간
+- Latency 분포 (백분위, jitter, 실패율)
+- 트래픽 (처리량, 전송량, 활성 채널, 연결 설정 시간)
 - 최근 이벤트 히스토리
 - 자동 재연결 설정
 """
@@ -17,6 +19,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont
 
+from src.core.latency_stats import LATENCY_SUMMARY_WINDOW_SECONDS
 from src.core.tunnel_monitor import TunnelMonitor, TunnelState, TunnelStatus
 from src.core.logger import get_logger
 
@@ -68,6 +71,15 @@ class TunnelStatusDialog(QDialog):
         self.avg_latency_label = QLabel("-")
         status_layout.addRow("평균 Latency:", self.avg_latency_label)
 
+        self.percentile_label = QLabel("-")
+        status_layout.addRow("Latency p50/p95/p99:", self.percentile_label)
+
+        self.jitter_label = QLabel("-")
+        status_layout.addRow("Jitter:", self.jitter_label)
+
+        self.failure_rate_label = QLabel("-")
+        status_layout.addRow("측정 실패율:", self.failure_rate_label)
+
         self.reconnect_label = QLabel("0")
         status_layout.addRow("재연결 횟수:", self.reconnect_label)
 
@@ -76,6 +88,24 @@ class TunnelStatusDialog(QDialog):
 
         layout.addWidget(status_group)
 
+        # 트래픽 (SSH 터널만)
+        traffic_group = QGroupBox("트래픽")
+        traffic_layout = QFormLayout(traffic_group)
+
+        self.throughput_label = QLabel("-")
+        traffic_layout.addRow("처리량:", self.throughput_label)
+
+        self.transferred_label = QLabel("-")
+        traffic_layout.addRow("전송량:", self.transferred_label)
+
+        self.channels_label = QLabel("-")
+        traffic_layout.addRow("활성 채널:", self.channels_label)
+
+        self.setup_time_label = QLabel("-")
+        traffic_layout.addRow("연결 설정 시간:", self.setup_time_label)
+
+        layout.addWidget(traffic_group)
+
         # 최근 이벤트
         event_group = QGroupBox("최근 이벤트")
         event_layout = QVBoxLayout(event_group)
@@ -169,6 +199,28 @@ class TunnelStatusDialog(QDialog):
         else:
             self.avg_latency_label.setText("-")
 
+        # Latency 분포 (최근 5분)
+        summary = status.get_latency_summary(LATENCY_SUMMARY_WINDOW_SECONDS)
+        if summary.p50_ms is not None:
+            self.percentile_label.setText(
+                f"{summary.p50_ms:.1f} / {summary.p95_ms:.1f} / {summary.p99_ms:.1f} ms (최근 5분)"
+            )
+        else:
+            self.percentile_label.setText("-")
+        if summary.jitter_ms is not None:
+            self.jitter_label.setText(f"{summary.jitter_ms:.1f} ms")
+        else:
+            self.jitter_label.setText("-")
+        if summary.samples:
+            self.failure_rate_label.setText(
+                f"{summary.failure_rate:.1%} ({summary.failures}/{summary.samples}회)"
+            )
+        else:
+            self.failure_rate_label.setText("-")
+
+        # 트래픽
+        self._refresh_traffic()
+
         # 재연결 횟수
         self.reconnect_label.setText(str(status.reconnect_count))
 
@@ -183,6 +235,42 @@ class TunnelStatusDialog(QDialog):
         # 이벤트 갱신
         self._refresh_events()
 
+    def _refresh_traffic(self):
+        """트래픽 카운터 갱신 (직접 연결/미실행이면 '-')"""
+        traffic = self.monitor.get_traffic_stats(self.tunnel_id)
+        if not traffic:
+            for label in (self.throughput_label, self.transferred_label,
+                          self.channels_label, self.setup_time_label):
+                label.setText("-")
+            return
+
+        self.throughput_label.setText(
+            f"↑ {self._format_bytes(traffic['sent_bytes_per_sec'])}/s"
+            f"  ↓ {self._format_bytes(traffic['received_bytes_per_sec'])}/s"
+        )
+        self.transferred_label.setText(
+            f"↑ {self._format_bytes(traffic['bytes_sent'])}"
+            f"  ↓ {self._format_bytes(traffic['bytes_received'])}"
+        )
+        self.channels_label.setText(
+            f"{traffic['active_channels']} (누적 {traffic['channels_opened']}, "
+            f"실패 {traffic['channels_failed']})"
+        )
+        setup_parts = []
+        if traffic['setup_seconds'] is not None:
+            setup_parts.append(f"터널 {traffic['setup_seconds'] * 1000:.0f} ms")
+        if traffic['avg_channel_setup_seconds'] is not None:
+            setup_parts.append(f"채널 평균 {traffic['avg_channel_setup_seconds'] * 1000:.0f} ms")
+        self.setup_time_label.setText(" / ".join(setup_parts) or "-")
+
+    @staticmethod
+    def _format_bytes(size: float) -> str:
+        for unit in ('B', 'KB', 'MB', 'GB'):
+            if size < 1024:
+                return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+            size /= 1024
+        return f"{size:.1f} TB"
+
     def _get_state_display(self, state: TunnelState) -> tuple:
         """상태 표시 텍스트와 색상"""
         displays = {
@@ -15,6 +15,7 @@ from src.ui.themes import ThemeColors
 from src.ui.widgets.tunnel_tree import TunnelTreeWidget
 from src.ui.dialogs.group_dialog import create_group_dialog, edit_group_dialog
 from src.ui.workers.test_worker import ConnectionTestWorker, TestType
+from src.ui.workers.tunnel_start_worker import TunnelStartWorker
 from src.ui.dialogs.test_dialogs import TestProgressDialog
 from src.ui.controllers import TrayController, TunnelActionsController, WizardLauncher
 from src.ui.dialogs.migration_dialogs import has_active_detached_migration_workers
@@ -48,6 +49,7 @@ from src.ui.dialogs.sql_editor_dialog import SQLEditorDialog
 from src.ui.dialogs.tunnel_status_dialog import TunnelStatusDialog
 from src.ui.dialogs.diff_dialog import SchemaDiffDialog
 from src.core.tunnel_monitor import TunnelMonitor
+from src.core.platform_paths import tunnel_events_dir
 from src.core.mysql_login_path import MysqlLoginPathManager
 
 
@@ -85,6 +87,9 @@ class TunnelManagerUI(QMainWindow):
         self.tunnels = self.config_data.get('tunnels', [])
 
         self._update_checker_thread = None
+        # 일괄 시작 Worker와 시작 중인 터널 (중복 시작 방지)
+        self._tunnel_start_workers = []
+        self._starting_tunnel_ids = set()
         self._error_reporting_consent_policy = ConsentPolicy(self.config_mgr)
         self._init_error_reporting_prompt_lifecycle()
 
@@ -109,7 +114,10 @@ class TunnelManagerUI(QMainWindow):
                 self.scheduler.start()
 
         # TunnelMonitor 초기화
-        self.tunnel_monitor = TunnelMonitor(tunnel_engine, config_manager)
+        # 이벤트는 재시작 후 사후 분석을 위해 로그 디렉토리에도 남긴다
+        self.tunnel_monitor = TunnelMonitor(
+            tunnel_engine, config_manager, event_log_dir=str(tunnel_events_dir())
+        )
         self.tunnel_monitor.add_callback(self._on_tunnel_status_changed)
         if self._start_background:
             self.tunnel_monitor.start_monitoring()
@@ -467,16 +475,67 @@ class TunnelManagerUI(QMainWindow):
         )
 
     def _connect_all_in_group(self, group_id: str):
-        """그룹 내 모든 터널 연결"""
+        """그룹 내 모든 터널 연결 (백그라운드에서 병렬 시작)"""
         groups = self.config_mgr.get_groups()
         for group in groups:
             if group['id'] == group_id:
+                tunnels = []
                 for tunnel_id in group.get('tunnel_ids', []):
                     tunnel = next((t for t in self.tunnels if t['id'] == tunnel_id), None)
                     if tunnel and not self.engine.is_running(tunnel_id):
-                        self.start_tunnel(tunnel)
+                        tunnels.append(tunnel)
+                if tunnels:
+                    self.statusBar().showMessage(f"{len(tunnels)}개 터널 연결 시도 중...")
+                    self._start_tunnels_in_background(tunnels, self._on_group_connect_finished)
                 break
 
+    def _on_group_connect_finished(self, results):
+        """그룹 연결 완료 - 실패한 터널을 한 번에 알린다."""
+        connected = [config for config, success, _ in results if success]
+        failed = [(config, msg) for config, success, msg in results if not success]
+        if connected:
+            self.tray_icon.showMessage(
+                "TunnelForge", f"{len(connected)}개 터널 연결됨",
+                QSystemTrayIcon.MessageIcon.Information, 2000
+            )
+        if failed:
+            details = "\n\n".join(f"[{config['name']}]\n{msg}" for config, msg in failed)
+            self.statusBar().showMessage(f"연결 실패: {', '.join(config['name'] for config, _ in failed)}")
+            QMessageBox.critical(self, "연결 오류", f"터널 연결에 실패했습니다.\n\n원인: {details}")
+
+    def _start_tunnels_in_background(self, tunnels, on_finished, check_port=True):
+        """여러 터널을 TunnelStartWorker로 병렬 시작하고, 결과가 도착할 때마다 트리를 갱신한다."""
+        pending = [t for t in tunnels if t['id'] not in self._starting_tunnel_ids]
+        if not pending:
+            return None
+        self._starting_tunnel_ids.update(t['id'] for t in pending)
+
+        worker = TunnelStartWorker(self.engine, pending, check_port=check_port, parent=self)
+        worker.tunnel_result.connect(self._on_bulk_tunnel_result)
+        worker.batch_finished.connect(on_finished)
+        # 참조 해제는 스레드가 실제로 정지한 뒤(내장 finished)에만 한다.
+        worker.finished.connect(lambda: self._release_tunnel_start_worker(worker))
+        self._tunnel_start_workers.append(worker)
+        worker.start()
+        return worker
+
+    def _on_bulk_tunnel_result(self, tunnel, success, msg):
+        """일괄 시작 중 터널 하나의 결과 도착"""
+        self._starting_tunnel_ids.discard(tunnel['id'])
+        if success:
+            self.statusBar().showMessage(f"연결 성공: {tunnel['name']}")
+            self._register_login_path(tunnel)
+        else:
+            self.statusBar().showMessage(f"연결 실패: {tunnel['name']}")
+        self.refresh_table()
+
+    def _release_tunnel_start_worker(self, worker):
+        if worker in self._tunnel_start_workers:
+            self._tunnel_start_workers.remove(worker)
+        for tunnel in worker.tunnels:
+            self._starting_tunnel_ids.discard(tunnel['id'])
+        worker.deleteLater()
+
     def _disconnect_all_in_group(self, group_id: str):
         """그룹 내 모든 터널 해제"""
         groups = self.config_mgr.get_groups()
@@ -903,6 +962,10 @@ class TunnelManagerUI(QMainWindow):
 
         if self._start_background:
             self._login_path_mgr.cleanup_all_tf_paths()
+        # 진행 중인 일괄 시작을 기다려 stop_all 이후 터널이 새로 열리지 않도록 한다
+        for worker in list(getattr(self, '_tunnel_start_workers', [])):
+            if worker.isRunning():
+                worker.wait(15000)
         self.engine.stop_all()
         self.tray_icon.hide()
         # 모든 창 닫고 종료
@@ -1121,29 +1184,31 @@ class TunnelManagerUI(QMainWindow):
 
         logger.info(f"이전 세션 터널 자동 연결 시도: {len(last_active)}개")
 
-        connected = []
-        skipped = []
-
+        tunnels = []
         for tid in last_active:
             # 터널 설정 찾기
             tunnel = next((t for t in self.tunnels if t.get('id') == tid), None)
             if not tunnel:
                 logger.warning(f"터널 설정을 찾을 수 없음: {tid}")
                 continue
+            tunnels.append(tunnel)
+
+        # 연결 시도 (bastion별 핸드셰이크를 병렬로 진행해 UI 스레드를 막지 않는다)
+        if tunnels:
+            self._start_tunnels_in_background(tunnels, self._on_auto_connect_finished, check_port=True)
 
-            # 연결 시도
-            success, msg = self.engine.start_tunnel(tunnel, check_port=True)
+    def _on_auto_connect_finished(self, results):
+        """이전 세션 터널 자동 연결 완료 - 결과 알림"""
+        connected = []
+        skipped = []
+        for tunnel, success, msg in results:
             if success:
                 connected.append(tunnel['name'])
                 logger.info(f"자동 연결 성공: {tunnel['name']}")
-                self._register_login_path(tunnel)
             else:
                 skipped.append((tunnel['name'], msg))
                 logger.warning(f"자동 연결 스킵: {tunnel['name']} - {msg}")
 
-        # 테이블 갱신
-        self.refresh_table()
-
         # 결과 알림
         if connected or skipped:
             msg_parts = []
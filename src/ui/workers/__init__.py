@@ -3,11 +3,13 @@ from .migration_worker import MigrationAnalyzerWorker, CleanupWorker
 from .test_worker import ConnectionTestWorker, SQLExecutionWorker, TestType
 from .validation_worker import ValidationWorker, MetadataLoadWorker, AutoCompleteWorker
 from .update_worker import UpdateDownloadWorker
+from .tunnel_start_worker import TunnelStartWorker
 from .error_reporting_worker import ErrorReportingMixin, ErrorReportingWorker
 
 __all__ = [
     'RustDumpWorker', 'MigrationAnalyzerWorker', 'CleanupWorker',
     'ConnectionTestWorker', 'SQLExecutionWorker', 'TestType',
     'ValidationWorker', 'MetadataLoadWorker', 'AutoCompleteWorker',
-    'UpdateDownloadWorker', 'ErrorReportingMixin', 'ErrorReportingWorker'
+    'UpdateDownloadWorker', 'ErrorReportingMixin', 'ErrorReportingWorker',
+    'TunnelStartWorker'
 ]
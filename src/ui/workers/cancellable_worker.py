@@ -1,7 +1,13 @@
 """Shared cancellable QThread base class."""
 
+import threading
+
 from PyQt6.QtCore import QThread
 
+from src.core.logger import get_logger
+
+logger = get_logger('cancellable_worker')
+
 
 class CancellableWorker(QThread):
     """QThread with a simple cooperative cancellation flag."""
@@ -12,3 +18,22 @@ class CancellableWorker(QThread):
 
     def cancel(self):
         self._cancelled = True
+
+
+def cancel_running_query_async(target) -> None:
+    """target(connector/connection)에서 실행 중인 쿼리를 서버 측에서 중단 요청한다.
+
+    취소는 Rust Core가 side connection을 새로 열어 보내므로(KILL QUERY / pg_cancel_backend)
+    GUI 스레드가 핸드셰이크를 기다리지 않도록 데몬 스레드에서 실행한다.
+    """
+    cancel = getattr(target, "cancel_running_query", None)
+    if not callable(cancel):
+        return
+
+    def _run():
+        try:
+            cancel()
+        except Exception:
+            logger.debug("쿼리 취소 요청 실패", exc_info=True)
+
+    threading.Thread(target=_run, name="db-query-cancel", daemon=True).start()
@@ -4,7 +4,9 @@ from dataclasses import asdict, dataclass, fields
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from src.core.db_connector import MySQLConnector
-from src.core.migration_analyzer import MigrationAnalyzer
+from src.core.migration_analysis_cache import AnalysisCache
+from src.core.migration_analyzer import MigrationAnalysisCancelled, MigrationAnalyzer
+from src.ui.workers.cancellable_worker import cancel_running_query_async
 
 
 @dataclass(frozen=True)
@@ -37,6 +39,7 @@ class MigrationAnalyzerWorker(QThread):
         connector: MySQLConnector,
         schema: str,
         options: MigrationCheckOptions = None,
+        analysis_cache: AnalysisCache = None,
         **legacy_check_options
     ):
         super().__init__()
@@ -54,11 +57,20 @@ class MigrationAnalyzerWorker(QThread):
         self.connector = connector
         self.schema = schema
         self.options = options
+        self.analysis_cache = analysis_cache
+
+    def cancel(self):
+        """분석 중지: 남은 검사는 건너뛰고 실행 중인 검사 쿼리는 서버에서 중단한다."""
+        self.requestInterruption()
+        cancel_running_query_async(self.connector)
 
     def run(self):
         try:
             analyzer = MigrationAnalyzer(self.connector)
             analyzer.set_progress_callback(lambda msg: self.progress.emit(msg))
+            analyzer.set_cancel_check(self.isInterruptionRequested)
+            if self.analysis_cache is not None:
+                analyzer.set_analysis_cache(self.analysis_cache)
 
             result = analyzer.analyze_schema(
                 self.schema,
@@ -68,7 +80,12 @@ class MigrationAnalyzerWorker(QThread):
             self.analysis_complete.emit(result)
             self.finished.emit(True, "분석 완료")
 
+        except MigrationAnalysisCancelled as e:
+            self.finished.emit(False, str(e))
         except Exception as e:
+            if self.isInterruptionRequested():
+                self.finished.emit(False, "분석이 취소되었습니다")
+                return
             self.finished.emit(False, f"분석 오류: {str(e)}")
 
 
@@ -0,0 +1,38 @@
+"""
+여러 터널을 백그라운드에서 동시에 시작하는 Worker
+"""
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from src.core.tunnel_engine import TUNNEL_START_WORKERS
+
+
+class TunnelStartWorker(QThread):
+    """그룹 연결/세션 복원용 일괄 터널 시작 Worker
+
+    연결은 TunnelEngine.start_tunnels()의 워커 풀에서 병렬로 진행되고,
+    터널 하나가 끝날 때마다 tunnel_result를 발화해 UI가 즉시 갱신할 수 있게 한다.
+    """
+    tunnel_result = pyqtSignal(dict, bool, str)   # (터널 설정, 성공여부, 메시지)
+    # QThread 내장 finished()를 가리지 않도록 별도 이름을 쓴다.
+    batch_finished = pyqtSignal(list)             # [(터널 설정, 성공여부, 메시지), ...]
+
+    def __init__(self, tunnel_engine, tunnels, check_port: bool = True,
+                 max_parallel: int = TUNNEL_START_WORKERS, parent=None):
+        super().__init__(parent)
+        self.engine = tunnel_engine
+        self.tunnels = list(tunnels)
+        self.check_port = check_port
+        self.max_parallel = max_parallel
+
+    def run(self):
+        try:
+            results = self.engine.start_tunnels(
+                self.tunnels,
+                max_parallel=self.max_parallel,
+                check_port=self.check_port,
+                on_result=self.tunnel_result.emit,
+            )
+        except Exception as e:
+            # 개별 연결 오류는 start_tunnels가 결과로 돌려주므로 여기는 풀 자체의 실패다.
+            results = [(tunnel, False, str(e)) for tunnel in self.tunnels]
+        self.batch_finished.emit(results)
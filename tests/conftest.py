@@ -26,17 +26,6 @@ def canonical_constants():
         return json.load(f)
 
 
-@pytest.fixture
-def mock_ssh_tunnel():
-    """SSHTunnelForwarder Mock"""
-    with patch('sshtunnel.SSHTunnelForwarder') as mock:
-        mock_instance = MagicMock()
-        mock_instance.is_active = True
-        mock_instance.local_bind_port = 3307
-        mock.return_value = mock_instance
-        yield mock
-
-
 @pytest.fixture
 def temp_config_dir(tmp_path):
     """임시 설정 디렉토리"""
@@ -165,6 +154,9 @@ class FakeMySQLConnector:
     def set_session_sql_mode(self, mode: str) -> bool:
         return True
 
+    def set_session_stats_expiry(self, seconds) -> bool:
+        return True
+
 
 @pytest.fixture
 def fake_connector():
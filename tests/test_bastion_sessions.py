@@ -0,0 +1,284 @@
+"""
+Bastion 세션 공유 테스트
+"""
+import socket
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.bastion_sessions import (
+    BastionSessionManager,
+    SharedTunnelForwarder,
+    TempTunnelPool,
+    TrafficCounters,
+)
+
+
+def _config(tunnel_id, remote_host='db-1', **overrides):
+    config = {
+        'id': tunnel_id,
+        'name': tunnel_id,
+        'bastion_host': '10.0.0.1',
+        'bastion_port': 22,
+        'bastion_user': 'ec2-user',
+        'bastion_key': '/keys/id_rsa',
+        'remote_host': remote_host,
+        'remote_port': 3306,
+    }
+    config.update(overrides)
+    return config
+
+
+class _FakeTransport:
+    def __init__(self):
+        self.active = True
+        self.closed = False
+        self.channels = []
+
+    def is_active(self):
+        return self.active
+
+    def set_keepalive(self, interval):
+        self.keepalive = interval
+
+    def open_channel(self, kind, dest, src, timeout=None):
+        # 채널 대신 socketpair 한쪽을 돌려주고, 반대쪽은 "원격 DB"로 테스트가 사용한다
+        local, remote = socket.socketpair()
+        self.channels.append((dest, remote))
+        return local
+
+    def close(self):
+        self.closed = True
+        self.active = False
+
+
+class _Connector:
+    def __init__(self):
+        self.transports = []
+        self.lock = threading.Lock()
+
+    def __call__(self, host, port, username, pkey, timeout):
+        with self.lock:
+            transport = _FakeTransport()
+            self.transports.append(transport)
+            return transport
+
+
+@pytest.fixture
+def connector():
+    return _Connector()
+
+
+@pytest.fixture
+def sessions(connector):
+    manager = BastionSessionManager(pkey_loader=lambda key_path: MagicMock(), connector=connector)
+    yield manager
+    manager.close_all()
+
+
+def test_tunnels_behind_same_bastion_share_one_transport(sessions, connector):
+    first = sessions.acquire(_config('a', 'db-1'))
+    second = sessions.acquire(_config('b', 'db-2'))
+    other = sessions.acquire(_config('c', bastion_host='10.0.0.2'))
+
+    assert first is second
+    assert other is not first
+    assert len(connector.transports) == 2
+    assert sessions.stats() == {'sessions': 2, 'active': 2, 'refs': 3}
+
+    sessions.release(first)
+    assert connector.transports[0].closed is False
+    sessions.release(second)
+    assert connector.transports[0].closed is True
+
+
+def test_concurrent_acquire_connects_once(sessions, connector):
+    barrier = threading.Barrier(8)
+    acquired = []
+
+    def borrow(index):
+        barrier.wait()
+        acquired.append(sessions.acquire(_config(f't{index}')))
+
+    threads = [threading.Thread(target=borrow, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(connector.transports) == 1
+    assert len({id(session) for session in acquired}) == 1
+
+
+def test_dropped_transport_is_reconnected_on_next_channel(sessions, connector):
+    session = sessions.acquire(_config('a'))
+    connector.transports[0].active = False
+
+    channel = session.open_channel('db-1', 3306)
+    channel.close()
+
+    assert len(connector.transports) == 2
+    assert session.connects == 2
+
+
+def test_failed_connect_does_not_leak_a_reference(connector):
+    def refuse(*args):
+        raise OSError("connection refused")
+
+    manager = BastionSessionManager(pkey_loader=lambda key_path: MagicMock(), connector=refuse)
+
+    with pytest.raises(OSError):
+        manager.acquire(_config('a'))
+    assert manager.stats()['sessions'] == 0
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = threading.Event()
+    for _ in range(int(timeout / 0.05)):
+        if predicate():
+            return True
+        deadline.wait(0.05)
+    return predicate()
+
+
+def test_forwarder_relays_local_connections_over_session_channels(sessions, connector):
+    forwarder = SharedTunnelForwarder(sessions, _config('a', 'db-9'), ('127.0.0.1', 0))
+    forwarder.start()
+    try:
+        assert forwarder.is_active
+        client = socket.create_connection(('127.0.0.1', forwarder.local_bind_port), timeout=5)
+        client.sendall(b'ping')
+
+        for _ in range(50):
+            if connector.transports[0].channels:
+                break
+            threading.Event().wait(0.05)
+        dest, remote = connector.transports[0].channels[0]
+        remote.settimeout(5)
+        assert dest == ('db-9', 3306)
+        assert remote.recv(4) == b'ping'
+        remote.sendall(b'pong')
+        client.settimeout(5)
+        assert client.recv(4) == b'pong'
+        assert _wait_for(lambda: forwarder.traffic.snapshot()['bytes_received'] == 4)
+        traffic = forwarder.traffic.snapshot()
+        assert traffic['bytes_sent'] == 4
+        assert traffic['active_channels'] == 1
+        assert traffic['channels_opened'] == 1
+        assert traffic['setup_seconds'] is not None
+        client.close()
+        remote.close()
+        assert _wait_for(lambda: forwarder.traffic.snapshot()['active_channels'] == 0)
+    finally:
+        forwarder.stop()
+
+    assert forwarder.is_active is False
+    assert sessions.stats()['sessions'] == 0
+
+
+def test_forwarder_port_conflict_fails_before_connecting(sessions, connector):
+    blocker = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    blocker.bind(('127.0.0.1', 0))
+    blocker.listen(1)
+    try:
+        forwarder = SharedTunnelForwarder(sessions, _config('a'), ('127.0.0.1', blocker.getsockname()[1]))
+        with pytest.raises(OSError):
+            forwarder.start()
+    finally:
+        blocker.close()
+
+    assert connector.transports == []
+
+
+class _FakeForwarder:
+    def __init__(self, config):
+        self.config = config
+        self.is_active = True
+        self.stopped = False
+
+    def stop(self):
+        self.stopped = True
+        self.is_active = False
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_traffic_counters_report_rolling_throughput_per_direction():
+    clock = _Clock()
+    traffic = TrafficCounters(window_seconds=10, clock=clock)
+    traffic.channel_opened(0.02)
+    traffic.add_bytes(sent=1000)
+    clock.now += 1
+    traffic.add_bytes(sent=1000, received=5000)
+    clock.now += 1
+    # 진행 중인 현재 초는 아직 처리량에 넣지 않는다
+    traffic.add_bytes(sent=7)
+
+    snapshot = traffic.snapshot()
+    assert snapshot['bytes_sent'] == 2007
+    assert snapshot['bytes_received'] == 5000
+    assert snapshot['sent_bytes_per_sec'] == 200.0
+    assert snapshot['received_bytes_per_sec'] == 500.0
+    assert snapshot['active_channels'] == 1
+    assert snapshot['avg_channel_setup_seconds'] == pytest.approx(0.02)
+
+    # 구간이 지나면 처리량은 0으로 돌아가고 누적 값은 남는다
+    clock.now += 30
+    traffic.channel_closed()
+    snapshot = traffic.snapshot()
+    assert snapshot['sent_bytes_per_sec'] == 0.0
+    assert snapshot['bytes_sent'] == 2007
+    assert snapshot['active_channels'] == 0
+
+
+def test_temp_tunnel_pool_reuses_released_forward_for_same_target():
+    clock = _Clock()
+    pool = TempTunnelPool(_FakeForwarder, max_idle=2, idle_timeout=60, clock=clock)
+
+    first = pool.lease(_config('a', 'db-1'))
+    pool.release(first)
+    again = pool.lease(_config('b', 'db-1'))
+    other_target = pool.lease(_config('c', 'db-2'))
+
+    assert again is first
+    assert other_target is not first
+    assert pool.stats()['reused'] == 1
+    assert pool.stats()['created'] == 2
+    pool.close_all()
+
+
+def test_temp_tunnel_pool_expires_idle_and_caps_size():
+    clock = _Clock()
+    pool = TempTunnelPool(_FakeForwarder, max_idle=2, idle_timeout=60, clock=clock)
+    forwards = [pool.lease(_config(f't{index}', f'db-{index}')) for index in range(3)]
+    for forward in forwards:
+        pool.release(forward)
+
+    # 상한(2)을 넘긴 가장 오래된 터널은 바로 닫힌다
+    assert forwards[0].stopped is True
+    assert pool.stats()['idle'] == 2
+
+    clock.now += 61
+    pool.sweep()
+    assert all(forward.stopped for forward in forwards)
+    assert pool.stats()['idle'] == 0
+
+
+def test_temp_tunnel_pool_drops_dead_idle_forward():
+    pool = TempTunnelPool(_FakeForwarder, idle_timeout=60, clock=_Clock())
+    first = pool.lease(_config('a'))
+    pool.release(first)
+    first.is_active = False
+
+    replacement = pool.lease(_config('a'))
+
+    assert replacement is not first
+    assert first.stopped is True
+    pool.close_all()
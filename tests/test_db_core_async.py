@@ -0,0 +1,242 @@
+import asyncio
+import io
+import json
+import threading
+
+from src.core.db_core_service import (
+    AsyncDbCoreFacade,
+    DbCoreFacade,
+    DbCoreLoopThread,
+    DbCorePoolConfig,
+    DbCoreProcessPool,
+    DbCoreServiceClient,
+    DbCoreServiceError,
+    DbEndpoint,
+)
+
+
+class FakeProcess:
+    def __init__(self, stdout_lines):
+        self.stdin = io.StringIO()
+        self.stdout = io.StringIO("\n".join(stdout_lines) + "\n")
+        self.stderr = io.StringIO("")
+
+    def poll(self):
+        return None
+
+    def terminate(self):
+        pass
+
+
+def _client(lines):
+    process = FakeProcess(lines)
+    client = DbCoreServiceClient(executable="fake-core", popen_factory=lambda *args, **kwargs: process)
+    return client, process
+
+
+class _AsyncClient:
+    """Answers `query.execute` only after the test releases it; tracks concurrency."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.commands = []
+        self.release = None
+
+    async def request_async(self, command, payload=None, request_id=None, on_event=None):
+        self.commands.append((command, payload))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            if command == "service.hello":
+                return {"result_formats": ["rows"]}
+            if command == "cursor.open":
+                return {"cursor_id": "cursor-1", "columns": ["id"]}
+            if command == "cursor.fetch":
+                return {"rows": [{"id": 1}], "columns": ["id"], "done": False}
+            if command == "cursor.close":
+                return {"closed": True}
+            await self.release.wait()
+            return {"rows": [{"n": payload["sql"]}], "columns": ["n"]}
+        finally:
+            self.in_flight -= 1
+
+
+def test_async_facade_shares_feature_negotiation_with_sync_facade():
+    client, process = _client([
+        '{"event":"result","command":"service.hello","success":true,"result_formats":["rows","columnar"]}',
+        '{"event":"result","command":"query.execute","success":true,"result_format":"columnar",'
+        '"columns":["id"],"rows":[],"values":[[1],[2]],"rows_affected":0}',
+    ])
+    facade = DbCoreFacade(client)
+    endpoint = DbEndpoint("mysql", "127.0.0.1", 3306, "root", "pw", "app")
+
+    async def run():
+        return await AsyncDbCoreFacade(facade).execute_query_result(
+            endpoint, "SELECT id FROM users", result_format="columnar",
+        )
+
+    result = asyncio.run(run())
+    client.shutdown()
+
+    sent = [json.loads(line) for line in process.stdin.getvalue().splitlines()]
+    assert [item["command"] for item in sent[:2]] == ["service.hello", "query.execute"]
+    assert sent[1]["payload"]["result_format"] == "columnar"
+    assert result["rows"].values == [[1], [2]]
+    # The sync facade reuses the negotiation done by the async one.
+    assert facade.supports_result_format("columnar") is True
+
+
+def test_async_facade_does_not_cache_a_failed_hello():
+    class FlakyClient:
+        calls = 0
+
+        async def request_async(self, command, payload=None, request_id=None, on_event=None):
+            FlakyClient.calls += 1
+            if FlakyClient.calls == 1:
+                raise DbCoreServiceError("core not ready")
+            return {"result_formats": ["rows", "columnar"]}
+
+    facade = DbCoreFacade(FlakyClient())
+    async_facade = AsyncDbCoreFacade(facade)
+
+    async def run():
+        first = await async_facade.supports_result_format("columnar")
+        second = await async_facade.supports_result_format("columnar")
+        return first, second
+
+    assert asyncio.run(run()) == (False, True)
+    assert facade.supports_result_format("columnar") is True
+    assert FlakyClient.calls == 2
+
+
+def test_async_facade_fans_out_up_to_the_in_flight_limit():
+    client = _AsyncClient()
+    facade = AsyncDbCoreFacade(DbCoreFacade(client), max_in_flight=8)
+
+    async def run():
+        client.release = asyncio.Event()
+        tasks = [
+            asyncio.ensure_future(facade.execute_on_connection("conn-1", f"SELECT {index}"))
+            for index in range(50)
+        ]
+        await asyncio.sleep(0)
+        assert client.in_flight == 8
+        client.release.set()
+        return await asyncio.gather(*tasks)
+
+    results = asyncio.run(run())
+
+    assert client.peak == 8
+    assert results[49] == [{"n": "SELECT 49"}]
+
+
+def test_async_facade_built_outside_a_loop_works_from_separate_loops():
+    client = _AsyncClient()
+    facade = AsyncDbCoreFacade(DbCoreFacade(client), max_in_flight=2)
+
+    async def run(sql):
+        client.release = asyncio.Event()
+        client.release.set()
+        return await facade.execute_on_connection("conn-1", sql)
+
+    assert asyncio.run(run("SELECT 1")) == [{"n": "SELECT 1"}]
+    assert asyncio.run(run("SELECT 2")) == [{"n": "SELECT 2"}]
+
+
+def test_event_stream_yields_progress_and_keeps_final_result():
+    client, _process = _client([
+        '{"event":"progress","table":"users","rows":10}',
+        '{"event":"progress","table":"orders","rows":20}',
+        '{"event":"result","command":"dump.run","success":true,"tables":2}',
+    ])
+    facade = AsyncDbCoreFacade(DbCoreFacade(client))
+
+    async def run():
+        stream = facade.stream_events("dump.run", {"tables": ["users", "orders"]})
+        events = [event async for event in stream]
+        return events, stream.result
+
+    events, result = asyncio.run(run())
+    client.shutdown()
+
+    assert [event["table"] for event in events] == ["users", "orders"]
+    assert result["tables"] == 2
+
+
+def test_event_stream_raises_core_error_after_draining_events():
+    client, _process = _client([
+        '{"event":"progress","rows":1}',
+        '{"event":"error","message":"dump failed"}',
+    ])
+    facade = AsyncDbCoreFacade(DbCoreFacade(client))
+
+    async def run():
+        seen = []
+        try:
+            async for event in facade.stream_events("dump.run", {}):
+                seen.append(event)
+        except DbCoreServiceError as exc:
+            return seen, str(exc)
+        return seen, None
+
+    seen, error = asyncio.run(run())
+    client.shutdown()
+
+    assert seen == [{"event": "progress", "rows": 1}]
+    assert "dump failed" in error
+
+
+def test_iter_cursor_closes_server_cursor_when_consumer_stops_early():
+    client = _AsyncClient()
+    facade = AsyncDbCoreFacade(DbCoreFacade(client))
+
+    async def run():
+        batches = facade.iter_cursor("conn-1", "SELECT id FROM big_table", row_batch_size=1)
+        first = await batches.__anext__()
+        await batches.aclose()
+        return first
+
+    assert asyncio.run(run()) == [{"id": 1}]
+    assert [command for command, _payload in client.commands] == ["cursor.open", "cursor.fetch", "cursor.close"]
+
+
+def test_loop_thread_runs_facade_coroutines_for_sync_callers():
+    class SyncClient:
+        def __init__(self):
+            self.threads = []
+
+        def request(self, command, payload=None, request_id=None, on_event=None):
+            self.threads.append(threading.current_thread().name)
+            return {"success": True, "connection_id": "conn-9"}
+
+    client = SyncClient()
+    facade = AsyncDbCoreFacade(DbCoreFacade(client))
+    loop_thread = DbCoreLoopThread(name="db-core-async-test")
+    endpoint = DbEndpoint("mysql", "127.0.0.1", 3306, "root", "pw", "app")
+    try:
+        assert loop_thread.call(facade.open_connection(endpoint), timeout=5) == "conn-9"
+    finally:
+        loop_thread.stop()
+
+    # Clients without request_async fall back to the loop's executor, not the caller thread.
+    assert client.threads and client.threads[0] != threading.current_thread().name
+
+
+def test_process_pool_routes_async_requests_to_the_connection_owner():
+    opener, _ = _client(['{"event":"result","command":"connection.open","success":true,"connection_id":"conn-1"}'])
+    bulk, _ = _client([])
+    workers = iter([opener, bulk])
+    pool = DbCoreProcessPool(
+        DbCorePoolConfig(interactive_workers=1, bulk_workers=1),
+        client_factory=lambda: next(workers),
+    )
+    facade = AsyncDbCoreFacade(DbCoreFacade(pool))
+    endpoint = DbEndpoint("mysql", "127.0.0.1", 3306, "root", "pw", "app")
+
+    connection_id = asyncio.run(facade.open_connection(endpoint))
+    owner = pool._pick_worker("query.execute", {"connection_id": connection_id})
+    pool.shutdown()
+
+    assert connection_id == "conn-1"
+    assert owner is opener
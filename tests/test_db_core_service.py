@@ -8,6 +8,9 @@ import pytest
 import src.core.db_core_dbapi_shim as db_core_dbapi_shim
 import src.core.db_core_service as db_core_service
 from src.core.db_core_service import (
+    ColumnarRows,
+    DbConnectionPool,
+    DbConnectionPoolConfig,
     DbCoreFacade,
     DbCoreServiceError,
     DbCoreServiceClient,
@@ -21,6 +24,7 @@ from src.core.db_core_service import (
 from src.core.sql_query_classifier import (
     classify_sql_statement,
     is_mysql_implicit_commit_ddl,
+    session_state_change,
     statement_returns_rows,
 )
 
@@ -839,3 +843,830 @@ def test_get_schemas_generic_exception_is_logged_and_returns_empty_default():
     result = connector.get_schemas()
 
     assert result == []
+
+
+# =====================================================================
+# DbCoreServiceClient: request_id 기반 다중화 (여러 요청 동시 in-flight)
+# =====================================================================
+
+class _QueueStdout:
+    """Stdout stub fed line-by-line by the test, like a live core process."""
+
+    def __init__(self):
+        import queue
+
+        self._lines = queue.Queue()
+
+    def feed(self, payload):
+        self._lines.put(json.dumps(payload) + "\n")
+
+    def close(self):
+        self._lines.put("")
+
+    def readline(self):
+        return self._lines.get(timeout=5)
+
+
+class _QueueProcess:
+    def __init__(self):
+        self.stdin = io.StringIO()
+        self.stdout = _QueueStdout()
+        self.stderr = io.StringIO()
+        self.terminated = False
+
+    def poll(self):
+        return None if not self.terminated else 0
+
+    def terminate(self):
+        self.terminated = True
+        self.stdout.close()
+
+    def sent_ids(self):
+        return [json.loads(line)["request_id"] for line in self.stdin.getvalue().splitlines()]
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_client_routes_out_of_order_results_to_in_flight_requests():
+    process = _QueueProcess()
+    client = DbCoreServiceClient(executable="fake-core", popen_factory=lambda *a, **k: process)
+    results = {}
+    dump_events = []
+
+    def run_dump():
+        results["dump"] = client.request(
+            "dump.run", request_id="dump-1", on_event=dump_events.append,
+        )
+
+    dump_thread = threading.Thread(target=run_dump)
+    dump_thread.start()
+    assert _wait_until(lambda: process.sent_ids() == ["dump-1"])
+
+    hello_thread = threading.Thread(
+        target=lambda: results.__setitem__("hello", client.request("service.hello", request_id="hello-1"))
+    )
+    hello_thread.start()
+    assert _wait_until(lambda: process.sent_ids() == ["dump-1", "hello-1"])
+
+    process.stdout.feed({"event": "phase", "request_id": "dump-1", "phase": "dump"})
+    process.stdout.feed({"event": "result", "request_id": "hello-1", "success": True})
+    hello_thread.join(timeout=5)
+
+    assert results["hello"]["success"] is True
+    assert dump_thread.is_alive(), "a slow dump must not block other requests"
+    assert client.in_flight_count() == 1
+
+    process.stdout.feed({"event": "result", "request_id": "dump-1", "rows_dumped": 3})
+    dump_thread.join(timeout=5)
+
+    assert results["dump"]["rows_dumped"] == 3
+    assert [event["event"] for event in dump_events] == ["phase", "result"]
+    assert client.in_flight_count() == 0
+
+
+def test_client_fails_every_in_flight_request_when_core_exits():
+    process = _QueueProcess()
+    client = DbCoreServiceClient(executable="fake-core", popen_factory=lambda *a, **k: process)
+    errors = []
+
+    def call(request_id):
+        try:
+            client.request("query.execute", request_id=request_id)
+        except DbCoreServiceError as exc:
+            errors.append((request_id, str(exc)))
+
+    threads = [threading.Thread(target=call, args=(f"q-{index}",)) for index in range(3)]
+    for thread in threads:
+        thread.start()
+    assert _wait_until(lambda: len(process.sent_ids()) == 3)
+
+    process.terminate()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert sorted(request_id for request_id, _ in errors) == ["q-0", "q-1", "q-2"]
+    assert client.in_flight_count() == 0
+
+
+def test_client_callback_error_abandons_request_without_blocking_others():
+    process = _QueueProcess()
+    client = DbCoreServiceClient(executable="fake-core", popen_factory=lambda *a, **k: process)
+    process.stdout.feed({"event": "phase", "request_id": "dump-1", "phase": "dump"})
+
+    def cancel(_event):
+        raise RuntimeError("cancelled by user")
+
+    with pytest.raises(RuntimeError):
+        client.request("dump.run", request_id="dump-1", on_event=cancel)
+
+    process.stdout.feed({"event": "result", "request_id": "dump-1", "success": False})
+    process.stdout.feed({"event": "result", "request_id": "hello-1", "success": True})
+
+    assert client.request("service.hello", request_id="hello-1")["success"] is True
+
+
+# =====================================================================
+# DbCoreProcessPool: interactive/bulk lane, 연결 affinity, crash 재시작
+# =====================================================================
+
+class _FakeWorker:
+    def __init__(self, name):
+        self.name = name
+        self.calls = []
+        self.generation = 1
+        self.running = True
+        self.started = 0
+        self.fail_next = None
+
+    def request(self, command, payload=None, request_id=None, on_event=None):
+        self.calls.append((command, payload))
+        if self.fail_next is not None:
+            error, self.fail_next = self.fail_next, None
+            raise error
+        if command == "connection.open":
+            return {"success": True, "connection_id": f"{self.name}-conn"}
+        return {"success": True, "worker": self.name}
+
+    def in_flight_count(self):
+        return 0
+
+    def is_running(self):
+        return self.running
+
+    def start(self):
+        self.started += 1
+        self.generation += 1
+        self.running = True
+
+    def shutdown(self):
+        self.running = False
+
+    def stats(self):
+        return {
+            "workers": 1,
+            "running_workers": int(self.running),
+            "busy_workers": 0,
+            "in_flight": 0,
+            "queue_depth": 0,
+            "restarts": self.generation - 1,
+        }
+
+
+def _fake_pool(interactive=1, bulk=1):
+    from src.core.db_core_pool import DbCorePoolConfig, DbCoreProcessPool
+
+    names = iter([f"i{index}" for index in range(interactive)] + [f"b{index}" for index in range(bulk)])
+    return DbCoreProcessPool(
+        DbCorePoolConfig(interactive_workers=interactive, bulk_workers=bulk),
+        client_factory=lambda: _FakeWorker(next(names)),
+    )
+
+
+def test_pool_routes_bulk_jobs_away_from_interactive_lane():
+    pool = _fake_pool()
+    facade = DbCoreFacade(pool)
+
+    facade.run_dump({"output_dir": "dump"})
+    facade.execute_query(DbEndpoint("mysql", "127.0.0.1", 3306, "root", "pw", "app"), "SELECT 1")
+
+    interactive, bulk = pool.workers
+    assert [command for command, _ in bulk.calls] == ["dump.run"]
+    assert [command for command, _ in interactive.calls] == ["query.execute"]
+
+
+def test_pool_pins_connection_scoped_requests_to_the_opening_worker():
+    pool = _fake_pool(interactive=2)
+    endpoint = DbEndpoint("mysql", "127.0.0.1", 3306, "root", "pw", "app")
+    facade = DbCoreFacade(pool)
+
+    connection_id = facade.open_connection(endpoint)
+    owner = next(worker for worker in pool.workers if worker.calls)
+    for _ in range(3):
+        facade.execute_on_connection(connection_id, "SELECT 1")
+    facade.close_connection(connection_id)
+
+    assert [command for command, _ in owner.calls] == [
+        "connection.open", "query.execute", "query.execute", "query.execute", "connection.close",
+    ]
+    assert pool.stats()["open_connections"] == 0
+
+
+def test_pool_restarts_crashed_worker_and_reports_stats():
+    pool = _fake_pool()
+    interactive = pool.workers[0]
+    connection_id = pool.request("connection.open", {})["connection_id"]
+    interactive.running = False
+    interactive.fail_next = DbCoreServiceError("DB core service stopped before a result")
+
+    with pytest.raises(DbCoreServiceError):
+        pool.request("query.execute", {"connection_id": connection_id, "sql": "SELECT 1"})
+
+    stats = pool.stats()
+    assert interactive.started == 1
+    assert stats["crashes"] == 1
+    assert stats["restarts"] == 1
+    assert stats["open_connections"] == 0
+    assert stats["lanes"]["interactive"]["restarts"] == 1
+    assert stats["lanes"]["bulk"]["restarts"] == 0
+
+
+def test_pool_config_reads_and_clamps_app_settings():
+    from src.core.db_core_pool import DbCorePoolConfig, MAX_WORKERS_PER_LANE
+
+    class FakeConfigManager:
+        def __init__(self, settings):
+            self.settings = settings
+
+        def get_app_setting(self, key, default=None):
+            return self.settings.get(key, default)
+
+    config = DbCorePoolConfig.from_config_manager(
+        FakeConfigManager({"db_core_interactive_workers": "3", "db_core_bulk_workers": 99})
+    )
+
+    assert config.interactive_workers == 3
+    assert config.bulk_workers == MAX_WORKERS_PER_LANE
+    assert DbCorePoolConfig.from_config_manager(FakeConfigManager({})) == DbCorePoolConfig()
+
+
+# =====================================================================
+# columnar 결과 포맷 (query.execute result_format)
+# =====================================================================
+def test_columnar_rows_builds_dicts_lazily_and_compares_with_dict_rows():
+    rows = ColumnarRows(["id", "name"], [[1, "alpha"], [2, "beta"]])
+
+    assert len(rows) == 2
+    assert rows[1] == {"id": 2, "name": "beta"}
+    assert rows[-1:] == [{"id": 2, "name": "beta"}]
+    assert rows == [{"id": 1, "name": "alpha"}, {"id": 2, "name": "beta"}]
+    assert ColumnarRows.from_dict_rows([], [{"id": 1, "name": "alpha"}]).values == [[1, "alpha"]]
+
+
+def test_facade_negotiates_columnar_once_and_returns_value_arrays():
+    process = FakeProcess([
+        '{"event":"result","command":"service.hello","success":true,"result_formats":["rows","columnar"]}',
+        '{"event":"result","command":"query.execute","success":true,"result_format":"columnar",'
+        '"columns":["id","name"],"rows":[],"values":[[1,"alpha"],[2,null]],"rows_affected":0}',
+        '{"event":"result","command":"query.execute","success":true,"result_format":"columnar",'
+        '"columns":["id"],"rows":[],"values":[[3]],"rows_affected":0}',
+    ])
+    client = DbCoreServiceClient(
+        executable="fake-core",
+        popen_factory=lambda *args, **kwargs: process,
+    )
+    endpoint = DbEndpoint("mysql", "127.0.0.1", 3306, "root", "pw", "app")
+    connection = RustDbConnection(endpoint, DbCoreFacade(client), "conn-1")
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT id, name FROM users")
+        dict_rows = [cursor.fetchone()]
+        values = cursor.fetchall_values()
+        cursor.execute("SELECT id FROM users")
+
+    sent = [json.loads(line) for line in process.stdin.getvalue().splitlines()]
+    assert [item["command"] for item in sent] == ["service.hello", "query.execute", "query.execute"]
+    assert sent[1]["payload"]["result_format"] == "columnar"
+    assert dict_rows == [{"id": 1, "name": "alpha"}]
+    assert values == [[2, None]]
+    assert cursor.description == [("id",)]
+    assert cursor.fetchone() == {"id": 3}
+
+
+class _FlakyHelloClient:
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+
+    def request(self, command, payload=None, request_id=None, on_event=None):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise DbCoreServiceError("core not ready")
+        return {"success": True, "result_formats": ["rows", "columnar"]}
+
+
+def test_facade_retries_feature_negotiation_after_failed_hello():
+    client = _FlakyHelloClient(failures=1)
+    facade = DbCoreFacade(client)
+
+    assert facade.supports_result_format("columnar") is False
+    assert facade._features is None
+    assert facade.supports_result_format("columnar") is True
+    assert facade.supports_result_format("columnar") is True
+    assert client.calls == 2
+
+
+def test_facade_skips_columnar_for_cores_without_support_and_converts_locally():
+    process = FakeProcess([
+        '{"event":"result","command":"service.hello","success":true}',
+        '{"event":"columns","columns":["id","name"]}',
+        '{"event":"row_batch","rows":[{"id":1,"name":"alpha"}]}',
+        '{"event":"result","command":"query.execute","success":true,"columns":["id","name"],"rows_streamed":1}',
+    ])
+    client = DbCoreServiceClient(
+        executable="fake-core",
+        popen_factory=lambda *args, **kwargs: process,
+    )
+    batches = []
+
+    DbCoreFacade(client).execute_on_connection_streaming(
+        "conn-1", "SELECT id, name FROM users", on_batch=batches.append, result_format="columnar",
+    )
+
+    sent = [json.loads(line) for line in process.stdin.getvalue().splitlines()]
+    assert "result_format" not in sent[1]["payload"]
+    assert batches == [[[1, "alpha"]]]
+
+
+# =====================================================================
+# 서버 측 스트리밍 커서 (cursor.open / cursor.fetch / cursor.close)
+# =====================================================================
+class _CursorFacade:
+    def __init__(self, batches, capabilities=("cursor.open",)):
+        self.batches = list(batches)
+        self.capabilities = capabilities
+        self.calls = []
+
+    def supports_command(self, command):
+        return command in self.capabilities
+
+    def supports_result_format(self, result_format):
+        return result_format == "rows"
+
+    def open_cursor(self, connection_id, sql, params=None, row_batch_size=500):
+        self.calls.append(("open", sql, row_batch_size))
+        return {"cursor_id": "cursor-1", "columns": ["id"]}
+
+    def fetch_cursor(self, connection_id, cursor_id, result_format="rows"):
+        self.calls.append(("fetch", cursor_id))
+        rows = self.batches.pop(0)
+        return {"rows": rows, "done": not self.batches}
+
+    def close_cursor(self, connection_id, cursor_id):
+        self.calls.append(("close", cursor_id))
+        return True
+
+    def execute_on_connection_result(self, connection_id, query, params=None):
+        self.calls.append(("execute", query))
+        return {"rows": [], "columns": [], "rows_affected": 4}
+
+
+def _cursor_connection(facade):
+    endpoint = DbEndpoint("mysql", "127.0.0.1", 3306, "root", "pw", "app")
+    return RustDbConnection(endpoint, facade, "conn-1")
+
+
+def test_streaming_cursor_pulls_batches_only_when_fetchmany_needs_them():
+    facade = _CursorFacade([[{"id": 1}, {"id": 2}], [{"id": 3}], []])
+    cursor = _cursor_connection(facade).cursor(streaming=True, batch_size=2)
+
+    assert cursor.execute("SELECT id FROM big_table") == -1
+    assert cursor.description == [("id",)]
+    assert facade.calls == [("open", "SELECT id FROM big_table", 2)]
+
+    assert cursor.fetchmany(1) == [{"id": 1}]
+    assert cursor.fetchmany(2) == [{"id": 2}, {"id": 3}]
+    assert [call[0] for call in facade.calls] == ["open", "fetch", "fetch"]
+    assert list(cursor) == []
+    assert cursor.fetchone() is None
+
+    cursor.close()
+    assert facade.calls[-1] == ("fetch", "cursor-1")
+
+
+def test_streaming_cursor_fetchmany_values_stops_pulling_at_the_cap():
+    facade = _CursorFacade([[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], [{"id": 5}]])
+    connection = _cursor_connection(facade)
+
+    with connection.cursor(streaming=True, batch_size=2) as cursor:
+        cursor.execute("SELECT id FROM big_table")
+        assert cursor.fetchmany_values(3) == [[1], [2], [3]]
+
+    assert [call[0] for call in facade.calls] == ["open", "fetch", "fetch", "close"]
+
+
+def test_streaming_cursor_close_releases_unread_server_cursor():
+    facade = _CursorFacade([[{"id": 1}], [{"id": 2}]])
+    connection = _cursor_connection(facade)
+
+    with connection.cursor(streaming=True) as cursor:
+        cursor.execute("SELECT id FROM big_table")
+        assert cursor.fetchone() == {"id": 1}
+
+    assert facade.calls[-1] == ("close", "cursor-1")
+
+
+def test_streaming_cursor_falls_back_to_buffered_execute_for_dml_and_old_cores():
+    facade = _CursorFacade([], capabilities=())
+    cursor = _cursor_connection(facade).cursor(streaming=True)
+
+    cursor.execute("SELECT id FROM t")
+    assert cursor.execute("UPDATE t SET id = id") == 4
+    assert [call[0] for call in facade.calls] == ["execute", "execute"]
+
+
+def test_streaming_cursor_uses_buffered_execute_inside_postgresql_transaction():
+    facade = _CursorFacade([], capabilities=("cursor.open",))
+    endpoint = DbEndpoint("postgresql", "127.0.0.1", 5432, "postgres", "pw", "app")
+    connection = RustDbConnection(endpoint, facade, "conn-1")
+    connection._in_transaction = True
+
+    connection.cursor(streaming=True).execute("SELECT id FROM t")
+
+    assert [call[0] for call in facade.calls] == ["execute"]
+
+
+def test_buffered_cursor_fetchmany_and_iteration_consume_rows():
+    class FakeFacade:
+        def execute_on_connection_result(self, connection_id, query, params=None):
+            return {"rows": [{"id": 1}, {"id": 2}, {"id": 3}], "columns": ["id"], "rows_affected": 0}
+
+    cursor = _cursor_connection(FakeFacade()).cursor()
+    cursor.execute("SELECT id FROM t")
+
+    assert cursor.fetchmany() == [{"id": 1}]
+    assert [row["id"] for row in cursor] == [2, 3]
+    assert cursor.fetchall() == []
+
+
+def test_facade_cancel_query_targets_the_stateful_connection():
+    process = FakeProcess([
+        '{"event":"result","command":"query.cancel","success":true,"cancelled":true,"connection_id":"conn-1"}',
+    ])
+    client = DbCoreServiceClient(
+        executable="fake-core",
+        popen_factory=lambda *args, **kwargs: process,
+    )
+
+    assert DbCoreFacade(client).cancel_query("conn-1") is True
+
+    sent = json.loads(process.stdin.getvalue().strip())
+    assert sent["command"] == "query.cancel"
+    assert sent["payload"] == {"connection_id": "conn-1"}
+
+
+def test_connection_cancel_running_query_reports_failure_without_raising():
+    class FakeFacade:
+        def cancel_query(self, connection_id):
+            raise DbCoreServiceError("core unavailable")
+
+    assert _cursor_connection(FakeFacade()).cancel_running_query() is False
+
+
+class _PoolFacade:
+    def __init__(self, failing_sql=()):
+        self.opened = []
+        self.closed = []
+        self.executed = []
+        self.failing_sql = set(failing_sql)
+        self.generation = 0
+
+    def core_generation(self):
+        return self.generation
+
+    def open_connection(self, endpoint):
+        connection_id = f"conn-{len(self.opened) + 1}"
+        self.opened.append(connection_id)
+        return connection_id
+
+    def close_connection(self, connection_id):
+        self.closed.append(connection_id)
+        return True
+
+    def execute_on_connection(self, connection_id, sql, params=None):
+        self.executed.append((connection_id, sql))
+        if sql in self.failing_sql:
+            raise DbCoreServiceError("server has gone away")
+        return []
+
+    def execute_on_connection_result(self, connection_id, query, params=None):
+        self.executed.append((connection_id, query))
+        return {"rows": [], "columns": [], "rows_affected": 0}
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _pooled_connector(facade, pool):
+    return RustDbConnector(
+        "mysql", "127.0.0.1", 3306, "root", "pw", "app", facade=facade, pool=pool,
+    )
+
+
+def test_session_state_change_classifies_pool_relevant_statements():
+    assert session_state_change("USE app") == "database"
+    assert session_state_change("SET SESSION sql_mode = 'ANSI'") == "sql_mode"
+    assert session_state_change("/* x */ set @@sql_mode := '';") == "sql_mode"
+    assert session_state_change("START TRANSACTION") == "transaction"
+    assert session_state_change("SET sql_mode = '', foreign_key_checks = 0") == "other"
+    assert session_state_change("SET NAMES utf8mb4") == "other"
+    assert session_state_change("CREATE TEMPORARY TABLE t (id int)") == "other"
+    assert session_state_change("SELECT 1") == ""
+
+
+def test_pooled_connector_reuses_core_connection_across_connect_cycles():
+    facade = _PoolFacade()
+    pool = DbConnectionPool()
+
+    for _ in range(3):
+        connector = _pooled_connector(facade, pool)
+        assert connector.connect() == (True, "연결 성공")
+        with connector.connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        connector.disconnect()
+
+    assert facade.opened == ["conn-1"]
+    assert facade.closed == []
+    assert pool.stats()["reused"] == 2
+    assert pool.stats()["idle"] == 1
+
+
+def test_pooled_lease_resets_session_state_before_reuse():
+    facade = _PoolFacade()
+    pool = DbConnectionPool()
+    connector = _pooled_connector(facade, pool)
+    connector.connect()
+    connection = connector.connection
+
+    connection.autocommit(False)
+    connection.select_db("other")
+    with connection.cursor() as cursor:
+        cursor.execute("SET SESSION sql_mode = 'ANSI'")
+    facade.executed.clear()
+    connector.disconnect()
+
+    assert [sql for _, sql in facade.executed] == [
+        "ROLLBACK",
+        "SET autocommit = 1",
+        "SET SESSION sql_mode = DEFAULT",
+        "USE `app`",
+    ]
+    assert connection.open is False
+    assert pool.stats()["idle"] == 1
+
+
+def test_pooled_lease_with_unresettable_session_is_closed_not_reused():
+    facade = _PoolFacade()
+    pool = DbConnectionPool()
+    connector = _pooled_connector(facade, pool)
+    connector.connect()
+    with connector.connection.cursor() as cursor:
+        cursor.execute("SET foreign_key_checks = 0")
+    connector.disconnect()
+
+    assert facade.closed == ["conn-1"]
+    connector.connect()
+    assert connector.connection_id == "conn-2"
+
+
+def test_cancelled_lease_is_closed_and_late_cancel_skips_the_next_holder():
+    facade = _PoolFacade()
+    facade.cancelled = []
+    facade.cancel_query = lambda connection_id: facade.cancelled.append(connection_id) or True
+    pool = DbConnectionPool()
+    connector = _pooled_connector(facade, pool)
+    connector.connect()
+    stale = connector.connection
+
+    assert connector.cancel_running_query() is True
+    connector.disconnect()
+    assert facade.closed == ["conn-1"]
+
+    # A cancel through the released wrapper never reaches whoever holds the lease next.
+    other = _pooled_connector(facade, pool)
+    other.connect()
+    assert stale.cancel_running_query() is False
+    assert facade.cancelled == ["conn-1"]
+
+
+def test_pool_expires_idle_connections_and_replaces_dead_ones():
+    clock = _Clock()
+    facade = _PoolFacade()
+    pool = DbConnectionPool(DbConnectionPoolConfig(idle_timeout=60.0, validate_after=10.0), clock=clock)
+    endpoint = DbEndpoint("mysql", "127.0.0.1", 3306, "root", "pw", "app")
+
+    pool.release(facade, endpoint, pool.acquire(facade, endpoint))
+    clock.now += 5
+    assert pool.acquire(facade, endpoint) == "conn-1"
+    assert facade.executed == []
+
+    pool.release(facade, endpoint, "conn-1")
+    clock.now += 30
+    facade.failing_sql.add("SELECT 1")
+    assert pool.acquire(facade, endpoint) == "conn-2"
+    assert facade.closed == ["conn-1"]
+
+    pool.release(facade, endpoint, "conn-2")
+    clock.now += 61
+    assert pool.acquire(facade, endpoint) == "conn-3"
+    assert facade.closed == ["conn-1", "conn-2"]
+
+
+def test_pool_drops_idle_ids_from_before_a_core_restart_without_touching_them():
+    facade = _PoolFacade()
+    pool = DbConnectionPool()
+    endpoint = DbEndpoint("mysql", "127.0.0.1", 3306, "root", "pw", "app")
+    other = DbEndpoint("mysql", "127.0.0.1", 3307, "root", "pw", "app")
+
+    pool.release(facade, endpoint, pool.acquire(facade, endpoint))
+    pool.release(facade, other, pool.acquire(facade, other))
+    facade.generation += 1
+
+    assert pool.acquire(facade, endpoint) == "conn-3"
+    assert facade.executed == []
+    assert facade.closed == []
+    assert pool.stats()["idle"] == 0
+    assert pool.stats()["discarded"] == 2
+
+    pool.release(facade, endpoint, "conn-3")
+    assert pool.acquire(facade, endpoint) == "conn-3"
+
+    # A lease that outlived the restart is forgotten on release, not pooled or closed.
+    facade.generation += 1
+    pool.release(facade, endpoint, "conn-3")
+    assert facade.closed == []
+    assert pool.stats()["idle"] == 0
+    assert pool.acquire(facade, endpoint) == "conn-4"
+
+
+def test_facade_core_generation_follows_worker_restarts():
+    class Client:
+        restarts = 0
+
+        def stats(self):
+            return {"restarts": self.restarts}
+
+    client = Client()
+    facade = DbCoreFacade(client)
+    assert facade.core_generation() == 0
+    client.restarts = 1
+    assert facade.core_generation() == 1
+
+
+def test_pool_closes_overflow_leases_beyond_max_size():
+    facade = _PoolFacade()
+    pool = DbConnectionPool(DbConnectionPoolConfig(max_size=1))
+    endpoint = DbEndpoint("mysql", "127.0.0.1", 3306, "root", "pw", "app")
+
+    first = pool.acquire(facade, endpoint)
+    second = pool.acquire(facade, endpoint)
+    pool.release(facade, endpoint, second)
+    pool.release(facade, endpoint, first)
+
+    assert facade.closed == [second]
+    assert pool.stats()["overflow"] == 1
+    assert pool.acquire(facade, endpoint) == first
+
+
+class _BatchFacade:
+    def __init__(self, errors=()):
+        self.errors = list(errors)
+        self.batches = []
+
+    def supports_command(self, command):
+        return command == "query.execute_batch"
+
+    def execute_batch(self, connection_id, sql=None, params=None, statements=None,
+                      transaction=True, stop_on_error=True):
+        self.batches.append({
+            "sql": sql, "params": params, "statements": statements,
+            "transaction": transaction, "stop_on_error": stop_on_error,
+        })
+        count = len(statements if statements is not None else params)
+        return {
+            "rows_affected": [1] * count,
+            "total_rows_affected": count,
+            "errors": self.errors,
+            "committed": transaction and not self.errors,
+            "rewritten": False,
+        }
+
+
+def test_facade_execute_batch_sends_template_and_parameter_matrix():
+    process = FakeProcess([
+        '{"event":"result","command":"query.execute_batch","success":true,"rows_affected":[1,1],'
+        '"total_rows_affected":2,"errors":[],"committed":true,"rewritten":true}',
+    ])
+    client = DbCoreServiceClient(
+        executable="fake-core",
+        popen_factory=lambda *args, **kwargs: process,
+    )
+
+    result = DbCoreFacade(client).execute_batch(
+        "conn-1", sql="INSERT INTO t (id) VALUES (%s)", params=[(1,), (2,)],
+    )
+
+    sent = json.loads(process.stdin.getvalue().strip())
+    assert sent["command"] == "query.execute_batch"
+    assert sent["payload"] == {
+        "connection_id": "conn-1",
+        "transaction": True,
+        "stop_on_error": True,
+        "sql": "INSERT INTO t (id) VALUES (%s)",
+        "params": [[1], [2]],
+    }
+    assert result["rows_affected"] == [1, 1]
+    assert result["rewritten"] is True
+
+
+def test_executemany_uses_one_batch_and_joins_open_transaction():
+    facade = _BatchFacade()
+    connection = _cursor_connection(facade)
+
+    with connection.cursor() as cursor:
+        assert cursor.executemany("INSERT INTO t (id) VALUES (%s)", [(1,), (2,), (3,)]) == 3
+    connection._in_transaction = True
+    with connection.cursor() as cursor:
+        cursor.executemany("UPDATE t SET n = %s WHERE id = %s", [("a", 1)])
+
+    assert [batch["transaction"] for batch in facade.batches] == [True, False]
+    assert facade.batches[0]["params"] == [[1], [2], [3]]
+
+
+def test_executemany_raises_first_failed_row_and_execute_batch_reports_all():
+    errors = [{"index": 1, "message": "Duplicate entry"}]
+    cursor = _cursor_connection(_BatchFacade(errors=errors)).cursor()
+
+    with pytest.raises(DbCoreServiceError, match="row 1: Duplicate entry"):
+        cursor.executemany("INSERT INTO t (id) VALUES (%s)", [(1,), (1,)])
+
+    result = cursor.execute_batch([("UPDATE t SET n = 1 WHERE id = %s", [1])], stop_on_error=False)
+    assert result["errors"] == errors
+
+
+# =====================================================================
+# prepared statement 캐시 (query.execute prepare)
+# =====================================================================
+def test_cursor_prepares_only_parameterized_statements_on_supporting_core():
+    process = FakeProcess([
+        '{"event":"result","command":"service.hello","success":true,"prepared_statements":true}',
+        '{"event":"result","command":"query.execute","success":true,"columns":["id"],'
+        '"rows":[{"id":"7"}],"rows_affected":0,"prepared":true,"statement_id":"stmt-1",'
+        '"statement_cache_hit":false}',
+        '{"event":"result","command":"query.execute","success":true,"columns":["n"],'
+        '"rows":[{"n":"1"}],"rows_affected":0}',
+    ])
+    client = DbCoreServiceClient(
+        executable="fake-core",
+        popen_factory=lambda *args, **kwargs: process,
+    )
+    endpoint = DbEndpoint("mysql", "127.0.0.1", 3306, "root", "pw", "app")
+    connection = RustDbConnection(endpoint, DbCoreFacade(client), "conn-1")
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT id FROM users WHERE id = %s", (7,))
+        assert cursor.fetchall() == [{"id": "7"}]
+        cursor.execute("SELECT 1 AS n")
+
+    sent = [json.loads(line) for line in process.stdin.getvalue().splitlines()]
+    assert [item["command"] for item in sent] == ["service.hello", "query.execute", "query.execute"]
+    assert sent[1]["payload"]["prepare"] is True
+    assert sent[1]["payload"]["params"] == [7]
+    assert "prepare" not in sent[2]["payload"]
+
+
+def test_facade_reports_statement_handle_and_skips_prepare_without_core_support():
+    process = FakeProcess([
+        '{"event":"result","command":"service.hello","success":true,"prepared_statements":true}',
+        '{"event":"result","command":"query.execute","success":true,"columns":[],"rows":[],'
+        '"rows_affected":1,"prepared":true,"statement_id":"stmt-ab","statement_cache_hit":true}',
+    ])
+    facade = DbCoreFacade(DbCoreServiceClient(
+        executable="fake-core",
+        popen_factory=lambda *args, **kwargs: process,
+    ))
+
+    result = facade.execute_on_connection_result(
+        "conn-1", "UPDATE t SET n = %s WHERE id = %s", params=["x", 1], prepare=True,
+    )
+
+    assert result["statement_id"] == "stmt-ab"
+    assert result["statement_cache_hit"] is True
+    assert result["rows_affected"] == 1
+
+    legacy = FakeProcess([
+        '{"event":"result","command":"service.hello","success":true}',
+        '{"event":"result","command":"query.execute","success":true,"columns":[],"rows":[],"rows_affected":1}',
+    ])
+    legacy_facade = DbCoreFacade(DbCoreServiceClient(
+        executable="fake-core",
+        popen_factory=lambda *args, **kwargs: legacy,
+    ))
+    result = legacy_facade.execute_on_connection_result(
+        "conn-1", "UPDATE t SET n = %s WHERE id = %s", params=["x", 1], prepare=True,
+    )
+
+    sent = [json.loads(line) for line in legacy.stdin.getvalue().splitlines()]
+    assert "prepare" not in sent[1]["payload"]
+    assert "statement_id" not in result
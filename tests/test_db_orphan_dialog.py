@@ -23,7 +23,7 @@ def test_orphan_analysis_worker_emits_results_without_gui_thread_process_events(
         def __init__(self, connector):
             self.connector = connector
 
-        def find_orphan_records(self, schema, progress_callback=None):
+        def find_orphan_records(self, schema, progress_callback=None, is_cancelled=None):
             if progress_callback:
                 progress_callback("검사 중...")
             return fake_results
@@ -55,6 +55,7 @@ def test_orphan_dialog_start_analysis_starts_worker_and_disables_reentrant_actio
         progress = FakeSignal()
         analysis_finished = FakeSignal()
         failed = FakeSignal()
+        cancelled = FakeSignal()
         finished = FakeSignal()
 
         def __init__(self, connector, schema):
@@ -82,6 +82,29 @@ def test_find_orphan_records_uses_shared_join_fragment_for_count_and_sample():
     assert "LIMIT" not in count_query
 
 
+def test_find_orphan_records_stops_before_next_fk_when_cancelled():
+    """is_cancelled가 True를 반환하면 남은 FK의 COUNT 쿼리를 실행하지 않는다."""
+    from src.core.foreign_key_resolver import ForeignKeyResolver
+
+    mock_connector = MagicMock()
+    mock_connector.execute.side_effect = [
+        [{'TABLE_NAME': 'posts', 'COLUMN_NAME': 'user_id',
+          'REFERENCED_TABLE_NAME': 'users', 'REFERENCED_COLUMN_NAME': 'id',
+          'CONSTRAINT_NAME': 'fk_posts_users'},
+         {'TABLE_NAME': 'comments', 'COLUMN_NAME': 'post_id',
+          'REFERENCED_TABLE_NAME': 'posts', 'REFERENCED_COLUMN_NAME': 'id',
+          'CONSTRAINT_NAME': 'fk_comments_posts'}],
+        [{'cnt': 0}],
+    ]
+    checks = iter([False, True])
+
+    resolver = ForeignKeyResolver(mock_connector)
+    results = resolver.find_orphan_records('blog', is_cancelled=lambda: next(checks))
+
+    assert results == []
+    assert mock_connector.execute.call_count == 2
+
+
 def test_get_all_orphan_queries_contains_fk_relation_alias():
     """get_all_orphan_queries가 각 FK별로 집계 쿼리를 생성한다."""
     from src.core.foreign_key_resolver import ForeignKeyResolver
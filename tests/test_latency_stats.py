@@ -0,0 +1,70 @@
+"""
+LatencyStats 링 버퍼 / 요약 테스트
+"""
+import json
+
+import pytest
+
+from src.core.latency_stats import LatencyStats, percentile
+
+
+def test_ring_buffer_keeps_only_the_newest_samples():
+    stats = LatencyStats(capacity=4, clock=lambda: 0.0)
+    for value in range(1, 7):
+        stats.record(float(value))
+
+    assert len(stats) == 4
+    assert stats.recent_latencies() == [3.0, 4.0, 5.0, 6.0]
+    assert stats.recent_latencies(2) == [5.0, 6.0]
+    assert stats.total_samples == 6
+
+
+def test_summary_reports_percentiles_jitter_and_failure_rate():
+    stats = LatencyStats(capacity=200)
+    for index in range(100):
+        stats.record(float(index + 1), at=float(index))
+    stats.record(-1, at=100.0)
+
+    summary = stats.summary()
+
+    assert summary.samples == 101
+    assert summary.failures == 1
+    assert summary.failure_rate == pytest.approx(1 / 101)
+    assert summary.p50_ms == pytest.approx(50.5)
+    assert summary.p95_ms == pytest.approx(95.05)
+    assert summary.p99_ms == pytest.approx(99.01)
+    assert summary.jitter_ms == pytest.approx(1.0)
+    assert summary.max_ms == 100.0
+
+
+def test_summary_window_only_counts_recent_samples():
+    stats = LatencyStats(capacity=16)
+    stats.record(500.0, at=0.0)  # 오래된 스파이크
+    stats.record(-1, at=1.0)
+    for at in (100.0, 101.0, 102.0):
+        stats.record(10.0, at=at)
+
+    recent = stats.summary(window_seconds=10, now=105.0)
+    everything = stats.summary(now=105.0)
+
+    assert recent.samples == 3 and recent.failures == 0
+    assert recent.p99_ms == 10.0
+    assert everything.max_ms == 500.0
+    assert everything.failures == 1
+
+
+def test_summary_without_successful_samples_has_no_percentiles():
+    stats = LatencyStats()
+    stats.record(-1)
+
+    summary = stats.summary()
+
+    assert summary.failure_rate == 1.0
+    assert summary.p50_ms is None and summary.jitter_ms is None
+    json.dumps(summary.to_dict())
+
+
+def test_percentile_interpolates_between_ranks():
+    assert percentile([], 0.5) is None
+    assert percentile([10.0], 0.99) == 10.0
+    assert percentile([0.0, 10.0], 0.25) == 2.5
@@ -0,0 +1,136 @@
+"""
+migration_analysis_cache.py 단위 테스트
+
+테이블 지문, 캐시 직렬화와, 재분석 시 지문이 바뀐 테이블/FK 만 다시 스캔하고
+나머지는 캐시 결과를 재사용하는지 검증합니다.
+"""
+from src.core.migration_analysis_cache import (
+    ANALYSIS_CACHE_VERSION,
+    AnalysisCache,
+    table_fingerprints,
+)
+from src.core.migration_analysis_models import SchemaCheckOptions
+from src.core.migration_analyzer import MigrationAnalyzer
+from src.core.migration_constants import IssueType
+from src.core.migration_schema_catalog import SchemaCatalogSnapshot
+from tests.conftest import FakeMySQLConnector
+
+ORPHAN_STEP = "고아 레코드 검사"
+DATE_STEP = "0000-00-00 날짜값 검사..."
+
+
+def _tables(users_updated="2026-10-01 10:00:00", orders_updated="2026-10-01 10:00:00"):
+    return [
+        {'TABLE_NAME': 'orders', 'TABLE_TYPE': 'BASE TABLE', 'ENGINE': 'InnoDB',
+         'TABLE_ROWS': 10, 'UPDATE_TIME': orders_updated},
+        {'TABLE_NAME': 'users', 'TABLE_TYPE': 'BASE TABLE', 'ENGINE': 'InnoDB',
+         'TABLE_ROWS': 5, 'UPDATE_TIME': users_updated},
+    ]
+
+
+def _connector(**table_kwargs) -> FakeMySQLConnector:
+    connector = FakeMySQLConnector()
+    connector.query_results = {
+        'FROM INFORMATION_SCHEMA.TABLES': _tables(**table_kwargs),
+        'FROM INFORMATION_SCHEMA.COLUMNS': [
+            {'TABLE_NAME': 'orders', 'COLUMN_NAME': 'shipped', 'DATA_TYPE': 'date', 'COLUMN_TYPE': 'date'},
+            {'TABLE_NAME': 'users', 'COLUMN_NAME': 'born', 'DATA_TYPE': 'date', 'COLUMN_TYPE': 'date'},
+        ],
+        'REFERENTIAL_CONSTRAINTS': [
+            {'CONSTRAINT_NAME': 'fk_orders_user', 'CHILD_TABLE': 'orders', 'CHILD_COLUMN': 'user_id',
+             'PARENT_TABLE': 'users', 'PARENT_COLUMN': 'id', 'DELETE_RULE': 'CASCADE', 'UPDATE_RULE': 'RESTRICT'},
+        ],
+        'MONTH(': [{'shipped': 3, 'born': 3}],
+        'as orphan_value': [{'orphan_value': 7}],
+        'LEFT JOIN': [{'cnt': 2}],
+    }
+    return connector
+
+
+def _analyze(connector, cache):
+    analyzer = MigrationAnalyzer(connector)
+    analyzer.set_analysis_cache(cache)
+    options = SchemaCheckOptions(**{
+        name: name in ('check_orphans', 'check_invalid_dates')
+        for name in SchemaCheckOptions.__dataclass_fields__
+    })
+    return analyzer._analyze_schema_impl('shop', options)
+
+
+def _data_scans(connector):
+    return [q for q, _ in connector.executed_queries if 'MONTH(' in q or 'LEFT JOIN' in q]
+
+
+class TestTableFingerprints:
+    def test_fingerprint_changes_only_for_modified_table(self):
+        before = table_fingerprints(SchemaCatalogSnapshot('shop', tables=_tables()))
+        after = table_fingerprints(SchemaCatalogSnapshot('shop', tables=_tables(users_updated="2026-10-02")))
+
+        assert before['orders'] == after['orders']
+        assert before['users'] != after['users']
+
+    def test_cache_from_other_version_or_server_is_empty(self):
+        cache = AnalysisCache('shop', 'db:3306')
+        cache.store('invalid_dates', 'users', 'abc', [])
+        data = cache.to_dict()
+
+        assert AnalysisCache.from_dict(data, 'shop', 'db:3306').lookup('invalid_dates', 'users', 'abc') == []
+        assert AnalysisCache.from_dict(data, 'shop', 'other:3306').lookup('invalid_dates', 'users', 'abc') is None
+        data['version'] = ANALYSIS_CACHE_VERSION + 1
+        assert AnalysisCache.from_dict(data, 'shop', 'db:3306').lookup('invalid_dates', 'users', 'abc') is None
+
+
+class TestIncrementalAnalysis:
+    def test_unchanged_schema_reuses_every_data_scan(self):
+        cache = AnalysisCache('shop')
+        first_connector = _connector()
+        first = _analyze(first_connector, cache)
+
+        second_connector = _connector()
+        second = _analyze(second_connector, cache)
+
+        assert len(_data_scans(first_connector)) > 0
+        assert _data_scans(second_connector) == []
+        assert second.orphan_records == first.orphan_records
+        assert second.compatibility_issues == first.compatibility_issues
+        assert second.reused_results == {
+            ORPHAN_STEP: ['orders.user_id->users.id'],
+            DATE_STEP: ['orders', 'users'],
+        }
+        assert first.reused_results == {}
+
+    def test_changed_table_is_rescanned_with_its_foreign_keys(self):
+        cache = AnalysisCache('shop')
+        _analyze(_connector(), cache)
+
+        connector = _connector(users_updated="2026-10-02 09:00:00")
+        result = _analyze(connector, cache)
+
+        date_scans = [q for q in _data_scans(connector) if 'MONTH(' in q]
+        assert len(date_scans) == 1 and '`shop`.`users`' in date_scans[0]
+        # 부모 테이블이 바뀌었으니 FK 고아 검사도 다시 돈다
+        assert any('LEFT JOIN' in q for q in _data_scans(connector))
+        assert result.reused_results == {DATE_STEP: ['orders']}
+        assert [i.table_name for i in result.compatibility_issues
+                if i.issue_type == IssueType.INVALID_DATE] == ['orders', 'users']
+
+    def test_failed_table_scan_is_not_cached(self):
+        cache = AnalysisCache('shop')
+        connector = _connector()
+        connector.fail_on = {'FROM `shop`.`users`': RuntimeError('denied')}
+        _analyze(connector, cache)
+
+        connector = _connector()
+        result = _analyze(connector, cache)
+
+        assert result.reused_results[DATE_STEP] == ['orders']
+        assert any('`shop`.`users`' in q and 'MONTH(' in q for q in _data_scans(connector))
+
+    def test_cache_for_another_schema_is_ignored(self):
+        cache = AnalysisCache('other')
+        connector = _connector()
+
+        result = _analyze(connector, cache)
+
+        assert result.reused_results == {}
+        assert cache.to_dict()['entries'] == {}
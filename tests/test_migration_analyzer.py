@@ -6,6 +6,7 @@ DB 없이 FakeMySQLConnector로 동작을 검증합니다.
 """
 import pytest
 import os
+import time
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch, call
@@ -21,7 +22,9 @@ from src.core.migration_analyzer import (
     ActionType,
     ForeignKeyInfo,
     SchemaCheckOptions,
+    DataScanLimits,
 )
+from src.core.migration_schema_catalog import SchemaCatalogSnapshot
 from tests.conftest import FakeMySQLConnector
 
 
@@ -421,11 +424,13 @@ class TestCheckIntDisplayWidth:
             check_int_display_width=enabled,
         )
 
+    # 파이프라인은 카탈로그 스냅샷의 벌크 COLUMNS 조회 결과를 걸러 쓴다
+    CATALOG_COLUMNS_QUERY_KEY = "FROM INFORMATION_SCHEMA.COLUMNS"
+
     def test_wired_into_pipeline_when_enabled(self, fake_connector):
-        fake_connector._tables = {"test_db": []}
         fake_connector.query_results = {
-            self.INT_DISPLAY_WIDTH_QUERY_KEY: [
-                {'TABLE_NAME': 'users', 'COLUMN_NAME': 'age', 'COLUMN_TYPE': 'int(11)'}
+            self.CATALOG_COLUMNS_QUERY_KEY: [
+                {'TABLE_NAME': 'users', 'COLUMN_NAME': 'age', 'DATA_TYPE': 'int', 'COLUMN_TYPE': 'int(11)'}
             ],
         }
         analyzer = MigrationAnalyzer(fake_connector)
@@ -434,10 +439,9 @@ class TestCheckIntDisplayWidth:
         assert len(int_issues) == 1
 
     def test_not_run_in_pipeline_when_disabled(self, fake_connector):
-        fake_connector._tables = {"test_db": []}
         fake_connector.query_results = {
-            self.INT_DISPLAY_WIDTH_QUERY_KEY: [
-                {'TABLE_NAME': 'users', 'COLUMN_NAME': 'age', 'COLUMN_TYPE': 'int(11)'}
+            self.CATALOG_COLUMNS_QUERY_KEY: [
+                {'TABLE_NAME': 'users', 'COLUMN_NAME': 'age', 'DATA_TYPE': 'int', 'COLUMN_TYPE': 'int(11)'}
             ],
         }
         analyzer = MigrationAnalyzer(fake_connector)
@@ -452,7 +456,7 @@ class TestCheckInvalidDateValues:
             "DATA_TYPE": [
                 {'TABLE_NAME': 'orders', 'COLUMN_NAME': 'created', 'DATA_TYPE': 'date', 'COLUMN_DEFAULT': None}
             ],
-            "'0000-00-00'": [{'cnt': 10}],
+            "'0000-00-00'": [{'created': 10}],
         }
         analyzer = MigrationAnalyzer(fake_connector)
         issues = analyzer.check_invalid_date_values("test_db")
@@ -470,6 +474,114 @@ class TestCheckInvalidDateValues:
         issues = analyzer.check_invalid_date_values("test_db")
         assert len(issues) == 0  # 실패 시 skip
 
+    @staticmethod
+    def _date_columns():
+        return [
+            {'TABLE_NAME': 'orders', 'COLUMN_NAME': 'created', 'DATA_TYPE': 'date'},
+            {'TABLE_NAME': 'orders', 'COLUMN_NAME': 'shipped', 'DATA_TYPE': 'datetime'},
+            {'TABLE_NAME': 'users', 'COLUMN_NAME': 'born', 'DATA_TYPE': 'date'},
+        ]
+
+    @staticmethod
+    def _scans(connector):
+        return [q for q, _ in connector.executed_queries if 'SUM(CASE' in q]
+
+    def test_scans_each_table_once_for_all_date_columns(self, fake_connector):
+        fake_connector.query_results = {
+            "DATA_TYPE": self._date_columns(),
+            "SUM(CASE": [{'created': 4, 'shipped': 0, 'born': 1}],
+        }
+        analyzer = MigrationAnalyzer(fake_connector)
+
+        issues = analyzer.check_invalid_date_values("test_db")
+
+        scans = self._scans(fake_connector)
+        assert len(scans) == 2
+        assert '`created`' in scans[0] and '`shipped`' in scans[0]
+        assert [i.location for i in issues] == ['test_db.orders.created', 'test_db.users.born']
+        assert '4개' in issues[0].description
+
+    def test_sampling_reads_pk_ranges_of_large_tables(self, fake_connector):
+        catalog = SchemaCatalogSnapshot(
+            'test_db',
+            tables=[{'TABLE_NAME': 'orders', 'TABLE_TYPE': 'BASE TABLE', 'TABLE_ROWS': 5_000_000}],
+            columns=[
+                {'TABLE_NAME': 'orders', 'COLUMN_NAME': 'id', 'DATA_TYPE': 'bigint'},
+                {'TABLE_NAME': 'orders', 'COLUMN_NAME': 'created', 'DATA_TYPE': 'date'},
+            ],
+            indexes=[{'TABLE_NAME': 'orders', 'INDEX_NAME': 'PRIMARY', 'SEQ_IN_INDEX': 1, 'COLUMN_NAME': 'id'}],
+        )
+        fake_connector.query_results = {
+            "MIN(`id`)": [{'lo': 1, 'hi': 5_000_000}],
+            "SUM(CASE": [{'created': 2}],
+        }
+        analyzer = MigrationAnalyzer(fake_connector)
+        analyzer._compat.catalog = catalog
+        analyzer.set_scan_limits(DataScanLimits(sample_rows=80_000))
+
+        issues = analyzer.check_invalid_date_values("test_db")
+
+        scan = self._scans(fake_connector)[0]
+        assert scan.count('BETWEEN') == 8
+        assert '`id` BETWEEN 1 AND 10000' in scan
+        assert '샘플링' in issues[0].description
+
+    def test_sampling_without_primary_key_limits_rows(self, fake_connector):
+        fake_connector.query_results = {"DATA_TYPE": self._date_columns()[:1]}
+        analyzer = MigrationAnalyzer(fake_connector)
+        analyzer.set_scan_limits(DataScanLimits(sample_rows=1000))
+
+        analyzer.check_invalid_date_values("test_db")
+
+        assert 'LIMIT 1000) AS sampled' in self._scans(fake_connector)[0]
+
+    def test_failed_sampling_bounds_skip_only_that_table(self, fake_connector):
+        catalog = SchemaCatalogSnapshot(
+            'test_db',
+            tables=[
+                {'TABLE_NAME': 'orders', 'TABLE_TYPE': 'BASE TABLE', 'TABLE_ROWS': 5_000_000},
+                {'TABLE_NAME': 'users', 'TABLE_TYPE': 'BASE TABLE', 'TABLE_ROWS': 10},
+            ],
+            columns=[
+                {'TABLE_NAME': 'orders', 'COLUMN_NAME': 'id', 'DATA_TYPE': 'bigint'},
+                {'TABLE_NAME': 'orders', 'COLUMN_NAME': 'created', 'DATA_TYPE': 'date'},
+                {'TABLE_NAME': 'users', 'COLUMN_NAME': 'born', 'DATA_TYPE': 'date'},
+            ],
+            indexes=[{'TABLE_NAME': 'orders', 'INDEX_NAME': 'PRIMARY', 'SEQ_IN_INDEX': 1, 'COLUMN_NAME': 'id'}],
+        )
+        fake_connector.query_results = {"SUM(CASE": [{'born': 1}]}
+        fake_connector.fail_on = {"MIN(`id`)": Exception("denied")}
+        analyzer = MigrationAnalyzer(fake_connector)
+        analyzer._compat.catalog = catalog
+        analyzer.set_scan_limits(DataScanLimits(sample_rows=1000))
+        skipped = []
+
+        issues = analyzer._compat.check_invalid_date_values("test_db", skipped=skipped)
+
+        assert skipped == ['orders']
+        assert [i.location for i in issues] == ['test_db.users.born']
+
+    def test_table_over_time_budget_is_reported_incomplete(self):
+        class SlowConnector(FakeMySQLConnector):
+            def execute(self, query, params=None):
+                result = super().execute(query, params)
+                if 'MAX_EXECUTION_TIME(50)' in query:
+                    time.sleep(0.06)
+                    return []  # 서버가 중단한 쿼리는 빈 결과
+                return result
+
+        connector = SlowConnector()
+        connector.query_results = {"DATA_TYPE": self._date_columns()[:1]}
+        analyzer = MigrationAnalyzer(connector)
+        analyzer.set_scan_limits(DataScanLimits(table_time_budget=0.05))
+        skipped = []
+
+        issues = analyzer._compat.check_invalid_date_values("test_db", skipped=skipped)
+
+        assert skipped == ['orders']
+        assert [(i.severity, i.location) for i in issues] == [('info', 'test_db')]
+        assert 'orders' in issues[0].description
+
 
 # ============================================================
 # CleanupAction / Orphan 테스트
@@ -0,0 +1,237 @@
+"""
+migration_check_executor.py 단위 테스트
+
+데이터 스캔 스텝의 병렬 실행, 서버별 동시 실행 상한, 스텝 순서대로의 로그 출력,
+예외/취소 처리와 분석기 연동을 검증합니다.
+"""
+import threading
+import time
+import uuid
+
+import pytest
+
+from src.core.migration_analysis_models import SchemaCheckOptions
+from src.core.migration_analyzer import MigrationAnalyzer
+from src.core.migration_check_executor import CheckExecutor, CheckStep
+from src.core.migration_rules import DataIntegrityRules
+from tests.conftest import FakeMySQLConnector
+
+
+class _Conn:
+    """풀 커넥터 대역 (서버 키는 host/port)"""
+
+    def __init__(self, host, name):
+        self.host = host
+        self.port = 3306
+        self.name = name
+        self.disconnected = False
+        self.cancelled = False
+
+    def disconnect(self):
+        self.disconnected = True
+
+    def cancel_running_query(self):
+        self.cancelled = True
+        return True
+
+
+def _factory(host, opened):
+    def open_conn():
+        conn = _Conn(host, f"pool-{len(opened)}")
+        opened.append(conn)
+        return conn
+    return open_conn
+
+
+class _PoolFakeConnector(FakeMySQLConnector):
+    def __init__(self):
+        super().__init__()
+        self.disconnected = False
+
+    def disconnect(self):
+        self.disconnected = True
+
+
+def _host() -> str:
+    # 서버별 세마포어는 프로세스 전역이라 테스트마다 다른 서버 키를 쓴다
+    return f"db-{uuid.uuid4().hex}"
+
+
+class TestCheckExecutor:
+    def test_without_factory_runs_everything_on_main_connector_in_order(self):
+        main = _Conn(_host(), 'main')
+        seen = []
+        steps = [
+            CheckStep('a', lambda conn, log: seen.append(('a', conn.name)) or 1),
+            CheckStep('b', lambda conn, log: seen.append(('b', conn.name)) or 2, scans_data=True),
+        ]
+
+        outcomes = CheckExecutor(main).run(steps)
+
+        assert seen == [('a', 'main'), ('b', 'main')]
+        assert [o.result for o in outcomes] == [1, 2]
+
+    def test_data_steps_run_concurrently_on_pool_connectors(self):
+        host = _host()
+        opened = []
+        barrier = threading.Barrier(2, timeout=5)
+
+        def scan(conn, log):
+            barrier.wait()
+            return conn.name
+
+        steps = [CheckStep('x', scan, scans_data=True), CheckStep('y', scan, scans_data=True)]
+        outcomes = CheckExecutor(_Conn(host, 'main'), _factory(host, opened)).run(steps)
+
+        assert sorted(o.result for o in outcomes) == ['pool-0', 'pool-1']
+        assert all(conn.disconnected for conn in opened)
+
+    def test_per_server_limit_caps_concurrent_scans(self):
+        host = _host()
+        opened = []
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def scan(conn, log):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+
+        steps = [CheckStep(str(i), scan, scans_data=True) for i in range(4)]
+        CheckExecutor(_Conn(host, 'main'), _factory(host, opened), max_workers=4, per_server_limit=2).run(steps)
+
+        assert len(opened) == 2
+        assert max(peak) <= 2
+
+    def test_logs_are_emitted_in_step_order(self):
+        host = _host()
+        messages = []
+        release_first = threading.Event()
+
+        def slow(conn, log):
+            log('first: start')
+            release_first.wait(5)
+            log('first: end')
+
+        def fast(conn, log):
+            log('second: start')
+            release_first.set()
+            log('second: end')
+
+        steps = [CheckStep('1', slow, scans_data=True), CheckStep('2', fast, scans_data=True)]
+        CheckExecutor(_Conn(host, 'main'), _factory(host, []), log=messages.append).run(steps)
+
+        assert messages == ['first: start', 'first: end', 'second: start', 'second: end']
+
+    def test_error_is_raised_after_pool_is_closed(self):
+        host = _host()
+        opened = []
+
+        def boom(conn, log):
+            raise RuntimeError('scan failed')
+
+        steps = [CheckStep('ok', lambda conn, log: None), CheckStep('bad', boom, scans_data=True)]
+        with pytest.raises(RuntimeError, match='scan failed'):
+            CheckExecutor(_Conn(host, 'main'), _factory(host, opened)).run(steps)
+        assert opened and all(conn.disconnected for conn in opened)
+
+    def test_cancel_skips_queued_steps_and_stops_running_queries(self):
+        host = _host()
+        opened = []
+        cancelled = threading.Event()
+
+        def scan(conn, log):
+            cancelled.set()
+            time.sleep(0.5)
+            return 'done'
+
+        steps = [
+            CheckStep('scan', scan, scans_data=True),
+            CheckStep('queued', lambda conn, log: 'queued', scans_data=True),
+        ]
+        executor = CheckExecutor(
+            _Conn(host, 'main'), _factory(host, opened), is_cancelled=cancelled.is_set, max_workers=1
+        )
+
+        outcomes = executor.run(steps)
+
+        assert outcomes[0].result == 'done'
+        assert outcomes[1].skipped and outcomes[1].result is None
+        assert opened[0].cancelled
+
+    @pytest.mark.parametrize('limit', [1, 2])
+    def test_nested_executor_shares_the_outer_server_budget(self, limit):
+        host = _host()
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def scan(conn, log):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.03)
+            with lock:
+                active.pop()
+            return 1
+
+        def nested(conn, log):
+            inner = CheckExecutor(conn, _factory(host, []), max_workers=3, per_server_limit=limit)
+            return sum(o.result for o in inner.run([CheckStep(str(i), scan, scans_data=True) for i in range(4)]))
+
+        steps = [CheckStep('nested', nested, scans_data=True), CheckStep('plain', scan, scans_data=True)]
+        outcomes = CheckExecutor(
+            _Conn(host, 'main'), _factory(host, []), max_workers=3, per_server_limit=limit
+        ).run(steps)
+
+        # 바깥 스텝이 슬롯을 넘겨주므로 상한 1 에서도 멈추지 않고, 동시 스캔은 상한 이하
+        assert [o.result for o in outcomes] == [4, 1]
+        assert max(peak) <= limit
+
+
+class TestAnalyzerIntegration:
+    def test_invalid_date_scan_uses_factory_connector_and_records_timings(self):
+        connector = FakeMySQLConnector()
+        opened = []
+
+        def factory():
+            conn = _PoolFakeConnector()
+            opened.append(conn)
+            return conn
+
+        analyzer = MigrationAnalyzer(connector, connector_factory=factory)
+        options = SchemaCheckOptions(check_sql_mode=False, check_auth_plugins=False)
+
+        result = analyzer._analyze_schema_impl('shop', options)
+
+        assert len(opened) == 1 and opened[0].disconnected
+        assert "0000-00-00 날짜값 검사..." in result.check_timings
+        assert "문자셋 이슈 검사..." in result.check_timings
+
+    def test_rules_accept_executor(self):
+        connector = FakeMySQLConnector()
+        connector.query_results = {
+            'FROM INFORMATION_SCHEMA.COLUMNS': [
+                {'TABLE_NAME': 'users', 'COLUMN_NAME': 'code', 'COLUMN_TYPE': 'int(5) zerofill'},
+            ],
+            'AS sampled': [{'code': 1}],
+        }
+        opened = []
+
+        def factory():
+            conn = _PoolFakeConnector()
+            conn.query_results = connector.query_results
+            opened.append(conn)
+            return conn
+
+        rules = DataIntegrityRules(connector)
+        issues = rules.check_all_live_db('shop', CheckExecutor(connector, factory))
+
+        assert [i.location for i in issues] == ['shop.users.code']
+        # 데이터 스캔 규칙만 추가 연결에서 실행된다
+        assert opened and all(conn.executed_queries for conn in opened)
+        assert all(conn.disconnected for conn in opened)
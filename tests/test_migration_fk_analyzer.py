@@ -0,0 +1,193 @@
+"""
+migration_fk_analyzer.py 단위 테스트
+
+고아 레코드 탐지의 행 수 일괄 조회, 큰 자식 테이블의 PK 범위 청크 분할과
+병렬 실행, FK 당 시간 예산에 따른 "최소 N개" 부분 결과를 검증합니다.
+"""
+import time
+
+from src.core.migration_analysis_models import DataScanLimits
+from src.core.migration_fk_analyzer import ForeignKeyAnalyzer
+from src.core.migration_schema_catalog import SchemaCatalogSnapshot
+from tests.conftest import FakeMySQLConnector
+
+_FK = {'CONSTRAINT_NAME': 'fk_orders_user', 'CHILD_TABLE': 'orders', 'CHILD_COLUMN': 'user_id',
+       'PARENT_TABLE': 'users', 'PARENT_COLUMN': 'id', 'DELETE_RULE': 'CASCADE', 'UPDATE_RULE': 'RESTRICT'}
+
+
+def _catalog(order_rows=2_500_000) -> SchemaCatalogSnapshot:
+    return SchemaCatalogSnapshot(
+        'shop',
+        tables=[
+            {'TABLE_NAME': 'orders', 'TABLE_TYPE': 'BASE TABLE', 'TABLE_ROWS': order_rows},
+            {'TABLE_NAME': 'users', 'TABLE_TYPE': 'BASE TABLE', 'TABLE_ROWS': 1000},
+        ],
+        columns=[
+            {'TABLE_NAME': 'orders', 'COLUMN_NAME': 'id', 'DATA_TYPE': 'bigint', 'COLUMN_TYPE': 'bigint'},
+            {'TABLE_NAME': 'orders', 'COLUMN_NAME': 'user_id', 'DATA_TYPE': 'int', 'COLUMN_TYPE': 'int'},
+        ],
+        indexes=[{'TABLE_NAME': 'orders', 'INDEX_NAME': 'PRIMARY', 'SEQ_IN_INDEX': 1, 'COLUMN_NAME': 'id'}],
+        foreign_keys=[_FK],
+    )
+
+
+def _results():
+    return {
+        'as orphan_value': [{'orphan_value': 42}],
+        'COUNT(*) as cnt': [{'cnt': 2}],
+        'MIN(`id`)': [{'lo': 1, 'hi': 3000}],
+    }
+
+
+def _analyzer(connector, catalog=None, messages=None):
+    fk = ForeignKeyAnalyzer(connector, (messages if messages is not None else []).append)
+    fk.catalog = catalog
+    return fk
+
+
+class _PoolConnector(FakeMySQLConnector):
+    def __init__(self):
+        super().__init__()
+        self.query_results = _results()
+        self.disconnected = False
+
+    def disconnect(self):
+        self.disconnected = True
+
+
+class _BudgetConnector(FakeMySQLConnector):
+    """첫 청크 밖의 고아 검사는 오래 걸리다 서버가 중단(빈 결과)한 것처럼 동작"""
+
+    def __init__(self, delay):
+        super().__init__()
+        self.query_results = _results()
+        self.delay = delay
+
+    def execute(self, query, params=None):
+        if 'COUNT(*)' in query and 'BETWEEN 1 AND' not in query:
+            self.executed_queries.append((query, params))
+            time.sleep(self.delay)
+            return []
+        return super().execute(query, params)
+
+
+class TestOrphanRowCounts:
+    def test_row_counts_are_read_once_for_all_foreign_keys(self):
+        connector = FakeMySQLConnector()
+        connector.query_results = {
+            'REFERENTIAL_CONSTRAINTS': [_FK, dict(_FK, CONSTRAINT_NAME='fk_orders_seller', CHILD_COLUMN='seller_id')],
+            'FROM INFORMATION_SCHEMA.TABLES': [
+                {'TABLE_NAME': 'orders', 'TABLE_ROWS': 200_000},
+                {'TABLE_NAME': 'users', 'TABLE_ROWS': 10},
+            ],
+        }
+        messages = []
+
+        _analyzer(connector, messages=messages).find_orphan_records('shop')
+
+        table_queries = [(q, p) for q, p in connector.executed_queries if 'INFORMATION_SCHEMA.TABLES' in q]
+        assert len(table_queries) == 1 and table_queries[0][1] == ('shop',)
+        assert sum('[자식:200,000행, 부모:10행]' in m for m in messages) == 2
+
+
+class TestChunkedOrphanScan:
+    def test_large_child_table_is_counted_in_pk_range_chunks(self):
+        connector = FakeMySQLConnector()
+        connector.query_results = _results()
+        messages = []
+
+        orphans = _analyzer(connector, _catalog(), messages).find_orphan_records('shop')
+
+        count_queries = [q for q, _ in connector.executed_queries if 'COUNT(*)' in q]
+        assert len(count_queries) == 3
+        assert 'BETWEEN 1 AND 1000' in count_queries[0] and 'BETWEEN 2001 AND 3000' in count_queries[2]
+        assert [m.strip() for m in messages if '청크' in m and '고아' in m] == [
+            '청크 1/3 [1~1,000]: 고아 2개', '청크 2/3 [1,001~2,000]: 고아 2개', '청크 3/3 [2,001~3,000]: 고아 2개',
+        ]
+        assert orphans[0].orphan_count == 6 and not orphans[0].is_partial
+        # 샘플은 고아가 나온 첫 청크 구간에서만 뽑는다
+        sample_query = next(q for q, _ in connector.executed_queries if 'orphan_value' in q)
+        assert 'BETWEEN 1 AND 1000' in sample_query
+
+    def test_small_table_or_missing_integer_pk_is_not_chunked(self):
+        connector = FakeMySQLConnector()
+        connector.query_results = _results()
+
+        _analyzer(connector, _catalog(order_rows=900_000)).find_orphan_records('shop')
+
+        assert not any('BETWEEN' in q or 'MIN(' in q for q, _ in connector.executed_queries)
+
+    def test_chunks_run_on_factory_connections(self):
+        connector = FakeMySQLConnector()
+        connector.query_results = _results()
+        opened = []
+
+        def factory():
+            conn = _PoolConnector()
+            opened.append(conn)
+            return conn
+
+        fk = _analyzer(connector, _catalog())
+        fk.connector_factory = factory
+        orphans = fk.find_orphan_records('shop')
+
+        assert orphans[0].orphan_count == 6
+        assert opened and all(conn.disconnected for conn in opened)
+        pooled = [q for conn in opened for q, _ in conn.executed_queries]
+        assert sum('BETWEEN' in q for q in pooled) == 3
+        assert not any('COUNT(*)' in q for q, _ in connector.executed_queries)
+
+
+class TestOrphanTimeBudget:
+    def test_budget_exceeded_reports_partial_lower_bound(self):
+        connector = _BudgetConnector(delay=0.3)
+        messages = []
+        skipped = []
+        fk = _analyzer(connector, _catalog(), messages)
+        fk.scan_limits = DataScanLimits(fk_time_budget=0.2)
+
+        orphans = fk.find_orphan_records('shop', skipped=skipped)
+
+        assert len(orphans) == 1
+        assert orphans[0].is_partial and orphans[0].orphan_count == 2
+        assert [s.constraint_name for s in skipped] == ['fk_orders_user']
+        count_queries = [q for q, _ in connector.executed_queries if 'COUNT(*)' in q]
+        # 예산이 지난 뒤 남은 청크는 시작하지 않는다
+        assert len(count_queries) == 2
+        assert all('MAX_EXECUTION_TIME(' in q for q in count_queries)
+        assert any('최소 2개' in m for m in messages)
+
+    def test_unchunked_scan_over_budget_is_skipped(self):
+        connector = _BudgetConnector(delay=0.15)
+        skipped = []
+        fk = _analyzer(connector, _catalog(order_rows=10))
+        fk.scan_limits = DataScanLimits(fk_time_budget=0.1)
+
+        orphans = fk.find_orphan_records('shop', skipped=skipped)
+
+        assert orphans == []
+        assert [s.constraint_name for s in skipped] == ['fk_orders_user']
+
+
+class TestOrphanScanFailures:
+    def test_empty_count_result_is_not_reported_as_clean(self):
+        connector = FakeMySQLConnector()
+        connector.query_results = {'as orphan_value': [{'orphan_value': 42}]}
+        skipped = []
+
+        orphans = _analyzer(connector, _catalog(order_rows=10)).find_orphan_records('shop', skipped=skipped)
+
+        assert orphans == []
+        assert [s.constraint_name for s in skipped] == ['fk_orders_user']
+
+    def test_failed_chunk_makes_result_partial(self):
+        connector = _BudgetConnector(delay=0)
+        messages = []
+        skipped = []
+
+        orphans = _analyzer(connector, _catalog(), messages).find_orphan_records('shop', skipped=skipped)
+
+        assert orphans[0].is_partial and orphans[0].orphan_count == 2
+        assert [s.constraint_name for s in skipped] == ['fk_orders_user']
+        assert sum('청크' in m and '결과 없음' in m for m in messages) == 2
+        assert any('최소 2개' in m for m in messages)
@@ -1,5 +1,6 @@
 from datetime import datetime
 
+from src.core.migration_analysis_cache import AnalysisCache
 from src.core.migration_analyzer import AnalysisResult, OrphanRecord
 from src.ui.dialogs.migration_result_store import MigrationResultStore
 
@@ -83,3 +84,37 @@ def test_migration_result_store_exports_orphan_queries(tmp_path):
     assert "-- FK 관계 수: 1개" in content
     assert "-- 총 고아 레코드: 3개" in content
     assert "SELECT * FROM `app`.`orders`;" in content
+
+
+def test_migration_result_store_round_trips_reused_results(tmp_path):
+    store = MigrationResultStore(base_dir=tmp_path)
+    result = _analysis_result()
+    result.reused_results = {"고아 레코드 검사": ["orders.user_id->users.id"]}
+
+    loaded = store.read(store.write(result, tmp_path / "analysis.json"))
+
+    assert loaded.reused_results == {"고아 레코드 검사": ["orders.user_id->users.id"]}
+
+
+def test_migration_result_store_persists_analysis_cache_per_server_and_schema(tmp_path):
+    store = MigrationResultStore(base_dir=tmp_path)
+    cache = AnalysisCache("app", "db.local:3306")
+    cache.store("invalid_dates", "orders", "fp-1", [{"location": "app.orders.created"}])
+
+    path = store.write_cache(cache)
+
+    assert path.parent == tmp_path / "cache"
+    assert store.read_cache("app", "db.local:3306").lookup("invalid_dates", "orders", "fp-1") == [
+        {"location": "app.orders.created"}
+    ]
+    assert store.read_cache("app", "other:3306").lookup("invalid_dates", "orders", "fp-1") is None
+
+
+def test_migration_result_store_ignores_corrupt_analysis_cache(tmp_path):
+    store = MigrationResultStore(base_dir=tmp_path)
+    store.cache_path("app", "db.local:3306").write_text("{not json", encoding="utf-8")
+
+    cache = store.read_cache("app", "db.local:3306")
+
+    assert cache.schema == "app"
+    assert cache.to_dict()["entries"] == {}
@@ -0,0 +1,140 @@
+"""
+migration_schema_catalog.py 단위 테스트
+
+SchemaCatalogSnapshot 인덱스와, 분석 파이프라인/규칙/Fix 옵션 생성기가
+스냅샷을 공유해 INFORMATION_SCHEMA 를 다시 조회하지 않는지 검증합니다.
+"""
+from src.core.migration_analysis_models import SchemaCheckOptions
+from src.core.migration_analyzer import MigrationAnalyzer
+from src.core.migration_compat_checker import MySQLUpgradeCompatibilityChecker
+from src.core.migration_constants import IssueType
+from src.core.migration_fix_option_generator import SmartFixGenerator
+from src.core.migration_rules import SchemaRules
+from src.core.migration_schema_catalog import SchemaCatalogSnapshot
+from tests.conftest import FakeMySQLConnector
+
+
+def _catalog() -> SchemaCatalogSnapshot:
+    return SchemaCatalogSnapshot(
+        'shop',
+        tables=[
+            {'TABLE_NAME': 'users', 'TABLE_TYPE': 'BASE TABLE', 'ENGINE': 'InnoDB',
+             'TABLE_ROWS': 1200, 'TABLE_COLLATION': 'utf8mb3_general_ci'},
+            {'TABLE_NAME': 'orders', 'TABLE_TYPE': 'BASE TABLE', 'ENGINE': 'MyISAM',
+             'TABLE_ROWS': None, 'TABLE_COLLATION': 'utf8mb4_0900_ai_ci'},
+            {'TABLE_NAME': 'v_users', 'TABLE_TYPE': 'VIEW', 'ENGINE': None,
+             'TABLE_ROWS': None, 'TABLE_COLLATION': None},
+        ],
+        columns=[
+            {'TABLE_NAME': 'users', 'COLUMN_NAME': 'id', 'DATA_TYPE': 'int',
+             'COLUMN_TYPE': 'int(11)', 'IS_NULLABLE': 'NO', 'COLUMN_DEFAULT': None, 'EXTRA': 'auto_increment'},
+            {'TABLE_NAME': 'users', 'COLUMN_NAME': 'flag', 'DATA_TYPE': 'tinyint',
+             'COLUMN_TYPE': 'tinyint(1)', 'IS_NULLABLE': 'YES', 'COLUMN_DEFAULT': None, 'EXTRA': ''},
+            {'TABLE_NAME': 'users', 'COLUMN_NAME': 'name', 'DATA_TYPE': 'varchar',
+             'COLUMN_TYPE': 'varchar(64)', 'CHARACTER_SET_NAME': 'utf8mb3', 'CHARACTER_MAXIMUM_LENGTH': 64,
+             'IS_NULLABLE': 'NO', 'COLUMN_DEFAULT': 'anon', 'EXTRA': ''},
+            {'TABLE_NAME': 'orders', 'COLUMN_NAME': 'born', 'DATA_TYPE': 'year',
+             'COLUMN_TYPE': 'year(2)', 'IS_NULLABLE': 'YES', 'COLUMN_DEFAULT': None, 'EXTRA': ''},
+            {'TABLE_NAME': 'orders', 'COLUMN_NAME': 'price', 'DATA_TYPE': 'float',
+             'COLUMN_TYPE': 'float(7,2) unsigned zerofill', 'IS_NULLABLE': 'YES', 'COLUMN_DEFAULT': None, 'EXTRA': ''},
+            {'TABLE_NAME': 'v_users', 'COLUMN_NAME': 'name', 'DATA_TYPE': 'varchar',
+             'COLUMN_TYPE': 'varchar(64)', 'CHARACTER_SET_NAME': 'utf8mb3', 'CHARACTER_MAXIMUM_LENGTH': 64,
+             'IS_NULLABLE': 'NO', 'COLUMN_DEFAULT': None, 'EXTRA': ''},
+        ],
+        indexes=[
+            {'TABLE_NAME': 'users', 'INDEX_NAME': 'PRIMARY', 'SEQ_IN_INDEX': 1,
+             'COLUMN_NAME': 'id', 'SUB_PART': None},
+        ],
+        foreign_keys=[
+            {'CONSTRAINT_NAME': 'fk_orders_user', 'CHILD_TABLE': 'orders', 'CHILD_COLUMN': 'user_id',
+             'PARENT_TABLE': 'users', 'PARENT_COLUMN': 'id', 'DELETE_RULE': 'CASCADE', 'UPDATE_RULE': 'RESTRICT'},
+        ],
+    )
+
+
+class TestSchemaCatalogSnapshot:
+    def test_load_reads_each_catalog_table_once(self):
+        connector = FakeMySQLConnector()
+        catalog = SchemaCatalogSnapshot.load(connector, 'shop')
+
+        assert catalog.schema == 'shop'
+        assert len(connector.executed_queries) == 6
+        assert all(params == ('shop',) for _, params in connector.executed_queries)
+
+    def test_lookups_are_indexed_and_case_insensitive(self):
+        catalog = _catalog()
+
+        assert catalog.table_names() == ['users', 'orders', 'v_users']
+        assert [t['TABLE_NAME'] for t in catalog.tables(base_only=True)] == ['users', 'orders']
+        assert catalog.is_base_table('USERS') and not catalog.is_base_table('v_users')
+        assert catalog.table_rows('users') == 1200
+        assert catalog.table_rows('orders') == 0
+        assert catalog.column('Users', 'NAME')['COLUMN_TYPE'] == 'varchar(64)'
+        assert catalog.column('users', 'missing') is None
+        assert [c['COLUMN_NAME'] for c in catalog.columns('users', data_types=('INT', 'tinyint'))] == ['id', 'flag']
+        assert [i['INDEX_NAME'] for i in catalog.indexes('users')] == ['PRIMARY']
+        assert catalog.covers('shop') and not catalog.covers('other')
+
+
+class TestCatalogBackedChecks:
+    def test_compat_checks_use_snapshot_instead_of_queries(self):
+        connector = FakeMySQLConnector()
+        checker = MySQLUpgradeCompatibilityChecker(connector, lambda message: None)
+        checker.catalog = _catalog()
+
+        assert [i.location for i in checker.check_int_display_width('shop')] == ['shop.users.id']
+        assert [i.location for i in checker.check_year2_type('shop')] == ['shop.orders.born']
+        assert [i.location for i in checker.check_zerofill_columns('shop')] == ['shop.orders.price']
+        assert [i.location for i in checker.check_float_precision('shop')] == ['shop.orders.price']
+        assert [i.location for i in checker.check_deprecated_engines('shop')] == ['shop.orders']
+        # 뷰 컬럼은 charset 검사에서 제외된다
+        assert [i.location for i in checker.check_charset_issues('shop')] == ['shop.users', 'shop.users.name']
+        assert connector.executed_queries == []
+
+    def test_snapshot_for_another_schema_falls_back_to_queries(self):
+        connector = FakeMySQLConnector()
+        checker = MySQLUpgradeCompatibilityChecker(connector, lambda message: None)
+        checker.catalog = _catalog()
+
+        checker.check_year2_type('other')
+
+        assert connector.executed_queries[0][1] == ('other',)
+
+    def test_rules_use_snapshot(self):
+        connector = FakeMySQLConnector()
+        rules = SchemaRules(connector, catalog=_catalog())
+
+        assert [i.location for i in rules.check_year2_type('shop')] == ['shop.orders.born']
+        assert rules.check_index_too_large('shop') == []
+        assert connector.executed_queries == []
+
+    def test_fix_generator_reads_column_definition_from_snapshot(self):
+        connector = FakeMySQLConnector()
+        generator = SmartFixGenerator(connector, 'shop', _catalog())
+
+        definition = generator._get_column_definition('shop', 'users', 'name', charset='utf8mb4')
+
+        assert definition == "varchar(64) CHARACTER SET utf8mb4 NOT NULL DEFAULT 'anon'"
+        assert generator._is_column_nullable('orders', 'born') is True
+        assert generator.get_fk_graph_builder().get_related_tables('orders') == {'users'}
+        assert connector.executed_queries == []
+
+    def test_analyze_schema_loads_catalog_once_for_all_checks(self):
+        connector = FakeMySQLConnector()
+        connector.query_results = {
+            'FROM INFORMATION_SCHEMA.COLUMNS': [
+                {'TABLE_NAME': 'users', 'COLUMN_NAME': 'age', 'DATA_TYPE': 'int', 'COLUMN_TYPE': 'int(11)'},
+            ],
+        }
+        analyzer = MigrationAnalyzer(connector)
+        options = SchemaCheckOptions(check_sql_mode=False, check_auth_plugins=False,
+                                     check_invalid_dates=False)
+
+        result = analyzer._analyze_schema_impl('shop', options)
+
+        schema_queries = [q for q, _ in connector.executed_queries if 'INFORMATION_SCHEMA' in q]
+        assert len(schema_queries) == 6
+        assert result.catalog is not None and result.catalog.covers('shop')
+        assert any(i.issue_type == IssueType.INT_DISPLAY_WIDTH for i in result.compatibility_issues)
+        # 분석이 끝나면 협력 객체는 스냅샷을 놓아 이후 단독 호출은 다시 조회한다
+        assert analyzer._compat.catalog is None and analyzer._fk.catalog is None
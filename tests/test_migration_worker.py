@@ -63,6 +63,9 @@ def test_migration_analyzer_worker_forwards_options_without_int_display_width(mo
         def set_progress_callback(self, callback):
             captured["progress_callback"] = callback
 
+        def set_cancel_check(self, callback):
+            captured["cancel_check"] = callback
+
         def analyze_schema(self, schema, **options):
             captured["schema"] = schema
             captured["options"] = options
@@ -101,6 +104,9 @@ def test_migration_analyzer_worker_accepts_legacy_check_kwargs(monkeypatch):
         def set_progress_callback(self, callback):
             captured["progress_callback"] = callback
 
+        def set_cancel_check(self, callback):
+            captured["cancel_check"] = callback
+
         def analyze_schema(self, schema, **options):
             captured["schema"] = schema
             captured["options"] = options
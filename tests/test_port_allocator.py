@@ -0,0 +1,131 @@
+"""
+PortAllocator 테스트
+"""
+from types import SimpleNamespace
+
+from src.core import port_allocator
+from src.core.port_allocator import PortAllocator, _parse_netstat, _parse_proc_net_tcp
+
+PROC_NET_TCP = """  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode
+   0: 0100007F:0CEB 00000000:0000 0A 00000000:00000000 00:00000000 00000000  1000        0 1 1
+   1: 00000000:0016 00000000:0000 0A 00000000:00000000 00:00000000 00000000     0        0 2 1
+   2: 0100007F:0CEC 0100007F:A2B4 01 00000000:00000000 00:00000000 00000000  1000        0 3 1
+"""
+
+WINDOWS_NETSTAT = """
+Active Connections
+
+  Proto  Local Address          Foreign Address        State
+  TCP    0.0.0.0:135            0.0.0.0:0              LISTENING
+  TCP    127.0.0.1:3307         0.0.0.0:0              ABHÖREN
+  TCP    127.0.0.1:3308         127.0.0.1:51000        ESTABLISHED
+  TCP    [::]:3310              [::]:0                 LISTENING
+  UDP    0.0.0.0:3311           *:*
+"""
+
+MACOS_NETSTAT = """Active Internet connections (including servers)
+Proto Recv-Q Send-Q  Local Address          Foreign Address        (state)
+tcp4       0      0  127.0.0.1.3307         *.*                    LISTEN
+tcp4       0      0  10.0.0.2.52000         10.0.0.9.3306          ESTABLISHED
+tcp46      0      0  *.3320                 *.*                    LISTEN
+"""
+
+
+def _allocator(listeners, start=3307, end=3315):
+    return PortAllocator(start, end, scanner=lambda: set(listeners), bind_probe=lambda port: False)
+
+
+def _tunnel(tunnel_id, port, mode='ssh_tunnel'):
+    return {'id': tunnel_id, 'local_port': port, 'connection_mode': mode}
+
+
+def test_listener_parsers_find_only_listening_sockets():
+    assert _parse_proc_net_tcp(PROC_NET_TCP) == {3307, 22}
+    assert _parse_netstat(WINDOWS_NETSTAT) == {135, 3307, 3310}
+    assert _parse_netstat(MACOS_NETSTAT) == {3307, 3320}
+
+
+def test_find_conflicts_reports_duplicates_running_tunnels_and_listeners():
+    allocator = _allocator({3307, 3309})
+    assert allocator.reserve('running', 3309)
+    scans = []
+    allocator._scanner = lambda: scans.append(1) or {3307, 3309}
+
+    conflicts = allocator.find_conflicts([
+        _tunnel('a', 3307),
+        _tunnel('b', 3308),
+        _tunnel('c', 3308),
+        _tunnel('d', 3309),
+        _tunnel('running', 3309),
+        _tunnel('direct', 3307, mode='direct'),
+    ])
+
+    assert [(c.tunnel_id, c.reason, c.other_tunnel_id) for c in conflicts] == [
+        ('a', 'listener', None),
+        ('c', 'duplicate', 'b'),
+        ('d', 'tunnel', 'running'),
+        ('running', 'duplicate', 'd'),
+    ]
+    assert len(scans) == 1
+
+
+def test_running_tunnel_does_not_conflict_with_its_own_listener():
+    allocator = _allocator({3307})
+    allocator.reserve('a', 3307)
+
+    assert allocator.find_conflicts([_tunnel('a', 3307)]) == []
+    assert allocator.reserve('b', 3307) is False
+    allocator.release('a')
+    assert allocator.reserve('b', 3307) is True
+
+
+def test_suggest_and_assign_skip_taken_ports():
+    allocator = _allocator({3307, 3309})
+    allocator.reserve('running', 3310)
+
+    assert allocator.suggest(3) == [3308, 3311, 3312]
+    assert allocator.suggest(1, preferred=3314) == [3314]
+    assert allocator.suggest(1, preferred=3309) == [3308]
+
+    assigned = allocator.assign(
+        [_tunnel('a', 3307), _tunnel('b', 3308), _tunnel('c', 3308)],
+        taken={3311},
+    )
+    assert assigned == {'a': 3312, 'c': 3313}
+
+
+def test_suggest_keeps_the_owners_own_reserved_port():
+    allocator = _allocator({3307, 3310})
+    allocator.reserve('running', 3310)
+
+    assert allocator.suggest(1, preferred=3310, owner='running') == [3310]
+    assert allocator.suggest(1, preferred=3310, owner='other') == [3308]
+    assert allocator.suggest(1, preferred=3310) == [3308]
+
+
+def test_bind_probe_is_used_when_listener_scan_is_unavailable():
+    probed = []
+
+    def probe(port):
+        probed.append(port)
+        return port != 3307
+
+    allocator = PortAllocator(3307, 3310, scanner=lambda: None, bind_probe=probe)
+
+    conflicts = allocator.find_conflicts([_tunnel('a', 3307), _tunnel('b', 3308)])
+    assert [c.tunnel_id for c in conflicts] == ['a']
+    assert probed == [3307, 3308]
+
+
+def test_listening_ports_picks_netstat_arguments_per_platform(monkeypatch):
+    calls = []
+
+    def fake_run(args, **kwargs):
+        calls.append(args)
+        return SimpleNamespace(returncode=0, stdout=WINDOWS_NETSTAT)
+
+    monkeypatch.setattr(port_allocator.subprocess, 'run', fake_run)
+
+    assert port_allocator.listening_ports('Windows') == {135, 3307, 3310}
+    port_allocator.listening_ports('Darwin')
+    assert calls == [['netstat', '-an'], ['netstat', '-an', '-p', 'tcp']]
@@ -0,0 +1,111 @@
+"""
+ReconnectScheduler 테스트
+"""
+import threading
+import time
+
+from src.core.reconnect_scheduler import ReconnectScheduler, reconnect_delay
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_reconnect_delay_grows_exponentially_with_bounded_jitter():
+    assert reconnect_delay(0, rng=lambda: 0.0) == 0.5
+    assert reconnect_delay(0, rng=lambda: 1.0) == 1.0
+    assert reconnect_delay(3, rng=lambda: 0.0) == 4.0
+    assert reconnect_delay(3, rng=lambda: 1.0) == 8.0
+    # 상한 이후에는 더 늘지 않는다
+    assert reconnect_delay(20, rng=lambda: 1.0) == 60.0
+
+    spread = {round(reconnect_delay(2), 6) for _ in range(20)}
+    assert len(spread) > 1
+    assert all(2.0 <= value <= 4.0 for value in spread)
+
+
+def test_scheduler_caps_concurrent_attempts_per_bastion():
+    release = threading.Event()
+    lock = threading.Lock()
+    running = {'bastion-a': 0, 'bastion-b': 0}
+    peak = {'bastion-a': 0, 'bastion-b': 0}
+    done = []
+
+    def attempt(tunnel_id, config):
+        bastion = tunnel_id.split('/')[0]
+        with lock:
+            running[bastion] += 1
+            peak[bastion] = max(peak[bastion], running[bastion])
+        release.wait(5)
+        with lock:
+            running[bastion] -= 1
+            done.append(tunnel_id)
+
+    scheduler = ReconnectScheduler(attempt, max_workers=8, per_key_limit=2)
+    try:
+        for index in range(5):
+            scheduler.schedule(f'bastion-a/t{index}', 0, key='bastion-a')
+        scheduler.schedule('bastion-b/t0', 0, key='bastion-b')
+
+        assert _wait_for(lambda: running['bastion-a'] == 2 and running['bastion-b'] == 1)
+        time.sleep(0.1)
+        assert running['bastion-a'] == 2
+        assert scheduler.pending_count() == 3
+
+        release.set()
+        assert _wait_for(lambda: len(done) == 6)
+    finally:
+        scheduler.stop()
+
+    assert peak == {'bastion-a': 2, 'bastion-b': 1}
+
+
+def test_scheduler_runs_in_due_order_and_replaces_duplicate_schedules():
+    order = []
+    scheduler = ReconnectScheduler(lambda tunnel_id, config: order.append(tunnel_id), max_workers=1)
+    try:
+        scheduler.schedule('late', 0.2)
+        scheduler.schedule('early', 0.05)
+        scheduler.schedule('early', 0.1)  # 같은 터널을 다시 예약하면 이전 예약을 대체
+        assert _wait_for(lambda: len(order) == 2)
+        time.sleep(0.1)
+    finally:
+        scheduler.stop()
+
+    assert order == ['early', 'late']
+
+
+def test_cancel_and_stop_drop_pending_attempts():
+    ran = []
+    scheduler = ReconnectScheduler(lambda tunnel_id, config: ran.append(tunnel_id))
+    scheduler.schedule('t1', 0.1)
+    scheduler.schedule('t2', 0.1)
+
+    assert scheduler.cancel('t1') is True
+    scheduler.stop()
+    time.sleep(0.25)
+    assert ran == []
+
+    # 중지 후에도 다시 예약하면 동작한다
+    scheduler.schedule('t3', 0)
+    try:
+        assert _wait_for(lambda: ran == ['t3'])
+    finally:
+        scheduler.stop()
+
+
+def test_scheduler_passes_the_scheduled_config_to_the_attempt():
+    received = []
+    scheduler = ReconnectScheduler(lambda tunnel_id, config: received.append((tunnel_id, config)))
+    try:
+        scheduler.schedule('t1', 0, key='bastion-a', config={'id': 't1', 'local_port': 13306})
+        assert _wait_for(lambda: len(received) == 1)
+    finally:
+        scheduler.stop()
+
+    assert received == [('t1', {'id': 't1', 'local_port': 13306})]
@@ -48,6 +48,9 @@ class FakeCursor:
     def fetchall(self):
         return list(self._rows)
 
+    def fetchmany(self, size):
+        return list(self._rows[:size])
+
     def fetchone(self):
         return self._rows[0] if self._rows else None
 
@@ -62,10 +65,12 @@ class FakeConnection:
         self.rolled_back = False
         self._cursor_factory = cursor_factory or (lambda: FakeCursor())
         self.cursors_created = []
+        self.streaming_requested = []
 
-    def cursor(self):
+    def cursor(self, streaming=False, batch_size=500):
         c = self._cursor_factory()
         self.cursors_created.append(c)
+        self.streaming_requested.append(streaming)
         return c
 
     def commit(self):
@@ -623,12 +628,7 @@ def test_autocommit_worker_uses_classifier_and_streaming_columns_for_empty_selec
     from src.ui.dialogs import sql_editor_dialog as module
     from src.ui.dialogs import sql_editor_workers as workers_module
 
-    connection = FakeConnection()
-    connection.connection_id = "conn-1"
-    connection.facade = MagicMock()
-    connection.facade.execute_on_connection_streaming.return_value = {
-        "columns": ["id", "name"], "rows": [], "rows_affected": 0,
-    }
+    connection = FakeConnection(cursor_factory=lambda: FakeCursor(description=[("id",), ("name",)]))
 
     connector = MagicMock()
     connector.connect.return_value = (True, "ok")
@@ -652,6 +652,41 @@ def test_autocommit_worker_uses_classifier_and_streaming_columns_for_empty_selec
     assert columns == ["id", "name"]
     assert rows == []
     assert error == ""
+    assert connection.streaming_requested == [True]
+
+
+def test_autocommit_worker_stops_reading_at_result_grid_cap(monkeypatch):
+    from src.ui.dialogs import sql_editor_workers as workers_module
+
+    connection = FakeConnection(
+        cursor_factory=lambda: FakeCursor(description=[("id",)], rows=[{"id": n} for n in range(5)])
+    )
+    connector = MagicMock()
+    connector.connect.return_value = (True, "ok")
+    connector.connection = connection
+    monkeypatch.setattr(workers_module, "create_sql_editor_connector", lambda *a, **k: connector)
+    monkeypatch.setattr(workers_module, "MAX_RESULT_GRID_ROWS", 2)
+
+    worker = workers_module.SQLQueryWorker("127.0.0.1", 3306, "user", "pass", "db", ["SELECT id FROM big_table"])
+    results = []
+    worker.query_result.connect(lambda *args: results.append(args))
+    worker.run()
+
+    assert results[0][3] == [[0], [1]]
+
+
+def test_result_at_grid_cap_reports_skipped_rows(monkeypatch):
+    from src.ui.dialogs import sql_editor_dialog as module
+
+    monkeypatch.setattr(module, "MAX_RESULT_GRID_ROWS", 2)
+    dialog = make_dialog(monkeypatch)
+    try:
+        dialog.history_manager = FakeHistory()
+        dialog._on_query_result(0, True, ["id"], [[1], [2]], "", 2, 0.1)
+
+        assert "2행 상한에 도달" in dialog.message_text.toPlainText()
+    finally:
+        close_dialog(dialog)
 
 
 def test_on_query_result_empty_select_creates_result_tab_and_history(monkeypatch):
@@ -3,6 +3,8 @@ TunnelEngine 테스트
 """
 import pytest
 import socket
+import threading
+import time
 from unittest.mock import patch, MagicMock, PropertyMock
 
 
@@ -77,8 +79,8 @@ class TestTunnelEngine:
 
     def test_start_ssh_tunnel_success(self, sample_tunnel_config):
         """SSH 터널 시작 성공 테스트 (Mock)"""
-        # SSHTunnelForwarder를 src.core.tunnel_engine 모듈에서 패치
-        with patch('src.core.tunnel_engine.SSHTunnelForwarder') as mock_tunnel:
+        # SharedTunnelForwarder를 src.core.tunnel_engine 모듈에서 패치
+        with patch('src.core.tunnel_engine.SharedTunnelForwarder') as mock_tunnel:
             # Mock 인스턴스 설정
             mock_instance = MagicMock()
             mock_instance.is_active = True
@@ -92,6 +94,28 @@ class TestTunnelEngine:
                 assert success is True
                 assert mock_tunnel.called
 
+    def test_ssh_tunnel_traffic_is_reported_in_active_tunnels(self, sample_tunnel_config):
+        """SSH 터널의 트래픽 카운터가 활성 터널 목록에 포함된다"""
+        from src.core.bastion_sessions import TrafficCounters
+
+        with patch('src.core.tunnel_engine.SharedTunnelForwarder') as mock_tunnel:
+            mock_instance = MagicMock()
+            mock_instance.is_active = True
+            mock_instance.local_bind_port = 3307
+            mock_instance.traffic = TrafficCounters()
+            mock_instance.traffic.channel_opened(0.01)
+            mock_instance.traffic.add_bytes(sent=10, received=20)
+            mock_tunnel.return_value = mock_instance
+
+            with patch.object(self.engine, '_load_private_key', return_value=MagicMock()):
+                success, _msg = self.engine.start_tunnel(sample_tunnel_config, check_port=False)
+
+        assert success is True
+        traffic = self.engine.get_active_tunnels()[0]['traffic']
+        assert traffic['bytes_sent'] == 10
+        assert traffic['bytes_received'] == 20
+        assert traffic['active_channels'] == 1
+
     def test_start_ssh_tunnel_key_error(self, sample_tunnel_config):
         """SSH 키 로드 실패 테스트"""
         # 존재하지 않는 키 파일 경로 설정
@@ -105,6 +129,34 @@ class TestTunnelEngine:
             # 에러 메시지에 '키' 또는 관련 오류 메시지 포함
             assert any(keyword in msg.lower() for keyword in ['key', '키', 'file', 'not found', '찾을 수 없'])
 
+    def test_load_private_key_caches_until_file_changes(self, tmp_path):
+        """파싱한 키는 (경로, mtime, 크기)가 같으면 재사용하고 파일이 바뀌면 다시 파싱한다"""
+        import os
+        import paramiko
+
+        key_path = tmp_path / "id_ed25519"
+        key_path.write_text("placeholder")
+        parsed = MagicMock()
+
+        with patch.object(paramiko.RSAKey, 'from_private_key_file', side_effect=paramiko.SSHException("not rsa")) as rsa, \
+                patch.object(paramiko.Ed25519Key, 'from_private_key_file', return_value=parsed) as ed25519:
+            first = self.engine._load_private_key(str(key_path))
+            second = self.engine._load_private_key(str(key_path))
+
+            assert first is parsed and second is parsed
+            assert rsa.call_count == 1
+            assert ed25519.call_count == 1
+            assert self.engine.key_cache_stats == {'hits': 1, 'misses': 1}
+
+            # 키 교체 - 지난번 성공 형식(Ed25519)부터 시도하므로 RSA 파서는 다시 호출되지 않는다
+            key_path.write_text("rotated key contents")
+            stat = key_path.stat()
+            os.utime(key_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.engine._load_private_key(str(key_path))
+
+            assert ed25519.call_count == 2
+            assert rsa.call_count == 1
+
     def test_already_running_direct(self, sample_direct_config):
         """이미 실행 중인 직접 연결 시작 시도"""
         # 첫 번째 시작
@@ -132,6 +184,88 @@ class TestTunnelEngine:
 
         assert len(self.engine.active_tunnels) == 0
 
+    def test_start_tunnels_connects_concurrently(self, sample_tunnel_config):
+        """일괄 시작 - 느린 bastion 연결이 병렬로 진행되어 가장 느린 것 하나만큼 걸린다"""
+        configs = []
+        for index in range(4):
+            config = sample_tunnel_config.copy()
+            config['id'] = f'test-{index}'
+            config['local_port'] = 3310 + index
+            configs.append(config)
+
+        barrier = threading.Barrier(4, timeout=5)
+
+        def slow_forwarder(*args, **kwargs):
+            server = MagicMock()
+            # 네 연결이 동시에 진행 중이어야 통과하는 장벽 (순차 시작이면 타임아웃)
+            server.start.side_effect = lambda: (time.sleep(0.05), barrier.wait())
+            return server
+
+        reported = []
+        with patch('src.core.tunnel_engine.SharedTunnelForwarder', side_effect=slow_forwarder), \
+                patch.object(self.engine, '_load_private_key', return_value=MagicMock()):
+            results = self.engine.start_tunnels(
+                configs + [configs[0]], max_parallel=4, check_port=False,
+                on_result=lambda config, success, msg: reported.append(config['id']),
+            )
+
+        assert [config['id'] for config, _, _ in results] == ['test-0', 'test-1', 'test-2', 'test-3']
+        assert all(success for _, success, _ in results)
+        assert sorted(reported) == ['test-0', 'test-1', 'test-2', 'test-3']
+        assert set(self.engine.active_tunnels) == {'test-0', 'test-1', 'test-2', 'test-3'}
+
+    def test_start_tunnels_reports_failures_without_stopping_others(self, sample_tunnel_config, sample_direct_config):
+        """일괄 시작 - 한 터널의 실패가 다른 터널 시작을 막지 않는다"""
+        with patch.object(self.engine, '_start_ssh_tunnel', side_effect=RuntimeError("boom")):
+            results = self.engine.start_tunnels([sample_tunnel_config, sample_direct_config], check_port=False)
+
+        assert results[0][1] is False
+        assert 'boom' in results[0][2]
+        assert results[1][1] is True
+        assert self.engine.is_running(sample_direct_config['id'])
+
+    def test_start_tunnels_checks_ports_with_one_scan(self, sample_tunnel_config):
+        """일괄 시작은 리스너 목록을 한 번만 읽고, 충돌 터널은 연결을 시도하지 않는다"""
+        busy = dict(sample_tunnel_config, id='busy', name='busy', local_port=3401)
+        free = dict(sample_tunnel_config, id='free', name='free', local_port=3402)
+        scans = []
+        self.engine.ports._scanner = lambda: scans.append(1) or {3401}
+        started = []
+
+        def no_bind_probe(port):
+            raise AssertionError(f"bind probe for {port} during bulk start")
+
+        self.engine.ports._bind_probe = no_bind_probe
+
+        def fake_start(config):
+            started.append(config['id'])
+            return True, "연결 성공"
+
+        with patch.object(self.engine, '_start_ssh_tunnel', side_effect=fake_start):
+            results = self.engine.start_tunnels([busy, free])
+
+        assert len(scans) == 1
+        assert started == ['free']
+        assert results[0][1] is False
+        assert '3401' in results[0][2]
+        assert '빈 포트' in results[0][2]
+        assert results[1][1] is True
+        assert self.engine.ports.reservations() == {3402: 'free'}
+
+    def test_same_local_port_is_reserved_for_one_tunnel(self, sample_tunnel_config):
+        """실행 중 터널의 로컬 포트는 다른 터널이 시작할 수 없고, 종료하면 풀린다"""
+        other = dict(sample_tunnel_config, id='other', name='other')
+        with patch.object(self.engine, '_start_ssh_tunnel', return_value=(True, "연결 성공")):
+            assert self.engine.start_tunnel(sample_tunnel_config, check_port=False)[0] is True
+            self.engine.active_tunnels[sample_tunnel_config['id']] = MagicMock(is_active=True)
+
+            success, msg = self.engine.start_tunnel(other, check_port=False)
+            assert success is False
+            assert '다른 터널' in msg
+
+            self.engine.stop_tunnel(sample_tunnel_config['id'])
+            assert self.engine.start_tunnel(other, check_port=False)[0] is True
+
     def test_get_active_tunnels(self, sample_direct_config):
         """활성 터널 목록 조회"""
         self.engine.start_tunnel(sample_direct_config)
@@ -141,6 +275,8 @@ class TestTunnelEngine:
         assert len(result) == 1
         assert result[0]['id'] == sample_direct_config['id']
         assert result[0]['mode'] == 'direct'
+        # 직접 연결은 포워딩을 거치지 않으므로 트래픽 카운터가 없다
+        assert result[0]['traffic'] is None
 
     def test_test_connection_direct_success(self, sample_direct_config):
         """직접 연결 테스트 (Mock)"""
@@ -173,35 +309,78 @@ class TestTunnelEngine:
         assert server is None  # 직접 연결은 터널 불필요
         assert error == ""
 
+    def _use_fake_bastion(self, transport):
+        from src.core.bastion_sessions import BastionSessionManager
+        self.engine.bastion_sessions = BastionSessionManager(
+            pkey_loader=lambda key_path: MagicMock(),
+            connector=lambda *args: transport,
+        )
+
     def test_target_reachable_from_bastion_success(self, sample_tunnel_config):
         """Bastion에서 Target DB 포트 도달성 확인 성공"""
-        with patch.object(self.engine, '_load_private_key', return_value=MagicMock()):
-            with patch('src.core.tunnel_engine.paramiko.SSHClient') as mock_client_cls:
-                mock_client = MagicMock()
-                mock_transport = MagicMock()
-                mock_transport.is_active.return_value = True
-                mock_transport.open_channel.return_value = MagicMock()
-                mock_client.get_transport.return_value = mock_transport
-                mock_client_cls.return_value = mock_client
+        mock_transport = MagicMock()
+        mock_transport.is_active.return_value = True
+        mock_transport.open_channel.return_value = MagicMock()
+        self._use_fake_bastion(mock_transport)
 
-                success, msg = self.engine.test_target_reachable_from_bastion(sample_tunnel_config)
+        success, msg = self.engine.test_target_reachable_from_bastion(sample_tunnel_config)
 
-                assert success is True
-                assert "도달 성공" in msg
-                mock_transport.open_channel.assert_called_once()
+        assert success is True
+        assert "도달 성공" in msg
+        mock_transport.open_channel.assert_called_once()
+        # 확인이 끝나면 세션을 반납해 Transport를 닫는다
+        mock_transport.close.assert_called_once()
 
     def test_target_reachable_from_bastion_failure(self, sample_tunnel_config):
         """Bastion에서 Target DB 포트 도달성 확인 실패"""
-        with patch.object(self.engine, '_load_private_key', return_value=MagicMock()):
-            with patch('src.core.tunnel_engine.paramiko.SSHClient') as mock_client_cls:
-                mock_client = MagicMock()
-                mock_transport = MagicMock()
-                mock_transport.is_active.return_value = True
-                mock_transport.open_channel.side_effect = socket.timeout("timed out")
-                mock_client.get_transport.return_value = mock_transport
-                mock_client_cls.return_value = mock_client
-
-                success, msg = self.engine.test_target_reachable_from_bastion(sample_tunnel_config)
-
-                assert success is False
-                assert "시간 초과" in msg
+        mock_transport = MagicMock()
+        mock_transport.is_active.return_value = True
+        mock_transport.open_channel.side_effect = socket.timeout("timed out")
+        self._use_fake_bastion(mock_transport)
+
+        success, msg = self.engine.test_target_reachable_from_bastion(sample_tunnel_config)
+
+        assert success is False
+        assert "시간 초과" in msg
+
+    def test_reachability_probe_reuses_running_tunnel_session(self, sample_tunnel_config):
+        """실행 중인 터널과 같은 bastion이면 도달성 확인이 새 SSH 세션을 열지 않는다"""
+        mock_transport = MagicMock()
+        mock_transport.is_active.return_value = True
+        connects = []
+        from src.core.bastion_sessions import BastionSessionManager
+        self.engine.bastion_sessions = BastionSessionManager(
+            pkey_loader=lambda key_path: MagicMock(),
+            connector=lambda *args: connects.append(args) or mock_transport,
+        )
+        sample_tunnel_config['local_port'] = 0
+
+        success, _ = self.engine.start_tunnel(sample_tunnel_config, check_port=False)
+        assert success is True
+        probe_ok, _ = self.engine.test_target_reachable_from_bastion(sample_tunnel_config)
+
+        assert probe_ok is True
+        assert len(connects) == 1
+        assert self.engine.bastion_sessions.stats()['refs'] == 1
+        self.engine.stop_tunnel(sample_tunnel_config['id'])
+        assert self.engine.bastion_sessions.stats()['sessions'] == 0
+
+    def test_temp_tunnel_is_reused_after_close(self, sample_tunnel_config):
+        """반납한 임시 터널은 같은 대상의 다음 요청에 재사용되고 stop_all에서 닫힌다"""
+        mock_transport = MagicMock()
+        mock_transport.is_active.return_value = True
+        self._use_fake_bastion(mock_transport)
+
+        ok, first, _ = self.engine.create_temp_tunnel(sample_tunnel_config)
+        port = self.engine.get_temp_tunnel_port(first)
+        self.engine.close_temp_tunnel(first)
+        ok_again, second, _ = self.engine.create_temp_tunnel(sample_tunnel_config)
+
+        assert ok and ok_again
+        assert second is first
+        assert self.engine.get_temp_tunnel_port(second) == port
+
+        self.engine.close_temp_tunnel(second)
+        self.engine.stop_all()
+        assert second.is_active is False
+        assert self.engine.bastion_sessions.stats()['sessions'] == 0
@@ -0,0 +1,134 @@
+"""
+TunnelEventLog 테스트
+"""
+import os
+from datetime import datetime, timedelta
+
+from src.core.tunnel_event_log import EVENT_SEGMENT_PREFIX, TunnelEvent, TunnelEventLog
+
+BASE = datetime(2026, 1, 1, 3, 0, 0)
+
+
+def _event(minute, tunnel_id='t1', event_type='disconnected'):
+    return TunnelEvent(BASE + timedelta(minutes=minute), tunnel_id, event_type, f'{tunnel_id}@{minute}')
+
+
+def test_recent_uses_per_tunnel_index_and_evicts_oldest():
+    log = TunnelEventLog(max_events=4)
+    for minute, tunnel_id in enumerate(['a', 'b', 'a', 'b', 'a', 'c']):
+        log.append(_event(minute, tunnel_id))
+
+    assert len(log) == 4
+    assert [e.message for e in log.recent(limit=10)] == ['c@5', 'a@4', 'b@3', 'a@2']
+    assert [e.message for e in log.recent('a', limit=10)] == ['a@4', 'a@2']
+    assert [e.message for e in log.recent('b', limit=1)] == ['b@3']
+    assert log.recent('missing') == []
+
+
+def test_between_returns_time_range_in_order():
+    log = TunnelEventLog(max_events=500)
+    for minute in range(300):
+        log.append(_event(minute, 'a' if minute % 2 else 'b'))
+
+    window = log.between(BASE + timedelta(minutes=100), BASE + timedelta(minutes=104))
+    assert [e.message for e in window] == ['b@100', 'a@101', 'b@102', 'a@103', 'b@104']
+
+    only_a = log.between(BASE + timedelta(minutes=100), BASE + timedelta(minutes=104), tunnel_id='a')
+    assert [e.message for e in only_a] == ['a@101', 'a@103']
+    assert len(log.between(start=BASE + timedelta(minutes=290))) == 10
+
+
+def test_persisted_events_survive_restart(tmp_path):
+    log = TunnelEventLog(max_events=10, persist_dir=str(tmp_path))
+    for minute in range(3):
+        log.append(_event(minute, 'a', 'reconnecting'))
+    log.close()
+
+    reopened = TunnelEventLog(max_events=10, persist_dir=str(tmp_path))
+    reopened.append(_event(3, 'a', 'reconnected'))
+
+    assert [(e.event_type, e.timestamp) for e in reopened.recent('a', limit=2)] == [
+        ('reconnected', BASE + timedelta(minutes=3)),
+        ('reconnecting', BASE + timedelta(minutes=2)),
+    ]
+    assert len(reopened) == 4
+    reopened.close()
+
+
+def test_segments_rotate_and_old_segments_are_removed(tmp_path):
+    log = TunnelEventLog(max_events=1000, persist_dir=str(tmp_path), segment_bytes=200, max_segments=3)
+    for minute in range(50):
+        log.append(_event(minute))
+    log.close()
+
+    segments = sorted(name for name in os.listdir(tmp_path) if name.startswith(EVENT_SEGMENT_PREFIX))
+    assert len(segments) == 3
+
+    # 남은 세그먼트에는 가장 최근 이벤트들이 이어져 있다
+    reopened = TunnelEventLog(max_events=1000, persist_dir=str(tmp_path))
+    messages = [e.message for e in reopened.recent(limit=1000)]
+    assert messages[0] == 't1@49'
+    assert messages == [f't1@{minute}' for minute in range(49, 49 - len(messages), -1)]
+    reopened.close()
+
+
+def test_truncated_line_is_skipped_on_load(tmp_path):
+    log = TunnelEventLog(persist_dir=str(tmp_path))
+    log.append(_event(0))
+    log.close()
+    segment = tmp_path / os.listdir(tmp_path)[0]
+    with open(segment, 'a', encoding='utf-8') as f:
+        f.write('{"timestamp": "2026-01-01T03:0')
+
+    reopened = TunnelEventLog(persist_dir=str(tmp_path))
+    assert [e.message for e in reopened.recent()] == ['t1@0']
+    # 잘린 줄 뒤에 이어 쓴 이벤트도 다음 시작 때 읽힌다
+    reopened.append(_event(1))
+    reopened.close()
+
+    again = TunnelEventLog(persist_dir=str(tmp_path))
+    assert [e.message for e in again.recent()] == ['t1@1', 't1@0']
+    again.close()
+
+
+def test_queries_older_than_memory_window_read_segments(tmp_path):
+    log = TunnelEventLog(max_events=5, persist_dir=str(tmp_path), segment_bytes=300)
+    for minute in range(20):
+        log.append(_event(minute, 'a' if minute % 2 else 'b'))
+
+    assert len(log) == 5
+    window = log.between(BASE + timedelta(minutes=3), BASE + timedelta(minutes=16))
+    assert [e.message for e in window] == [f"{'a' if m % 2 else 'b'}@{m}" for m in range(3, 17)]
+    assert [e.message for e in log.between(end=BASE + timedelta(minutes=4), tunnel_id='a')] == ['a@1', 'a@3']
+    assert [e.message for e in log.history('b', limit=4)] == ['b@18', 'b@16', 'b@14', 'b@12']
+    log.close()
+
+    # 재시작 뒤에도 메모리에 다시 읽지 않은 오래된 세그먼트를 조회한다
+    reopened = TunnelEventLog(max_events=5, persist_dir=str(tmp_path))
+    assert [e.message for e in reopened.between(end=BASE + timedelta(minutes=1))] == ['b@0', 'a@1']
+    reopened.close()
+
+
+def test_recent_reads_memory_only_even_when_older_segments_exist(tmp_path, monkeypatch):
+    log = TunnelEventLog(max_events=3, persist_dir=str(tmp_path), segment_bytes=300)
+    for minute in range(10):
+        log.append(_event(minute, 'a' if minute == 0 else 'b'))
+
+    def fail_read(path):
+        raise AssertionError(f"recent() read {path}")
+
+    monkeypatch.setattr(TunnelEventLog, '_read_segment', staticmethod(fail_read))
+    assert log.recent('a', limit=20) == []
+    assert [e.message for e in log.recent('b', limit=20)] == ['b@9', 'b@8', 'b@7']
+    monkeypatch.undo()
+
+    assert [e.message for e in log.history('a', limit=20)] == ['a@0']
+    log.close()
+
+
+def test_memory_only_log_does_not_touch_disk_for_old_ranges():
+    log = TunnelEventLog(max_events=2)
+    for minute in range(4):
+        log.append(_event(minute))
+
+    assert [e.message for e in log.between()] == ['t1@2', 't1@3']
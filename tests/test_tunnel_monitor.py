@@ -177,6 +177,7 @@ class TestTunnelMonitor:
             if self.monitor._thread and self.monitor._thread.is_alive():
                 self.monitor._thread.join(timeout=1)
             self.monitor._thread = None
+        self.monitor._reconnects.stop()
 
     def test_initial_state_not_running(self):
         """초기 상태 미실행 확인"""
@@ -315,7 +316,10 @@ class TestTunnelMonitor:
         for i in range(10):
             monitor._add_event('t1', 'info', f'event {i}')
 
-        assert len(monitor._events) == 5
+        assert len(monitor.event_log) == 5
+        assert [e.message for e in monitor.get_recent_events(limit=10)] == [
+            f'event {i}' for i in range(9, 4, -1)
+        ]
 
     def test_on_tunnel_connected(self):
         """터널 연결 이벤트 처리 확인"""
@@ -580,13 +584,61 @@ class TestTunnelMonitor:
         self.monitor._statuses['tunnel1'] = guarded
         self.monitor._max_reconnect_attempts = 5
 
-        with patch('threading.Thread') as mock_thread:
+        with patch.object(self.monitor._reconnects, 'schedule') as mock_schedule:
             self.monitor._attempt_reconnect('tunnel1')
 
-        mock_thread.assert_called_once()
+        mock_schedule.assert_called_once()
         assert status.state == TunnelState.RECONNECTING
         assert status.reconnect_count == 1
 
+    def test_stop_monitoring_cancels_pending_reconnects(self):
+        """대기 중인 재연결은 모니터링 중지 시 실행되지 않고 취소된다"""
+        from src.core.tunnel_monitor import TunnelStatus
+
+        self.monitor._running = True
+        self.monitor._statuses['tunnel1'] = TunnelStatus(tunnel_id='tunnel1')
+        with patch('src.core.tunnel_monitor.reconnect_delay', return_value=0.3):
+            self.monitor._attempt_reconnect('tunnel1')
+        assert self.monitor._reconnects.is_scheduled('tunnel1')
+
+        self.monitor.stop_monitoring()
+        time.sleep(0.5)
+
+        assert self.monitor._reconnects.pending_count() == 0
+        self.mock_engine.start_tunnel.assert_not_called()
+
+    def test_reconnect_retries_with_the_config_captured_on_first_attempt(self):
+        """stop_tunnel이 엔진 설정을 지운 뒤에도 재시도는 같은 설정과 bastion 키로 예약된다"""
+        from src.core.tunnel_monitor import TunnelStatus, TunnelState
+
+        config = {
+            'id': 'tunnel1', 'bastion_host': 'bastion.example', 'bastion_port': 22,
+            'bastion_user': 'ec2-user', 'bastion_key': '',
+            'remote_host': 'db.internal', 'remote_port': 3306, 'local_port': 13306,
+        }
+        self.mock_engine.tunnel_configs = {'tunnel1': config}
+        self.mock_engine.stop_tunnel.side_effect = (
+            lambda tunnel_id: self.mock_engine.tunnel_configs.pop(tunnel_id, None)
+        )
+        self.mock_engine.start_tunnel.return_value = (False, "bastion unreachable")
+        self.monitor._running = True
+        self.monitor._statuses['tunnel1'] = TunnelStatus(tunnel_id='tunnel1')
+
+        with patch.object(self.monitor._reconnects, 'schedule') as mock_schedule:
+            self.monitor._attempt_reconnect('tunnel1')
+            first = mock_schedule.call_args
+            self.monitor._reconnect_now('tunnel1', first.kwargs['config'])
+            retry = mock_schedule.call_args
+
+        assert mock_schedule.call_count == 2
+        self.mock_engine.start_tunnel.assert_called_once_with(config, check_port=False)
+        assert retry.kwargs['config'] is config
+        assert retry.kwargs['key'] == ('bastion.example', 22, 'ec2-user', '')
+        assert first.kwargs['key'] == retry.kwargs['key']
+        status = self.monitor._statuses['tunnel1']
+        assert status.state == TunnelState.RECONNECTING
+        assert status.reconnect_count == 2
+
     def test_attempt_reconnect_exceeds_max_mutates_under_lock(self):
         """최대 횟수 초과 분기의 state/error_message 변경도 락 보유 중에만 발생"""
         from src.core.tunnel_monitor import TunnelStatus, TunnelState
@@ -614,3 +666,147 @@ class TestTunnelMonitor:
         monitor.set_auto_reconnect(False)
 
         mock_config.set_app_setting.assert_called_with('auto_reconnect', False)
+
+    def test_check_all_tunnels_applies_fast_probes_while_one_probe_hangs(self):
+        """멈춘 ping 하나가 다른 터널의 latency 반영을 막지 않고, 제한 시간 뒤 실패로 반영"""
+        from src.core.tunnel_monitor import TunnelMonitor
+
+        monitor = TunnelMonitor(self.mock_engine, probe_workers=4, probe_timeout=0.2)
+        self.mock_engine.active_tunnels = {'slow': MagicMock(), 'fast1': MagicMock(), 'fast2': MagicMock()}
+        self.mock_engine.is_running.return_value = True
+        release = threading.Event()
+        applied = []
+        monitor.add_callback(lambda tunnel_id, status: applied.append((tunnel_id, status.latency_ms)))
+
+        calls = []
+
+        def fake_measure_latency(tunnel_id):
+            calls.append(tunnel_id)
+            if tunnel_id == 'slow':
+                release.wait(5)
+                return 99.0
+            return 3.0
+
+        with patch.object(monitor, '_measure_latency', side_effect=fake_measure_latency):
+            started = time.monotonic()
+            monitor._check_all_tunnels()
+            elapsed = time.monotonic() - started
+
+            assert elapsed < 1.0
+            assert monitor.get_status('fast1').latency_ms == 3.0
+            assert monitor.get_status('fast2').latency_ms == 3.0
+            assert monitor.get_status('slow').latency_ms is None
+            # 빠른 측정 결과가 멈춘 측정의 시간 초과보다 먼저 반영된다
+            assert applied[-1] == ('slow', None)
+            assert ('fast1', 3.0) in applied and ('fast2', 3.0) in applied
+
+            # 다음 주기: 아직 끝나지 않은 측정은 다시 제출하지 않는다
+            monitor._check_all_tunnels()
+            assert calls.count('slow') == 1
+            assert calls.count('fast1') == 2
+
+            release.set()
+        monitor.stop_monitoring()
+
+    def test_check_all_tunnels_bounds_concurrent_probes(self):
+        """동시에 실행되는 latency 측정 수는 probe_workers를 넘지 않는다"""
+        from src.core.tunnel_monitor import TunnelMonitor
+
+        monitor = TunnelMonitor(self.mock_engine, probe_workers=2, probe_timeout=2.0)
+        self.mock_engine.active_tunnels = {f't{index}': MagicMock() for index in range(6)}
+        self.mock_engine.is_running.return_value = True
+        counter_lock = threading.Lock()
+        counters = {'running': 0, 'peak': 0}
+
+        def fake_measure_latency(tunnel_id):
+            with counter_lock:
+                counters['running'] += 1
+                counters['peak'] = max(counters['peak'], counters['running'])
+            time.sleep(0.02)
+            with counter_lock:
+                counters['running'] -= 1
+            return 1.0
+
+        with patch.object(monitor, '_measure_latency', side_effect=fake_measure_latency):
+            monitor._check_all_tunnels()
+        monitor.stop_monitoring()
+
+        assert counters['peak'] == 2
+        assert all(status.latency_history == [1.0] for status in monitor.get_all_statuses().values())
+
+    def test_scheduled_checks_back_off_stable_tunnels_and_retry_failures_quickly(self):
+        """안정적인 터널은 측정 간격이 늘어나고, 실패한 터널은 곧바로 다시 측정된다"""
+        from src.core import tunnel_monitor as tm
+
+        monitor = tm.TunnelMonitor(self.mock_engine, probe_timeout=2.0)
+        monitor._probe_interval = 5.0
+        self.mock_engine.active_tunnels = {'stable': MagicMock(), 'flaky': MagicMock()}
+        self.mock_engine.is_running.return_value = True
+        self.mock_engine.get_tunnel_traffic_bytes.return_value = None
+        clock = {'now': 1000.0}
+        calls = []
+
+        def fake_measure_latency(tunnel_id):
+            calls.append(tunnel_id)
+            return 5.0 if tunnel_id == 'stable' else -1
+
+        with patch.object(tm.time, 'monotonic', side_effect=lambda: clock['now']), \
+                patch.object(monitor, '_measure_latency', side_effect=fake_measure_latency):
+            for _ in range(40):  # 20초 동안 0.5초 간격 루프
+                monitor._check_all_tunnels(scheduled=True)
+                clock['now'] += 0.5
+        monitor.stop_monitoring()
+
+        # stable: 0s, 5s, 15s (간격 5 -> 10 -> 20)
+        assert calls.count('stable') == 3
+        # flaky: 실패할 때마다 1초 뒤 재측정
+        assert calls.count('flaky') >= 15
+
+    def test_scheduled_checks_skip_tunnels_carrying_heavy_traffic(self):
+        """덤프처럼 트래픽이 많은 터널은 측정을 미루고, 트래픽이 멈추면 다시 잰다"""
+        from src.core import tunnel_monitor as tm
+
+        monitor = tm.TunnelMonitor(self.mock_engine, probe_timeout=2.0)
+        monitor._probe_interval = 5.0
+        self.mock_engine.active_tunnels = {'dump': MagicMock()}
+        self.mock_engine.is_running.return_value = True
+        clock = {'now': 1000.0}
+        traffic = {'bytes': 0}
+        self.mock_engine.get_tunnel_traffic_bytes.side_effect = lambda tunnel_id: traffic['bytes']
+        calls = []
+
+        with patch.object(tm.time, 'monotonic', side_effect=lambda: clock['now']), \
+                patch.object(monitor, '_measure_latency', side_effect=lambda tid: calls.append(tid) or 1.0):
+            monitor._check_all_tunnels(scheduled=True)  # 첫 측정
+            for _ in range(4):  # 초당 1MiB 트래픽이 흐르는 동안
+                clock['now'] += 5.0
+                traffic['bytes'] += 5 * 1024 * 1024
+                monitor._check_all_tunnels(scheduled=True)
+            assert calls == ['dump']
+
+            clock['now'] += 5.0  # 트래픽 멈춤
+            monitor._check_all_tunnels(scheduled=True)
+        monitor.stop_monitoring()
+
+        assert calls == ['dump', 'dump']
+
+    def test_export_latency_stats_is_json_serializable(self):
+        """터널별 latency 요약/샘플을 JSON으로 내보낼 수 있다"""
+        import json
+        from src.core.tunnel_monitor import TunnelMonitor
+
+        monitor = TunnelMonitor(self.mock_engine)
+        self.mock_engine.is_running.return_value = True
+        monitor.get_status('t1')
+        with monitor._lock:
+            for latency in (10.0, 12.0, -1, 30.0):
+                monitor._apply_latency('t1', latency)
+
+        exported = json.loads(json.dumps(monitor.export_latency_stats()))
+        summary = monitor.get_latency_summary('t1')
+
+        assert exported['t1']['total_failures'] == 1
+        assert [value for _, value in exported['t1']['samples']] == [10.0, 12.0, None, 30.0]
+        assert exported['t1']['summary']['p50_ms'] == 12.0
+        assert summary.failure_rate == 0.25
+        assert monitor.get_status('t1').latency_ms == 30.0
@@ -0,0 +1,40 @@
+from src.core.tunnel_engine import TunnelEngine
+from src.ui.workers.tunnel_start_worker import TunnelStartWorker
+
+
+def _direct(tunnel_id):
+    return {
+        "id": tunnel_id,
+        "name": tunnel_id,
+        "remote_host": "127.0.0.1",
+        "remote_port": 3306,
+        "connection_mode": "direct",
+    }
+
+
+def test_worker_emits_each_result_then_the_batch():
+    engine = TunnelEngine()
+    worker = TunnelStartWorker(engine, [_direct("a"), _direct("b")])
+    per_tunnel = []
+    batches = []
+    worker.tunnel_result.connect(lambda config, success, msg: per_tunnel.append((config["id"], success)))
+    worker.batch_finished.connect(batches.append)
+
+    worker.run()
+
+    assert sorted(per_tunnel) == [("a", True), ("b", True)]
+    assert [config["id"] for config, _, _ in batches[0]] == ["a", "b"]
+
+
+def test_worker_reports_pool_failure_for_every_tunnel():
+    class BrokenEngine:
+        def start_tunnels(self, *args, **kwargs):
+            raise RuntimeError("pool unavailable")
+
+    worker = TunnelStartWorker(BrokenEngine(), [_direct("a"), _direct("b")])
+    batches = []
+    worker.batch_finished.connect(batches.append)
+
+    worker.run()
+
+    assert [(config["id"], success) for config, success, _ in batches[0]] == [("a", False), ("b", False)]
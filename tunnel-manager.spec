@@ -23,7 +23,6 @@ hiddenimports = [
     'PyQt6.sip',
 
     # SSH 및 암호화 관련
-    'sshtunnel',
     'paramiko',
     'paramiko.dsskey',
     'paramiko.rsakey',